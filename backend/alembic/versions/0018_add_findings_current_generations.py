@@ -0,0 +1,96 @@
+"""add findings current generation pointer
+
+Revision ID: 0018_findings_current_pointer
+Revises: 0017_remove_console_roles
+Create Date: 2026-04-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0018_findings_current_pointer"
+down_revision = "0017_remove_console_roles"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "findings_current_generations",
+        sa.Column("finding_type", sa.Text(), nullable=False),
+        sa.Column("target_date", sa.Date(), nullable=False),
+        sa.Column("generation_id", sa.Text(), nullable=False),
+        sa.Column("published_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("finding_type", "target_date"),
+    )
+    op.create_index(
+        "idx_scof_date_generation",
+        "suspicious_conversion_findings",
+        ["date", "generation_id"],
+    )
+
+    bind = op.get_bind()
+    # Rows written before generations existed get a per-date legacy generation
+    # so that every current row can be resolved through the pointer table.
+    bind.execute(
+        sa.text(
+            """
+            UPDATE suspicious_conversion_findings
+            SET generation_id = 'legacy-' || CAST(date AS TEXT)
+            WHERE is_current = TRUE
+              AND generation_id IS NULL
+            """
+        )
+    )
+    rows = bind.execute(
+        sa.text(
+            """
+            SELECT date, MIN(generation_id) AS generation_id, MAX(computed_at) AS published_at
+            FROM suspicious_conversion_findings
+            WHERE is_current = TRUE
+            GROUP BY date
+            """
+        )
+    ).mappings()
+    published = {row["date"]: dict(row) for row in rows}
+    generation_rows = bind.execute(
+        sa.text(
+            """
+            SELECT target_date, generation_id, created_at
+            FROM findings_generations
+            WHERE finding_type = 'conversion'
+              AND is_current = TRUE
+            """
+        )
+    ).mappings()
+    for row in generation_rows:
+        published[row["target_date"]] = {
+            "date": row["target_date"],
+            "generation_id": row["generation_id"],
+            "published_at": row["created_at"],
+        }
+    for row in published.values():
+        bind.execute(
+            sa.text(
+                """
+                INSERT INTO findings_current_generations (
+                    finding_type, target_date, generation_id, published_at
+                ) VALUES (
+                    'conversion', :target_date, :generation_id, :published_at
+                )
+                """
+            ),
+            {
+                "target_date": row["date"],
+                "generation_id": row["generation_id"],
+                "published_at": row["published_at"],
+            },
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_scof_date_generation", table_name="suspicious_conversion_findings")
+    op.drop_table("findings_current_generations")
@@ -0,0 +1,54 @@
+"""add persisted findings enrichment tables
+
+Revision ID: 0019_findings_enrichment
+Revises: 0018_findings_current_pointer
+Create Date: 2026-04-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0019_findings_enrichment"
+down_revision = "0018_findings_current_pointer"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "program_unit_prices_daily",
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("program_id", sa.Text(), nullable=False),
+        sa.Column("unit_price_yen", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("date", "program_id"),
+    )
+
+    op.create_table(
+        "conversion_finding_summaries",
+        sa.Column("finding_key", sa.Text(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("transaction_count", sa.Integer(), nullable=False),
+        sa.Column("reward_amount", sa.Integer(), nullable=False),
+        sa.Column("reward_amount_source", sa.Text(), nullable=False),
+        sa.Column("affiliate_id", sa.Text(), nullable=True),
+        sa.Column("affiliate_name", sa.Text(), nullable=True),
+        sa.Column("outcome_type", sa.Text(), nullable=True),
+        sa.Column("latest_occurred_at", sa.DateTime(), nullable=True),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("finding_key"),
+    )
+    op.create_index(
+        "idx_conversion_finding_summaries_date",
+        "conversion_finding_summaries",
+        ["date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_conversion_finding_summaries_date", table_name="conversion_finding_summaries")
+    op.drop_table("conversion_finding_summaries")
+    op.drop_table("program_unit_prices_daily")
@@ -0,0 +1,28 @@
+"""add conversion reward column
+
+Revision ID: 0020_conversion_reward_yen
+Revises: 0019_findings_enrichment
+Create Date: 2026-04-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0020_conversion_reward_yen"
+down_revision = "0019_findings_enrichment"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing rows stay NULL here and are filled by `backfill-rewards`, so the
+    # upgrade does not rewrite conversion_raw at application start-up.
+    op.add_column("conversion_raw", sa.Column("reward_yen", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("conversion_raw") as batch_op:
+        batch_op.drop_column("reward_yen")
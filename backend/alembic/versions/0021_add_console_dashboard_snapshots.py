@@ -0,0 +1,32 @@
+"""add materialized console dashboard snapshots
+
+Revision ID: 0021_dashboard_snapshots
+Revises: 0020_conversion_reward_yen
+Create Date: 2026-04-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0021_dashboard_snapshots"
+down_revision = "0020_conversion_reward_yen"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "console_dashboard_snapshots",
+        sa.Column("snapshot_key", sa.Text(), nullable=False),
+        sa.Column("target_date", sa.Date(), nullable=True),
+        sa.Column("payload_json", sa.Text(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("snapshot_key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("console_dashboard_snapshots")
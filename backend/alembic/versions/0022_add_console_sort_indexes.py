@@ -0,0 +1,71 @@
+"""add partial console sort indexes and require case_key
+
+Revision ID: 0022_console_sort_indexes
+Revises: 0021_dashboard_snapshots
+Create Date: 2026-04-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0022_console_sort_indexes"
+down_revision = "0021_dashboard_snapshots"
+branch_labels = None
+depends_on = None
+
+
+CURRENT_FINDINGS_WHERE = "is_current = TRUE"
+SORT_INDEXES = {
+    "idx_scof_current_risk_desc": ("risk_score DESC", "computed_at DESC", "finding_key"),
+    "idx_scof_current_risk_asc": ("risk_score ASC", "computed_at DESC", "finding_key"),
+    "idx_scof_current_damage_desc": (
+        "(COALESCE(estimated_damage_yen, 0)) DESC",
+        "risk_score DESC",
+        "computed_at DESC",
+        "finding_key",
+    ),
+    "idx_scof_current_damage_asc": (
+        "(COALESCE(estimated_damage_yen, 0)) ASC",
+        "risk_score DESC",
+        "computed_at DESC",
+        "finding_key",
+    ),
+    "idx_scof_current_detected_desc": ("computed_at DESC", "risk_score DESC", "finding_key"),
+    "idx_scof_current_detected_asc": ("computed_at ASC", "risk_score DESC", "finding_key"),
+}
+
+
+def upgrade() -> None:
+    # 0014 backfilled case_key for existing rows; this only catches stragglers.
+    op.execute(
+        "UPDATE suspicious_conversion_findings SET case_key = finding_key WHERE case_key IS NULL"
+    )
+    with op.batch_alter_table("suspicious_conversion_findings") as batch_op:
+        batch_op.alter_column("case_key", existing_type=sa.Text(), nullable=False)
+
+    op.create_index(
+        "idx_scof_current_case",
+        "suspicious_conversion_findings",
+        ["case_key"],
+        postgresql_where=sa.text(CURRENT_FINDINGS_WHERE),
+        sqlite_where=sa.text(CURRENT_FINDINGS_WHERE),
+    )
+    for index_name, columns in SORT_INDEXES.items():
+        op.create_index(
+            index_name,
+            "suspicious_conversion_findings",
+            [sa.text(column) for column in columns],
+            postgresql_where=sa.text(CURRENT_FINDINGS_WHERE),
+            sqlite_where=sa.text(CURRENT_FINDINGS_WHERE),
+        )
+
+
+def downgrade() -> None:
+    for index_name in reversed(list(SORT_INDEXES)):
+        op.drop_index(index_name, table_name="suspicious_conversion_findings")
+    op.drop_index("idx_scof_current_case", table_name="suspicious_conversion_findings")
+    with op.batch_alter_table("suspicious_conversion_findings") as batch_op:
+        batch_op.alter_column("case_key", existing_type=sa.Text(), nullable=True)
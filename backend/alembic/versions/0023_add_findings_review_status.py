@@ -0,0 +1,85 @@
+"""denormalize review status onto conversion findings
+
+Revision ID: 0023_findings_review_status
+Revises: 0022_console_sort_indexes
+Create Date: 2026-04-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0023_findings_review_status"
+down_revision = "0022_console_sort_indexes"
+branch_labels = None
+depends_on = None
+
+CURRENT_FINDINGS_WHERE = "is_current = TRUE"
+# The console filters by review status before sorting, so each sort order gets a
+# status-leading twin of the 0022 indexes.
+STATUS_SORT_INDEXES = {
+    "idx_scof_current_status_risk_desc": ("review_status", "risk_score DESC", "computed_at DESC", "finding_key"),
+    "idx_scof_current_status_risk_asc": ("review_status", "risk_score ASC", "computed_at DESC", "finding_key"),
+    "idx_scof_current_status_damage_desc": (
+        "review_status",
+        "(COALESCE(estimated_damage_yen, 0)) DESC",
+        "risk_score DESC",
+        "computed_at DESC",
+        "finding_key",
+    ),
+    "idx_scof_current_status_damage_asc": (
+        "review_status",
+        "(COALESCE(estimated_damage_yen, 0)) ASC",
+        "risk_score DESC",
+        "computed_at DESC",
+        "finding_key",
+    ),
+    "idx_scof_current_status_detected_desc": (
+        "review_status",
+        "computed_at DESC",
+        "risk_score DESC",
+        "finding_key",
+    ),
+    "idx_scof_current_status_detected_asc": (
+        "review_status",
+        "computed_at ASC",
+        "risk_score DESC",
+        "finding_key",
+    ),
+}
+
+
+def upgrade() -> None:
+    op.add_column(
+        "suspicious_conversion_findings",
+        sa.Column("review_status", sa.Text(), nullable=False, server_default="unhandled"),
+    )
+    # Only reviewed cases need a write; review states are a small fraction of findings.
+    op.execute(
+        """
+        UPDATE suspicious_conversion_findings
+        SET review_status = (
+            SELECT s.review_status
+            FROM fraud_alert_review_states s
+            WHERE s.case_key = suspicious_conversion_findings.case_key
+        )
+        WHERE case_key IN (SELECT case_key FROM fraud_alert_review_states)
+        """
+    )
+    for index_name, columns in STATUS_SORT_INDEXES.items():
+        op.create_index(
+            index_name,
+            "suspicious_conversion_findings",
+            [sa.text(column) for column in columns],
+            postgresql_where=sa.text(CURRENT_FINDINGS_WHERE),
+            sqlite_where=sa.text(CURRENT_FINDINGS_WHERE),
+        )
+
+
+def downgrade() -> None:
+    for index_name in reversed(list(STATUS_SORT_INDEXES)):
+        op.drop_index(index_name, table_name="suspicious_conversion_findings")
+    with op.batch_alter_table("suspicious_conversion_findings") as batch_op:
+        batch_op.drop_column("review_status")
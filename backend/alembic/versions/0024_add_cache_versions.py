@@ -0,0 +1,31 @@
+"""add cache version counters for read-endpoint caching
+
+Revision ID: 0024_cache_versions
+Revises: 0023_findings_review_status
+Create Date: 2026-04-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0024_cache_versions"
+down_revision = "0023_findings_review_status"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cache_versions",
+        sa.Column("scope", sa.Text(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("scope"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cache_versions")
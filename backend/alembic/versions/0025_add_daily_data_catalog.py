@@ -0,0 +1,87 @@
+"""add per-date data catalog maintained by ingestion and retention
+
+Revision ID: 0025_daily_data_catalog
+Revises: 0024_cache_versions
+Create Date: 2026-04-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0025_daily_data_catalog"
+down_revision = "0024_cache_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_data_catalog",
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("click_row_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("click_total", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("click_watermark", sa.DateTime(), nullable=True),
+        sa.Column("conversion_row_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("conversion_total", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("conversion_watermark", sa.DateTime(), nullable=True),
+        sa.Column("findings_generation_id", sa.Text(), nullable=True),
+        sa.Column("findings_computed_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("date"),
+    )
+    op.execute(
+        """
+        INSERT INTO daily_data_catalog (
+            date,
+            click_row_count,
+            click_total,
+            click_watermark,
+            conversion_row_count,
+            conversion_total,
+            conversion_watermark,
+            updated_at
+        )
+        SELECT
+            d.date,
+            COALESCE(c.row_count, 0),
+            COALESCE(c.total, 0),
+            c.watermark,
+            COALESCE(v.row_count, 0),
+            COALESCE(v.total, 0),
+            v.watermark,
+            CURRENT_TIMESTAMP
+        FROM (
+            SELECT date FROM click_ipua_daily
+            UNION
+            SELECT date FROM conversion_ipua_daily
+        ) d
+        LEFT JOIN (
+            SELECT date, COUNT(*) AS row_count, SUM(click_count) AS total, MAX(updated_at) AS watermark
+            FROM click_ipua_daily
+            GROUP BY date
+        ) c ON c.date = d.date
+        LEFT JOIN (
+            SELECT date, COUNT(*) AS row_count, SUM(conversion_count) AS total, MAX(updated_at) AS watermark
+            FROM conversion_ipua_daily
+            GROUP BY date
+        ) v ON v.date = d.date
+        """
+    )
+    op.execute(
+        """
+        UPDATE daily_data_catalog
+        SET findings_generation_id = g.generation_id,
+            findings_computed_at = g.created_at
+        FROM findings_generations g
+        WHERE g.target_date = daily_data_catalog.date
+          AND g.finding_type = 'conversion'
+          AND g.is_current = TRUE
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_data_catalog")
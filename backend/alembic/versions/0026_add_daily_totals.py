@@ -0,0 +1,79 @@
+"""add daily totals rollup for summary and trend reads
+
+Revision ID: 0026_daily_totals
+Revises: 0025_daily_data_catalog
+Create Date: 2026-04-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0026_daily_totals"
+down_revision = "0025_daily_data_catalog"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_totals",
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("click_total", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("click_unique_ips", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("click_media_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("click_ip_sketch", sa.Text(), nullable=True),
+        sa.Column("click_media_sketch", sa.Text(), nullable=True),
+        sa.Column("conversion_total", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("conversion_unique_ips", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("conversion_ip_sketch", sa.Text(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("date"),
+    )
+    # Exact counts for existing days; sketches stay NULL and are built on the next merge for that day.
+    op.execute(
+        """
+        INSERT INTO daily_totals (
+            date,
+            click_total,
+            click_unique_ips,
+            click_media_count,
+            conversion_total,
+            conversion_unique_ips,
+            updated_at
+        )
+        SELECT
+            d.date,
+            COALESCE(c.total, 0),
+            COALESCE(c.unique_ips, 0),
+            COALESCE(c.media_count, 0),
+            COALESCE(v.total, 0),
+            COALESCE(v.unique_ips, 0),
+            CURRENT_TIMESTAMP
+        FROM (
+            SELECT date FROM click_ipua_daily
+            UNION
+            SELECT date FROM conversion_ipua_daily
+        ) d
+        LEFT JOIN (
+            SELECT
+                date,
+                SUM(click_count) AS total,
+                COUNT(DISTINCT ipaddress) AS unique_ips,
+                COUNT(DISTINCT media_id) AS media_count
+            FROM click_ipua_daily
+            GROUP BY date
+        ) c ON c.date = d.date
+        LEFT JOIN (
+            SELECT date, SUM(conversion_count) AS total, COUNT(DISTINCT ipaddress) AS unique_ips
+            FROM conversion_ipua_daily
+            GROUP BY date
+        ) v ON v.date = d.date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_totals")
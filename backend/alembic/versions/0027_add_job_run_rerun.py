@@ -0,0 +1,26 @@
+"""add coalesced rerun request columns to job runs
+
+Revision ID: 0027_job_run_rerun
+Revises: 0026_daily_totals
+Create Date: 2026-04-20
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0027_job_run_rerun"
+down_revision = "0026_daily_totals"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("job_runs", sa.Column("rerun_not_before", sa.DateTime(), nullable=True))
+    op.add_column("job_runs", sa.Column("rerun_params_json", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("job_runs", "rerun_params_json")
+    op.drop_column("job_runs", "rerun_not_before")
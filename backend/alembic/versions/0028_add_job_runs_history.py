@@ -0,0 +1,156 @@
+"""add job run history, active-status partial indexes and queue counters
+
+Revision ID: 0028_job_runs_history
+Revises: 0027_job_run_rerun
+Create Date: 2026-04-20
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0028_job_runs_history"
+down_revision = "0027_job_run_rerun"
+branch_labels = None
+depends_on = None
+
+
+ACTIVE_PARTIAL_INDEXES = (
+    ("idx_job_runs_queued_pick", ["priority", "queued_at"], "status = 'queued'"),
+    ("idx_job_runs_running_lease", ["locked_until"], "status = 'running'"),
+    (
+        "idx_job_runs_active_concurrency",
+        ["concurrency_key", "status"],
+        "status IN ('queued', 'running') AND concurrency_key IS NOT NULL",
+    ),
+    ("idx_job_runs_finished_archive", ["finished_at"], "status IN ('succeeded', 'failed', 'cancelled')"),
+)
+
+COUNTER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION job_runs_count_statuses() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO job_queue_counters (status, job_count)
+        SELECT status, COUNT(*) FROM new_rows GROUP BY status;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO job_queue_counters (status, job_count)
+        SELECT status, -COUNT(*) FROM old_rows GROUP BY status;
+    ELSE
+        INSERT INTO job_queue_counters (status, job_count)
+        SELECT status, SUM(delta)
+        FROM (
+            SELECT status, -1 AS delta FROM old_rows
+            UNION ALL
+            SELECT status, 1 AS delta FROM new_rows
+        ) changes
+        GROUP BY status
+        HAVING SUM(delta) <> 0;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_runs_history",
+        sa.Column("id", sa.Text(), nullable=False),
+        sa.Column("job_type", sa.Text(), nullable=False),
+        sa.Column("status", sa.Text(), nullable=False),
+        sa.Column("params_json", sa.Text(), nullable=True),
+        sa.Column("result_json", sa.Text(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("message", sa.Text(), nullable=True),
+        sa.Column("attempt_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("next_retry_at", sa.DateTime(), nullable=True),
+        sa.Column("dedupe_key", sa.Text(), nullable=True),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="100"),
+        sa.Column("concurrency_key", sa.Text(), nullable=True),
+        sa.Column("queued_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("worker_id", sa.Text(), nullable=True),
+        sa.Column("rerun_not_before", sa.DateTime(), nullable=True),
+        sa.Column("rerun_params_json", sa.Text(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_job_runs_history_type_status_finished",
+        "job_runs_history",
+        ["job_type", "status", "finished_at"],
+    )
+    op.create_index("idx_job_runs_history_finished_at", "job_runs_history", ["finished_at"])
+
+    op.create_table(
+        "job_queue_counters",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("status", sa.Text(), nullable=False),
+        sa.Column("job_count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for name, columns, predicate in ACTIVE_PARTIAL_INDEXES:
+        op.create_index(name, "job_runs", columns, postgresql_where=sa.text(predicate))
+
+    op.execute(COUNTER_FUNCTION_SQL)
+    op.execute(
+        """
+        CREATE TRIGGER job_runs_count_insert
+        AFTER INSERT ON job_runs
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION job_runs_count_statuses()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER job_runs_count_update
+        AFTER UPDATE ON job_runs
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION job_runs_count_statuses()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER job_runs_count_delete
+        AFTER DELETE ON job_runs
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION job_runs_count_statuses()
+        """
+    )
+    # CREATE TRIGGER blocks job_runs writes until this migration commits, so the seed and the
+    # trigger deltas cannot double count or miss a row.
+    op.execute(
+        """
+        INSERT INTO job_queue_counters (status, job_count)
+        SELECT status, COUNT(*)
+        FROM job_runs
+        GROUP BY status
+        """
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS job_runs_count_delete ON job_runs")
+        op.execute("DROP TRIGGER IF EXISTS job_runs_count_update ON job_runs")
+        op.execute("DROP TRIGGER IF EXISTS job_runs_count_insert ON job_runs")
+        op.execute("DROP FUNCTION IF EXISTS job_runs_count_statuses()")
+        for name, _columns, _predicate in reversed(ACTIVE_PARTIAL_INDEXES):
+            op.drop_index(name, table_name="job_runs")
+    op.drop_table("job_queue_counters")
+    op.drop_index("idx_job_runs_history_finished_at", table_name="job_runs_history")
+    op.drop_index("idx_job_runs_history_type_status_finished", table_name="job_runs_history")
+    op.drop_table("job_runs_history")
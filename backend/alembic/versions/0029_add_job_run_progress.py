@@ -0,0 +1,29 @@
+"""add progress and cancellation request columns to job runs
+
+Revision ID: 0029_job_run_progress
+Revises: 0028_job_runs_history
+Create Date: 2026-04-20
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0029_job_run_progress"
+down_revision = "0028_job_runs_history"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table_name in ("job_runs", "job_runs_history"):
+        op.add_column(table_name, sa.Column("progress_json", sa.Text(), nullable=True))
+        op.add_column(table_name, sa.Column("cancel_requested_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    for table_name in ("job_runs_history", "job_runs"):
+        op.drop_column(table_name, "cancel_requested_at")
+        op.drop_column(table_name, "progress_json")
@@ -0,0 +1,42 @@
+"""add the precomputed aging sort key and its partial index to job runs
+
+Revision ID: 0030_job_run_effective_at
+Revises: 0029_job_run_progress
+Create Date: 2026-04-20
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0030_job_run_effective_at"
+down_revision = "0029_job_run_progress"
+branch_labels = None
+depends_on = None
+
+# Matches DEFAULT_PRIORITY_AGING_SECONDS; runs queued before the upgrade get the default step.
+BACKFILL_PRIORITY_STEP_SECONDS = 15
+
+
+def upgrade() -> None:
+    op.add_column("job_runs", sa.Column("effective_at", sa.DateTime(), nullable=True))
+    op.execute(
+        f"""
+        UPDATE job_runs
+        SET effective_at = queued_at + priority * INTERVAL '{BACKFILL_PRIORITY_STEP_SECONDS} seconds'
+        WHERE status = 'queued'
+        """
+    )
+    op.create_index(
+        "idx_job_runs_effective_pick",
+        "job_runs",
+        ["effective_at", "queued_at"],
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_job_runs_effective_pick", table_name="job_runs")
+    op.drop_column("job_runs", "effective_at")
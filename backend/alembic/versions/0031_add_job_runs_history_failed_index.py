@@ -0,0 +1,30 @@
+"""add a partial index on failed runs in job run history
+
+Revision ID: 0031_history_failed_index
+Revises: 0030_job_run_effective_at
+Create Date: 2026-04-20
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0031_history_failed_index"
+down_revision = "0030_job_run_effective_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_job_runs_history_failed",
+        "job_runs_history",
+        ["finished_at"],
+        postgresql_where=sa.text("status = 'failed'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_job_runs_history_failed", table_name="job_runs_history")
@@ -0,0 +1,31 @@
+"""add the reward resolution flag to conversion raw rows
+
+Revision ID: 0032_reward_resolved
+Revises: 0031_history_failed_index
+Create Date: 2026-04-20
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0032_reward_resolved"
+down_revision = "0031_history_failed_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A constant default is metadata-only on Postgres; existing rows are re-resolved by
+    # `backfill-rewards`, which also clears defaults written into reward_yen earlier.
+    op.add_column(
+        "conversion_raw",
+        sa.Column("reward_resolved", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("conversion_raw") as batch_op:
+        batch_op.drop_column("reward_resolved")
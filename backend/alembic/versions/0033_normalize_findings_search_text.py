@@ -0,0 +1,63 @@
+"""rewrite stored findings search_text with the NFKC / whitespace normalization used for terms
+
+Revision ID: 0033_normalize_search_text
+Revises: 0032_reward_resolved
+Create Date: 2026-04-20
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0033_normalize_search_text"
+down_revision = "0032_reward_resolved"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(value: str) -> str:
+    # Frozen copy of fraud_checker.search_text.normalize_search_text at this revision.
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", value)).strip().lower()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    select_batch = sa.text(
+        """
+        SELECT finding_key, search_text
+        FROM suspicious_conversion_findings
+        WHERE search_text IS NOT NULL
+          AND finding_key > :last_key
+        ORDER BY finding_key
+        LIMIT :batch_size
+        """
+    )
+    update_row = sa.text(
+        "UPDATE suspicious_conversion_findings SET search_text = :search_text WHERE finding_key = :finding_key"
+    )
+    last_key = ""
+    while True:
+        rows = bind.execute(select_batch, {"last_key": last_key, "batch_size": BATCH_SIZE}).all()
+        if not rows:
+            return
+        changed = [
+            {"finding_key": finding_key, "search_text": _normalize(search_text)}
+            for finding_key, search_text in rows
+            if _normalize(search_text) != search_text
+        ]
+        if changed:
+            bind.execute(update_row, changed)
+        last_key = rows[-1][0]
+
+
+def downgrade() -> None:
+    # The previous lowercase-only text is not recoverable; normalized text still matches old searches.
+    pass
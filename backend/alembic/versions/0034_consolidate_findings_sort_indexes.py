@@ -0,0 +1,104 @@
+"""consolidate console sort indexes into status-leading indexes that carry the date window
+
+Revision ID: 0034_consolidate_scof_sort_idx
+Revises: 0033_normalize_search_text
+Create Date: 2026-04-20
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0034_consolidate_scof_sort_idx"
+down_revision = "0033_normalize_search_text"
+branch_labels = None
+depends_on = None
+
+CURRENT_FINDINGS_WHERE = "is_current = TRUE"
+# Each ascending console sort is the exact reverse of its descending sort, so one
+# index per sort family serves both directions by scanning backwards. finding_key is
+# unique, so the trailing date column never changes the order; it lets the console's
+# date window be checked inside the index instead of on the heap. Only the detected
+# sort keeps computed_at, which every recompute upsert rewrites.
+SORT_INDEXES = {
+    "idx_scof_status_risk": ("review_status", "risk_score DESC", "finding_key", "date"),
+    "idx_scof_status_damage": (
+        "review_status",
+        "(COALESCE(estimated_damage_yen, 0)) DESC",
+        "risk_score DESC",
+        "finding_key",
+        "date",
+    ),
+    "idx_scof_status_detected": (
+        "review_status",
+        "computed_at DESC",
+        "risk_score DESC",
+        "finding_key",
+        "date",
+    ),
+}
+# Definitions from 0022 / 0023, recreated on downgrade.
+LEGACY_SORT_INDEXES = {
+    "idx_scof_current_risk_desc": ("risk_score DESC", "computed_at DESC", "finding_key"),
+    "idx_scof_current_risk_asc": ("risk_score ASC", "computed_at DESC", "finding_key"),
+    "idx_scof_current_damage_desc": (
+        "(COALESCE(estimated_damage_yen, 0)) DESC",
+        "risk_score DESC",
+        "computed_at DESC",
+        "finding_key",
+    ),
+    "idx_scof_current_damage_asc": (
+        "(COALESCE(estimated_damage_yen, 0)) ASC",
+        "risk_score DESC",
+        "computed_at DESC",
+        "finding_key",
+    ),
+    "idx_scof_current_detected_desc": ("computed_at DESC", "risk_score DESC", "finding_key"),
+    "idx_scof_current_detected_asc": ("computed_at ASC", "risk_score DESC", "finding_key"),
+    "idx_scof_current_status_risk_desc": ("review_status", "risk_score DESC", "computed_at DESC", "finding_key"),
+    "idx_scof_current_status_risk_asc": ("review_status", "risk_score ASC", "computed_at DESC", "finding_key"),
+    "idx_scof_current_status_damage_desc": (
+        "review_status",
+        "(COALESCE(estimated_damage_yen, 0)) DESC",
+        "risk_score DESC",
+        "computed_at DESC",
+        "finding_key",
+    ),
+    "idx_scof_current_status_damage_asc": (
+        "review_status",
+        "(COALESCE(estimated_damage_yen, 0)) ASC",
+        "risk_score DESC",
+        "computed_at DESC",
+        "finding_key",
+    ),
+    "idx_scof_current_status_detected_desc": ("review_status", "computed_at DESC", "risk_score DESC", "finding_key"),
+    "idx_scof_current_status_detected_asc": ("review_status", "computed_at ASC", "risk_score DESC", "finding_key"),
+}
+
+
+def _create_indexes(indexes: dict[str, tuple[str, ...]]) -> None:
+    for index_name, columns in indexes.items():
+        op.create_index(
+            index_name,
+            "suspicious_conversion_findings",
+            [sa.text(column) for column in columns],
+            postgresql_where=sa.text(CURRENT_FINDINGS_WHERE),
+            sqlite_where=sa.text(CURRENT_FINDINGS_WHERE),
+        )
+
+
+def _drop_indexes(indexes: dict[str, tuple[str, ...]]) -> None:
+    for index_name in reversed(list(indexes)):
+        op.drop_index(index_name, table_name="suspicious_conversion_findings")
+
+
+def upgrade() -> None:
+    _create_indexes(SORT_INDEXES)
+    _drop_indexes(LEGACY_SORT_INDEXES)
+
+
+def downgrade() -> None:
+    _create_indexes(LEGACY_SORT_INDEXES)
+    _drop_indexes(SORT_INDEXES)
@@ -0,0 +1,355 @@
+"""Load harness for the job_runs queue.
+
+Runs synthetic jobs through the real queue primitives (`enqueue`, `acquire_next` /
+`acquire_batch`, `heartbeat`, `complete` / `complete_many`, `fail`, `recover_stale_runs`)
+from N worker threads against a disposable Postgres database, then prints a JSON report:
+acquire/complete latency percentiles, throughput, sampled lock waits and stale recoveries.
+
+    python bench/queue_throughput.py --database-url postgresql+psycopg://... --jobs 10000 --workers 16
+
+Every synthetic row uses a `bench_` job type and is deleted before and after the run. The
+harness refuses to start while non-bench jobs are active, because workers would lease them.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import sqlalchemy as sa  # noqa: E402
+
+from fraud_checker.job_status_pg import JobStatusStorePG  # noqa: E402
+
+BENCH_JOB_PREFIX = "bench_"
+BENCH_NOOP_JOB = f"{BENCH_JOB_PREFIX}noop"
+BENCH_SLEEP_JOB = f"{BENCH_JOB_PREFIX}sleep"
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    jobs: int = 10_000
+    workers: int = 8
+    sleep_ratio: float = 0.2
+    sleep_ms: float = 20.0
+    priorities: tuple[int, ...] = (10, 20, 30, 50)
+    concurrency_keys: int = 50
+    keyed_ratio: float = 0.5
+    fail_ratio: float = 0.02
+    crash_ratio: float = 0.01
+    batch_size: int = 1
+    lease_seconds: int = 60
+    recovery_interval: float = 1.0
+    lock_sample_interval: float = 0.05
+    timeout_seconds: float = 600.0
+    seed: int = 7
+
+
+@dataclass
+class BenchStats:
+    acquire_ms: list[float] = field(default_factory=list)
+    heartbeat_ms: list[float] = field(default_factory=list)
+    complete_ms: list[float] = field(default_factory=list)
+    fail_ms: list[float] = field(default_factory=list)
+    empty_acquires: int = 0
+    completed: int = 0
+    failed_attempts: int = 0
+    crashed: int = 0
+    recovered: int = 0
+    lock_wait_samples: list[int] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, bucket: str, started: float) -> None:
+        elapsed = (time.perf_counter() - started) * 1000
+        with self.lock:
+            getattr(self, bucket).append(elapsed)
+
+
+def percentiles(samples: list[float], points: tuple[int, ...] = (50, 90, 95, 99)) -> dict[str, float | None]:
+    """Nearest-rank percentiles plus max, in the samples' unit; None when there are no samples."""
+    ordered = sorted(samples)
+    summary: dict[str, float | None] = {}
+    for point in points:
+        if not ordered:
+            summary[f"p{point}"] = None
+            continue
+        rank = max(1, -(-point * len(ordered) // 100))
+        summary[f"p{point}"] = round(ordered[rank - 1], 3)
+    summary["max"] = round(ordered[-1], 3) if ordered else None
+    return summary
+
+
+def build_report(stats: BenchStats, *, config: BenchConfig, elapsed_seconds: float) -> dict[str, Any]:
+    samples = stats.lock_wait_samples
+    return {
+        "config": {key: value for key, value in config.__dict__.items() if key != "priorities"},
+        "elapsed_seconds": round(elapsed_seconds, 3),
+        "throughput_jobs_per_second": round(stats.completed / elapsed_seconds, 2) if elapsed_seconds else None,
+        "completed": stats.completed,
+        "failed_attempts": stats.failed_attempts,
+        "crashed_leases": stats.crashed,
+        "stale_recoveries": stats.recovered,
+        "empty_acquires": stats.empty_acquires,
+        "acquire_ms": percentiles(stats.acquire_ms),
+        "heartbeat_ms": percentiles(stats.heartbeat_ms),
+        "complete_ms": percentiles(stats.complete_ms),
+        "fail_ms": percentiles(stats.fail_ms),
+        "lock_waits": {
+            "samples": len(samples),
+            "samples_with_waiters": sum(1 for value in samples if value),
+            "max_waiting_sessions": max(samples) if samples else 0,
+            "mean_waiting_sessions": round(sum(samples) / len(samples), 3) if samples else 0.0,
+        },
+    }
+
+
+def _bench_store(database_url: str, *, workers: int) -> JobStatusStorePG:
+    store = JobStatusStorePG(database_url)
+    # One pooled connection per worker plus the recovery and lock-sampler threads.
+    store.engine = sa.create_engine(store.database_url, pool_size=workers + 4, max_overflow=4)
+    return store
+
+
+def _purge_bench_rows(store: JobStatusStorePG) -> None:
+    with store.engine.begin() as conn:
+        conn.execute(
+            sa.text("DELETE FROM job_runs WHERE job_type LIKE :prefix"),
+            {"prefix": f"{BENCH_JOB_PREFIX}%"},
+        )
+
+
+def _assert_queue_is_private(store: JobStatusStorePG) -> None:
+    with store.engine.begin() as conn:
+        foreign = conn.execute(
+            sa.text(
+                """
+                SELECT COUNT(*)
+                FROM job_runs
+                WHERE status IN ('queued', 'running')
+                  AND job_type NOT LIKE :prefix
+                """
+            ),
+            {"prefix": f"{BENCH_JOB_PREFIX}%"},
+        ).scalar_one()
+    if foreign:
+        raise SystemExit(f"{foreign} non-benchmark job(s) are active; use a disposable database")
+
+
+def _enqueue_jobs(store: JobStatusStorePG, config: BenchConfig, rng: random.Random) -> None:
+    for index in range(config.jobs):
+        sleeping = rng.random() < config.sleep_ratio
+        keyed = rng.random() < config.keyed_ratio and config.concurrency_keys > 0
+        store.enqueue(
+            job_type=BENCH_SLEEP_JOB if sleeping else BENCH_NOOP_JOB,
+            params={"n": index},
+            message="bench",
+            max_attempts=3,
+            dedupe_key=None,
+            priority=rng.choice(config.priorities),
+            concurrency_key=f"bench-key:{rng.randrange(config.concurrency_keys)}" if keyed else None,
+        )
+
+
+def _remaining(store: JobStatusStorePG) -> int:
+    with store.engine.begin() as conn:
+        return int(
+            conn.execute(
+                sa.text(
+                    """
+                    SELECT COUNT(*)
+                    FROM job_runs
+                    WHERE job_type LIKE :prefix
+                      AND status IN ('queued', 'running')
+                    """
+                ),
+                {"prefix": f"{BENCH_JOB_PREFIX}%"},
+            ).scalar_one()
+        )
+
+
+def _worker_loop(
+    store: JobStatusStorePG,
+    config: BenchConfig,
+    stats: BenchStats,
+    worker_id: str,
+    done: threading.Event,
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    while not done.is_set():
+        started = time.perf_counter()
+        if config.batch_size > 1:
+            runs = store.acquire_batch(
+                worker_id=worker_id,
+                lease_seconds=config.lease_seconds,
+                job_type=rng.choice((BENCH_NOOP_JOB, BENCH_SLEEP_JOB)),
+                limit=config.batch_size,
+                recover_stale=False,
+            )
+        else:
+            run = store.acquire_next(worker_id=worker_id, lease_seconds=config.lease_seconds, recover_stale=False)
+            runs = [run] if run is not None else []
+        stats.record("acquire_ms", started)
+        if not runs:
+            with stats.lock:
+                stats.empty_acquires += 1
+            done.wait(0.01)
+            continue
+
+        completions = []
+        for run in runs:
+            started = time.perf_counter()
+            store.heartbeat(run_id=run.id, worker_id=worker_id, lease_seconds=config.lease_seconds)
+            stats.record("heartbeat_ms", started)
+            if run.job_type == BENCH_SLEEP_JOB:
+                time.sleep(config.sleep_ms / 1000)
+            roll = rng.random()
+            if roll < config.crash_ratio:
+                # Simulate a worker dying mid-job: expire the lease and walk away.
+                store.heartbeat(run_id=run.id, worker_id=worker_id, lease_seconds=0)
+                with stats.lock:
+                    stats.crashed += 1
+                continue
+            if roll < config.crash_ratio + config.fail_ratio:
+                started = time.perf_counter()
+                store.fail(run.id, "bench failure", {"success": False}, error_message="bench", backoff_seconds=1)
+                stats.record("fail_ms", started)
+                with stats.lock:
+                    stats.failed_attempts += 1
+                continue
+            completions.append((run.id, "bench done", {"success": True}))
+
+        if completions:
+            started = time.perf_counter()
+            if len(completions) > 1:
+                store.complete_many(completions)
+            else:
+                store.complete(*completions[0])
+            stats.record("complete_ms", started)
+            with stats.lock:
+                stats.completed += len(completions)
+
+
+def _recovery_loop(store: JobStatusStorePG, config: BenchConfig, stats: BenchStats, done: threading.Event) -> None:
+    while not done.wait(config.recovery_interval):
+        recovered = store.recover_stale_runs()
+        with stats.lock:
+            stats.recovered += recovered
+
+
+def _lock_sampler(store: JobStatusStorePG, config: BenchConfig, stats: BenchStats, done: threading.Event) -> None:
+    query = sa.text(
+        """
+        SELECT COUNT(*)
+        FROM pg_stat_activity
+        WHERE datname = current_database()
+          AND wait_event_type = 'Lock'
+        """
+    )
+    with store.engine.connect() as conn:
+        while not done.wait(config.lock_sample_interval):
+            waiting = int(conn.execute(query).scalar_one())
+            conn.rollback()
+            with stats.lock:
+                stats.lock_wait_samples.append(waiting)
+
+
+def run_benchmark(database_url: str, config: BenchConfig | None = None) -> dict[str, Any]:
+    config = config or BenchConfig()
+    store = _bench_store(database_url, workers=config.workers)
+    store.ensure_schema()
+    _assert_queue_is_private(store)
+    _purge_bench_rows(store)
+    rng = random.Random(config.seed)
+    stats = BenchStats()
+    done = threading.Event()
+
+    enqueue_started = time.perf_counter()
+    _enqueue_jobs(store, config, rng)
+    enqueue_seconds = time.perf_counter() - enqueue_started
+
+    threads = [
+        threading.Thread(
+            target=_worker_loop,
+            args=(store, config, stats, f"bench-worker-{index}", done, config.seed + index),
+            name=f"bench-worker-{index}",
+        )
+        for index in range(config.workers)
+    ]
+    threads.append(threading.Thread(target=_recovery_loop, args=(store, config, stats, done), name="bench-recovery"))
+    threads.append(threading.Thread(target=_lock_sampler, args=(store, config, stats, done), name="bench-locks"))
+
+    started = time.perf_counter()
+    deadline = started + config.timeout_seconds
+    for thread in threads:
+        thread.start()
+    try:
+        while _remaining(store) and time.perf_counter() < deadline:
+            time.sleep(0.2)
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join()
+    elapsed = time.perf_counter() - started
+
+    report = build_report(stats, config=config, elapsed_seconds=elapsed)
+    report["enqueue_jobs_per_second"] = round(config.jobs / enqueue_seconds, 2) if enqueue_seconds else None
+    report["unfinished"] = _remaining(store)
+    _purge_bench_rows(store)
+    return report
+
+
+def _parse_args(argv: list[str] | None) -> tuple[str, BenchConfig]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("FRAUD_BENCH_DATABASE_URL") or os.getenv("FRAUD_TEST_DATABASE_URL"),
+        help="Disposable Postgres database (defaults to FRAUD_BENCH_DATABASE_URL / FRAUD_TEST_DATABASE_URL)",
+    )
+    defaults = BenchConfig()
+    parser.add_argument("--jobs", type=int, default=defaults.jobs)
+    parser.add_argument("--workers", type=int, default=defaults.workers)
+    parser.add_argument("--sleep-ratio", type=float, default=defaults.sleep_ratio)
+    parser.add_argument("--sleep-ms", type=float, default=defaults.sleep_ms)
+    parser.add_argument("--concurrency-keys", type=int, default=defaults.concurrency_keys)
+    parser.add_argument("--keyed-ratio", type=float, default=defaults.keyed_ratio)
+    parser.add_argument("--fail-ratio", type=float, default=defaults.fail_ratio)
+    parser.add_argument("--crash-ratio", type=float, default=defaults.crash_ratio)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--timeout", type=float, default=defaults.timeout_seconds)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args(argv)
+    if not args.database_url:
+        parser.error("--database-url or FRAUD_BENCH_DATABASE_URL is required")
+    return args.database_url, BenchConfig(
+        jobs=args.jobs,
+        workers=args.workers,
+        sleep_ratio=args.sleep_ratio,
+        sleep_ms=args.sleep_ms,
+        concurrency_keys=args.concurrency_keys,
+        keyed_ratio=args.keyed_ratio,
+        fail_ratio=args.fail_ratio,
+        crash_ratio=args.crash_ratio,
+        batch_size=args.batch_size,
+        timeout_seconds=args.timeout,
+        seed=args.seed,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    database_url, config = _parse_args(argv)
+    report = run_benchmark(database_url, config)
+    print(json.dumps(report, indent=2))
+    return 0 if report["unfinished"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -25,9 +25,10 @@ class DailyStatsResponse(BaseModel):
 class SuspiciousResponse(BaseModel):
     date: str
     data: list[dict]
-    total: int = 0
+    total: int | None = 0
     limit: int = 500
     offset: int = 0
+    next_cursor: str | None = None
 
 
 class IngestRequest(BaseModel):
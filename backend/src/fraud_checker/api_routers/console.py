@@ -3,7 +3,8 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
 
 from ..api_dependencies import (
     ConsoleAccessContext,
@@ -19,20 +20,38 @@ from ..api_models import (
     RefreshRequest,
     SettingsModel,
 )
-from ..console_service_support import date_to_filename_fragment
+from ..api_parsers import parse_iso_date
+from ..console_service_support import date_to_filename_fragment, gzip_chunks
+from ..response_cache import cached_json_response, resolve_cache_version
 from ..service_dependencies import get_job_store, get_repository
 from ..services import console as console_service
+from ..services import exports as exports_service
 from ..services import settings as settings_service
-from ..services.jobs import JobConflictError, enqueue_master_sync_job, enqueue_refresh_job
+from ..services.jobs import (
+    JOB_TYPE_EXPORT_ALERTS,
+    JobConflictError,
+    enqueue_alert_export_job,
+    enqueue_master_sync_job,
+    enqueue_refresh_job,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/console", tags=["console"])
 
 
 @router.get("/dashboard", dependencies=[Depends(require_console_access)])
-def get_dashboard(target_date: Optional[str] = Query(None)):
+def get_dashboard(request: Request, target_date: Optional[str] = Query(None)):
     try:
-        return console_service.get_dashboard(get_repository(), target_date=target_date)
+        repo = get_repository()
+        return cached_json_response(
+            request,
+            endpoint="console.dashboard",
+            params={"target_date": target_date},
+            version=resolve_cache_version(repo),
+            compute=lambda: console_service.load_dashboard(repo, target_date=target_date),
+            live=lambda payload: console_service.attach_dashboard_job_status(repo, payload),
+            expires_at=console_service.dashboard_cache_expiry,
+        )
     except HTTPException:
         raise
     except Exception:
@@ -40,6 +59,18 @@ def get_dashboard(target_date: Optional[str] = Query(None)):
         raise HTTPException(status_code=500, detail="ダッシュボードの取得に失敗しました") from None
 
 
+@router.post("/dashboard/snapshot", dependencies=[Depends(require_console_access)])
+def recompute_dashboard_snapshot(target_date: Optional[str] = Query(None)):
+    try:
+        payload = console_service.recompute_dashboard_snapshot(get_repository(), target_date=target_date)
+        return {"target_date": payload["target_date"], "snapshot": payload["snapshot"]}
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error recomputing console dashboard snapshot")
+        raise HTTPException(status_code=500, detail="ダッシュボードの再計算に失敗しました") from None
+
+
 @router.get("/alerts", dependencies=[Depends(require_console_access)])
 def get_alerts(
     status: Optional[str] = Query("unhandled"),
@@ -50,6 +81,8 @@ def get_alerts(
     sort: str = Query("risk_desc"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, max_length=1024),
+    include_totals: Optional[bool] = Query(None),
 ):
     try:
         return console_service.list_alerts(
@@ -62,7 +95,11 @@ def get_alerts(
             sort=sort,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            include_totals=include_totals,
         )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except HTTPException:
         raise
     except Exception:
@@ -78,9 +115,10 @@ def export_alerts(
     end_date: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
     sort: str = Query("risk_desc"),
+    compress: bool = Query(False),
 ):
     try:
-        csv_text = console_service.export_alerts_csv(
+        chunks = console_service.iter_alerts_csv(
             get_repository(),
             status=status,
             risk_level=risk_level,
@@ -89,20 +127,65 @@ def export_alerts(
             search=search,
             sort=sort,
         )
-        filename_date = date_to_filename_fragment(start_date or end_date)
-        return Response(
-            content=csv_text,
-            media_type="text/csv; charset=utf-8",
-            headers={
-                "Content-Disposition": f'attachment; filename="fraud-alerts-{filename_date}.csv"',
-            },
-        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except HTTPException:
         raise
     except Exception:
         logger.exception("Error exporting console alerts")
         raise HTTPException(status_code=500, detail="CSV エクスポートに失敗しました") from None
 
+    filename = f"fraud-alerts-{date_to_filename_fragment(start_date or end_date)}.csv"
+    if compress:
+        return StreamingResponse(
+            gzip_chunks(chunks),
+            media_type="application/gzip",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.gz"'},
+        )
+    return StreamingResponse(
+        (chunk.encode("utf-8") for chunk in chunks),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post(
+    "/alerts/export-jobs",
+    response_model=IngestResponse,
+    dependencies=[Depends(require_console_access)],
+)
+def enqueue_alert_export(
+    background_tasks: BackgroundTasks,
+    status: Optional[str] = Query("unhandled"),
+    risk_level: Optional[str] = Query(None),
+    start_date: Optional[str] = Query(None),
+    end_date: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    sort: str = Query("risk_desc"),
+):
+    for value in (start_date, end_date):
+        if value:
+            parse_iso_date(value)
+    try:
+        job = enqueue_alert_export_job(
+            {
+                "status": status,
+                "risk_level": risk_level,
+                "start_date": start_date,
+                "end_date": end_date,
+                "search": search,
+                "sort": sort,
+            },
+            background_tasks=background_tasks,
+        )
+    except JobConflictError:
+        raise HTTPException(status_code=409, detail="別のジョブが実行中です") from None
+    return IngestResponse(
+        success=True,
+        message="アラート CSV エクスポートジョブを登録しました",
+        details={"job_id": job.id, "status_url": f"/api/console/job-status/{job.id}"},
+    )
+
 
 @router.get("/alerts/{finding_key}", dependencies=[Depends(require_console_access)])
 def get_alert_detail(
@@ -256,12 +339,56 @@ def get_console_job_status(job_id: str):
     if status is None:
         raise HTTPException(status_code=404, detail="ジョブが見つかりません")
     queue = job_store._serialize_queue_metrics(job_store.get_queue_metrics())
-    return {
+    payload = {
         "status": "completed" if status.status == "succeeded" else status.status,
         "job_id": status.id,
         "message": status.message,
         "started_at": status.started_at.isoformat() if status.started_at else None,
         "completed_at": status.finished_at.isoformat() if status.finished_at else None,
         "result": status.result,
+        "progress": getattr(status, "progress", None),
+        "cancel_requested": getattr(status, "cancel_requested_at", None) is not None,
         "queue": queue,
     }
+    if getattr(status, "job_type", None) == JOB_TYPE_EXPORT_ALERTS and status.status == "succeeded":
+        payload["download_url"] = f"/api/console/job-status/{status.id}/download"
+    return payload
+
+
+@router.post(
+    "/job-status/{job_id}/cancel",
+    response_model=IngestResponse,
+    dependencies=[Depends(require_console_access)],
+)
+def cancel_console_job(job_id: str):
+    job_store = get_job_store()
+    if job_store.get_by_id(job_id) is None:
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
+    # Queued runs are cancelled at once; running ones stop at their next checkpoint.
+    next_status = job_store.request_cancel(job_id, "キャンセルが要求されました")
+    if next_status is None:
+        raise HTTPException(status_code=409, detail="ジョブは既に終了しています")
+    return IngestResponse(
+        success=True,
+        message="ジョブのキャンセルを受け付けました",
+        details={"job_id": job_id, "status": next_status},
+    )
+
+
+@router.get("/job-status/{job_id}/download", dependencies=[Depends(require_console_access)])
+def download_console_job_artifact(job_id: str):
+    status = get_job_store().get_by_id(job_id)
+    if status is None or status.job_type != JOB_TYPE_EXPORT_ALERTS:
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
+    if status.status != "succeeded":
+        raise HTTPException(status_code=409, detail="エクスポートはまだ完了していません")
+    artifact_path = exports_service.resolve_export_artifact(status.result)
+    if artifact_path is None:
+        raise HTTPException(status_code=410, detail="エクスポートファイルが見つかりません")
+    filters = (status.result or {}).get("filters") or {}
+    filename_date = date_to_filename_fragment(filters.get("start_date") or filters.get("end_date"))
+    return FileResponse(
+        artifact_path,
+        media_type=exports_service.ALERT_EXPORT_MEDIA_TYPE,
+        filename=f"fraud-alerts-{filename_date}.{exports_service.ALERT_EXPORT_FORMAT}",
+    )
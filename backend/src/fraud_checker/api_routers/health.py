@@ -23,10 +23,15 @@ router = APIRouter(tags=["health"])
 
 
 def _serialize_health_metrics(repo) -> dict:
-    latest_click = repo.fetch_one("SELECT MAX(date) AS last_date FROM click_ipua_daily")
-    latest_conv = repo.fetch_one("SELECT MAX(date) AS last_date FROM conversion_ipua_daily")
     latest_date = max(
-        [item["last_date"] for item in (latest_click, latest_conv) if item and item.get("last_date")],
+        [
+            value
+            for value in (
+                reporting.get_latest_date(repo, "click_ipua_daily"),
+                reporting.get_latest_date(repo, "conversion_ipua_daily"),
+            )
+            if value
+        ],
         default=None,
     )
     latest_date_obj = date.fromisoformat(latest_date) if isinstance(latest_date, str) else latest_date
@@ -3,10 +3,11 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from ..api_dependencies import require_read_access
 from ..api_models import DailyStatsResponse, SummaryResponse
+from ..response_cache import cached_json_response, resolve_cache_version
 from ..service_dependencies import get_repository
 from ..services import reporting
 
@@ -15,29 +16,48 @@ router = APIRouter(prefix="/api", tags=["reporting"], dependencies=[Depends(requ
 
 
 @router.get("/summary", response_model=SummaryResponse)
-def get_summary(target_date: Optional[str] = None):
+def get_summary(request: Request, target_date: Optional[str] = None):
     try:
-        payload = reporting.get_summary(get_repository(), target_date)
-        return SummaryResponse(**payload)
+        repo = get_repository()
+        return cached_json_response(
+            request,
+            endpoint="reporting.summary",
+            params={"target_date": target_date},
+            version=resolve_cache_version(repo),
+            compute=lambda: SummaryResponse(**reporting.get_summary(repo, target_date)),
+        )
     except Exception:
         logger.exception("Error getting summary")
         raise HTTPException(status_code=500, detail="サーバー内部エラー") from None
 
 
 @router.get("/stats/daily", response_model=DailyStatsResponse)
-def get_daily_stats(limit: int = 30, target_date: Optional[str] = None):
+def get_daily_stats(request: Request, limit: int = 30, target_date: Optional[str] = None):
     try:
-        data = reporting.get_daily_stats(get_repository(), limit, target_date)
-        return DailyStatsResponse(data=data)
+        repo = get_repository()
+        return cached_json_response(
+            request,
+            endpoint="reporting.daily_stats",
+            params={"limit": limit, "target_date": target_date},
+            version=resolve_cache_version(repo),
+            compute=lambda: DailyStatsResponse(data=reporting.get_daily_stats(repo, limit, target_date)),
+        )
     except Exception:
         logger.exception("Error getting daily stats")
         raise HTTPException(status_code=500, detail="サーバー内部エラー") from None
 
 
 @router.get("/dates")
-def get_available_dates():
+def get_available_dates(request: Request):
     try:
-        return {"dates": reporting.get_available_dates(get_repository())}
+        repo = get_repository()
+        return cached_json_response(
+            request,
+            endpoint="reporting.dates",
+            params={},
+            version=resolve_cache_version(repo),
+            compute=lambda: {"dates": reporting.get_available_dates(repo)},
+        )
     except Exception:
         logger.exception("Error getting dates")
         raise HTTPException(status_code=500, detail="サーバー内部エラー") from None
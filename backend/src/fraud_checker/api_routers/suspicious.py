@@ -27,6 +27,8 @@ def get_suspicious_conversions(
     risk_level: Optional[str] = Query(None, pattern="^(high|medium|low)$"),
     sort_by: str = Query("count", pattern="^(count|risk|latest)$"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    cursor: Optional[str] = Query(None, max_length=1024, description="Opaque keyset cursor from next_cursor"),
+    include_total: Optional[bool] = Query(None, description="Count the filtered set (default: first page only)"),
 ):
     try:
         payload = suspicious_service.get_conversion_findings(
@@ -41,8 +43,12 @@ def get_suspicious_conversions(
             include_names=include_names,
             include_details=include_details,
             mask_sensitive=mask_sensitive,
+            cursor=cursor,
+            include_total=include_total,
         )
         return SuspiciousResponse(**payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except HTTPException:
         raise
     except Exception:
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from .time_utils import now_local
+
+CACHE_VERSION_TABLE = "cache_versions"
+REPORTING_CACHE_SCOPE = "reporting"
+
+
+def bump_cache_version(conn, scope: str = REPORTING_CACHE_SCOPE) -> None:
+    """Invalidate cached reads inside the caller's transaction so the bump commits with the write.
+
+    Callers check that the counter table exists first; older schemas simply never cache.
+    """
+    conn.execute(
+        sa.text(
+            """
+            INSERT INTO cache_versions (scope, version, updated_at)
+            VALUES (:scope, 1, :updated_at)
+            ON CONFLICT (scope)
+            DO UPDATE SET
+                version = cache_versions.version + 1,
+                updated_at = excluded.updated_at
+            """
+        ),
+        {"scope": scope, "updated_at": now_local()},
+    )
+
+
+def read_cache_version(conn, scope: str = REPORTING_CACHE_SCOPE) -> int:
+    row = conn.execute(
+        sa.text("SELECT version FROM cache_versions WHERE scope = :scope"),
+        {"scope": scope},
+    ).first()
+    return int(row[0]) if row else 0
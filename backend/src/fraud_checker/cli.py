@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os
+import signal
 import sys
 from datetime import timedelta
 
@@ -11,7 +12,8 @@ from .env import load_env
 from .ingestion import ClickLogIngestor, ConversionIngestor
 from .job_status_pg import JobStatusStorePG
 from .repository_pg import PostgresRepository
-from .services import findings as findings_service, lifecycle
+from .services import console as console_service, findings as findings_service, lifecycle
+from .services import worker as worker_service
 from .services.jobs import (
     enqueue_master_sync_job,
     enqueue_refresh_job,
@@ -122,6 +124,32 @@ def build_parser() -> argparse.ArgumentParser:
     worker = sub.add_parser("run-worker", help="Run queued durable jobs")
     worker.add_argument("--max-jobs", type=int, default=1, help="Maximum jobs to process")
 
+    daemon = sub.add_parser("worker", help="Run a persistent worker pool that waits for queued jobs")
+    daemon.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Jobs executed in parallel (overrides FC_WORKER_CONCURRENCY)",
+    )
+    daemon.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="Seconds between queue polls when no notification arrives (overrides FC_WORKER_POLL_SECONDS)",
+    )
+    daemon.add_argument(
+        "--recovery-interval",
+        type=float,
+        default=None,
+        help="Seconds between stale lease recovery sweeps (overrides FC_WORKER_RECOVERY_SECONDS)",
+    )
+    daemon.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Maximum short jobs leased and completed together (overrides FC_WORKER_BATCH_SIZE)",
+    )
+
     purge = sub.add_parser("purge-data", help="Purge old monitoring data by retention policy")
     purge.add_argument("--execute", action="store_true", help="Delete matching rows instead of dry-run")
     purge.add_argument("--raw-days", type=int, default=None, help="Retention days for raw tables")
@@ -143,6 +171,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Retention days for finished job runs",
     )
+    purge.add_argument(
+        "--export-artifact-days",
+        type=int,
+        default=None,
+        help="Retention days for alert export artifacts in FC_EXPORT_ARTIFACT_DIR",
+    )
+
+    backfill_rewards = sub.add_parser(
+        "backfill-rewards",
+        help="Resolve conversion_raw.reward_yen for rows ingested before rewards were resolved at ingest",
+    )
+    backfill_rewards.add_argument("--batch-size", type=int, default=1000, help="Rows updated per transaction")
 
     return parser
 
@@ -206,6 +246,7 @@ def _cmd_refresh(args: argparse.Namespace) -> int:
     persisted = {}
     if args.detect and dates_to_recompute:
         persisted = findings_service.recompute_findings_for_dates(repository, sorted(dates_to_recompute))
+        console_service.invalidate_dashboard_snapshots(repository)
         print("\n--- Suspicious Detection ---")
         for target_date in sorted(dates_to_recompute):
             counts = persisted.get(target_date.isoformat(), {})
@@ -214,6 +255,11 @@ def _cmd_refresh(args: argparse.Namespace) -> int:
                 print(f"\n{target_date.isoformat()}:")
                 print(f"  Suspicious conversions: {conv_count}")
 
+    bump_cache_version = getattr(repository, "bump_cache_version", None)
+    if callable(bump_cache_version) and (click_new or conv_new or persisted):
+        # CLI refresh bypasses the job queue, so invalidate cached reporting reads here.
+        bump_cache_version()
+
     print("\n=== Refresh Complete ===")
     print(
         f"Total: {click_new + conv_new} new records added, {click_skip + conv_skip} duplicates skipped"
@@ -267,6 +313,36 @@ def _cmd_run_worker(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_worker(args: argparse.Namespace) -> int:
+    settings = worker_service.resolve_worker_settings(
+        concurrency=args.concurrency,
+        poll_seconds=args.poll_interval,
+        recovery_seconds=args.recovery_interval,
+        batch_size=args.batch_size,
+    )
+    pool = worker_service.JobWorkerPool(settings)
+
+    def _handle_signal(signum, frame) -> None:
+        del frame
+        if pool.stopping:
+            # Second signal: exit now and let lease expiry hand running jobs to another worker.
+            print(f"Received signal {signum} again; exiting without waiting for running jobs")
+            os._exit(1)
+        print(f"Received signal {signum}; finishing running jobs before exit")
+        pool.stop()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    print("=== Job Worker ===")
+    print(f"Worker ID: {pool.worker_id}")
+    print(f"Concurrency: {settings.concurrency}")
+    print(f"Batch size: {settings.batch_size}")
+    processed = pool.run()
+    print(f"Processed {processed} queued job(s)")
+    return 0
+
+
 def _cmd_purge_data(args: argparse.Namespace) -> int:
     repository = _build_repository(store_raw=False)
     job_store = JobStatusStorePG(_require_database_url())
@@ -275,6 +351,7 @@ def _cmd_purge_data(args: argparse.Namespace) -> int:
         aggregate_days=args.aggregate_days,
         findings_days=args.findings_days,
         job_run_days=args.job_run_days,
+        export_artifact_days=args.export_artifact_days,
     )
     result = lifecycle.purge_old_data(
         repository,
@@ -290,10 +367,20 @@ def _cmd_purge_data(args: argparse.Namespace) -> int:
     print(f"Aggregate cutoff: {result['cutoffs']['aggregates_before']}")
     print(f"Findings cutoff: {result['cutoffs']['findings_before']}")
     print(f"Job runs cutoff: {result['cutoffs']['job_runs_before']}")
+    print(f"Export artifacts cutoff: {result['cutoffs']['export_artifacts_before']}")
     print(f"Raw rows: {result['counts']['raw']}")
     print(f"Aggregate rows: {result['counts']['aggregates']}")
     print(f"Findings rows: {result['counts']['findings']}")
     print(f"Job runs: {result['counts']['job_runs']}")
+    print(f"Export artifacts: {result['counts']['export_artifacts']}")
+    return 0
+
+
+def _cmd_backfill_rewards(args: argparse.Namespace) -> int:
+    repository = _build_repository(store_raw=False)
+    updated = repository.backfill_conversion_reward_yen(batch_size=max(1, args.batch_size))
+    print("=== Reward Backfill ===")
+    print(f"Conversions updated: {updated}")
     return 0
 
 
@@ -313,8 +400,12 @@ def main(argv: list[str] | None = None) -> int:
         return _cmd_enqueue_sync_masters()
     if args.command == "run-worker":
         return _cmd_run_worker(args)
+    if args.command == "worker":
+        return _cmd_worker(args)
     if args.command == "purge-data":
         return _cmd_purge_data(args)
+    if args.command == "backfill-rewards":
+        return _cmd_backfill_rewards(args)
 
     parser.print_help()
     return 1
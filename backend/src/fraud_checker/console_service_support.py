@@ -2,77 +2,105 @@ from __future__ import annotations
 
 import csv
 import io
+import zlib
 from datetime import date
+from typing import Iterable, Iterator
+
+ALERT_CSV_HEADER = [
+    "case_key",
+    "latest_detected_at",
+    "environment_date",
+    "environment_ipaddress",
+    "environment_useragent",
+    "affected_affiliate_count",
+    "affected_affiliates",
+    "affected_program_count",
+    "affected_programs",
+    "risk_score",
+    "risk_level",
+    "status",
+    "reward_amount",
+    "reward_amount_source",
+    "reward_amount_is_estimated",
+    "transaction_count",
+    "primary_reason",
+]
 
 
 def build_alert_csv(rows: list[dict], *, exported_at: str | None = None) -> str:
+    return "".join(iter_alert_csv([rows], exported_at=exported_at))
+
+
+def iter_alert_csv(batches: Iterable[list[dict]], *, exported_at: str | None = None) -> Iterator[str]:
     output = io.StringIO()
     writer = csv.writer(output)
-    writer.writerow(
-        [
-            "case_key",
-            "latest_detected_at",
-            "environment_date",
-            "environment_ipaddress",
-            "environment_useragent",
-            "affected_affiliate_count",
-            "affected_affiliates",
-            "affected_program_count",
-            "affected_programs",
-            "risk_score",
-            "risk_level",
-            "status",
-            "reward_amount",
-            "reward_amount_source",
-            "reward_amount_is_estimated",
-            "transaction_count",
-            "primary_reason",
-        ]
-    )
-    for row in rows:
-        writer.writerow(
-            [
-                row.get("case_key", ""),
-                row.get("latest_detected_at", ""),
-                (row.get("environment") or {}).get("date", ""),
-                (row.get("environment") or {}).get("ipaddress", ""),
-                (row.get("environment") or {}).get("useragent", ""),
-                row.get("affected_affiliate_count", 0),
-                ", ".join(
-                    filter(
-                        None,
-                        [
-                            item.get("name") or item.get("id")
-                            for item in row.get("affected_affiliates", [])
-                            if isinstance(item, dict)
-                        ],
-                    )
-                ),
-                row.get("affected_program_count", 0),
-                ", ".join(
-                    filter(
-                        None,
-                        [
-                            item.get("name") or item.get("id")
-                            for item in row.get("affected_programs", [])
-                            if isinstance(item, dict)
-                        ],
-                    )
-                ),
-                row.get("risk_score", ""),
-                row.get("risk_level", ""),
-                row.get("status", ""),
-                row.get("reward_amount", 0),
-                row.get("reward_amount_source", ""),
-                "true" if row.get("reward_amount_is_estimated") else "false",
-                row.get("transaction_count", 0),
-                row.get("primary_reason", ""),
-            ]
-        )
+    writer.writerow(ALERT_CSV_HEADER)
+    yield _drain(output)
+    for rows in batches:
+        writer.writerows(_alert_csv_row(row) for row in rows)
+        chunk = _drain(output)
+        if chunk:
+            yield chunk
     if exported_at:
         writer.writerow([])
         writer.writerow(["exported_at", exported_at])
-    return output.getvalue()
+        yield _drain(output)
+
+
+def gzip_chunks(chunks: Iterable[str], *, encoding: str = "utf-8") -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk.encode(encoding))
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _alert_csv_row(row: dict) -> list[object]:
+    return [
+        row.get("case_key", ""),
+        row.get("latest_detected_at", ""),
+        (row.get("environment") or {}).get("date", ""),
+        (row.get("environment") or {}).get("ipaddress", ""),
+        (row.get("environment") or {}).get("useragent", ""),
+        row.get("affected_affiliate_count", 0),
+        ", ".join(
+            filter(
+                None,
+                [
+                    item.get("name") or item.get("id")
+                    for item in row.get("affected_affiliates", [])
+                    if isinstance(item, dict)
+                ],
+            )
+        ),
+        row.get("affected_program_count", 0),
+        ", ".join(
+            filter(
+                None,
+                [
+                    item.get("name") or item.get("id")
+                    for item in row.get("affected_programs", [])
+                    if isinstance(item, dict)
+                ],
+            )
+        ),
+        row.get("risk_score", ""),
+        row.get("risk_level", ""),
+        row.get("status", ""),
+        row.get("reward_amount", 0),
+        row.get("reward_amount_source", ""),
+        "true" if row.get("reward_amount_is_estimated") else "false",
+        row.get("transaction_count", 0),
+        row.get("primary_reason", ""),
+    ]
+
+
+def _drain(output: io.StringIO) -> str:
+    value = output.getvalue()
+    output.seek(0)
+    output.truncate(0)
+    return value
 
 
 def normalize_reward_amount_source(source: str | None) -> str:
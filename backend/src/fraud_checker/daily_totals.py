@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+
+import sqlalchemy as sa
+
+from .hyperloglog import HyperLogLog
+from .time_utils import now_local
+
+DAILY_TOTALS_TABLE = "daily_totals"
+
+
+@dataclass(frozen=True)
+class _TotalsSide:
+    source_table: str
+    count_column: str
+    total_column: str
+    # distinct-count column -> (sketch column, source column)
+    sketches: dict[str, tuple[str, str]]
+
+
+_SIDES = {
+    "click": _TotalsSide(
+        source_table="click_ipua_daily",
+        count_column="click_count",
+        total_column="click_total",
+        sketches={
+            "click_unique_ips": ("click_ip_sketch", "ipaddress"),
+            "click_media_count": ("click_media_sketch", "media_id"),
+        },
+    ),
+    "conversion": _TotalsSide(
+        source_table="conversion_ipua_daily",
+        count_column="conversion_count",
+        total_column="conversion_total",
+        sketches={
+            "conversion_unique_ips": ("conversion_ip_sketch", "ipaddress"),
+        },
+    ),
+}
+
+
+@dataclass
+class DailyTotalsDelta:
+    total: int = 0
+    values: dict[str, set[str]] = field(default_factory=dict)
+
+    def add(self, count: int = 1, **values: str | None) -> None:
+        self.total += count
+        for source_column, value in values.items():
+            if value is not None:
+                self.values.setdefault(source_column, set()).add(value)
+
+
+def apply_daily_totals(conn, kind: str, deltas: dict[date, DailyTotalsDelta]) -> None:
+    """Fold newly merged aggregate rows into the rollup inside the caller's transaction.
+
+    Sides without a sketch yet (rows backfilled by the migration) are rebuilt from the aggregate
+    table once; afterwards every merge only touches the day's rollup row.
+
+    The new total is read-modify-write, and refreshes, queued jobs and CLI runs can merge the
+    same date concurrently, so the row is created if missing and locked before it is read.
+    Dates are locked in ascending order so two writers never wait on each other's rows.
+    """
+    side = _SIDES[kind]
+    lock_clause = " FOR UPDATE" if conn.dialect.name == "postgresql" else ""
+    for target_date in sorted(deltas):
+        delta = deltas[target_date]
+        conn.execute(
+            sa.text(
+                """
+                INSERT INTO daily_totals (date, updated_at)
+                VALUES (:target_date, :updated_at)
+                ON CONFLICT (date) DO NOTHING
+                """
+            ),
+            {"target_date": target_date, "updated_at": now_local()},
+        )
+        row = conn.execute(
+            sa.text(f"SELECT * FROM daily_totals WHERE date = :target_date{lock_clause}"),
+            {"target_date": target_date},
+        ).mappings().first()
+        if row is None or any(row[sketch] is None for sketch, _ in side.sketches.values()):
+            rebuild_daily_totals(conn, kind, target_date)
+            continue
+        sketches: dict[str, HyperLogLog] = {}
+        for sketch_column, source_column in side.sketches.values():
+            sketch = HyperLogLog.from_text(row[sketch_column])
+            sketch.update(delta.values.get(source_column, ()))
+            sketches[sketch_column] = sketch
+        _write_side(conn, side, target_date, int(row[side.total_column] or 0) + delta.total, sketches)
+
+
+def rebuild_daily_totals(conn, kind: str, target_date: date) -> None:
+    side = _SIDES[kind]
+    _write_side(conn, side, target_date, *_rebuild_side(conn, side, target_date))
+
+
+def reset_daily_totals(conn, kind: str, target_date: date) -> None:
+    """Zero one side of the day's rollup after its aggregates were deleted for a full reload."""
+    side = _SIDES[kind]
+    empty = {sketch_column: HyperLogLog() for sketch_column, _ in side.sketches.values()}
+    _write_side(conn, side, target_date, 0, empty)
+
+
+def _rebuild_side(conn, side: _TotalsSide, target_date: date) -> tuple[int, dict[str, HyperLogLog]]:
+    total = conn.execute(
+        sa.text(
+            f"SELECT COALESCE(SUM({side.count_column}), 0) FROM {side.source_table} WHERE date = :target_date"
+        ),
+        {"target_date": target_date},
+    ).scalar_one()
+    sketches: dict[str, HyperLogLog] = {}
+    for sketch_column, source_column in side.sketches.values():
+        sketch = HyperLogLog()
+        sketch.update(
+            conn.execute(
+                sa.text(
+                    f"SELECT DISTINCT {source_column} FROM {side.source_table} WHERE date = :target_date"
+                ),
+                {"target_date": target_date},
+            ).scalars()
+        )
+        sketches[sketch_column] = sketch
+    return int(total or 0), sketches
+
+
+def _write_side(
+    conn,
+    side: _TotalsSide,
+    target_date: date,
+    total: int,
+    sketches: dict[str, HyperLogLog],
+) -> None:
+    params: dict[str, object] = {
+        "target_date": target_date,
+        "updated_at": now_local(),
+        side.total_column: total,
+    }
+    for count_column, (sketch_column, _) in side.sketches.items():
+        params[count_column] = sketches[sketch_column].estimate()
+        params[sketch_column] = sketches[sketch_column].to_text()
+    columns = [name for name in params if name not in {"target_date", "updated_at"}]
+    conn.execute(
+        sa.text(
+            f"""
+            INSERT INTO daily_totals (date, {", ".join(columns)}, updated_at)
+            VALUES (:target_date, {", ".join(f":{name}" for name in columns)}, :updated_at)
+            ON CONFLICT (date)
+            DO UPDATE SET
+                {", ".join(f"{name} = excluded.{name}" for name in columns)},
+                updated_at = excluded.updated_at
+            """
+        ),
+        params,
+    )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Iterable
+
+import sqlalchemy as sa
+
+from .time_utils import now_local
+
+DATE_CATALOG_TABLE = "daily_data_catalog"
+
+
+CATALOG_SIDES = {
+    "click": ("click_ipua_daily", "click_count"),
+    "conversion": ("conversion_ipua_daily", "conversion_count"),
+}
+
+
+def refresh_date_catalog(
+    conn,
+    target_dates: Iterable[date],
+    *,
+    sides: Iterable[str] = tuple(CATALOG_SIDES),
+) -> None:
+    """Recount the aggregate rows for each date inside the caller's transaction.
+
+    Only the columns of `sides` are rewritten, so a click writer never overwrites the conversion
+    counts with a snapshot that misses a concurrent conversion writer (and vice versa). The
+    catalog row is locked before counting; on Postgres the recount then runs in a fresh
+    snapshot that sees any writer that committed while this one waited. The counts come from
+    the per-date index on each aggregate table, one small range scan per side.
+    """
+    sides = sorted(set(sides))
+    lock_rows = conn.dialect.name == "postgresql"
+    updated_at = now_local()
+    for target_date in sorted(set(target_dates)):
+        params = {"target_date": target_date, "updated_at": updated_at}
+        conn.execute(
+            sa.text(
+                """
+                INSERT INTO daily_data_catalog (
+                    date, click_row_count, click_total, conversion_row_count, conversion_total, updated_at
+                ) VALUES (:target_date, 0, 0, 0, 0, :updated_at)
+                ON CONFLICT (date) DO NOTHING
+                """
+            ),
+            params,
+        )
+        if lock_rows:
+            conn.execute(
+                sa.text("SELECT date FROM daily_data_catalog WHERE date = :target_date FOR UPDATE"),
+                params,
+            )
+        for side in sides:
+            table_name, count_column = CATALOG_SIDES[side]
+            conn.execute(
+                sa.text(
+                    f"""
+                    UPDATE daily_data_catalog
+                    SET {side}_row_count = counted.row_count,
+                        {side}_total = counted.total,
+                        {side}_watermark = counted.watermark,
+                        updated_at = :updated_at
+                    FROM (
+                        SELECT COUNT(*) AS row_count,
+                               COALESCE(SUM({count_column}), 0) AS total,
+                               MAX(updated_at) AS watermark
+                        FROM {table_name}
+                        WHERE date = :target_date
+                    ) counted
+                    WHERE daily_data_catalog.date = :target_date
+                    """
+                ),
+                params,
+            )
+
+
+def record_findings_generation(
+    conn,
+    target_date: date,
+    *,
+    generation_id: str,
+    computed_at: datetime,
+) -> None:
+    conn.execute(
+        sa.text(
+            """
+            INSERT INTO daily_data_catalog (
+                date,
+                click_row_count,
+                click_total,
+                conversion_row_count,
+                conversion_total,
+                findings_generation_id,
+                findings_computed_at,
+                updated_at
+            ) VALUES (
+                :target_date,
+                0,
+                0,
+                0,
+                0,
+                :generation_id,
+                :computed_at,
+                :updated_at
+            )
+            ON CONFLICT (date)
+            DO UPDATE SET
+                findings_generation_id = excluded.findings_generation_id,
+                findings_computed_at = excluded.findings_computed_at,
+                updated_at = excluded.updated_at
+            """
+        ),
+        {
+            "target_date": target_date,
+            "generation_id": generation_id,
+            "computed_at": computed_at,
+            "updated_at": now_local(),
+        },
+    )
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, DateTime, Integer, Text
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Identity, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import CheckConstraint, Index, UniqueConstraint
+from sqlalchemy import CheckConstraint, Index, UniqueConstraint, text
 from . import Base
 
 
@@ -74,6 +74,8 @@ class ConversionRaw(Base):
     click_useragent: Mapped[str | None] = mapped_column(Text)
     state: Mapped[str | None] = mapped_column(Text)
     raw_payload: Mapped[str | None] = mapped_column(Text)
+    reward_yen: Mapped[int | None] = mapped_column(Integer)
+    reward_resolved: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=text("false"))
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
@@ -266,6 +268,39 @@ class JobRun(Base):
         Index("idx_job_runs_queue_scan", "status", "next_retry_at", "priority", "queued_at"),
         Index("idx_job_runs_dedupe_status", "dedupe_key", "status", "queued_at"),
         Index("idx_job_runs_concurrency_status", "concurrency_key", "status", "queued_at"),
+        Index(
+            "idx_job_runs_queued_pick",
+            "priority",
+            "queued_at",
+            postgresql_where=text("status = 'queued'"),
+            sqlite_where=text("status = 'queued'"),
+        ),
+        Index(
+            "idx_job_runs_effective_pick",
+            "effective_at",
+            "queued_at",
+            postgresql_where=text("status = 'queued'"),
+            sqlite_where=text("status = 'queued'"),
+        ),
+        Index(
+            "idx_job_runs_running_lease",
+            "locked_until",
+            postgresql_where=text("status = 'running'"),
+            sqlite_where=text("status = 'running'"),
+        ),
+        Index(
+            "idx_job_runs_active_concurrency",
+            "concurrency_key",
+            "status",
+            postgresql_where=text("status IN ('queued', 'running') AND concurrency_key IS NOT NULL"),
+            sqlite_where=text("status IN ('queued', 'running') AND concurrency_key IS NOT NULL"),
+        ),
+        Index(
+            "idx_job_runs_finished_archive",
+            "finished_at",
+            postgresql_where=text("status IN ('succeeded', 'failed', 'cancelled')"),
+            sqlite_where=text("status IN ('succeeded', 'failed', 'cancelled')"),
+        ),
     )
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
@@ -282,11 +317,63 @@ class JobRun(Base):
     priority: Mapped[int] = mapped_column(Integer, nullable=False, default=100)
     concurrency_key: Mapped[str | None] = mapped_column(Text)
     queued_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    effective_at: Mapped[datetime | None] = mapped_column(DateTime)
     started_at: Mapped[datetime | None] = mapped_column(DateTime)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime)
     heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime)
     locked_until: Mapped[datetime | None] = mapped_column(DateTime)
     worker_id: Mapped[str | None] = mapped_column(Text)
+    rerun_not_before: Mapped[datetime | None] = mapped_column(DateTime)
+    rerun_params_json: Mapped[str | None] = mapped_column(Text)
+    progress_json: Mapped[str | None] = mapped_column(Text)
+    cancel_requested_at: Mapped[datetime | None] = mapped_column(DateTime)
+
+
+class JobRunHistory(Base):
+    __tablename__ = "job_runs_history"
+    __table_args__ = (
+        Index("idx_job_runs_history_type_status_finished", "job_type", "status", "finished_at"),
+        Index("idx_job_runs_history_finished_at", "finished_at"),
+        Index(
+            "idx_job_runs_history_failed",
+            "finished_at",
+            postgresql_where=text("status = 'failed'"),
+            sqlite_where=text("status = 'failed'"),
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
+    job_type: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(Text, nullable=False)
+    params_json: Mapped[str | None] = mapped_column(Text)
+    result_json: Mapped[str | None] = mapped_column(Text)
+    error_message: Mapped[str | None] = mapped_column(Text)
+    message: Mapped[str | None] = mapped_column(Text)
+    attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+    next_retry_at: Mapped[datetime | None] = mapped_column(DateTime)
+    dedupe_key: Mapped[str | None] = mapped_column(Text)
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=100, server_default="100")
+    concurrency_key: Mapped[str | None] = mapped_column(Text)
+    queued_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime)
+    worker_id: Mapped[str | None] = mapped_column(Text)
+    rerun_not_before: Mapped[datetime | None] = mapped_column(DateTime)
+    rerun_params_json: Mapped[str | None] = mapped_column(Text)
+    progress_json: Mapped[str | None] = mapped_column(Text)
+    cancel_requested_at: Mapped[datetime | None] = mapped_column(DateTime)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class JobQueueCounter(Base):
+    __tablename__ = "job_queue_counters"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    status: Mapped[str] = mapped_column(Text, nullable=False)
+    job_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
 
 class FindingsGeneration(Base):
@@ -312,6 +399,15 @@ class FindingsGeneration(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
 
+class FindingsCurrentGeneration(Base):
+    __tablename__ = "findings_current_generations"
+
+    finding_type: Mapped[str] = mapped_column(Text, primary_key=True)
+    target_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    generation_id: Mapped[str] = mapped_column(Text, nullable=False)
+    published_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
 class SuspiciousConversionFindingRecord(Base):
     __tablename__ = "suspicious_conversion_findings"
     __table_args__ = (
@@ -319,10 +415,46 @@ class SuspiciousConversionFindingRecord(Base):
         Index("idx_scof_date_current_risk", "date", "is_current", "risk_level"),
         Index("idx_scof_date_current_computed", "date", "is_current", "computed_at"),
         Index("idx_scof_case_current", "case_key", "is_current"),
+        Index("idx_scof_date_generation", "date", "generation_id"),
+        Index(
+            "idx_scof_current_case",
+            "case_key",
+            postgresql_where=text("is_current = TRUE"),
+            sqlite_where=text("is_current = TRUE"),
+        ),
+        Index(
+            "idx_scof_status_risk",
+            text("review_status"),
+            text("risk_score DESC"),
+            text("finding_key"),
+            text("date"),
+            postgresql_where=text("is_current = TRUE"),
+            sqlite_where=text("is_current = TRUE"),
+        ),
+        Index(
+            "idx_scof_status_damage",
+            text("review_status"),
+            text("(COALESCE(estimated_damage_yen, 0)) DESC"),
+            text("risk_score DESC"),
+            text("finding_key"),
+            text("date"),
+            postgresql_where=text("is_current = TRUE"),
+            sqlite_where=text("is_current = TRUE"),
+        ),
+        Index(
+            "idx_scof_status_detected",
+            text("review_status"),
+            text("computed_at DESC"),
+            text("risk_score DESC"),
+            text("finding_key"),
+            text("date"),
+            postgresql_where=text("is_current = TRUE"),
+            sqlite_where=text("is_current = TRUE"),
+        ),
     )
 
     finding_key: Mapped[str] = mapped_column(Text, primary_key=True)
-    case_key: Mapped[str | None] = mapped_column(Text)
+    case_key: Mapped[str] = mapped_column(Text, nullable=False)
     date: Mapped[date] = mapped_column(Date, nullable=False)
     ipaddress: Mapped[str] = mapped_column(Text, nullable=False)
     useragent: Mapped[str] = mapped_column(Text, nullable=False)
@@ -357,6 +489,84 @@ class SuspiciousConversionFindingRecord(Base):
     generation_id: Mapped[str | None] = mapped_column(Text)
     is_current: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     search_text: Mapped[str] = mapped_column(Text, nullable=False)
+    review_status: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        default="unhandled",
+        server_default="unhandled",
+    )
+
+
+class ProgramUnitPriceDaily(Base):
+    __tablename__ = "program_unit_prices_daily"
+
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    program_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    unit_price_yen: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class ConversionFindingSummary(Base):
+    __tablename__ = "conversion_finding_summaries"
+    __table_args__ = (Index("idx_conversion_finding_summaries_date", "date"),)
+
+    finding_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    transaction_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    reward_amount: Mapped[int] = mapped_column(Integer, nullable=False)
+    reward_amount_source: Mapped[str] = mapped_column(Text, nullable=False)
+    affiliate_id: Mapped[str | None] = mapped_column(Text)
+    affiliate_name: Mapped[str | None] = mapped_column(Text)
+    outcome_type: Mapped[str | None] = mapped_column(Text)
+    latest_occurred_at: Mapped[datetime | None] = mapped_column(DateTime)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class ConsoleDashboardSnapshot(Base):
+    __tablename__ = "console_dashboard_snapshots"
+
+    snapshot_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    target_date: Mapped[date | None] = mapped_column(Date)
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+
+    scope: Mapped[str] = mapped_column(Text, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class DailyDataCatalog(Base):
+    __tablename__ = "daily_data_catalog"
+
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    click_row_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    click_total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    click_watermark: Mapped[datetime | None] = mapped_column(DateTime)
+    conversion_row_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    conversion_total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    conversion_watermark: Mapped[datetime | None] = mapped_column(DateTime)
+    findings_generation_id: Mapped[str | None] = mapped_column(Text)
+    findings_computed_at: Mapped[datetime | None] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class DailyTotals(Base):
+    __tablename__ = "daily_totals"
+
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    click_total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    click_unique_ips: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    click_media_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    click_ip_sketch: Mapped[str | None] = mapped_column(Text)
+    click_media_sketch: Mapped[str | None] = mapped_column(Text)
+    conversion_total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    conversion_unique_ips: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    conversion_ip_sketch: Mapped[str | None] = mapped_column(Text)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
 
 class FraudFindingRecord(Base):
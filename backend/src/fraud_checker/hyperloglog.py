@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import math
+from typing import Iterable
+
+DEFAULT_PRECISION = 11
+
+
+class HyperLogLog:
+    """Fixed-size distinct-count sketch; p=11 keeps 2048 registers for ~2.3% standard error."""
+
+    def __init__(self, precision: int = DEFAULT_PRECISION, registers: bytearray | None = None) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError(f"Unsupported HyperLogLog precision: {precision}")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = registers if registers is not None else bytearray(self.size)
+        if len(self.registers) != self.size:
+            raise ValueError("Register count does not match precision")
+
+    def add(self, value: str) -> None:
+        hashed = int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+        remaining_bits = 64 - self.precision
+        index = hashed >> remaining_bits
+        rank = remaining_bits - (hashed & ((1 << remaining_bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, values: Iterable[str | None]) -> None:
+        for value in values:
+            if value is not None:
+                self.add(str(value))
+
+    def merge(self, other: HyperLogLog) -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+
+    def estimate(self) -> int:
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        raw = alpha * self.size * self.size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * self.size and zeros:
+            # Linear counting is close to exact for the small per-day cardinalities we mostly see.
+            return int(round(self.size * math.log(self.size / zeros)))
+        return int(round(raw))
+
+    def to_text(self) -> str:
+        return base64.b64encode(bytes(self.registers)).decode("ascii")
+
+    @classmethod
+    def from_text(cls, value: str) -> HyperLogLog:
+        registers = bytearray(base64.b64decode(value))
+        return cls(precision=len(registers).bit_length() - 1, registers=registers)
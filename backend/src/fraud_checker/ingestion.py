@@ -4,6 +4,7 @@ import logging
 from datetime import date, datetime
 from typing import Iterable, Protocol
 
+from .job_control import raise_if_job_aborted, report_job_progress
 from .models import ClickLog, ConversionLog
 from .repository_pg import PostgresRepository
 
@@ -49,9 +50,11 @@ class ClickLogIngestor:
         page = 1
         all_clicks: list[ClickLog] = []
         while True:
+            raise_if_job_aborted()
             batch = list(self.client.fetch_click_logs(target_date, page, self.page_size))
             if not batch:
                 break
+            report_job_progress(pages_fetched=1, rows_fetched=len(batch))
             all_clicks.extend(batch)
             if len(batch) < self.page_size:
                 break
@@ -63,17 +66,23 @@ class ClickLogIngestor:
             return 0
 
         self.last_affected_dates = sorted({click.click_time.date() for click in all_clicks})
-        return self.repository.ingest_clicks(
+        ingested = self.repository.ingest_clicks(
             all_clicks, target_date=target_date, store_raw=self.store_raw
         )
+        report_job_progress(rows_merged=ingested)
+        return ingested
 
     def run_for_time_range(
         self, start_time: datetime, end_time: datetime
     ) -> tuple[int, int]:
+        return self.persist_time_range(self.fetch_for_time_range(start_time, end_time))
+
+    def fetch_for_time_range(self, start_time: datetime, end_time: datetime) -> list[ClickLog]:
         page = 1
         all_clicks: list[ClickLog] = []
 
         while True:
+            raise_if_job_aborted()
             batch = list(
                 self.client.fetch_click_logs_for_time_range(
                     start_time, end_time, page, self.page_size
@@ -81,6 +90,7 @@ class ClickLogIngestor:
             )
             if not batch:
                 break
+            report_job_progress(pages_fetched=1, rows_fetched=len(batch))
 
             filtered = [
                 click for click in batch if start_time <= click.click_time <= end_time
@@ -97,12 +107,16 @@ class ClickLogIngestor:
             start_time.isoformat(),
             end_time.isoformat(),
         )
+        return all_clicks
 
+    def persist_time_range(self, all_clicks: list[ClickLog]) -> tuple[int, int]:
+        """Merge fetched clicks; callers may pass any subset, e.g. one date at a time."""
         if not all_clicks:
             self.last_affected_dates = []
             return 0, 0
 
         new_count, skip_count = self.repository.merge_clicks(all_clicks, store_raw=self.store_raw)
+        report_job_progress(rows_merged=new_count)
         affected_dates = getattr(self.repository, "last_merged_click_dates", None)
         if isinstance(affected_dates, list):
             self.last_affected_dates = list(affected_dates)
@@ -130,11 +144,13 @@ class ConversionIngestor:
         page = 1
         all_conversions: list[ConversionLog] = []
         while True:
+            raise_if_job_aborted()
             batch = list(
                 self.client.fetch_conversion_logs(target_date, page, self.page_size)
             )
             if not batch:
                 break
+            report_job_progress(pages_fetched=1, rows_fetched=len(batch))
             all_conversions.extend(batch)
             if len(batch) < self.page_size:
                 break
@@ -163,16 +179,21 @@ class ConversionIngestor:
         total_count = self.repository.ingest_conversions(
             all_conversions, target_date=target_date
         )
+        report_job_progress(rows_merged=total_count)
         self.last_affected_dates = [target_date] if total_count > 0 else []
         return total_count, valid_entry_count, click_enriched_count
 
     def run_for_time_range(
         self, start_time: datetime, end_time: datetime
     ) -> tuple[int, int, int, int]:
+        return self.persist_time_range(self.fetch_for_time_range(start_time, end_time))
+
+    def fetch_for_time_range(self, start_time: datetime, end_time: datetime) -> list[ConversionLog]:
         page = 1
         all_conversions: list[ConversionLog] = []
 
         while True:
+            raise_if_job_aborted()
             batch = list(
                 self.client.fetch_conversion_logs_for_time_range(
                     start_time, end_time, page, self.page_size
@@ -180,6 +201,7 @@ class ConversionIngestor:
             )
             if not batch:
                 break
+            report_job_progress(pages_fetched=1, rows_fetched=len(batch))
 
             filtered = [
                 conversion
@@ -198,7 +220,10 @@ class ConversionIngestor:
             start_time.isoformat(),
             end_time.isoformat(),
         )
+        return all_conversions
 
+    def persist_time_range(self, all_conversions: list[ConversionLog]) -> tuple[int, int, int, int]:
+        """Enrich from click_raw and merge; the clicks these conversions point at must be committed."""
         if not all_conversions:
             self.last_affected_dates = []
             return 0, 0, 0, 0
@@ -210,6 +235,7 @@ class ConversionIngestor:
             self.repository.enrich_conversions_with_click_info(all_conversions)
         )
         new_count, skip_count = self.repository.merge_conversions(all_conversions)
+        report_job_progress(rows_merged=new_count)
         affected_dates = getattr(self.repository, "last_merged_conversion_dates", None)
         if isinstance(affected_dates, list):
             self.last_affected_dates = list(affected_dates)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+ABORT_LEASE_LOST = "lease_lost"
+ABORT_CANCELLED = "cancelled"
+
+
+class JobAbortedError(RuntimeError):
+    """Raised inside a job when its worker must stop early (lease lost or cancellation)."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"job aborted: {reason}")
+        self.reason = reason
+
+
+class JobControl:
+    """Per-run channel between a running job and the worker's heartbeat thread.
+
+    The job adds progress counters and checks the abort flag at its checkpoints; the heartbeat
+    thread drains changed progress into its next lease renewal and raises the flag when the
+    lease is lost or a cancellation was requested.
+    """
+
+    def __init__(self) -> None:
+        self.abort_reason: str | None = None
+        self._aborted = threading.Event()
+        self._lock = threading.Lock()
+        self._progress: dict[str, Any] = {}
+        self._dirty = False
+
+    @property
+    def aborted(self) -> bool:
+        return self._aborted.is_set()
+
+    def abort(self, reason: str) -> None:
+        if not self._aborted.is_set():
+            self.abort_reason = reason
+            self._aborted.set()
+
+    def report(self, **increments: Any) -> None:
+        # Numbers accumulate; anything else (a stage name, the current date) replaces.
+        with self._lock:
+            for key, value in increments.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    self._progress[key] = self._progress.get(key, 0) + value
+                else:
+                    self._progress[key] = value
+            self._dirty = True
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return dict(self._progress)
+
+    def take_progress(self) -> dict[str, Any] | None:
+        """Progress changed since the last call, or None; a failed write should `mark_dirty`."""
+        with self._lock:
+            if not self._dirty:
+                return None
+            self._dirty = False
+            return dict(self._progress)
+
+    def mark_dirty(self) -> None:
+        with self._lock:
+            self._dirty = True
+
+
+_current_job_control: ContextVar[JobControl | None] = ContextVar("job_control", default=None)
+
+
+@contextmanager
+def job_control_scope(control: JobControl):
+    """Bind `control` to the running job so long loops can report and check it cooperatively."""
+    token = _current_job_control.set(control)
+    try:
+        yield control
+    finally:
+        _current_job_control.reset(token)
+
+
+def report_job_progress(**increments: Any) -> None:
+    """Add to the running job's progress counters; a no-op outside a job scope.
+
+    Only updates memory: the heartbeat thread persists it with the next lease renewal.
+    """
+    control = _current_job_control.get()
+    if control is not None:
+        control.report(**increments)
+
+
+def raise_if_job_aborted() -> None:
+    """Checkpoint for long-running job code; a no-op outside a job scope."""
+    control = _current_job_control.get()
+    if control is not None and control.aborted:
+        raise JobAbortedError(control.abort_reason or ABORT_LEASE_LOST)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+JOB_QUEUE_COUNTER_TABLE = "job_queue_counters"
+# Readers fold the deltas themselves once the table holds more rows than this.
+QUEUE_COUNTER_COMPACT_ROWS = 1000
+
+
+def read_queue_counters(conn) -> tuple[dict[str, int], int]:
+    """Current job_runs row count per status, maintained by triggers on job_runs.
+
+    Triggers only append `(status, delta)` rows, so writers never contend on a shared counter
+    row; `compact_queue_counters` folds them back to one row per status. Also returns how many
+    delta rows the totals were summed from, so callers can tell when to compact.
+    """
+    rows = conn.execute(
+        sa.text(
+            """
+            SELECT status, SUM(job_count) AS job_count, COUNT(*) AS delta_rows
+            FROM job_queue_counters
+            GROUP BY status
+            """
+        )
+    ).mappings().all()
+    totals = {row["status"]: int(row["job_count"] or 0) for row in rows}
+    return totals, sum(int(row["delta_rows"] or 0) for row in rows)
+
+
+def compact_queue_counters(conn) -> None:
+    # Rows appended concurrently are outside the DELETE snapshot and survive for the next pass.
+    conn.execute(
+        sa.text(
+            """
+            WITH folded AS (
+                DELETE FROM job_queue_counters
+                RETURNING status, job_count
+            )
+            INSERT INTO job_queue_counters (status, job_count)
+            SELECT status, SUM(job_count)
+            FROM folded
+            GROUP BY status
+            HAVING SUM(job_count) <> 0
+            """
+        )
+    )
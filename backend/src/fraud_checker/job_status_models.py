@@ -48,3 +48,5 @@ class JobRun:
     locked_until: datetime | None
     worker_id: str | None
     concurrency_key: str | None = None
+    progress: dict[str, Any] | None = None
+    cancel_requested_at: datetime | None = None
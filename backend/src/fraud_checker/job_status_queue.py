@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 import json
+import logging
+import threading
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Callable, Mapping
 
 import sqlalchemy as sa
 from sqlalchemy.exc import IntegrityError
 
 import fraud_checker.db.models  # noqa: F401
 
+from .cache_versions import CACHE_VERSION_TABLE, bump_cache_version
+from .job_queue_counters import (
+    JOB_QUEUE_COUNTER_TABLE,
+    QUEUE_COUNTER_COMPACT_ROWS,
+    compact_queue_counters,
+    read_queue_counters,
+)
+from .job_scheduling import JOB_TYPE_CAPS_LOCK_KEY, SchedulingPolicy, resolve_scheduling_policy
 from .db import Base
 from .db.session import normalize_database_url
 from .job_status_models import (
@@ -23,15 +33,148 @@ from .job_status_models import (
 )
 from .time_utils import now_local
 
+logger = logging.getLogger(__name__)
+
+JOB_NOTIFY_CHANNEL = "fraud_checker_jobs"
+JOB_RUNS_HISTORY_TABLE = "job_runs_history"
+DEFAULT_ARCHIVE_BATCH_SIZE = 500
+JOB_RELEASED_NOTIFY_PAYLOAD = "released"
+# A holder whose lease lapsed (slow heartbeat, stalled DB) no longer blocks acquisition but may
+# still hold the advisory lock; the back-off keeps its waiters from spinning on lock failures.
+BLOCKED_RETRY_SECONDS = 2
+
+# A queued run is blocked while another run with the same concurrency key holds a live lease.
+CONCURRENCY_HOLDER_EXISTS_SQL = """
+    EXISTS (
+        SELECT 1
+        FROM job_runs holder
+        WHERE holder.status = 'running'
+          AND holder.concurrency_key = job_runs.concurrency_key
+          AND (holder.locked_until IS NULL OR holder.locked_until >= :now)
+    )
+"""
+
+# Turns a pending rerun request on a finished run into one queued follow-up, in the same transaction.
+FOLLOW_UP_RERUN_SQL = """
+    INSERT INTO job_runs (
+        id, job_type, status, params_json, message,
+        attempt_count, max_attempts, next_retry_at, dedupe_key, priority, concurrency_key, queued_at, effective_at
+    )
+    SELECT :follow_up_id, job_type, 'queued', COALESCE(rerun_params_json, params_json),
+           job_type || ' rerun requested while running',
+           0, max_attempts, rerun_not_before, dedupe_key, priority, concurrency_key, :now, :effective_at
+    FROM job_runs
+    WHERE id = :run_id
+      AND rerun_not_before IS NOT NULL
+"""
+
+_RUN_RETURNING_COLUMNS = """
+    id, job_type, status, params_json, result_json, error_message, message,
+    attempt_count, max_attempts, next_retry_at, dedupe_key, priority, concurrency_key,
+    queued_at, started_at, finished_at, heartbeat_at, locked_until, worker_id,
+    progress_json, cancel_requested_at
+"""
+
+
+_ARCHIVE_COLUMNS = (
+    "id, job_type, status, params_json, result_json, error_message, message, "
+    "attempt_count, max_attempts, next_retry_at, dedupe_key, priority, concurrency_key, "
+    "queued_at, started_at, finished_at, heartbeat_at, locked_until, worker_id, "
+    "rerun_not_before, rerun_params_json, progress_json, cancel_requested_at"
+)
+
 
 class JobStatusQueueStore:
     def __init__(self, database_url: str):
         self.database_url = normalize_database_url(database_url)
         self.engine = sa.create_engine(self.database_url, pool_pre_ping=True)
+        self._has_cache_versions: bool | None = None
+        self._has_history: bool | None = None
+        self._has_queue_counters: bool | None = None
+        self._policy: SchedulingPolicy | None = None
 
     def ensure_schema(self) -> None:
         Base.metadata.create_all(self.engine, tables=[Base.metadata.tables["job_runs"]])
 
+    def _cache_versions_enabled(self) -> bool:
+        # Terminal job transitions invalidate cached reporting reads when the counter table exists.
+        if getattr(self, "_has_cache_versions", None) is None:
+            try:
+                self._has_cache_versions = sa.inspect(self.engine).has_table(CACHE_VERSION_TABLE)
+            except Exception:
+                self._has_cache_versions = False
+        return self._has_cache_versions
+
+    def _history_enabled(self) -> bool:
+        # Finished runs move to job_runs_history once archived; reads by id or recency fall back to it.
+        if getattr(self, "_has_history", None) is None:
+            try:
+                self._has_history = sa.inspect(self.engine).has_table(JOB_RUNS_HISTORY_TABLE)
+            except Exception:
+                self._has_history = False
+        return self._has_history
+
+    def _queue_counters_enabled(self) -> bool:
+        # The counters are trigger-maintained, and the triggers only exist on Postgres.
+        if getattr(self, "_has_queue_counters", None) is None:
+            try:
+                self._has_queue_counters = self._notify_enabled() and sa.inspect(self.engine).has_table(
+                    JOB_QUEUE_COUNTER_TABLE
+                )
+            except Exception:
+                self._has_queue_counters = False
+        return self._has_queue_counters
+
+    def _scheduling_policy(self) -> SchedulingPolicy:
+        if getattr(self, "_policy", None) is None:
+            self._policy = resolve_scheduling_policy()
+        return self._policy
+
+    def _serialize_capped_acquisition(self, conn, policy: SchedulingPolicy) -> None:
+        # Without this, two workers could each count one slot free and both take it. Held only
+        # until the acquiring statement commits.
+        if policy.type_caps and self._notify_enabled():
+            conn.execute(
+                sa.text("SELECT pg_advisory_xact_lock(hashtext(:lock_key))"),
+                {"lock_key": JOB_TYPE_CAPS_LOCK_KEY},
+            )
+
+    def _run_tables(self) -> list[str]:
+        return ["job_runs", JOB_RUNS_HISTORY_TABLE] if self._history_enabled() else ["job_runs"]
+
+    def _notify_enabled(self) -> bool:
+        return getattr(getattr(self.engine, "dialect", None), "name", None) == "postgresql"
+
+    def _notify_job_available(self, conn, payload: str) -> None:
+        # NOTIFY is delivered on commit, so listeners never wake before the row is visible.
+        if self._notify_enabled():
+            conn.execute(
+                sa.text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": JOB_NOTIFY_CHANNEL, "payload": payload},
+            )
+
+    def listen_for_jobs(
+        self,
+        on_notify: Callable[[], None],
+        stop_event: threading.Event,
+        *,
+        timeout_seconds: float = 1.0,
+    ) -> None:
+        """Block until `stop_event` is set, calling `on_notify` for every enqueue notification."""
+        if not self._notify_enabled():
+            return
+        raw = self.engine.raw_connection()
+        try:
+            driver = raw.driver_connection
+            driver.autocommit = True
+            driver.execute(f"LISTEN {JOB_NOTIFY_CHANNEL}")
+            while not stop_event.is_set():
+                for _notify in driver.notifies(timeout=timeout_seconds, stop_after=1):
+                    on_notify()
+        finally:
+            # Never hand a LISTENing autocommit session back to the pool.
+            raw.invalidate()
+
     def _loads(self, value: str | None) -> dict[str, Any] | None:
         if not value:
             return None
@@ -63,39 +206,44 @@ class JobStatusQueueStore:
             heartbeat_at=row.get("heartbeat_at"),
             locked_until=row.get("locked_until"),
             worker_id=row.get("worker_id"),
+            progress=self._loads(row.get("progress_json")),
+            cancel_requested_at=row.get("cancel_requested_at"),
         )
 
     def _fetch_latest_run(self) -> JobRun | None:
-        with self.engine.begin() as conn:
-            row = conn.execute(
-                sa.text(
-                    """
-                    SELECT id, job_type, status, params_json, result_json, error_message, message,
-                           attempt_count, max_attempts, next_retry_at, dedupe_key, priority, concurrency_key,
-                           queued_at, started_at, finished_at, heartbeat_at, locked_until, worker_id
-                    FROM job_runs
-                    ORDER BY COALESCE(finished_at, started_at, queued_at) DESC, queued_at DESC
-                    LIMIT 1
-                    """
-                )
-            ).mappings().first()
-        return self._to_run(row) if row else None
+        # The hot table always holds the newest run unless everything has been archived.
+        for table_name in self._run_tables():
+            with self.engine.begin() as conn:
+                row = conn.execute(
+                    sa.text(
+                        f"""
+                        SELECT {_RUN_RETURNING_COLUMNS}
+                        FROM {table_name}
+                        ORDER BY COALESCE(finished_at, started_at, queued_at) DESC, queued_at DESC
+                        LIMIT 1
+                        """
+                    )
+                ).mappings().first()
+            if row:
+                return self._to_run(row)
+        return None
 
     def get_by_id(self, run_id: str) -> JobRun | None:
-        with self.engine.begin() as conn:
-            row = conn.execute(
-                sa.text(
-                    """
-                    SELECT id, job_type, status, params_json, result_json, error_message, message,
-                           attempt_count, max_attempts, next_retry_at, dedupe_key, priority, concurrency_key,
-                           queued_at, started_at, finished_at, heartbeat_at, locked_until, worker_id
-                    FROM job_runs
-                    WHERE id = :run_id
-                    """
-                ),
-                {"run_id": run_id},
-            ).mappings().first()
-        return self._to_run(row) if row else None
+        for table_name in self._run_tables():
+            with self.engine.begin() as conn:
+                row = conn.execute(
+                    sa.text(
+                        f"""
+                        SELECT {_RUN_RETURNING_COLUMNS}
+                        FROM {table_name}
+                        WHERE id = :run_id
+                        """
+                    ),
+                    {"run_id": run_id},
+                ).mappings().first()
+            if row:
+                return self._to_run(row)
+        return None
 
     def get_latest_run(self) -> JobRun | None:
         return self._fetch_latest_run()
@@ -154,10 +302,12 @@ class JobStatusQueueStore:
                     """
                     INSERT INTO job_runs (
                         id, job_type, status, params_json, message,
-                        attempt_count, max_attempts, next_retry_at, dedupe_key, priority, concurrency_key, queued_at
+                        attempt_count, max_attempts, next_retry_at, dedupe_key, priority, concurrency_key,
+                        queued_at, effective_at
                     ) VALUES (
                         :id, :job_type, 'queued', :params_json, :message,
-                        0, :max_attempts, NULL, :dedupe_key, :priority, :concurrency_key, :queued_at
+                        0, :max_attempts, NULL, :dedupe_key, :priority, :concurrency_key,
+                        :queued_at, :effective_at
                     )
                     """
                 ),
@@ -171,8 +321,10 @@ class JobStatusQueueStore:
                     "priority": priority,
                     "concurrency_key": concurrency_key,
                     "queued_at": queued_at,
+                    "effective_at": self._scheduling_policy().effective_at(priority, queued_at),
                 },
             )
+            self._notify_job_available(conn, job_type)
         return JobRun(
             id=run_id,
             job_type=job_type,
@@ -202,11 +354,26 @@ class JobStatusQueueStore:
                 sa.text(
                     """
                     UPDATE job_runs
-                    SET status = 'queued',
-                        message = COALESCE(message, job_type) || ' (lease recovered)',
+                    SET status = CASE WHEN cancel_requested_at IS NULL THEN 'queued' ELSE 'cancelled' END,
+                        message = COALESCE(message, job_type) || CASE
+                            WHEN cancel_requested_at IS NULL THEN ' (lease recovered)'
+                            ELSE ' (cancelled after lease expired)'
+                        END,
+                        finished_at = CASE WHEN cancel_requested_at IS NULL THEN finished_at ELSE :now END,
                         worker_id = NULL,
                         locked_until = NULL,
-                        next_retry_at = COALESCE(next_retry_at, :now)
+                        next_retry_at = CASE
+                            WHEN cancel_requested_at IS NULL THEN COALESCE(next_retry_at, :now)
+                            ELSE NULL
+                        END,
+                        -- Like a retry, the requeued run re-reads current data and carries a pending
+                        -- rerun's params, so the coalesced request is satisfied rather than dropped.
+                        params_json = CASE
+                            WHEN cancel_requested_at IS NULL THEN COALESCE(rerun_params_json, params_json)
+                            ELSE params_json
+                        END,
+                        rerun_not_before = NULL,
+                        rerun_params_json = NULL
                     WHERE status = 'running'
                       AND locked_until IS NOT NULL
                       AND locked_until < :now
@@ -216,20 +383,32 @@ class JobStatusQueueStore:
             )
         return int(result.rowcount or 0)
 
-    def acquire_next(self, *, worker_id: str, lease_seconds: int) -> JobRun | None:
-        self.recover_stale_runs()
+    def acquire_next(
+        self,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+        recover_stale: bool = True,
+    ) -> JobRun | None:
+        # Long-running workers recover stale leases on their own timer instead of per acquisition.
+        if recover_stale:
+            self.recover_stale_runs()
         now = now_local()
         locked_until = now + timedelta(seconds=lease_seconds)
+        policy = self._scheduling_policy()
         with self.engine.begin() as conn:
+            self._serialize_capped_acquisition(conn, policy)
             row = conn.execute(
                 sa.text(
-                    """
+                    f"""
                     WITH candidate AS (
                         SELECT id
                         FROM job_runs
                         WHERE status = 'queued'
                           AND (next_retry_at IS NULL OR next_retry_at <= :now)
-                        ORDER BY priority ASC, queued_at ASC
+                          AND (concurrency_key IS NULL OR NOT {CONCURRENCY_HOLDER_EXISTS_SQL})
+                          {policy.cap_filter_sql()}
+                        ORDER BY {policy.order_by_sql()}
                         LIMIT 1
                         FOR UPDATE SKIP LOCKED
                     )
@@ -240,15 +419,103 @@ class JobStatusQueueStore:
                         locked_until = :locked_until,
                         worker_id = :worker_id
                     WHERE id IN (SELECT id FROM candidate)
-                    RETURNING id, job_type, status, params_json, result_json, error_message, message,
-                              attempt_count, max_attempts, next_retry_at, dedupe_key, priority, concurrency_key,
-                              queued_at, started_at, finished_at, heartbeat_at, locked_until, worker_id
+                    RETURNING {_RUN_RETURNING_COLUMNS}
                     """
                 ),
-                {"now": now, "locked_until": locked_until, "worker_id": worker_id},
+                {"now": now, "locked_until": locked_until, "worker_id": worker_id, **policy.sql_params()},
             ).mappings().first()
         return self._to_run(row) if row else None
 
+    def acquire_batch(
+        self,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+        job_type: str,
+        limit: int,
+        recover_stale: bool = True,
+    ) -> list[JobRun]:
+        """Lease up to `limit` queued runs of one type in a single statement.
+
+        Runs in a batch never share a concurrency key, so the caller can hold all of their
+        advisory locks at once. Attempt accounting is untouched; each run still fails or
+        retries on its own.
+        """
+        if limit <= 0:
+            return []
+        if recover_stale:
+            self.recover_stale_runs()
+        now = now_local()
+        locked_until = now + timedelta(seconds=lease_seconds)
+        policy = self._scheduling_policy()
+        with self.engine.begin() as conn:
+            self._serialize_capped_acquisition(conn, policy)
+            cap = policy.type_caps.get(job_type)
+            if cap is not None:
+                running = conn.execute(
+                    sa.text(
+                        """
+                        SELECT COUNT(*)
+                        FROM job_runs
+                        WHERE status = 'running'
+                          AND job_type = :job_type
+                          AND (locked_until IS NULL OR locked_until >= :now)
+                        """
+                    ),
+                    {"job_type": job_type, "now": now},
+                ).scalar_one()
+                limit = min(limit, cap - int(running or 0))
+                if limit <= 0:
+                    return []
+            rows = conn.execute(
+                sa.text(
+                    f"""
+                    WITH locked AS (
+                        SELECT id, concurrency_key, priority, queued_at, effective_at
+                        FROM job_runs
+                        WHERE status = 'queued'
+                          AND job_type = :job_type
+                          AND (next_retry_at IS NULL OR next_retry_at <= :now)
+                          AND (concurrency_key IS NULL OR NOT {CONCURRENCY_HOLDER_EXISTS_SQL})
+                        ORDER BY {policy.order_by_sql()}
+                        LIMIT :scan_limit
+                        FOR UPDATE SKIP LOCKED
+                    ),
+                    candidate AS (
+                        SELECT id
+                        FROM (
+                            SELECT DISTINCT ON (COALESCE(concurrency_key, id)) id, priority, queued_at, effective_at
+                            FROM locked
+                            ORDER BY COALESCE(concurrency_key, id), {policy.order_by_sql()}
+                        ) distinct_keys
+                        ORDER BY {policy.order_by_sql()}
+                        LIMIT :limit
+                    )
+                    UPDATE job_runs
+                    SET status = 'running',
+                        started_at = COALESCE(started_at, :now),
+                        heartbeat_at = :now,
+                        locked_until = :locked_until,
+                        worker_id = :worker_id
+                    WHERE id IN (SELECT id FROM candidate)
+                    RETURNING {_RUN_RETURNING_COLUMNS}
+                    """
+                ),
+                {
+                    "now": now,
+                    "locked_until": locked_until,
+                    "worker_id": worker_id,
+                    "job_type": job_type,
+                    "limit": limit,
+                    # Same-key duplicates are dropped after locking, so scan a little past the limit.
+                    "scan_limit": limit * 4,
+                    **policy.sql_params(),
+                },
+            ).mappings().all()
+        runs = [self._to_run(row) for row in rows]
+        runs.sort(key=lambda run: policy.sort_key(run.priority, run.queued_at))
+        return runs
+
     def heartbeat(self, *, run_id: str, worker_id: str, lease_seconds: int) -> bool:
         now = now_local()
         with self.engine.begin() as conn:
@@ -272,8 +539,122 @@ class JobStatusQueueStore:
             )
         return result.rowcount == 1
 
-    def requeue_blocked(self, run_id: str, message: str, *, delay_seconds: int = 15) -> None:
-        retry_at = now_local() + timedelta(seconds=max(1, int(delay_seconds)))
+    def heartbeat_many(
+        self,
+        *,
+        run_ids: list[str],
+        worker_id: str,
+        lease_seconds: int,
+        progress: dict[str, dict[str, Any]] | None = None,
+    ) -> dict[str, bool]:
+        """Extend every lease this worker still owns in one statement.
+
+        Pending progress snapshots ride along on the same update. Returns the renewed ids,
+        each mapped to whether a cancellation has been requested for that run.
+        """
+        if not run_ids:
+            return {}
+        progress = progress or {}
+        now = now_local()
+        with self.engine.begin() as conn:
+            rows = conn.execute(
+                sa.text(
+                    """
+                    UPDATE job_runs
+                    SET heartbeat_at = :now,
+                        locked_until = :locked_until,
+                        progress_json = COALESCE(beat.progress_json, job_runs.progress_json)
+                    FROM unnest(CAST(:run_ids AS text[]), CAST(:progress AS text[])) AS beat(id, progress_json)
+                    WHERE job_runs.id = beat.id
+                      AND job_runs.status = 'running'
+                      AND job_runs.worker_id = :worker_id
+                    RETURNING job_runs.id, job_runs.cancel_requested_at IS NOT NULL AS cancel_requested
+                    """
+                ),
+                {
+                    "run_ids": list(run_ids),
+                    "progress": [self._dumps(progress.get(run_id)) for run_id in run_ids],
+                    "worker_id": worker_id,
+                    "now": now,
+                    "locked_until": now + timedelta(seconds=lease_seconds),
+                },
+            ).all()
+        return {row[0]: bool(row[1]) for row in rows}
+
+    def request_cancel(self, run_id: str, message: str) -> str | None:
+        """Cancel a queued run outright, or flag a running one for cooperative cancellation.
+
+        Returns the run's status after the request, or None when it had already finished.
+        The worker running a flagged run sees the flag on its next heartbeat and stops at
+        the job's next checkpoint.
+        """
+        now = now_local()
+        with self.engine.begin() as conn:
+            row = conn.execute(
+                sa.text(
+                    """
+                    UPDATE job_runs
+                    SET status = CASE WHEN status = 'queued' THEN 'cancelled' ELSE status END,
+                        finished_at = CASE WHEN status = 'queued' THEN :now ELSE finished_at END,
+                        next_retry_at = CASE WHEN status = 'queued' THEN NULL ELSE next_retry_at END,
+                        cancel_requested_at = COALESCE(cancel_requested_at, :now),
+                        message = :message
+                    WHERE id = :run_id
+                      AND status IN ('queued', 'running')
+                    RETURNING status
+                    """
+                ),
+                {"run_id": run_id, "message": message, "now": now},
+            ).first()
+        return row[0] if row is not None else None
+
+    def request_rerun(self, run_id: str, *, params: dict[str, Any] | None, not_before: datetime) -> bool:
+        """Flag a running run for one follow-up; False when it is no longer running.
+
+        Repeated requests only move the debounce deadline and keep the latest params, so any
+        number of them collapse into a single follow-up queued when the run finishes.
+        """
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                sa.text(
+                    """
+                    UPDATE job_runs
+                    SET rerun_not_before = :not_before,
+                        rerun_params_json = :params_json
+                    WHERE id = :run_id
+                      AND status = 'running'
+                    """
+                ),
+                {"run_id": run_id, "not_before": not_before, "params_json": self._dumps(params)},
+            )
+        return result.rowcount == 1
+
+    def _enqueue_follow_up(self, conn, run_ids: list[str], now: datetime) -> None:
+        pending = conn.execute(
+            sa.text(
+                "SELECT id, priority FROM job_runs WHERE id IN :run_ids AND rerun_not_before IS NOT NULL"
+            ).bindparams(sa.bindparam("run_ids", expanding=True)),
+            {"run_ids": run_ids},
+        ).all()
+        if not pending:
+            return
+        policy = self._scheduling_policy()
+        conn.execute(
+            sa.text(FOLLOW_UP_RERUN_SQL),
+            [
+                {
+                    "follow_up_id": uuid.uuid4().hex,
+                    "run_id": run_id,
+                    "now": now,
+                    "effective_at": policy.effective_at(priority, now),
+                }
+                for run_id, priority in pending
+            ],
+        )
+
+    def requeue_blocked(self, run_id: str, message: str, *, delay_seconds: int = BLOCKED_RETRY_SECONDS) -> None:
+        now = now_local()
+        retry_at = now + timedelta(seconds=max(0, int(delay_seconds))) if delay_seconds else None
         with self.engine.begin() as conn:
             conn.execute(
                 sa.text(
@@ -283,12 +664,12 @@ class JobStatusQueueStore:
                         message = :message,
                         worker_id = NULL,
                         locked_until = NULL,
-                        heartbeat_at = :retry_at,
+                        heartbeat_at = :now,
                         next_retry_at = :retry_at
                     WHERE id = :run_id
                     """
                 ),
-                {"run_id": run_id, "message": message, "retry_at": retry_at},
+                {"run_id": run_id, "message": message, "now": now, "retry_at": retry_at},
             )
 
     def complete(self, run_id: str, message: str, result: dict[str, Any] | None = None) -> None:
@@ -316,6 +697,46 @@ class JobStatusQueueStore:
                     "finished_at": finished_at,
                 },
             )
+            self._enqueue_follow_up(conn, [run_id], finished_at)
+            if self._cache_versions_enabled():
+                bump_cache_version(conn)
+            self._notify_job_available(conn, JOB_RELEASED_NOTIFY_PAYLOAD)
+
+    def complete_many(self, completions: list[tuple[str, str, dict[str, Any] | None]]) -> None:
+        """Mark several `(run_id, message, result)` runs succeeded in one transaction."""
+        if not completions:
+            return
+        finished_at = now_local()
+        with self.engine.begin() as conn:
+            conn.execute(
+                sa.text(
+                    """
+                    UPDATE job_runs
+                    SET status = 'succeeded',
+                        message = :message,
+                        result_json = :result_json,
+                        error_message = NULL,
+                        finished_at = :finished_at,
+                        heartbeat_at = :finished_at,
+                        locked_until = NULL,
+                        next_retry_at = NULL
+                    WHERE id = :run_id
+                    """
+                ),
+                [
+                    {
+                        "run_id": run_id,
+                        "message": message,
+                        "result_json": self._dumps(result),
+                        "finished_at": finished_at,
+                    }
+                    for run_id, message, result in completions
+                ],
+            )
+            self._enqueue_follow_up(conn, [run_id for run_id, _message, _result in completions], finished_at)
+            if self._cache_versions_enabled():
+                bump_cache_version(conn)
+            self._notify_job_available(conn, JOB_RELEASED_NOTIFY_PAYLOAD)
 
     def fail(
         self,
@@ -354,7 +775,13 @@ class JobStatusQueueStore:
                         heartbeat_at = :heartbeat_at,
                         locked_until = NULL,
                         worker_id = NULL,
-                        next_retry_at = :next_retry_at
+                        next_retry_at = :next_retry_at,
+                        params_json = CASE
+                            WHEN :status = 'queued' THEN COALESCE(rerun_params_json, params_json)
+                            ELSE params_json
+                        END,
+                        rerun_not_before = CASE WHEN :status = 'queued' THEN NULL ELSE rerun_not_before END,
+                        rerun_params_json = CASE WHEN :status = 'queued' THEN NULL ELSE rerun_params_json END
                     WHERE id = :run_id
                     """
                 ),
@@ -370,6 +797,13 @@ class JobStatusQueueStore:
                     "next_retry_at": next_retry_at,
                 },
             )
+            # A retry re-reads current data and satisfies the rerun request; a terminal failure
+            # still owes the caller one pass over the newer data.
+            if next_status == "failed":
+                self._enqueue_follow_up(conn, [run_id], finished_at)
+            if next_status == "failed" and self._cache_versions_enabled():
+                bump_cache_version(conn)
+            self._notify_job_available(conn, JOB_RELEASED_NOTIFY_PAYLOAD)
         return next_status
 
     def cancel(self, run_id: str, message: str) -> None:
@@ -390,24 +824,30 @@ class JobStatusQueueStore:
                 ),
                 {"run_id": run_id, "message": message, "finished_at": finished_at},
             )
+            self._notify_job_available(conn, JOB_RELEASED_NOTIFY_PAYLOAD)
 
     def get_latest_successful_finished_at(self, job_types: list[str]) -> datetime | None:
         if not job_types:
             return None
         placeholders = ", ".join(f":job_type_{idx}" for idx in range(len(job_types)))
         params = {f"job_type_{idx}": job_type for idx, job_type in enumerate(job_types)}
+        latest: datetime | None = None
         with self.engine.begin() as conn:
-            return conn.execute(
-                sa.text(
-                    f"""
-                    SELECT MAX(finished_at)
-                    FROM job_runs
-                    WHERE status = 'succeeded'
-                      AND job_type IN ({placeholders})
-                    """
-                ),
-                params,
-            ).scalar_one()
+            for table_name in self._run_tables():
+                finished_at = conn.execute(
+                    sa.text(
+                        f"""
+                        SELECT MAX(finished_at)
+                        FROM {table_name}
+                        WHERE status = 'succeeded'
+                          AND job_type IN ({placeholders})
+                        """
+                    ),
+                    params,
+                ).scalar_one()
+                if finished_at is not None and (latest is None or finished_at > latest):
+                    latest = finished_at
+        return latest
 
     def purge_finished_runs_before(self, cutoff: datetime, *, execute: bool) -> int:
         params = {"cutoff": cutoff}
@@ -416,26 +856,98 @@ class JobStatusQueueStore:
             "AND finished_at IS NOT NULL "
             "AND finished_at < :cutoff"
         )
+        total = 0
+        with self.engine.begin() as conn:
+            for table_name in self._run_tables():
+                if execute:
+                    result = conn.execute(sa.text(f"DELETE FROM {table_name} WHERE {where_sql}"), params)
+                    total += int(result.rowcount or 0)
+                else:
+                    total += int(
+                        conn.execute(sa.text(f"SELECT COUNT(*) FROM {table_name} WHERE {where_sql}"), params).scalar_one()
+                    )
         if execute:
+            self.compact_counters()
+        return total
+
+    def compact_counters(self) -> bool:
+        """Fold the trigger-appended counter deltas into one row per status.
+
+        Safe to run from any process at any time; the archive daemon, the purge command and
+        oversized metric reads all call it, so the table stays small without the daemon.
+        """
+        if not self._queue_counters_enabled():
+            return False
+        with self.engine.begin() as conn:
+            compact_queue_counters(conn)
+        return True
+
+    def archive_finished_runs(self, cutoff: datetime, *, batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE) -> int:
+        """Move runs that finished before `cutoff` into job_runs_history, in short batches.
+
+        Keeps job_runs down to the active queue plus recent history, whatever the retention.
+        Also folds the queue counter deltas, so housekeeping bounds both tables.
+        """
+        if not self._history_enabled():
+            return 0
+        moved = 0
+        while True:
             with self.engine.begin() as conn:
                 result = conn.execute(
-                    sa.text(f"DELETE FROM job_runs WHERE {where_sql}"),
-                    params,
+                    sa.text(
+                        f"""
+                        WITH archived AS (
+                            DELETE FROM job_runs
+                            WHERE id IN (
+                                SELECT id
+                                FROM job_runs
+                                WHERE status IN ('succeeded', 'failed', 'cancelled')
+                                  AND finished_at IS NOT NULL
+                                  AND finished_at < :cutoff
+                                ORDER BY finished_at ASC
+                                LIMIT :batch_size
+                                FOR UPDATE SKIP LOCKED
+                            )
+                            RETURNING {_ARCHIVE_COLUMNS}
+                        )
+                        INSERT INTO job_runs_history ({_ARCHIVE_COLUMNS}, archived_at)
+                        SELECT {_ARCHIVE_COLUMNS}, :archived_at
+                        FROM archived
+                        ON CONFLICT (id) DO NOTHING
+                        """
+                    ),
+                    {"cutoff": cutoff, "batch_size": batch_size, "archived_at": now_local()},
                 )
-            return int(result.rowcount or 0)
-        with self.engine.begin() as conn:
-            count = conn.execute(
-                sa.text(f"SELECT COUNT(*) FROM job_runs WHERE {where_sql}"),
-                params,
-            ).scalar_one()
-        return int(count)
+            batch = int(result.rowcount or 0)
+            moved += batch
+            if batch < batch_size:
+                break
+        self.compact_counters()
+        return moved
 
     def get_queue_metrics(self) -> dict[str, Any]:
         now = now_local()
+        # With trigger-maintained counters, status totals come from the counters and the
+        # time-dependent figures only scan the active rows through the partial indexes.
+        use_counters = self._queue_counters_enabled()
+        active_filter = "WHERE status IN ('queued', 'running')" if use_counters else ""
+        counters: dict[str, int] = {}
+        counter_rows = 0
+        archived_failed_count = 0
         with self.engine.begin() as conn:
+            if use_counters:
+                counters, counter_rows = read_queue_counters(conn)
+            if self._history_enabled():
+                # Failures stay counted after archiving, until the retention purge removes them.
+                archived_failed_count = int(
+                    conn.execute(
+                        sa.text(f"SELECT COUNT(*) FROM {JOB_RUNS_HISTORY_TABLE} WHERE status = 'failed'")
+                    ).scalar_one()
+                    or 0
+                )
             row = conn.execute(
                 sa.text(
-                    """
+                    f"""
                     SELECT
                         COUNT(*) FILTER (WHERE status = 'queued') AS queued_jobs_count,
                         COUNT(*) FILTER (
@@ -448,46 +960,84 @@ class JobStatusQueueStore:
                               AND (locked_until IS NULL OR locked_until >= :now)
                         ) AS running_jobs_count,
                         COUNT(*) FILTER (WHERE status = 'failed') AS failed_jobs_count,
-                        MIN(queued_at) FILTER (WHERE status = 'queued') AS oldest_queued_at
+                        MIN(queued_at) FILTER (WHERE status = 'queued') AS oldest_queued_at,
+                        COUNT(*) FILTER (
+                            WHERE status = 'queued'
+                              AND concurrency_key IS NOT NULL
+                              AND {CONCURRENCY_HOLDER_EXISTS_SQL}
+                        ) AS blocked_jobs_count,
+                        MIN(queued_at) FILTER (
+                            WHERE status = 'queued'
+                              AND concurrency_key IS NOT NULL
+                              AND {CONCURRENCY_HOLDER_EXISTS_SQL}
+                        ) AS oldest_blocked_queued_at
                     FROM job_runs
+                    {active_filter}
                     """
                 ),
                 {"now": now},
             ).mappings().one()
+        if counter_rows > QUEUE_COUNTER_COMPACT_ROWS:
+            try:
+                self.compact_counters()
+            except Exception:
+                logger.exception("Failed to compact job queue counters")
         oldest_queued_at = row["oldest_queued_at"]
         oldest_queued_age_seconds = None
         if oldest_queued_at is not None:
             oldest_queued_age_seconds = int((now - oldest_queued_at).total_seconds())
+        oldest_blocked_queued_at = row.get("oldest_blocked_queued_at")
+        oldest_blocked_age_seconds = None
+        if oldest_blocked_queued_at is not None:
+            oldest_blocked_age_seconds = int((now - oldest_blocked_queued_at).total_seconds())
+        if use_counters:
+            queued_jobs_count = counters.get("queued", 0)
+            failed_jobs_count = counters.get("failed", 0)
+        else:
+            queued_jobs_count = int(row["queued_jobs_count"] or 0)
+            failed_jobs_count = int(row["failed_jobs_count"] or 0)
         return {
-            "queued_jobs_count": int(row["queued_jobs_count"] or 0),
+            "queued_jobs_count": queued_jobs_count,
             "retry_scheduled_jobs_count": int(row["retry_scheduled_jobs_count"] or 0),
             "running_jobs_count": int(row["running_jobs_count"] or 0),
-            "failed_jobs_count": int(row["failed_jobs_count"] or 0),
+            "failed_jobs_count": failed_jobs_count + archived_failed_count,
             "oldest_queued_at": oldest_queued_at,
             "oldest_queued_age_seconds": oldest_queued_age_seconds,
+            "blocked_jobs_count": int(row.get("blocked_jobs_count") or 0),
+            "oldest_blocked_age_seconds": oldest_blocked_age_seconds,
         }
 
     def list_recent_failed_runs(self, *, limit: int = 3) -> list[dict[str, Any]]:
-        with self.engine.begin() as conn:
-            rows = conn.execute(
-                sa.text(
-                    """
-                    SELECT id, job_type, message, error_message, finished_at
-                    FROM job_runs
-                    WHERE status = 'failed'
-                    ORDER BY CASE WHEN finished_at IS NULL THEN 1 ELSE 0 END, finished_at DESC, queued_at DESC
-                    LIMIT :limit
-                    """
-                ),
-                {"limit": max(1, int(limit))},
-            ).mappings().all()
+        # Archiving moves the oldest finished runs, so history only fills what the hot table lacks.
+        limit = max(1, int(limit))
+        rows: list[Mapping[str, Any]] = []
+        for table_name in self._run_tables():
+            with self.engine.begin() as conn:
+                rows.extend(
+                    conn.execute(
+                        sa.text(
+                            f"""
+                            SELECT id, job_type, message, error_message, finished_at
+                            FROM {table_name}
+                            WHERE status = 'failed'
+                            ORDER BY CASE WHEN finished_at IS NULL THEN 1 ELSE 0 END, finished_at DESC, queued_at DESC
+                            LIMIT :limit
+                            """
+                        ),
+                        {"limit": limit - len(rows)},
+                    ).mappings().all()
+                )
+            if len(rows) >= limit:
+                break
         return [
             {
                 "job_id": row["id"],
                 "job_type": row.get("job_type"),
                 "message": row.get("message"),
                 "error_message": row.get("error_message"),
-                "finished_at": row.get("finished_at").isoformat() if row.get("finished_at") else None,
+                "finished_at": (
+                    row["finished_at"].isoformat() if isinstance(row.get("finished_at"), datetime) else row.get("finished_at")
+                ),
             }
             for row in rows
         ]
@@ -516,6 +1066,32 @@ class JobStatusQueueStore:
                 )
             conn.close()
 
+    @contextmanager
+    def advisory_locks(self, concurrency_keys: list[str | None]):
+        """Try every key's advisory lock on one session; yields the set of keys that were acquired."""
+        keys = sorted({key for key in concurrency_keys if key})
+        if not keys:
+            yield set()
+            return
+
+        conn = self.engine.connect()
+        acquired: set[str] = set()
+        try:
+            for key in keys:
+                if conn.execute(
+                    sa.text("SELECT pg_try_advisory_lock(hashtext(:concurrency_key))"),
+                    {"concurrency_key": key},
+                ).scalar_one():
+                    acquired.add(key)
+            yield acquired
+        finally:
+            for key in acquired:
+                conn.execute(
+                    sa.text("SELECT pg_advisory_unlock(hashtext(:concurrency_key))"),
+                    {"concurrency_key": key},
+                )
+            conn.close()
+
     def _get_attempt_state(self, run_id: str) -> dict[str, int]:
         with self.engine.begin() as conn:
             row = conn.execute(
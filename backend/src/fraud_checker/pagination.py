@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Mapping, Sequence
+
+CURSOR_VERSION = 1
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    payload = {
+        "v": CURSOR_VERSION,
+        "sort": sort,
+        "values": [value.isoformat() if hasattr(value, "isoformat") else value for value in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *, sort: str, kinds: Sequence[str]) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+    if not isinstance(payload, Mapping) or payload.get("v") != CURSOR_VERSION:
+        raise ValueError("Invalid pagination cursor")
+    if payload.get("sort") != sort:
+        raise ValueError("Pagination cursor does not match the requested sort")
+    values = payload.get("values")
+    if not isinstance(values, list) or len(values) != len(kinds):
+        raise ValueError("Invalid pagination cursor")
+    try:
+        return [_coerce_value(kind, value) for kind, value in zip(kinds, values)]
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+def keyset_predicate(columns: Sequence[tuple[str, str]], *, prefix: str = "cursor_") -> str:
+    """Build a seek predicate the planner can use as an index condition.
+
+    One direction throughout becomes a row-value comparison. Mixed ASC/DESC orderings expand to
+    an OR chain, ANDed with a redundant bound on the leading column so the index scan starts at
+    the cursor instead of filtering every row ahead of it.
+    """
+    directions = {direction.upper() for _expr, direction in columns}
+    if len(directions) == 1:
+        operator = "<" if directions.pop() == "DESC" else ">"
+        exprs = ", ".join(expr for expr, _direction in columns)
+        placeholders = ", ".join(f":{prefix}{idx}" for idx in range(len(columns)))
+        if len(columns) == 1:
+            return f"({exprs} {operator} {placeholders})"
+        return f"(({exprs}) {operator} ({placeholders}))"
+
+    clauses: list[str] = []
+    for idx, (expr, direction) in enumerate(columns):
+        operator = "<" if direction.upper() == "DESC" else ">"
+        terms = [f"{columns[prev][0]} = :{prefix}{prev}" for prev in range(idx)]
+        terms.append(f"{expr} {operator} :{prefix}{idx}")
+        clauses.append("(" + " AND ".join(terms) + ")")
+    lead_expr, lead_direction = columns[0]
+    lead_operator = "<=" if lead_direction.upper() == "DESC" else ">="
+    return f"({lead_expr} {lead_operator} :{prefix}0 AND (" + " OR ".join(clauses) + "))"
+
+
+def keyset_params(values: Sequence[Any], *, prefix: str = "cursor_") -> dict[str, object]:
+    return {f"{prefix}{idx}": value for idx, value in enumerate(values)}
+
+
+def _coerce_value(kind: str, value: Any) -> Any:
+    if kind == "int":
+        return int(value)
+    if kind == "datetime":
+        return datetime.fromisoformat(str(value))
+    return str(value)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from typing import Iterator
 
 import sqlalchemy as sa
 
@@ -79,6 +80,24 @@ class RepositoryBase:
             result = conn.execute(sa.text(sql), bind_params)
             return [dict(row) for row in result.mappings().all()]
 
+    def iter_batches(
+        self,
+        query: str,
+        params: tuple | dict = (),
+        *,
+        batch_size: int = 1000,
+    ) -> Iterator[list[dict]]:
+        """Stream a large result through a server-side cursor, holding one batch in memory at a time."""
+        sql, bind_params = self._normalize_query(query, params)
+        with self.engine.connect() as conn:
+            result = conn.execute(
+                sa.text(sql),
+                bind_params,
+                execution_options={"yield_per": batch_size},
+            )
+            for partition in result.mappings().partitions(batch_size):
+                yield [dict(row) for row in partition]
+
     def fetch_one(self, query: str, params: tuple | dict = ()) -> dict | None:
         sql, bind_params = self._normalize_query(query, params)
         with self._connect() as conn:
@@ -8,8 +8,17 @@ import uuid
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from ..daily_totals import (
+    DAILY_TOTALS_TABLE,
+    DailyTotalsDelta,
+    apply_daily_totals,
+    rebuild_daily_totals,
+    reset_daily_totals,
+)
+from ..date_catalog import DATE_CATALOG_TABLE, refresh_date_catalog
 from ..db import Base
 from ..models import ClickLog, ConversionLog, ConversionWithClickInfo
+from ..rewards import observed_reward
 from ..time_utils import now_local
 from .base import RepositoryBase
 
@@ -86,6 +95,41 @@ class IngestionRepository(RepositoryBase):
         )
         conn.execute(stmt)
 
+    def _date_catalog_enabled(self) -> bool:
+        return all(
+            self._table_exists(name)
+            for name in (DATE_CATALOG_TABLE, "click_ipua_daily", "conversion_ipua_daily")
+        )
+
+    def _refresh_date_catalog(
+        self,
+        conn: sa.Connection,
+        target_dates: Iterable[date],
+        *,
+        sides: Iterable[str] = ("click", "conversion"),
+    ) -> None:
+        if self._date_catalog_enabled():
+            refresh_date_catalog(conn, target_dates, sides=sides)
+
+    def _apply_daily_totals(
+        self,
+        conn: sa.Connection,
+        kind: str,
+        deltas: dict[date, DailyTotalsDelta],
+    ) -> None:
+        if deltas and self._table_exists(DAILY_TOTALS_TABLE):
+            apply_daily_totals(conn, kind, deltas)
+
+    def refresh_date_rollups(self, target_dates: Iterable[date]) -> None:
+        """Rebuild the catalog and totals rows for dates whose aggregates were written directly."""
+        target_dates = sorted(set(target_dates))
+        with self._connect() as conn:
+            if self._table_exists(DAILY_TOTALS_TABLE):
+                for target_date in target_dates:
+                    rebuild_daily_totals(conn, "click", target_date)
+                    rebuild_daily_totals(conn, "conversion", target_date)
+            self._refresh_date_catalog(conn, target_dates)
+
     def clear_date(self, target_date: date, *, store_raw: bool) -> None:
         with self._connect() as conn:
             conn.execute(
@@ -97,11 +141,15 @@ class IngestionRepository(RepositoryBase):
                     sa.text("DELETE FROM click_raw WHERE CAST(click_time AS date) = :target_date"),
                     {"target_date": target_date},
                 )
+            if self._table_exists(DAILY_TOTALS_TABLE):
+                reset_daily_totals(conn, "click", target_date)
+            self._refresh_date_catalog(conn, [target_date], sides=("click",))
 
     def ingest_clicks(self, clicks: Iterable[ClickLog], *, target_date: date, store_raw: bool) -> int:
         self.clear_date(target_date, store_raw=store_raw)
 
         count = 0
+        totals = DailyTotalsDelta()
         with self._connect() as conn:
             for click in clicks:
                 if click.click_time.date() != target_date:
@@ -109,7 +157,10 @@ class IngestionRepository(RepositoryBase):
                 if store_raw:
                     self._insert_click_raw(conn, click)
                 self._upsert_click_aggregate(conn, click)
+                totals.add(ipaddress=click.ipaddress, media_id=click.media_id)
                 count += 1
+            self._apply_daily_totals(conn, "click", {target_date: totals})
+            self._refresh_date_catalog(conn, [target_date], sides=("click",))
         return count
 
     def _clear_conversions_date(self, conn: sa.Connection, target_date: date) -> None:
@@ -123,6 +174,8 @@ class IngestionRepository(RepositoryBase):
                 sa.text("DELETE FROM conversion_ipua_daily WHERE date = :target_date"),
                 {"target_date": target_date},
             )
+            if self._table_exists(DAILY_TOTALS_TABLE):
+                reset_daily_totals(conn, "conversion", target_date)
 
     def _insert_conversion_raw(self, conn: sa.Connection, conv: ConversionLog) -> None:
         table = Base.metadata.tables["conversion_raw"]
@@ -143,6 +196,8 @@ class IngestionRepository(RepositoryBase):
             "click_useragent": insert_stmt.excluded.click_useragent,
             "state": insert_stmt.excluded.state,
             "raw_payload": insert_stmt.excluded.raw_payload,
+            "reward_yen": insert_stmt.excluded.reward_yen,
+            "reward_resolved": insert_stmt.excluded.reward_resolved,
             "created_at": insert_stmt.excluded.created_at,
             "updated_at": insert_stmt.excluded.updated_at,
         }
@@ -165,6 +220,8 @@ class IngestionRepository(RepositoryBase):
                 "click_useragent": getattr(conv, "click_useragent", None),
                 "state": conv.state,
                 "raw_payload": json.dumps(conv.raw_payload) if conv.raw_payload is not None else None,
+                "reward_yen": observed_reward(conv.raw_payload),
+                "reward_resolved": True,
                 "created_at": now,
                 "updated_at": now,
             },
@@ -198,6 +255,7 @@ class IngestionRepository(RepositoryBase):
 
     def ingest_conversions(self, conversions: Iterable[ConversionLog], *, target_date: date) -> int:
         count = 0
+        totals = DailyTotalsDelta()
         with self._connect() as conn:
             self._clear_conversions_date(conn, target_date)
             for conv in conversions:
@@ -206,7 +264,10 @@ class IngestionRepository(RepositoryBase):
                 self._insert_conversion_raw(conn, conv)
                 if conv.entry_ipaddress and conv.entry_useragent:
                     self._upsert_conversion_aggregate(conn, conv)
+                    totals.add(ipaddress=conv.entry_ipaddress)
                 count += 1
+            self._apply_daily_totals(conn, "conversion", {target_date: totals})
+            self._refresh_date_catalog(conn, [target_date], sides=("conversion",))
         return count
 
     def update_conversion_click_info(self, conversion_id: str, ip: str, ua: str) -> None:
@@ -309,6 +370,7 @@ class IngestionRepository(RepositoryBase):
         new_count = 0
         skip_count = 0
         affected_dates: set[date] = set()
+        totals: dict[date, DailyTotalsDelta] = {}
         with self._connect() as conn:
             for click in clicks:
                 if store_raw:
@@ -341,6 +403,12 @@ class IngestionRepository(RepositoryBase):
                 self._upsert_click_aggregate(conn, click)
                 new_count += 1
                 affected_dates.add(click.click_time.date())
+                totals.setdefault(click.click_time.date(), DailyTotalsDelta()).add(
+                    ipaddress=click.ipaddress,
+                    media_id=click.media_id,
+                )
+            self._apply_daily_totals(conn, "click", totals)
+            self._refresh_date_catalog(conn, affected_dates, sides=("click",))
         self.last_merged_click_dates = sorted(affected_dates)
         return new_count, skip_count
 
@@ -348,6 +416,7 @@ class IngestionRepository(RepositoryBase):
         new_count = 0
         skip_count = 0
         affected_dates: set[date] = set()
+        totals: dict[date, DailyTotalsDelta] = {}
         with self._connect() as conn:
             for conv in conversions:
                 table = Base.metadata.tables["conversion_raw"]
@@ -374,6 +443,8 @@ class IngestionRepository(RepositoryBase):
                             if conv.raw_payload is not None
                             else None
                         ),
+                        reward_yen=observed_reward(conv.raw_payload),
+                        reward_resolved=True,
                         created_at=now,
                         updated_at=now,
                     )
@@ -385,11 +456,52 @@ class IngestionRepository(RepositoryBase):
                     continue
                 if conv.entry_ipaddress and conv.entry_useragent:
                     self._upsert_conversion_aggregate(conn, conv)
+                    totals.setdefault(conv.conversion_time.date(), DailyTotalsDelta()).add(
+                        ipaddress=conv.entry_ipaddress,
+                    )
                 new_count += 1
                 affected_dates.add(conv.conversion_time.date())
+            self._apply_daily_totals(conn, "conversion", totals)
+            self._refresh_date_catalog(conn, affected_dates, sides=("conversion",))
         self.last_merged_conversion_dates = sorted(affected_dates)
         return new_count, skip_count
 
+    def backfill_conversion_reward_yen(self, *, batch_size: int = 1000) -> int:
+        """Resolve reward_yen for rows ingested before rewards were resolved at ingest time.
+
+        Also rewrites the default that earlier ingests stored for payloads without a reward.
+        """
+        if not self._column_exists("conversion_raw", "reward_resolved"):
+            return 0
+        updated = 0
+        last_id = None
+        while True:
+            # Keyset on id: each batch starts after the last one, however many rows it updated.
+            with self._connect() as conn:
+                rows = conn.execute(
+                    sa.text(
+                        f"""
+                        SELECT id, raw_payload
+                        FROM conversion_raw
+                        WHERE NOT reward_resolved
+                          {"AND id > :last_id" if last_id is not None else ""}
+                        ORDER BY id
+                        LIMIT :batch_size
+                        """
+                    ),
+                    {"batch_size": batch_size, "last_id": last_id},
+                ).mappings().all()
+                if not rows:
+                    return updated
+                conn.execute(
+                    sa.text(
+                        "UPDATE conversion_raw SET reward_yen = :reward_yen, reward_resolved = TRUE WHERE id = :id"
+                    ),
+                    [{"id": row["id"], "reward_yen": observed_reward(row["raw_payload"])} for row in rows],
+                )
+            updated += len(rows)
+            last_id = rows[-1]["id"]
+
     def purge_raw_before(self, cutoff: datetime, *, execute: bool) -> dict[str, int]:
         targets = {
             "click_raw": ("click_time < :cutoff", {"cutoff": cutoff}),
@@ -401,6 +513,8 @@ class IngestionRepository(RepositoryBase):
         targets = {
             "click_ipua_daily": ("date < :cutoff", {"cutoff": cutoff}),
             "conversion_ipua_daily": ("date < :cutoff", {"cutoff": cutoff}),
+            DATE_CATALOG_TABLE: ("date < :cutoff", {"cutoff": cutoff}),
+            DAILY_TOTALS_TABLE: ("date < :cutoff", {"cutoff": cutoff}),
         }
         return self._purge_targets(targets, execute=execute)
 
@@ -4,6 +4,9 @@ from datetime import date, timedelta
 
 import sqlalchemy as sa
 
+from ..cache_versions import CACHE_VERSION_TABLE, REPORTING_CACHE_SCOPE, read_cache_version
+from ..daily_totals import DAILY_TOTALS_TABLE
+from ..date_catalog import DATE_CATALOG_TABLE
 from ..ip_filters import DATACENTER_IP_PREFIXES
 from ..models import AggregatedRow, ConversionIpUaRollup
 from .base import RepositoryBase
@@ -34,16 +37,57 @@ class ReportingReadRepository(RepositoryBase):
         )
         return row["watermark"] if row else None
 
+    def _catalog_watermark(self, column: str, target_date: date) -> object | None:
+        row = self.fetch_one(
+            f"SELECT {column} AS watermark FROM daily_data_catalog WHERE date = :target_date",
+            {"target_date": target_date},
+        )
+        return row["watermark"] if row else None
+
     def get_click_data_watermark(self, target_date: date):
         if not self._table_exists("click_ipua_daily"):
             return None
+        if self._table_exists(DATE_CATALOG_TABLE):
+            return self._catalog_watermark("click_watermark", target_date)
         return self._max_timestamp_for_date("click_ipua_daily", target_date)
 
     def get_conversion_data_watermark(self, target_date: date):
         if not self._table_exists("conversion_ipua_daily"):
             return None
+        if self._table_exists(DATE_CATALOG_TABLE):
+            return self._catalog_watermark("conversion_watermark", target_date)
         return self._max_timestamp_for_date("conversion_ipua_daily", target_date)
 
+    def get_catalog_dates(self) -> list[object] | None:
+        """Dates holding click or conversion aggregates, newest first; None without the catalog."""
+        if not self._table_exists(DATE_CATALOG_TABLE):
+            return None
+        rows = self.fetch_all(
+            """
+            SELECT date
+            FROM daily_data_catalog
+            WHERE click_row_count > 0 OR conversion_row_count > 0
+            ORDER BY date DESC
+            """
+        )
+        return [row["date"] for row in rows]
+
+    def get_catalog_latest_dates(self) -> dict[str, object] | None:
+        if not self._table_exists(DATE_CATALOG_TABLE):
+            return None
+        row = self.fetch_one(
+            """
+            SELECT
+                MAX(CASE WHEN click_row_count > 0 THEN date END) AS click_ipua_daily,
+                MAX(CASE WHEN conversion_row_count > 0 THEN date END) AS conversion_ipua_daily
+            FROM daily_data_catalog
+            """
+        ) or {}
+        return {
+            "click_ipua_daily": row.get("click_ipua_daily"),
+            "conversion_ipua_daily": row.get("conversion_ipua_daily"),
+        }
+
     def get_conversion_findings_lineage(self, target_date: date) -> dict | None:
         if self._table_exists("findings_generations"):
             return self.fetch_one(
@@ -83,6 +127,47 @@ class ReportingReadRepository(RepositoryBase):
             {"target_date": target_date},
         )
 
+    def get_daily_totals(self, limit: int, *, end_date: date | None = None) -> list[dict] | None:
+        """Newest `limit` rollup rows on or before `end_date`; None when the rollup is missing."""
+        if not self._table_exists(DAILY_TOTALS_TABLE):
+            return None
+        date_filter = "AND date <= :end_date" if end_date else ""
+        return self.fetch_all(
+            f"""
+            SELECT
+                date,
+                click_total,
+                click_unique_ips,
+                click_media_count,
+                conversion_total,
+                conversion_unique_ips
+            FROM daily_totals
+            WHERE (click_total > 0 OR conversion_total > 0)
+            {date_filter}
+            ORDER BY date DESC
+            LIMIT :limit
+            """,
+            {"limit": limit, "end_date": end_date},
+        )
+
+    def get_cache_version(self, scope: str = REPORTING_CACHE_SCOPE) -> int | None:
+        if not self._table_exists(CACHE_VERSION_TABLE):
+            return None
+        with self.engine.connect() as conn:
+            return read_cache_version(conn, scope)
+
+    def get_dashboard_snapshot(self, snapshot_key: str) -> dict | None:
+        if not self._table_exists("console_dashboard_snapshots"):
+            return None
+        return self.fetch_one(
+            """
+            SELECT snapshot_key, target_date, payload_json, computed_at
+            FROM console_dashboard_snapshots
+            WHERE snapshot_key = :snapshot_key
+            """,
+            {"snapshot_key": snapshot_key},
+        )
+
     def fetch_aggregates(self, target_date: date) -> list[AggregatedRow]:
         with self._connect() as conn:
             result = conn.execute(
@@ -7,6 +7,7 @@ from datetime import datetime
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from ..cache_versions import CACHE_VERSION_TABLE, bump_cache_version
 from ..db import Base
 from ..time_utils import now_local
 from .base import RepositoryBase
@@ -37,6 +38,8 @@ class SettingsRepository(RepositoryBase):
         )
         with self._connect() as conn:
             conn.execute(stmt, rows)
+            if self._table_exists(CACHE_VERSION_TABLE):
+                bump_cache_version(conn)
         return self.ensure_settings_version(settings, fingerprint)
 
     def ensure_settings_version(self, settings: dict, fingerprint: str) -> str:
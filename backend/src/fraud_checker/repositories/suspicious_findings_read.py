@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 import json
-from datetime import date
+from collections import Counter
+from datetime import date, datetime, time, timedelta
 
 import sqlalchemy as sa
 
-from ..constants import DEFAULT_REWARD_YEN
+from ..pagination import keyset_params, keyset_predicate
+from ..rewards import reward_from_row, representative_weighted_price
+from ..search_text import contains_pattern, search_condition_sql
 from .base import RepositoryBase
 
 
 class SuspiciousFindingsReadRepository(RepositoryBase):
     def _generation_join_sql(self) -> str:
+        if self._table_exists("findings_current_generations"):
+            return """
+            JOIN findings_current_generations cg
+              ON cg.generation_id = f.generation_id
+             AND cg.target_date = f.date
+             AND cg.finding_type = 'conversion'
+        """
         if not self._table_exists("findings_generations"):
             return ""
         return """
@@ -91,31 +101,101 @@ class SuspiciousFindingsReadRepository(RepositoryBase):
         placeholders = ", ".join(f":program_id_{idx}" for idx in range(len(unique_program_ids)))
         params: dict[str, object] = {"target_date": target_date}
         params.update({f"program_id_{idx}": value for idx, value in enumerate(unique_program_ids)})
+        reward_select_sql, reward_group_sql = self._conversion_reward_sql()
         rows = self.fetch_all(
             f"""
             SELECT
-                program_id,
-                raw_payload
-            FROM conversion_raw
-            WHERE CAST(conversion_time AS date) = :target_date
-              AND program_id IN ({placeholders})
+                c.program_id,
+                {reward_select_sql},
+                COUNT(*) AS conversion_count
+            FROM conversion_raw c
+            WHERE CAST(c.conversion_time AS date) = :target_date
+              AND c.program_id IN ({placeholders})
+            GROUP BY c.program_id, {reward_group_sql}
             """,
             params,
         )
 
-        grouped_prices: dict[str, list[int]] = {}
+        grouped_prices: dict[str, Counter[int]] = {}
         for row in rows:
             program_id = row.get("program_id")
             if not program_id:
                 continue
-            grouped_prices.setdefault(str(program_id), []).append(_reward_from_payload(row.get("raw_payload")))
+            grouped_prices.setdefault(str(program_id), Counter())[reward_from_row(row)] += int(
+                row.get("conversion_count") or 0
+            )
 
         return {
             program_id: price
-            for program_id, values in grouped_prices.items()
-            if (price := _representative_unit_price(values)) is not None
+            for program_id, counts in grouped_prices.items()
+            if (price := representative_weighted_price(counts)) is not None
         }
 
+    def get_conversion_transaction_summaries_bulk(
+        self,
+        target_date: date,
+        ip_ua_pairs: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], dict]:
+        if not ip_ua_pairs or not self._table_exists("conversion_raw"):
+            return {}
+
+        target_start = datetime.combine(target_date, time.min)
+        reward_select_sql, reward_group_sql = self._conversion_reward_sql()
+        grouped: dict[tuple[str, str], list[dict]] = {}
+        chunk_size = 400
+        for index in range(0, len(ip_ua_pairs), chunk_size):
+            chunk = ip_ua_pairs[index : index + chunk_size]
+            placeholders = ",".join(f"(:ip{idx}, :ua{idx})" for idx in range(len(chunk)))
+            params: dict[str, object] = {
+                "target_start": target_start,
+                "target_end": target_start + timedelta(days=1),
+            }
+            for idx, (ipaddress, useragent) in enumerate(chunk):
+                params[f"ip{idx}"] = ipaddress
+                params[f"ua{idx}"] = useragent
+            rows = self.fetch_all(
+                f"""
+                SELECT
+                    c.entry_ipaddress AS ipaddress,
+                    c.entry_useragent AS useragent,
+                    c.user_id,
+                    COALESCE(u.name, c.user_id) AS affiliate_name,
+                    COALESCE(p.name, c.program_id) AS promotion_name,
+                    {reward_select_sql},
+                    COUNT(*) AS conversion_count,
+                    MAX(c.conversion_time) AS latest_conversion_time
+                FROM conversion_raw c
+                LEFT JOIN master_user u ON u.id = c.user_id
+                LEFT JOIN master_promotion p ON p.id = c.program_id
+                WHERE c.conversion_time >= :target_start
+                  AND c.conversion_time < :target_end
+                  AND (c.entry_ipaddress, c.entry_useragent) IN ({placeholders})
+                GROUP BY
+                    c.entry_ipaddress,
+                    c.entry_useragent,
+                    c.user_id,
+                    COALESCE(u.name, c.user_id),
+                    COALESCE(p.name, c.program_id),
+                    {reward_group_sql}
+                """,
+                params,
+            )
+            for row in rows:
+                grouped.setdefault((row["ipaddress"], row["useragent"]), []).append(row)
+
+        return {key: _summarize_observed_transactions(rows) for key, rows in grouped.items()}
+
+    def _conversion_reward_sql(self, alias: str = "c") -> tuple[str, str]:
+        # Rows not resolved yet (ingested before resolution moved to ingest time) are the only
+        # ones that still carry their payload into the aggregate for Python parsing.
+        if self._column_exists("conversion_raw", "reward_resolved"):
+            payload_sql = f"CASE WHEN NOT {alias}.reward_resolved THEN {alias}.raw_payload END"
+            return (
+                f"{alias}.reward_yen, {alias}.reward_resolved, {payload_sql} AS raw_payload",
+                f"{alias}.reward_yen, {alias}.reward_resolved, {payload_sql}",
+            )
+        return f"CAST(NULL AS INTEGER) AS reward_yen, {alias}.raw_payload", f"{alias}.raw_payload"
+
     def list_conversion_findings(
         self,
         *,
@@ -126,7 +206,9 @@ class SuspiciousFindingsReadRepository(RepositoryBase):
         risk_level: str | None,
         sort_by: str,
         sort_order: str,
-    ) -> tuple[list[dict], int]:
+        keyset: list | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[dict], int | None]:
         allowed_sort = {
             "count": "total_conversions",
             "risk": "risk_score",
@@ -135,36 +217,48 @@ class SuspiciousFindingsReadRepository(RepositoryBase):
         sort_column = f"f.{allowed_sort.get(sort_by, 'total_conversions')}"
         direction = "ASC" if sort_order.lower() == "asc" else "DESC"
         conditions = ["f.date = :target_date", "f.is_current = TRUE"]
-        params: dict[str, object] = {"target_date": target_date, "limit": limit, "offset": offset}
+        params: dict[str, object] = {"target_date": target_date}
         if risk_level:
             conditions.append("f.risk_level = :risk_level")
             params["risk_level"] = risk_level
-        if search:
-            conditions.append("f.search_text LIKE :search")
-            params["search"] = f"%{search.lower()}%"
+        if search and search.strip():
+            conditions.append(search_condition_sql())
+            params["search"] = contains_pattern(search)
         where_sql = " AND ".join(conditions)
 
+        page_conditions = list(conditions)
+        page_params: dict[str, object] = {**params, "limit": limit}
+        if keyset is not None:
+            page_conditions.append(keyset_predicate([(sort_column, direction), ("f.finding_key", "ASC")]))
+            page_params.update(keyset_params(keyset))
+            pagination_sql = "LIMIT :limit"
+        else:
+            page_params["offset"] = offset
+            pagination_sql = "LIMIT :limit OFFSET :offset"
         rows = self.fetch_all(
             f"""
             SELECT f.*
             FROM suspicious_conversion_findings f
             {self._generation_join_sql()}
-            WHERE {where_sql}
+            WHERE {" AND ".join(page_conditions)}
             ORDER BY {sort_column} {direction}, f.finding_key ASC
-            LIMIT :limit OFFSET :offset
+            {pagination_sql}
             """,
-            params,
+            page_params,
         )
-        total_row = self.fetch_one(
-            f"""
-            SELECT COUNT(*) AS cnt
-            FROM suspicious_conversion_findings f
-            {self._generation_join_sql()}
-            WHERE {where_sql}
-            """,
-            {key: value for key, value in params.items() if key not in {"limit", "offset"}},
-        )
-        return [self._deserialize_finding_row(row) for row in rows], int(total_row["cnt"] if total_row else 0)
+        total = None
+        if include_total:
+            total_row = self.fetch_one(
+                f"""
+                SELECT COUNT(*) AS cnt
+                FROM suspicious_conversion_findings f
+                {self._generation_join_sql()}
+                WHERE {where_sql}
+                """,
+                params,
+            )
+            total = int(total_row["cnt"] if total_row else 0)
+        return [self._deserialize_finding_row(row) for row in rows], total
 
     def get_conversion_finding_by_key(self, finding_key: str) -> dict | None:
         row = self.fetch_one(
@@ -196,18 +290,15 @@ class SuspiciousFindingsReadRepository(RepositoryBase):
             legacy_where_parts.append("date <= :target_date")
 
         if self._table_exists("suspicious_conversion_findings"):
-            if not self._table_exists("findings_generations"):
+            generation_join_sql = self._generation_join_sql()
+            if not generation_join_sql:
                 merged.update(self._get_daily_finding_counts_legacy(" AND ".join(legacy_where_parts), params))
             else:
                 rows = self.fetch_all(
                     f"""
                     SELECT f.date, COUNT(*) AS suspicious_conversions
                     FROM suspicious_conversion_findings f
-                    JOIN findings_generations fg
-                      ON fg.generation_id = f.generation_id
-                     AND fg.target_date = f.date
-                     AND fg.finding_type = 'conversion'
-                     AND fg.is_current = TRUE
+                    {generation_join_sql}
                     WHERE {" AND ".join(where_parts)}
                     GROUP BY f.date
                     ORDER BY f.date DESC
@@ -226,17 +317,14 @@ class SuspiciousFindingsReadRepository(RepositoryBase):
     def count_current_conversion_findings(self, target_date: date) -> int:
         if not self._table_exists("suspicious_conversion_findings"):
             return 0
-        if not self._table_exists("findings_generations"):
+        generation_join_sql = self._generation_join_sql()
+        if not generation_join_sql:
             return self._count_current_findings_legacy(target_date)
         row = self.fetch_one(
-            """
+            f"""
             SELECT COUNT(*) AS cnt
             FROM suspicious_conversion_findings f
-            JOIN findings_generations fg
-              ON fg.generation_id = f.generation_id
-             AND fg.target_date = f.date
-             AND fg.finding_type = 'conversion'
-             AND fg.is_current = TRUE
+            {generation_join_sql}
             WHERE f.date = :target_date
               AND f.is_current = TRUE
             """,
@@ -248,7 +336,11 @@ class SuspiciousFindingsReadRepository(RepositoryBase):
         params = {"cutoff": cutoff}
         where_sql = "date < :cutoff"
         counts: dict[str, int] = {}
-        for table_name in ("suspicious_conversion_findings",):
+        for table_name in (
+            "suspicious_conversion_findings",
+            "conversion_finding_summaries",
+            "program_unit_prices_daily",
+        ):
             if not self._table_exists(table_name):
                 counts[table_name] = 0
                 continue
@@ -314,82 +406,32 @@ class SuspiciousFindingsReadRepository(RepositoryBase):
         return parsed
 
 
-REWARD_KEYS = {
-    "gross_reward",
-    "net_reward",
-    "gross_action_cost",
-    "net_action_cost",
-    "reward",
-    "reward_amount",
-    "commission",
-    "commission_amount",
-    "payout",
-    "payout_amount",
-    "amount",
-    "price",
-    "cv_price",
-}
-def _reward_from_payload(raw_payload) -> int:
-    parsed = _parse_json(raw_payload)
-    extracted = _extract_reward_value(parsed)
-    if extracted is None:
-        return DEFAULT_REWARD_YEN
-    return extracted
-
-
-def _extract_reward_value(value) -> int | None:
-    if isinstance(value, dict):
-        # First pass: find a positive value from reward keys
-        for key, nested in value.items():
-            if key.lower() in REWARD_KEYS:
-                parsed = _coerce_int(nested)
-                if parsed is not None and parsed > 0:
-                    return parsed
-        # Second pass: recurse into nested structures
-        for _key, nested in value.items():
-            nested_value = _extract_reward_value(nested)
-            if nested_value is not None:
-                return nested_value
-    if isinstance(value, list):
-        for item in value:
-            nested_value = _extract_reward_value(item)
-            if nested_value is not None:
-                return nested_value
-    return None
-
-
-def _coerce_int(value) -> int | None:
-    if isinstance(value, bool) or value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return int(value)
-    if isinstance(value, str):
-        stripped = value.replace(",", "").replace("¥", "").strip()
-        if not stripped:
-            return None
-        try:
-            return int(float(stripped))
-        except ValueError:
-            return None
-    return None
-
-
-def _parse_json(value):
-    if value is None or isinstance(value, (dict, list)):
-        return value
-    if isinstance(value, str):
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            return value
-    return value
-
-
-def _representative_unit_price(prices: list[int]) -> int | None:
-    positive_prices = [price for price in prices if price > 0]
-    if not positive_prices:
-        return None
-    counts: dict[int, int] = {}
-    for price in positive_prices:
-        counts[price] = counts.get(price, 0) + 1
-    return max(counts.items(), key=lambda item: (item[1], item[0]))[0]
+def _summarize_observed_transactions(rows: list[dict]) -> dict:
+    affiliate_counts: Counter[str] = Counter()
+    affiliate_names: dict[str, str] = {}
+    program_counts: Counter[str] = Counter()
+    reward_counts: Counter[int] = Counter()
+    latest_occurred_at = None
+    for row in rows:
+        conversion_count = int(row.get("conversion_count") or 0)
+        reward_counts[reward_from_row(row)] += conversion_count
+        user_id = row.get("user_id")
+        if user_id:
+            affiliate_counts[str(user_id)] += conversion_count
+            affiliate_names[str(user_id)] = row.get("affiliate_name") or str(user_id)
+        promotion_name = row.get("promotion_name")
+        if promotion_name:
+            program_counts[str(promotion_name)] += conversion_count
+        row_latest = row.get("latest_conversion_time")
+        if row_latest is not None and (latest_occurred_at is None or row_latest > latest_occurred_at):
+            latest_occurred_at = row_latest
+    affiliate_id = affiliate_counts.most_common(1)[0][0] if affiliate_counts else None
+    return {
+        "transaction_count": sum(reward_counts.values()),
+        "reward_amount": sum(price * count for price, count in reward_counts.items()),
+        "unit_price_yen": representative_weighted_price(reward_counts),
+        "latest_occurred_at": latest_occurred_at,
+        "affiliate_id": affiliate_id,
+        "affiliate_name": affiliate_names.get(affiliate_id) if affiliate_id else None,
+        "outcome_type": program_counts.most_common(1)[0][0] if program_counts else None,
+    }
@@ -6,6 +6,8 @@ from datetime import date, timedelta
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from ..cache_versions import CACHE_VERSION_TABLE, REPORTING_CACHE_SCOPE, bump_cache_version
+from ..date_catalog import DATE_CATALOG_TABLE, record_findings_generation
 from ..db import Base
 from .base import RepositoryBase
 
@@ -67,11 +69,24 @@ class SuspiciousFindingsWriteRepository(RepositoryBase):
                         for finding_key in finding_keys
                     ],
                 )
+                if self._column_exists("suspicious_conversion_findings", "review_status"):
+                    placeholders, params = self._sequence_placeholders("review_key_", list(finding_keys))
+                    conn.execute(
+                        sa.text(
+                            f"""
+                            UPDATE suspicious_conversion_findings
+                            SET review_status = :review_status
+                            WHERE finding_key IN ({placeholders})
+                            """
+                        ),
+                        {**params, "review_status": status},
+                    )
+                self._invalidate_review_reads(conn)
             return len(finding_keys)
 
         keys = sorted({value for value in finding_keys if value})
         placeholders, params = self._sequence_placeholders("review_key_", keys)
-        case_key_sql = "COALESCE(case_key, finding_key)" if self._column_exists("suspicious_conversion_findings", "case_key") else "finding_key"
+        case_key_sql = "case_key" if self._column_exists("suspicious_conversion_findings", "case_key") else "finding_key"
         with self._connect() as conn:
             matched_rows = conn.execute(
                 sa.text(
@@ -169,6 +184,13 @@ class SuspiciousFindingsWriteRepository(RepositoryBase):
             if payload_rows:
                 conn.execute(state_statement, payload_rows)
                 conn.execute(event_statement, payload_rows)
+                self._sync_case_review_status(
+                    conn,
+                    sorted({str(row["case_key"]) for row in payload_rows}),
+                    status=status,
+                    case_key_sql=case_key_sql,
+                )
+                self._invalidate_review_reads(conn)
                 self._sync_followup_tasks(
                     conn,
                     payload_rows,
@@ -195,12 +217,12 @@ class SuspiciousFindingsWriteRepository(RepositoryBase):
             matched_rows = conn.execute(
                 sa.text(
                     f"""
-                    SELECT DISTINCT COALESCE(case_key, finding_key) AS case_key
+                    SELECT DISTINCT case_key
                     FROM suspicious_conversion_findings
                     WHERE is_current = TRUE
                       AND (
                         finding_key IN ({placeholders})
-                        OR COALESCE(case_key, finding_key) IN ({placeholders})
+                        OR case_key IN ({placeholders})
                       )
                     """
                 ),
@@ -311,64 +333,319 @@ class SuspiciousFindingsWriteRepository(RepositoryBase):
         rows: list[dict],
         *,
         generation_metadata: dict,
+        enrichment: dict | None = None,
     ) -> None:
+        """Write a findings generation and publish it.
+
+        `enrichment` (`unit_prices`, `summaries`, `computed_at`) is written in the same
+        transaction, before the pointer moves, so readers never see the new generation
+        next to the previous generation's summaries.
+        """
         table = Base.metadata.tables["suspicious_conversion_findings"]
+        uses_pointer = self._table_exists("findings_current_generations")
         with self._connect() as conn:
+            if not uses_pointer:
+                conn.execute(
+                    sa.text(
+                        """
+                        UPDATE suspicious_conversion_findings
+                        SET is_current = FALSE
+                        WHERE date = :target_date
+                          AND is_current = TRUE
+                        """
+                    ),
+                    {"target_date": target_date},
+                )
+            self._replace_current_generation(conn, generation_metadata)
+            if rows:
+                self._upsert_conversion_findings(conn, table, rows)
+                self._sync_generation_review_status(conn, generation_metadata)
+            if self._table_exists(DATE_CATALOG_TABLE):
+                record_findings_generation(
+                    conn,
+                    target_date,
+                    generation_id=generation_metadata["generation_id"],
+                    computed_at=generation_metadata["created_at"],
+                )
+            if enrichment is not None:
+                self._write_conversion_enrichment(conn, target_date, **enrichment)
+            if uses_pointer:
+                self._publish_current_generation(conn, generation_metadata)
+
+    def _write_conversion_enrichment(
+        self,
+        conn,
+        target_date: date,
+        *,
+        unit_prices: dict[str, int],
+        summaries: list[dict],
+        computed_at,
+    ) -> None:
+        has_unit_prices = self._table_exists("program_unit_prices_daily")
+        has_summaries = self._table_exists("conversion_finding_summaries")
+        if has_unit_prices:
+            conn.execute(
+                sa.text("DELETE FROM program_unit_prices_daily WHERE date = :target_date"),
+                {"target_date": target_date},
+            )
+            if unit_prices:
+                conn.execute(
+                    sa.text(
+                        """
+                        INSERT INTO program_unit_prices_daily (date, program_id, unit_price_yen, computed_at)
+                        VALUES (:target_date, :program_id, :unit_price_yen, :computed_at)
+                        """
+                    ),
+                    [
+                        {
+                            "target_date": target_date,
+                            "program_id": program_id,
+                            "unit_price_yen": unit_price,
+                            "computed_at": computed_at,
+                        }
+                        for program_id, unit_price in sorted(unit_prices.items())
+                    ],
+                )
+        if has_summaries:
+            conn.execute(
+                sa.text("DELETE FROM conversion_finding_summaries WHERE date = :target_date"),
+                {"target_date": target_date},
+            )
+            if summaries:
+                conn.execute(
+                    sa.text(
+                        """
+                        INSERT INTO conversion_finding_summaries (
+                            finding_key,
+                            date,
+                            transaction_count,
+                            reward_amount,
+                            reward_amount_source,
+                            affiliate_id,
+                            affiliate_name,
+                            outcome_type,
+                            latest_occurred_at,
+                            computed_at
+                        ) VALUES (
+                            :finding_key,
+                            :target_date,
+                            :transaction_count,
+                            :reward_amount,
+                            :reward_amount_source,
+                            :affiliate_id,
+                            :affiliate_name,
+                            :outcome_type,
+                            :latest_occurred_at,
+                            :computed_at
+                        )
+                        """
+                    ),
+                    [
+                        {**summary, "target_date": target_date, "computed_at": computed_at}
+                        for summary in summaries
+                    ],
+                )
+
+    def save_dashboard_snapshot(
+        self,
+        snapshot_key: str,
+        *,
+        target_date: date | None,
+        payload_json: str,
+        computed_at,
+    ) -> None:
+        if not self._table_exists("console_dashboard_snapshots"):
+            return
+        with self._connect() as conn:
+            conn.execute(
+                sa.text("DELETE FROM console_dashboard_snapshots WHERE snapshot_key = :snapshot_key"),
+                {"snapshot_key": snapshot_key},
+            )
             conn.execute(
                 sa.text(
                     """
+                    INSERT INTO console_dashboard_snapshots (snapshot_key, target_date, payload_json, computed_at)
+                    VALUES (:snapshot_key, :target_date, :payload_json, :computed_at)
+                    """
+                ),
+                {
+                    "snapshot_key": snapshot_key,
+                    "target_date": target_date,
+                    "payload_json": payload_json,
+                    "computed_at": computed_at,
+                },
+            )
+
+    def bump_cache_version(self, scope: str = REPORTING_CACHE_SCOPE) -> None:
+        if not self._table_exists(CACHE_VERSION_TABLE):
+            return
+        with self._connect() as conn:
+            bump_cache_version(conn, scope)
+
+    def clear_dashboard_snapshots(self) -> int:
+        if not self._table_exists("console_dashboard_snapshots"):
+            return 0
+        with self._connect() as conn:
+            result = conn.execute(sa.text("DELETE FROM console_dashboard_snapshots"))
+        return int(result.rowcount or 0)
+
+    def _invalidate_review_reads(self, conn) -> None:
+        # Snapshots go in the same transaction as the bump: a reader that sees the new version
+        # can no longer find a dashboard built before the review and cache it under that version.
+        if self._table_exists("console_dashboard_snapshots"):
+            conn.execute(sa.text("DELETE FROM console_dashboard_snapshots"))
+        if self._table_exists(CACHE_VERSION_TABLE):
+            bump_cache_version(conn)
+
+    def retire_superseded_conversion_findings(self, target_dates: list[date]) -> int:
+        """Clear is_current on rows that the published generation pointer no longer selects."""
+        if not target_dates or not self._table_exists("findings_current_generations"):
+            return 0
+        placeholders, params = self._sequence_placeholders(
+            "target_date_",
+            sorted(set(target_dates)),
+        )
+        with self._connect() as conn:
+            result = conn.execute(
+                sa.text(
+                    f"""
                     UPDATE suspicious_conversion_findings
                     SET is_current = FALSE
-                    WHERE date = :target_date
+                    WHERE date IN ({placeholders})
                       AND is_current = TRUE
+                      AND NOT EXISTS (
+                        SELECT 1
+                        FROM findings_current_generations cg
+                        WHERE cg.finding_type = 'conversion'
+                          AND cg.target_date = suspicious_conversion_findings.date
+                          AND cg.generation_id = suspicious_conversion_findings.generation_id
+                      )
                     """
                 ),
-                {"target_date": target_date},
-            )
-            self._replace_current_generation(conn, generation_metadata)
-            if not rows:
-                return
-            stmt = pg_insert(table).on_conflict_do_update(
-                index_elements=["finding_key"],
-                set_={
-                    "case_key": sa.text("excluded.case_key"),
-                    "date": sa.text("excluded.date"),
-                    "ipaddress": sa.text("excluded.ipaddress"),
-                    "useragent": sa.text("excluded.useragent"),
-                    "ua_hash": sa.text("excluded.ua_hash"),
-                    "media_ids_json": sa.text("excluded.media_ids_json"),
-                    "program_ids_json": sa.text("excluded.program_ids_json"),
-                    "media_names_json": sa.text("excluded.media_names_json"),
-                    "program_names_json": sa.text("excluded.program_names_json"),
-                    "affiliate_ids_json": sa.text("excluded.affiliate_ids_json"),
-                    "affiliate_names_json": sa.text("excluded.affiliate_names_json"),
-                    "risk_level": sa.text("excluded.risk_level"),
-                    "risk_score": sa.text("excluded.risk_score"),
-                    "reasons_json": sa.text("excluded.reasons_json"),
-                    "reasons_formatted_json": sa.text("excluded.reasons_formatted_json"),
-                    "metrics_json": sa.text("excluded.metrics_json"),
-                    "total_conversions": sa.text("excluded.total_conversions"),
-                    "media_count": sa.text("excluded.media_count"),
-                    "program_count": sa.text("excluded.program_count"),
-                    "min_click_to_conv_seconds": sa.text("excluded.min_click_to_conv_seconds"),
-                    "max_click_to_conv_seconds": sa.text("excluded.max_click_to_conv_seconds"),
-                    "first_time": sa.text("excluded.first_time"),
-                    "last_time": sa.text("excluded.last_time"),
-                    "rule_version": sa.text("excluded.rule_version"),
-                    "computed_at": sa.text("excluded.computed_at"),
-                    "computed_by_job_id": sa.text("excluded.computed_by_job_id"),
-                    "settings_updated_at_snapshot": sa.text("excluded.settings_updated_at_snapshot"),
-                    "source_click_watermark": sa.text("excluded.source_click_watermark"),
-                    "source_conversion_watermark": sa.text("excluded.source_conversion_watermark"),
-                    "estimated_damage_yen": sa.text("excluded.estimated_damage_yen"),
-                    "damage_unit_price_source": sa.text("excluded.damage_unit_price_source"),
-                    "damage_evidence_json": sa.text("excluded.damage_evidence_json"),
-                    "generation_id": sa.text("excluded.generation_id"),
-                    "is_current": sa.text("excluded.is_current"),
-                    "search_text": sa.text("excluded.search_text"),
-                },
+                params,
             )
-            conn.execute(stmt, rows)
+        return int(result.rowcount or 0)
+
+    def _publish_current_generation(self, conn, generation_metadata: dict) -> None:
+        conn.execute(
+            sa.text(
+                """
+                INSERT INTO findings_current_generations (
+                    finding_type,
+                    target_date,
+                    generation_id,
+                    published_at
+                ) VALUES (
+                    :finding_type,
+                    :target_date,
+                    :generation_id,
+                    :published_at
+                )
+                ON CONFLICT (finding_type, target_date)
+                DO UPDATE SET
+                    generation_id = excluded.generation_id,
+                    published_at = excluded.published_at
+                """
+            ),
+            {
+                "finding_type": generation_metadata["finding_type"],
+                "target_date": generation_metadata["target_date"],
+                "generation_id": generation_metadata["generation_id"],
+                "published_at": generation_metadata["created_at"],
+            },
+        )
+
+    def _upsert_conversion_findings(self, conn, table, rows: list[dict]) -> None:
+        stmt = pg_insert(table).on_conflict_do_update(
+            index_elements=["finding_key"],
+            set_={
+                "case_key": sa.text("excluded.case_key"),
+                "date": sa.text("excluded.date"),
+                "ipaddress": sa.text("excluded.ipaddress"),
+                "useragent": sa.text("excluded.useragent"),
+                "ua_hash": sa.text("excluded.ua_hash"),
+                "media_ids_json": sa.text("excluded.media_ids_json"),
+                "program_ids_json": sa.text("excluded.program_ids_json"),
+                "media_names_json": sa.text("excluded.media_names_json"),
+                "program_names_json": sa.text("excluded.program_names_json"),
+                "affiliate_ids_json": sa.text("excluded.affiliate_ids_json"),
+                "affiliate_names_json": sa.text("excluded.affiliate_names_json"),
+                "risk_level": sa.text("excluded.risk_level"),
+                "risk_score": sa.text("excluded.risk_score"),
+                "reasons_json": sa.text("excluded.reasons_json"),
+                "reasons_formatted_json": sa.text("excluded.reasons_formatted_json"),
+                "metrics_json": sa.text("excluded.metrics_json"),
+                "total_conversions": sa.text("excluded.total_conversions"),
+                "media_count": sa.text("excluded.media_count"),
+                "program_count": sa.text("excluded.program_count"),
+                "min_click_to_conv_seconds": sa.text("excluded.min_click_to_conv_seconds"),
+                "max_click_to_conv_seconds": sa.text("excluded.max_click_to_conv_seconds"),
+                "first_time": sa.text("excluded.first_time"),
+                "last_time": sa.text("excluded.last_time"),
+                "rule_version": sa.text("excluded.rule_version"),
+                "computed_at": sa.text("excluded.computed_at"),
+                "computed_by_job_id": sa.text("excluded.computed_by_job_id"),
+                "settings_updated_at_snapshot": sa.text("excluded.settings_updated_at_snapshot"),
+                "source_click_watermark": sa.text("excluded.source_click_watermark"),
+                "source_conversion_watermark": sa.text("excluded.source_conversion_watermark"),
+                "estimated_damage_yen": sa.text("excluded.estimated_damage_yen"),
+                "damage_unit_price_source": sa.text("excluded.damage_unit_price_source"),
+                "damage_evidence_json": sa.text("excluded.damage_evidence_json"),
+                "generation_id": sa.text("excluded.generation_id"),
+                "is_current": sa.text("excluded.is_current"),
+                "search_text": sa.text("excluded.search_text"),
+            },
+        )
+        conn.execute(stmt, rows)
+
+    def _sync_case_review_status(
+        self,
+        conn,
+        case_keys: list[str],
+        *,
+        status: str,
+        case_key_sql: str,
+    ) -> None:
+        if not case_keys or not self._column_exists("suspicious_conversion_findings", "review_status"):
+            return
+        placeholders, params = self._sequence_placeholders("status_case_", case_keys)
+        conn.execute(
+            sa.text(
+                f"""
+                UPDATE suspicious_conversion_findings
+                SET review_status = :review_status
+                WHERE {case_key_sql} IN ({placeholders})
+                  AND review_status <> :review_status
+                """
+            ),
+            {**params, "review_status": status},
+        )
+
+    def _sync_generation_review_status(self, conn, generation_metadata: dict) -> None:
+        if not self._column_exists("suspicious_conversion_findings", "review_status"):
+            return
+        if not self._table_exists("fraud_alert_review_states"):
+            return
+        # New generations insert as unhandled; carry over decisions already made for the same case.
+        conn.execute(
+            sa.text(
+                """
+                UPDATE suspicious_conversion_findings
+                SET review_status = (
+                    SELECT s.review_status
+                    FROM fraud_alert_review_states s
+                    WHERE s.case_key = suspicious_conversion_findings.case_key
+                )
+                WHERE date = :target_date
+                  AND generation_id = :generation_id
+                  AND case_key IN (SELECT case_key FROM fraud_alert_review_states)
+                """
+            ),
+            {
+                "target_date": generation_metadata["target_date"],
+                "generation_id": generation_metadata["generation_id"],
+            },
+        )
 
     def _replace_current_generation(self, conn, generation_metadata: dict) -> None:
         conn.execute(
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Mapping, Protocol
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from .cache_versions import REPORTING_CACHE_SCOPE
+from .time_utils import now_local
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    payload: Any
+    body: bytes
+    etag: str
+    expires_at: datetime | None = None
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> CachedPayload | None: ...
+    def set(self, key: str, value: CachedPayload) -> None: ...
+    def clear(self) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """Thread-safe LRU; stale versions simply age out because the version is part of the key."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, CachedPayload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedPayload | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedPayload) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_backend: CacheBackend = InMemoryCacheBackend()
+
+
+def get_cache_backend() -> CacheBackend:
+    return _backend
+
+
+def set_cache_backend(backend: CacheBackend) -> None:
+    global _backend
+    _backend = backend
+
+
+def resolve_cache_version(repo: Any, scope: str = REPORTING_CACHE_SCOPE) -> int | None:
+    """None disables caching for this request (no counter table or the lookup failed)."""
+    get_version = getattr(repo, "get_cache_version", None)
+    if not callable(get_version):
+        return None
+    try:
+        return get_version(scope)
+    except Exception:
+        logger.exception("Failed to read cache version for scope '%s'", scope)
+        return None
+
+
+def cached_json_response(
+    request: Request,
+    *,
+    endpoint: str,
+    params: Mapping[str, Any],
+    version: int | None,
+    compute: Callable[[], Any],
+    live: Callable[[Any], Any] | None = None,
+    expires_at: Callable[[Any], datetime | None] | None = None,
+) -> Response:
+    """Serve `compute()` from cache for the current data version, answering If-None-Match with 304.
+
+    `live` receives a shallow copy of the cached payload and adds top-level fields that must
+    stay fresh (e.g. job status); the ETag then covers the decorated body.
+    `expires_at` bounds how long a computed payload may be reused under the same version, for
+    payloads that were themselves served from a materialization with a limited lifetime.
+    """
+    if version is not None:
+        key = f"{endpoint}?{_canonical(params)}#v{version}"
+        backend = get_cache_backend()
+        entry = backend.get(key)
+        if entry is None or (entry.expires_at is not None and entry.expires_at <= now_local()):
+            payload = compute()
+            entry = _build_entry(payload, expires_at(payload) if expires_at is not None else None)
+            backend.set(key, entry)
+    else:
+        entry = _build_entry(compute())
+    if live is not None:
+        entry = _build_entry(live(dict(entry.payload)))
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def _build_entry(payload: Any, expires_at: datetime | None = None) -> CachedPayload:
+    encoded = jsonable_encoder(payload)
+    body = json.dumps(encoded, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    return CachedPayload(payload=encoded, body=body, etag=etag, expires_at=expires_at)
+
+
+def _canonical(params: Mapping[str, Any]) -> str:
+    return json.dumps(dict(params), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag in candidates
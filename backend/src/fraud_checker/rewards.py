@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from typing import Any, Iterable, Mapping
+
+from .constants import DEFAULT_REWARD_YEN
+
+REWARD_KEYS = {
+    "gross_reward",
+    "net_reward",
+    "gross_action_cost",
+    "net_action_cost",
+    "reward",
+    "reward_amount",
+    "commission",
+    "commission_amount",
+    "payout",
+    "payout_amount",
+    "amount",
+    "price",
+    "cv_price",
+}
+
+
+def observed_reward(raw_payload: Any) -> int | None:
+    """The reward the payload actually carries; this, not the default, is what gets stored."""
+    return extract_reward_value(_parse_json(raw_payload))
+
+
+def reward_from_payload(raw_payload: Any) -> int:
+    extracted = observed_reward(raw_payload)
+    return extracted if extracted is not None else DEFAULT_REWARD_YEN
+
+
+def reward_from_row(row: Mapping[str, Any]) -> int:
+    """Resolve a conversion's reward from `reward_yen` / `reward_resolved` / `raw_payload`.
+
+    A resolved row with NULL `reward_yen` carried no reward, so the default applies here at
+    read time; unresolved rows (not backfilled yet) fall back to parsing the payload.
+    """
+    reward_yen = row.get("reward_yen")
+    if reward_yen is not None:
+        return int(reward_yen)
+    if row.get("reward_resolved"):
+        return DEFAULT_REWARD_YEN
+    return reward_from_payload(row.get("raw_payload"))
+
+
+def extract_reward_value(value: Any) -> int | None:
+    if isinstance(value, dict):
+        # Prefer a positive value stored directly under a reward key before recursing.
+        for key, nested in value.items():
+            if key.lower() in REWARD_KEYS:
+                parsed = _coerce_int(nested)
+                if parsed is not None and parsed > 0:
+                    return parsed
+        for nested in value.values():
+            nested_value = extract_reward_value(nested)
+            if nested_value is not None:
+                return nested_value
+    if isinstance(value, list):
+        for item in value:
+            nested_value = extract_reward_value(item)
+            if nested_value is not None:
+                return nested_value
+    return None
+
+
+def representative_unit_price(prices: Iterable[int]) -> int | None:
+    return representative_weighted_price(Counter(prices))
+
+
+def representative_weighted_price(price_counts: Mapping[int, int]) -> int | None:
+    positive = {price: count for price, count in price_counts.items() if price > 0 and count > 0}
+    if not positive:
+        return None
+    return max(positive.items(), key=lambda item: (item[1], item[0]))[0]
+
+
+def _coerce_int(value: Any) -> int | None:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        stripped = value.replace(",", "").replace("¥", "").replace("￥", "").strip()
+        if not stripped:
+            return None
+        try:
+            return int(float(stripped))
+        except ValueError:
+            return None
+    return None
+
+
+def _parse_json(value: Any) -> Any:
+    if value is None or isinstance(value, (dict, list)):
+        return value
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+    return value
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+
+LIKE_ESCAPE_CHAR = "\\"
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_search_text(value: str) -> str:
+    """Fold width/case variants so stored search_text and query terms compare equal."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", value)).strip().lower()
+
+
+def contains_pattern(term: str) -> str:
+    normalized = normalize_search_text(term)
+    escaped = (
+        normalized.replace(LIKE_ESCAPE_CHAR, LIKE_ESCAPE_CHAR * 2)
+        .replace("%", f"{LIKE_ESCAPE_CHAR}%")
+        .replace("_", f"{LIKE_ESCAPE_CHAR}_")
+    )
+    return f"%{escaped}%"
+
+
+def search_condition_sql(column: str = "f.search_text", param: str = "search") -> str:
+    # A bare LIKE on the stored column keeps the pg_trgm GIN index usable; the
+    # same predicate still runs (as a scan) where the extension is unavailable.
+    return f"{column} LIKE :{param} ESCAPE '{LIKE_ESCAPE_CHAR}'"
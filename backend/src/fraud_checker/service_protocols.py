@@ -42,7 +42,12 @@ class FindingsRepository(Protocol):
     ): ...
     def get_program_unit_prices(self, target_date: date, program_ids: list[str]): ...
     def replace_conversion_findings(
-        self, target_date: date, rows: list[dict], *, generation_metadata: dict
+        self,
+        target_date: date,
+        rows: list[dict],
+        *,
+        generation_metadata: dict,
+        enrichment: dict | None = None,
     ) -> None: ...
 
 
@@ -60,13 +65,20 @@ class FindingsReadRepository(Protocol):
         risk_level: str | None,
         sort_by: str,
         sort_order: str,
-    ) -> tuple[list[dict], int]: ...
+        keyset: list | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[dict], int | None]: ...
     def get_conversion_finding_by_key(self, finding_key: str) -> dict | None: ...
 
 
 class FindingsWriteRepository(Protocol):
     def replace_conversion_findings(
-        self, target_date: date, rows: list[dict], *, generation_metadata: dict
+        self,
+        target_date: date,
+        rows: list[dict],
+        *,
+        generation_metadata: dict,
+        enrichment: dict | None = None,
     ) -> None: ...
 
 
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timedelta
-from typing import Any, Mapping
+from typing import Any, Callable, Iterator, Mapping, cast
 
 import sqlalchemy as sa
 
@@ -12,12 +14,15 @@ from ..api_dependencies import ConsoleAccessContext
 from ..api_parsers import parse_iso_date
 from ..api_presenters import format_reasons
 from ..console_service_support import (
-    build_alert_csv,
+    iter_alert_csv,
     normalize_reward_amount_source,
     reward_amount_is_estimated,
 )
 from ..constants import DEFAULT_REWARD_YEN
 from ..job_status_pg import JobStatusStorePG
+from ..pagination import decode_cursor, encode_cursor, keyset_params, keyset_predicate
+from ..rewards import representative_unit_price, representative_weighted_price, reward_from_row
+from ..search_text import contains_pattern, search_condition_sql
 from ..service_protocols import ConsoleRepository
 from ..time_utils import now_local
 from . import reporting
@@ -25,6 +30,7 @@ from . import reporting
 logger = logging.getLogger(__name__)
 
 ALERT_REVIEW_STATUSES = {"unhandled", "investigating", "confirmed_fraud", "white"}
+ACTIVE_REVIEW_STATUSES = {"unhandled", "investigating"}
 DEFAULT_AFFILIATE_ID = "unassigned"
 DEFAULT_AFFILIATE_NAME = "Unassigned"
 DEFAULT_OUTCOME_TYPE = "Unknown Outcome"
@@ -32,67 +38,180 @@ DEFAULT_ALERT_PAGE = 1
 DEFAULT_ALERT_PAGE_SIZE = 50
 MAX_ALERT_PAGE_SIZE = 200
 DEFAULT_RELATED_CASE_LIMIT = 5
+DEFAULT_ALERT_DETAIL_CONTEXT_WORKERS = 4
+EXPORT_BATCH_SIZE = 500
+# Each ascending order is the exact reverse of its descending order so the same
+# status-leading partial index (0034) serves both directions.
+ALERT_SORT_KEYS: dict[str, tuple[tuple[str, str, str, str], ...]] = {
+    "risk_desc": (
+        ("f.risk_score", "DESC", "int", "risk_score"),
+        ("f.finding_key", "ASC", "text", "finding_key"),
+    ),
+    "risk_asc": (
+        ("f.risk_score", "ASC", "int", "risk_score"),
+        ("f.finding_key", "DESC", "text", "finding_key"),
+    ),
+    "damage_desc": (
+        ("COALESCE(f.estimated_damage_yen, 0)", "DESC", "int", "estimated_damage_yen"),
+        ("f.risk_score", "DESC", "int", "risk_score"),
+        ("f.finding_key", "ASC", "text", "finding_key"),
+    ),
+    "damage_asc": (
+        ("COALESCE(f.estimated_damage_yen, 0)", "ASC", "int", "estimated_damage_yen"),
+        ("f.risk_score", "ASC", "int", "risk_score"),
+        ("f.finding_key", "DESC", "text", "finding_key"),
+    ),
+    "detected_desc": (
+        ("f.computed_at", "DESC", "datetime", "computed_at"),
+        ("f.risk_score", "DESC", "int", "risk_score"),
+        ("f.finding_key", "ASC", "text", "finding_key"),
+    ),
+    "detected_asc": (
+        ("f.computed_at", "ASC", "datetime", "computed_at"),
+        ("f.risk_score", "ASC", "int", "risk_score"),
+        ("f.finding_key", "DESC", "text", "finding_key"),
+    ),
+}
+DASHBOARD_SNAPSHOT_TABLE = "console_dashboard_snapshots"
+DASHBOARD_SNAPSHOT_LATEST_KEY = "latest"
+DASHBOARD_SNAPSHOT_MAX_AGE = timedelta(minutes=15)
+DASHBOARD_BACKLOG_LIMIT = 10
+DASHBOARD_STALE_UNHANDLED_DAYS = 3
 FOLLOW_UP_OPEN_STATUSES = {"open"}
 FOLLOW_UP_TASK_LABELS = {
     "payout_hold": "支払保留を実施",
     "partner_notice": "関係者へ通知",
     "evidence_preservation": "証跡を保全",
 }
-REWARD_KEYS = {
-    "gross_reward",
-    "net_reward",
-    "gross_action_cost",
-    "net_action_cost",
-    "reward",
-    "reward_amount",
-    "commission",
-    "commission_amount",
-    "payout",
-    "payout_amount",
-    "amount",
-    "price",
-    "cv_price",
-}
 
 
 def get_dashboard(repo: ConsoleRepository, target_date: str | None = None) -> dict[str, Any]:
+    return attach_dashboard_job_status(repo, load_dashboard(repo, target_date))
+
+
+def load_dashboard(repo: ConsoleRepository, target_date: str | None = None) -> dict[str, Any]:
+    payload = _load_dashboard_snapshot(repo, target_date)
+    if payload is None:
+        payload = recompute_dashboard_snapshot(repo, target_date)
+    return payload
+
+
+def attach_dashboard_job_status(repo: ConsoleRepository, payload: dict[str, Any]) -> dict[str, Any]:
+    # Job status changes on enqueue/acquire, which does not bump the cache version; keep it live.
+    payload["job_status_summary"] = _get_job_status_summary(repo)
+    return payload
+
+
+def recompute_dashboard_snapshot(repo: ConsoleRepository, target_date: str | None = None) -> dict[str, Any]:
+    computed_at = now_local()
+    payload = _build_dashboard_payload(repo, target_date)
+    payload["snapshot"] = {"computed_at": _iso(computed_at), "served_from": "live"}
+    save = getattr(repo, "save_dashboard_snapshot", None)
+    if callable(save) and table_exists(repo, DASHBOARD_SNAPSHOT_TABLE):
+        try:
+            save(
+                _dashboard_snapshot_key(target_date),
+                target_date=parse_iso_date(payload["target_date"]) if payload.get("target_date") else None,
+                payload_json=json.dumps(payload, ensure_ascii=False, default=str),
+                computed_at=computed_at,
+            )
+        except Exception:
+            logger.exception("Failed to save console dashboard snapshot")
+    return payload
+
+
+def invalidate_dashboard_snapshots(repo: ConsoleRepository) -> None:
+    """Drop materialized dashboards after findings change; the next read rebuilds its own view.
+
+    Writers only pay for a DELETE, so a refresh that recomputes N dates never rebuilds the
+    dashboard N times, and views nobody opens are never rebuilt at all.
+    """
+    if not table_exists(repo, DASHBOARD_SNAPSHOT_TABLE):
+        return
+    try:
+        clear = getattr(repo, "clear_dashboard_snapshots", None)
+        if callable(clear):
+            clear()
+    except Exception:
+        logger.exception("Failed to invalidate console dashboard snapshots")
+
+
+def dashboard_cache_expiry(payload: dict[str, Any]) -> datetime | None:
+    """A payload served from a snapshot may only be reused until that snapshot would expire."""
+    snapshot = payload.get("snapshot") or {}
+    if snapshot.get("served_from") != "snapshot":
+        return None
+    try:
+        return datetime.fromisoformat(snapshot["computed_at"]) + DASHBOARD_SNAPSHOT_MAX_AGE
+    except (KeyError, TypeError, ValueError):
+        return now_local()
+
+
+def _dashboard_snapshot_key(target_date: str | None) -> str:
+    if not target_date:
+        return DASHBOARD_SNAPSHOT_LATEST_KEY
+    return parse_iso_date(target_date).isoformat()
+
+
+def _load_dashboard_snapshot(repo: ConsoleRepository, target_date: str | None) -> dict[str, Any] | None:
+    loader = getattr(repo, "get_dashboard_snapshot", None)
+    if not callable(loader):
+        return None
+    snapshot_key = _dashboard_snapshot_key(target_date)
+    try:
+        row = loader(snapshot_key)
+    except Exception:
+        logger.exception("Failed to load console dashboard snapshot")
+        return None
+    if not row or not row.get("payload_json"):
+        return None
+    computed_at = row.get("computed_at")
+    if isinstance(computed_at, str):
+        computed_at = datetime.fromisoformat(computed_at)
+    if not isinstance(computed_at, datetime) or now_local() - computed_at > DASHBOARD_SNAPSHOT_MAX_AGE:
+        return None
+    payload = _parse_json(row["payload_json"])
+    if not isinstance(payload, dict):
+        return None
+    payload["snapshot"] = {"computed_at": _iso(computed_at), "served_from": "snapshot"}
+    return payload
+
+
+def _build_dashboard_payload(repo: ConsoleRepository, target_date: str | None) -> dict[str, Any]:
     summary = reporting.get_summary(repo, target_date)
     resolved_date = summary["date"]
-    daily_rows = _fetch_alert_rows(
-        repo,
-        start_date=resolved_date,
-        end_date=resolved_date,
-        status=None,
-        sort="risk_desc",
-    )
+    backlog = _fetch_backlog_aggregates(repo, target_date=resolved_date)
+    status_counts = {status: int(values["row_count"]) for status, values in backlog.items()}
     backlog_rows = _fetch_alert_rows(
         repo,
         start_date=None,
         end_date=None,
-        status=None,
+        status="unhandled",
         sort="risk_desc",
+        limit=DASHBOARD_BACKLOG_LIMIT,
     )
     transaction_summary = _fetch_alert_transaction_summary(
         repo,
-        [row for row in daily_rows + backlog_rows if _requires_summary_fallback(row)],
+        [row for row in backlog_rows if _requires_summary_fallback(row)],
     )
-    daily_items = [_build_case_item(row, transaction_summary.get(str(row["finding_key"]))) for row in daily_rows]
     backlog_items = [_build_case_item(row, transaction_summary.get(str(row["finding_key"]))) for row in backlog_rows]
-    _attach_case_context(repo, backlog_items)
 
-    impacted_conversions = sum(int(item.get("transaction_count") or 0) for item in daily_items)
+    impacted_conversions = sum(int(values["impacted_conversions"]) for values in backlog.values())
     total_conversions = int(summary.get("stats", {}).get("conversions", {}).get("total", 0) or 0)
     fraud_rate = round((impacted_conversions / total_conversions) * 100, 1) if total_conversions else 0.0
-    active_items = [item for item in backlog_items if item["status"] in {"unhandled", "investigating"}]
-    unhandled_alerts = sum(1 for item in backlog_items if item["status"] == "unhandled")
-    estimated_damage = sum(int(item.get("reward_amount") or 0) for item in active_items)
+    unhandled_alerts = status_counts.get("unhandled", 0)
+    estimated_damage = sum(
+        int(values["damage_total"])
+        for status, values in backlog.items()
+        if status in ACTIVE_REVIEW_STATUSES
+    )
 
     trend = [
         {"date": item["date"], "alerts": int(item.get("suspicious_conversions", 0) or 0)}
         for item in reporting.get_daily_stats(repo, 14, resolved_date)
     ]
-    review_outcomes = _build_review_outcomes(backlog_items)
-    operations = _build_operational_insights(repo, backlog_items)
+    review_outcomes = _build_review_outcomes(status_counts)
+    operations = _build_operational_insights(repo, backlog.get("unhandled"))
 
     return {
         "target_date": resolved_date,
@@ -105,8 +224,8 @@ def get_dashboard(repo: ConsoleRepository, target_date: str | None = None) -> di
         "trend": trend,
         "review_outcomes": review_outcomes,
         "operations": operations,
+        "backlog": {"items": backlog_items, "total": unhandled_alerts},
         "quality": summary.get("quality") or {},
-        "job_status_summary": _get_job_status_summary(repo),
     }
 
 
@@ -121,44 +240,63 @@ def list_alerts(
     sort: str = "risk_desc",
     page: int = DEFAULT_ALERT_PAGE,
     page_size: int = DEFAULT_ALERT_PAGE_SIZE,
+    cursor: str | None = None,
+    include_totals: bool | None = None,
 ) -> dict[str, Any]:
     resolved_start, resolved_end = _resolve_alert_window(repo, start_date, end_date)
+    resolved_sort = sort if sort in ALERT_SORT_KEYS else "risk_desc"
     resolved_page = max(DEFAULT_ALERT_PAGE, int(page or DEFAULT_ALERT_PAGE))
     resolved_page_size = min(MAX_ALERT_PAGE_SIZE, max(1, int(page_size or DEFAULT_ALERT_PAGE_SIZE)))
-    offset = (resolved_page - 1) * resolved_page_size
+    keyset = _decode_alert_cursor(resolved_sort, cursor) if cursor else None
+    offset = None if keyset is not None else (resolved_page - 1) * resolved_page_size
 
-    filtered_rows = _fetch_alert_rows(
+    fetched_rows = _fetch_alert_rows(
         repo,
         start_date=resolved_start,
         end_date=resolved_end,
         risk_level=risk_level,
         search=search,
         status=status,
-        sort=sort,
-        limit=resolved_page_size,
+        sort=resolved_sort,
+        limit=resolved_page_size + 1,
         offset=offset,
+        keyset=keyset,
     )
+    has_next = len(fetched_rows) > resolved_page_size
+    filtered_rows = fetched_rows[:resolved_page_size]
     transaction_summary = _fetch_alert_transaction_summary(
         repo,
         [row for row in filtered_rows if _requires_summary_fallback(row)],
     )
     items = [_build_case_item(row, transaction_summary.get(str(row["finding_key"]))) for row in filtered_rows]
     _attach_case_context(repo, items)
-    status_counts = _fetch_alert_status_counts(
-        repo,
-        start_date=resolved_start,
-        end_date=resolved_end,
-        risk_level=risk_level,
-        search=search,
-    )
-    total = _count_alert_rows(
-        repo,
-        start_date=resolved_start,
-        end_date=resolved_end,
-        risk_level=risk_level,
-        search=search,
-        status=status,
-    )
+
+    # Totals rescan the whole filtered set, so cursor pages skip them unless explicitly requested.
+    wants_totals = include_totals if include_totals is not None else cursor is None
+    status_counts: dict[str, int] | None = None
+    total: int | None = None
+    if wants_totals:
+        counts = _fetch_alert_status_counts(
+            repo,
+            start_date=resolved_start,
+            end_date=resolved_end,
+            risk_level=risk_level,
+            search=search,
+        )
+        status_counts = {
+            "unhandled": counts.get("unhandled", 0),
+            "investigating": counts.get("investigating", 0),
+            "confirmed_fraud": counts.get("confirmed_fraud", 0),
+            "white": counts.get("white", 0),
+        }
+        total = _count_alert_rows(
+            repo,
+            start_date=resolved_start,
+            end_date=resolved_end,
+            risk_level=risk_level,
+            search=search,
+            status=status,
+        )
 
     return {
         "available_dates": reporting.get_available_dates(repo),
@@ -170,17 +308,13 @@ def list_alerts(
             "search": (search or "").strip() or None,
             "sort": sort,
         },
-        "status_counts": {
-            "unhandled": status_counts.get("unhandled", 0),
-            "investigating": status_counts.get("investigating", 0),
-            "confirmed_fraud": status_counts.get("confirmed_fraud", 0),
-            "white": status_counts.get("white", 0),
-        },
+        "status_counts": status_counts,
         "items": items,
         "total": total,
-        "page": resolved_page,
+        "page": resolved_page if keyset is None else None,
         "page_size": resolved_page_size,
-        "has_next": offset + len(items) < total,
+        "has_next": has_next,
+        "next_cursor": _encode_alert_cursor(resolved_sort, filtered_rows[-1]) if has_next else None,
     }
 
 
@@ -194,8 +328,36 @@ def export_alerts_csv(
     search: str | None = None,
     sort: str = "risk_desc",
 ) -> str:
+    return "".join(
+        iter_alerts_csv(
+            repo,
+            status=status,
+            risk_level=risk_level,
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+            sort=sort,
+        )
+    )
+
+
+def iter_alerts_csv(
+    repo: ConsoleRepository,
+    *,
+    status: str | None = "unhandled",
+    risk_level: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    search: str | None = None,
+    sort: str = "risk_desc",
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[str]:
+    """Validate the filters up front, then return a lazy CSV stream that holds one batch at a time."""
     resolved_start, resolved_end = _resolve_alert_window(repo, start_date, end_date)
-    rows = _fetch_alert_rows(
+    for value in (resolved_start, resolved_end):
+        if value:
+            parse_iso_date(value)
+    batches = _iter_alert_row_batches(
         repo,
         start_date=resolved_start,
         end_date=resolved_end,
@@ -203,13 +365,20 @@ def export_alerts_csv(
         search=search,
         status=status,
         sort=sort,
+        batch_size=batch_size,
+    )
+    return iter_alert_csv(
+        (_build_export_items(repo, rows) for rows in batches),
+        exported_at=now_local().isoformat(),
     )
+
+
+def _build_export_items(repo: ConsoleRepository, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     transaction_summary = _fetch_alert_transaction_summary(
         repo,
         [row for row in rows if _requires_summary_fallback(row)],
     )
-    items = [_build_case_item(row, transaction_summary.get(str(row["finding_key"]))) for row in rows]
-    return build_alert_csv(items, exported_at=now_local().isoformat())
+    return [_build_case_item(row, transaction_summary.get(str(row["finding_key"]))) for row in rows]
 
 
 def get_alert_detail(
@@ -218,16 +387,23 @@ def get_alert_detail(
     *,
     access_context: ConsoleAccessContext | None = None,
 ) -> dict[str, Any] | None:
+    repo = cast(ConsoleRepository, _SchemaProbeMemo(repo))
     row = _fetch_alert_detail_row(repo, finding_key)
     if row is None:
         return None
 
-    fallback_summary = None
-    if _requires_summary_fallback(row):
-        fallback_summary = _fetch_alert_transaction_summary(repo, [row]).get(str(row["finding_key"]))
-
-    summary = _resolve_alert_summary(row, fallback_summary)
+    case_key = str(row.get("case_key") or row["finding_key"])
     reasons = format_reasons(row.get("reasons_json") or []) if row.get("reasons_json") else []
+    known_affiliate = _primary_affiliate(
+        _build_entities(
+            row.get("affiliate_ids_json"),
+            row.get("affiliate_names_json"),
+            default_name=DEFAULT_AFFILIATE_NAME,
+        )
+    )
+    context = _load_alert_detail_context(repo, row, case_key=case_key, affiliate=known_affiliate)
+
+    summary = _resolve_alert_summary(row, context.get("fallback_summary"))
     affected_affiliates = _build_entities(
         row.get("affiliate_ids_json"),
         row.get("affiliate_names_json"),
@@ -241,31 +417,16 @@ def get_alert_detail(
         fallback_name=summary["outcome_type"],
         default_name=DEFAULT_OUTCOME_TYPE,
     )
-    evidence_transactions = [
-        _present_transaction(item)
-        for item in _fetch_entity_transactions(repo, row["date"], row["ipaddress"], row["useragent"])
-    ]
-    affiliate_recent_transactions: list[dict[str, Any]] = []
-    affiliate_recent_scope: dict[str, str] | None = None
-    primary_affiliate = next(
-        (
-            item
-            for item in affected_affiliates
-            if item["id"] and item["id"] != DEFAULT_AFFILIATE_ID
-        ),
-        None,
-    )
-    if primary_affiliate is not None:
-        affiliate_recent_transactions = [
-            _present_transaction(item)
-            for item in _fetch_recent_affiliate_transactions(repo, primary_affiliate["id"])
-        ]
-        affiliate_recent_scope = primary_affiliate
-
-    assignment_map = _fetch_case_assignments(repo, [str(row.get("case_key") or row["finding_key"])])
-    followup_map = _fetch_followup_tasks(repo, [str(row.get("case_key") or row["finding_key"])])
-    case_key = str(row.get("case_key") or row["finding_key"])
-    related_cases = _fetch_related_cases(repo, row)
+    evidence_transactions = [_present_transaction(item) for item in context["evidence_transactions"]]
+    affiliate_recent_scope = known_affiliate or _primary_affiliate(affected_affiliates)
+    affiliate_rows = context.get("affiliate_recent_transactions")
+    if affiliate_rows is None and affiliate_recent_scope is not None:
+        # Only reached when the affiliate comes from the transaction summary fallback.
+        affiliate_rows = _fetch_recent_affiliate_transactions(repo, affiliate_recent_scope["id"])
+    affiliate_recent_transactions = [_present_transaction(item) for item in affiliate_rows or []]
+    assignment_map = context["assignments"]
+    followup_map = context["followups"]
+    related_cases = context["related_cases"]
 
     if access_context is not None:
         logger.info(
@@ -301,7 +462,7 @@ def get_alert_detail(
         "evidence_transactions": evidence_transactions,
         "affiliate_recent_transactions": affiliate_recent_transactions,
         "affiliate_recent_scope": affiliate_recent_scope,
-        "review_history": _fetch_review_history(repo, row["case_key"], row["finding_key"]),
+        "review_history": context["review_history"],
         "follow_up_tasks": followup_map.get(case_key, []),
         "assignee": assignment_map.get(case_key),
         "related_cases": related_cases,
@@ -315,6 +476,80 @@ def get_alert_detail(
     }
 
 
+class _SchemaProbeMemo:
+    """Request-scoped repository view that answers repeated table/column probes from memory."""
+
+    def __init__(self, repo: ConsoleRepository) -> None:
+        self._repo = repo
+        self._tables: dict[str, bool] = {}
+        self._columns: dict[tuple[str, str], bool] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repo, name)
+
+    def _table_exists(self, table_name: str) -> bool:
+        if table_name not in self._tables:
+            exists = getattr(self._repo, "_table_exists", None)
+            self._tables[table_name] = bool(exists(table_name)) if callable(exists) else False
+        return self._tables[table_name]
+
+    def _column_exists(self, table_name: str, column_name: str) -> bool:
+        key = (table_name, column_name)
+        if key not in self._columns:
+            exists = getattr(self._repo, "_column_exists", None)
+            self._columns[key] = bool(exists(table_name, column_name)) if callable(exists) else False
+        return self._columns[key]
+
+
+def _primary_affiliate(affiliates: list[dict[str, str]]) -> dict[str, str] | None:
+    return next(
+        (item for item in affiliates if item["id"] and item["id"] != DEFAULT_AFFILIATE_ID),
+        None,
+    )
+
+
+def _alert_detail_context_workers() -> int:
+    raw = os.getenv("FC_ALERT_DETAIL_CONTEXT_WORKERS", str(DEFAULT_ALERT_DETAIL_CONTEXT_WORKERS))
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return DEFAULT_ALERT_DETAIL_CONTEXT_WORKERS
+
+
+def _load_alert_detail_context(
+    repo: ConsoleRepository,
+    row: dict[str, Any],
+    *,
+    case_key: str,
+    affiliate: dict[str, str] | None,
+) -> dict[str, Any]:
+    """Fetch the independent detail sections at once; each loader checks out its own pooled connection."""
+    loaders: dict[str, Callable[[], Any]] = {
+        "evidence_transactions": lambda: _fetch_entity_transactions(
+            repo, row["date"], row["ipaddress"], row["useragent"]
+        ),
+        "review_history": lambda: _fetch_review_history(repo, case_key, row["finding_key"]),
+        "assignments": lambda: _fetch_case_assignments(repo, [case_key]),
+        "followups": lambda: _fetch_followup_tasks(repo, [case_key]),
+        "related_cases": lambda: _fetch_related_cases(repo, row),
+    }
+    if _requires_summary_fallback(row):
+        loaders["fallback_summary"] = lambda: _fetch_alert_transaction_summary(repo, [row]).get(
+            str(row["finding_key"])
+        )
+    if affiliate is not None:
+        loaders["affiliate_recent_transactions"] = lambda: _fetch_recent_affiliate_transactions(
+            repo, affiliate["id"]
+        )
+
+    workers = min(_alert_detail_context_workers(), len(loaders))
+    if workers <= 1:
+        return {name: loader() for name, loader in loaders.items()}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="alert-detail") as executor:
+        futures = {name: executor.submit(loader) for name, loader in loaders.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
 def apply_review_action(
     repo: ConsoleRepository,
     finding_keys: list[str],
@@ -431,7 +666,8 @@ def _optional_findings_column(repo: ConsoleRepository, column_name: str, sql_typ
     return f"CAST(NULL AS {sql_type}) AS {column_name}"
 
 
-def _table_exists(repo: ConsoleRepository, table_name: str) -> bool:
+def table_exists(repo: ConsoleRepository, table_name: str) -> bool:
+    """Whether `table_name` exists, via the repository's cached probe; False when it cannot tell."""
     exists = getattr(repo, "_table_exists", None)
     if not callable(exists):
         return False
@@ -442,9 +678,39 @@ def _table_exists(repo: ConsoleRepository, table_name: str) -> bool:
         return False
 
 
+def _current_findings_sql(repo: ConsoleRepository) -> str:
+    if not table_exists(repo, "findings_current_generations"):
+        return "f.is_current = TRUE"
+    return (
+        "f.is_current = TRUE AND EXISTS ("
+        "SELECT 1 FROM findings_current_generations cg "
+        "WHERE cg.finding_type = 'conversion' "
+        "AND cg.target_date = f.date "
+        "AND cg.generation_id = f.generation_id"
+        ")"
+    )
+
+
+def _conversion_reward_column_exists(repo: ConsoleRepository) -> bool:
+    exists = getattr(repo, "_column_exists", None)
+    if not callable(exists):
+        return False
+    try:
+        return bool(exists("conversion_raw", "reward_resolved"))
+    except Exception:
+        logger.exception("Failed to inspect conversion_raw column 'reward_resolved'")
+        return False
+
+
+def _conversion_reward_sql(repo: ConsoleRepository) -> str:
+    if _conversion_reward_column_exists(repo):
+        return "c.reward_yen, c.reward_resolved"
+    return "CAST(NULL AS INTEGER) AS reward_yen"
+
+
 def _case_key_expr(repo: ConsoleRepository) -> str:
     if _findings_column_exists(repo, "case_key"):
-        return "COALESCE(f.case_key, f.finding_key)"
+        return "f.case_key"
     return "f.finding_key"
 
 
@@ -477,12 +743,14 @@ def _findings_select_columns(repo: ConsoleRepository) -> str:
 
 
 def _review_join_sql(repo: ConsoleRepository) -> tuple[str, str]:
-    if _table_exists(repo, "fraud_alert_review_states"):
+    if _findings_column_exists(repo, "review_status"):
+        return "", "f.review_status"
+    if table_exists(repo, "fraud_alert_review_states"):
         return (
             f"LEFT JOIN fraud_alert_review_states review_state ON review_state.case_key = {_case_key_expr(repo)}",
             "COALESCE(review_state.review_status, 'unhandled')",
         )
-    if _table_exists(repo, "fraud_alert_reviews"):
+    if table_exists(repo, "fraud_alert_reviews"):
         return (
             "LEFT JOIN fraud_alert_reviews review_state ON review_state.finding_key = f.finding_key",
             "COALESCE(review_state.review_status, 'unhandled')",
@@ -514,7 +782,7 @@ def _build_alert_conditions(
     status: str | None = None,
 ) -> tuple[dict[str, object], list[str]]:
     params: dict[str, object] = {}
-    conditions = ["f.is_current = TRUE"]
+    conditions = [_current_findings_sql(repo)]
     _join_sql, review_status_sql = _review_join_sql(repo)
 
     if start_date:
@@ -527,20 +795,30 @@ def _build_alert_conditions(
         params["risk_level"] = risk_level.strip()
         conditions.append("f.risk_level = :risk_level")
     if search and search.strip():
-        params["search"] = f"%{search.strip().lower()}%"
-        conditions.append(
-            "("
-            "LOWER(COALESCE(f.search_text, '')) LIKE :search "
-            "OR LOWER(COALESCE(f.ipaddress, '')) LIKE :search "
-            "OR LOWER(COALESCE(f.useragent, '')) LIKE :search"
-            ")"
-        )
+        params["search"] = contains_pattern(search)
+        conditions.append(search_condition_sql())
     if status and status != "all":
         params["review_status"] = status
         conditions.append(f"{review_status_sql} = :review_status")
     return params, conditions
 
 
+def _alert_sort_keys(sort: str) -> tuple[tuple[str, str, str, str], ...]:
+    return ALERT_SORT_KEYS.get(sort, ALERT_SORT_KEYS["risk_desc"])
+
+
+def _encode_alert_cursor(sort: str, row: Mapping[str, Any]) -> str:
+    values: list[Any] = []
+    for _expr, _direction, kind, field in _alert_sort_keys(sort):
+        value = row.get(field)
+        values.append(int(value or 0) if kind == "int" else value)
+    return encode_cursor(sort, values)
+
+
+def _decode_alert_cursor(sort: str, cursor: str) -> list[Any]:
+    return decode_cursor(cursor, sort=sort, kinds=[kind for _expr, _direction, kind, _field in _alert_sort_keys(sort)])
+
+
 def _fetch_alert_rows(
     repo: ConsoleRepository,
     *,
@@ -552,7 +830,73 @@ def _fetch_alert_rows(
     sort: str,
     limit: int | None = None,
     offset: int | None = None,
+    keyset: list[Any] | None = None,
 ) -> list[dict[str, Any]]:
+    query, params = _alert_rows_query(
+        repo,
+        start_date=start_date,
+        end_date=end_date,
+        risk_level=risk_level,
+        search=search,
+        status=status,
+        sort=sort,
+        limit=limit,
+        offset=offset,
+        keyset=keyset,
+    )
+    try:
+        rows = repo.fetch_all(query, params)
+    except sa.exc.SQLAlchemyError:
+        logger.exception("Failed to fetch console alert rows")
+        raise
+    return [_deserialize_alert_row(row) for row in rows]
+
+
+def _iter_alert_row_batches(
+    repo: ConsoleRepository,
+    *,
+    start_date: str | None,
+    end_date: str | None,
+    risk_level: str | None = None,
+    search: str | None = None,
+    status: str | None = None,
+    sort: str,
+    batch_size: int,
+) -> Iterator[list[dict[str, Any]]]:
+    query, params = _alert_rows_query(
+        repo,
+        start_date=start_date,
+        end_date=end_date,
+        risk_level=risk_level,
+        search=search,
+        status=status,
+        sort=sort,
+    )
+    iter_batches = getattr(repo, "iter_batches", None)
+    if not callable(iter_batches):
+        yield [_deserialize_alert_row(row) for row in repo.fetch_all(query, params)]
+        return
+    try:
+        for rows in iter_batches(query, params, batch_size=batch_size):
+            yield [_deserialize_alert_row(row) for row in rows]
+    except sa.exc.SQLAlchemyError:
+        logger.exception("Failed to stream console alert rows")
+        raise
+
+
+def _alert_rows_query(
+    repo: ConsoleRepository,
+    *,
+    start_date: str | None,
+    end_date: str | None,
+    risk_level: str | None = None,
+    search: str | None = None,
+    status: str | None = None,
+    sort: str,
+    limit: int | None = None,
+    offset: int | None = None,
+    keyset: list[Any] | None = None,
+) -> tuple[str, dict[str, Any]]:
     select_columns = _findings_select_columns(repo)
     join_sql, review_status_sql = _review_join_sql(repo)
     params, conditions = _build_alert_conditions(
@@ -563,14 +907,11 @@ def _fetch_alert_rows(
         search=search,
         status=status,
     )
-    order_by = {
-        "risk_desc": "f.risk_score DESC, f.computed_at DESC",
-        "risk_asc": "f.risk_score ASC, f.computed_at DESC",
-        "damage_desc": "COALESCE(f.estimated_damage_yen, 0) DESC, f.risk_score DESC, f.computed_at DESC",
-        "damage_asc": "COALESCE(f.estimated_damage_yen, 0) ASC, f.risk_score DESC, f.computed_at DESC",
-        "detected_desc": "f.computed_at DESC, f.risk_score DESC",
-        "detected_asc": "f.computed_at ASC, f.risk_score DESC",
-    }.get(sort, "f.risk_score DESC, f.computed_at DESC")
+    sort_keys = _alert_sort_keys(sort)
+    order_by = ", ".join(f"{expr} {direction}" for expr, direction, _kind, _field in sort_keys)
+    if keyset is not None:
+        conditions.append(keyset_predicate([(expr, direction) for expr, direction, _kind, _field in sort_keys]))
+        params.update(keyset_params(keyset))
     pagination_sql = ""
     if limit is not None:
         params["limit"] = limit
@@ -578,24 +919,17 @@ def _fetch_alert_rows(
     if offset is not None:
         params["offset"] = max(0, offset)
         pagination_sql += " OFFSET :offset"
-    try:
-        rows = repo.fetch_all(
-            f"""
+    query = f"""
             SELECT
                 {select_columns},
                 {review_status_sql} AS review_status
             FROM suspicious_conversion_findings f
             {join_sql}
             WHERE {" AND ".join(conditions)}
-            ORDER BY {order_by}, f.finding_key ASC
+            ORDER BY {order_by}
             {pagination_sql}
-            """,
-            params,
-        )
-    except sa.exc.SQLAlchemyError:
-        logger.exception("Failed to fetch console alert rows")
-        raise
-    return [_deserialize_alert_row(row) for row in rows]
+            """
+    return query, params
 
 
 def _fetch_alert_detail_row(repo: ConsoleRepository, alert_key: str) -> dict[str, Any] | None:
@@ -610,7 +944,7 @@ def _fetch_alert_detail_row(repo: ConsoleRepository, alert_key: str) -> dict[str
                 {review_status_sql} AS review_status
             FROM suspicious_conversion_findings f
             {join_sql}
-            WHERE f.is_current = TRUE
+            WHERE {_current_findings_sql(repo)}
               AND (
                 f.finding_key = :alert_key
                 OR {case_key_expr} = :alert_key
@@ -666,6 +1000,60 @@ def _fetch_alert_status_counts(
     }
 
 
+def _fetch_backlog_aggregates(
+    repo: ConsoleRepository,
+    *,
+    target_date: str | None,
+) -> dict[str, dict[str, Any]]:
+    join_sql, review_status_sql = _review_join_sql(repo)
+    params, conditions = _build_alert_conditions(repo, start_date=None, end_date=None)
+    summary_join_sql = ""
+    fallback_terms: list[str] = []
+    if _findings_column_exists(repo, "estimated_damage_yen"):
+        fallback_terms.append("f.estimated_damage_yen")
+    if table_exists(repo, "conversion_finding_summaries"):
+        summary_join_sql = "LEFT JOIN conversion_finding_summaries s ON s.finding_key = f.finding_key"
+        fallback_terms.append("s.reward_amount")
+        conversions_expr = "COALESCE(NULLIF(f.total_conversions, 0), s.transaction_count, 0)"
+    else:
+        conversions_expr = "COALESCE(f.total_conversions, 0)"
+    damage_expr = f"COALESCE({', '.join(fallback_terms)}, 0)" if fallback_terms else "0"
+    params["target_date"] = parse_iso_date(target_date) if target_date else None
+    params["stale_cutoff"] = now_local().date() - timedelta(days=DASHBOARD_STALE_UNHANDLED_DAYS)
+    try:
+        rows = repo.fetch_all(
+            f"""
+            SELECT
+                {review_status_sql} AS review_status,
+                COUNT(*) AS row_count,
+                SUM({damage_expr}) AS damage_total,
+                SUM(CASE WHEN f.date = :target_date THEN {conversions_expr} ELSE 0 END) AS impacted_conversions,
+                MIN(f.date) AS oldest_date,
+                SUM(CASE WHEN f.date <= :stale_cutoff THEN 1 ELSE 0 END) AS stale_count
+            FROM suspicious_conversion_findings f
+            {join_sql}
+            {summary_join_sql}
+            WHERE {" AND ".join(conditions)}
+            GROUP BY 1
+            """,
+            params,
+        )
+    except sa.exc.SQLAlchemyError:
+        logger.exception("Failed to fetch console backlog aggregates")
+        raise
+    return {
+        str(row["review_status"]): {
+            "row_count": int(row.get("row_count") or 0),
+            "damage_total": int(row.get("damage_total") or 0),
+            "impacted_conversions": int(row.get("impacted_conversions") or 0),
+            "oldest_date": row.get("oldest_date"),
+            "stale_count": int(row.get("stale_count") or 0),
+        }
+        for row in rows
+        if row.get("review_status")
+    }
+
+
 def _count_alert_rows(
     repo: ConsoleRepository,
     *,
@@ -735,7 +1123,7 @@ def _fetch_matching_case_keys(repo: ConsoleRepository, requested_keys: list[str]
                 {case_key_expr} AS case_key,
                 f.finding_key
             FROM suspicious_conversion_findings f
-            WHERE f.is_current = TRUE
+            WHERE {_current_findings_sql(repo)}
               AND (
                 f.finding_key IN ({placeholders})
                 OR {case_key_expr} IN ({placeholders})
@@ -764,7 +1152,7 @@ def _fetch_matching_case_keys(repo: ConsoleRepository, requested_keys: list[str]
 
 def _fetch_review_history(repo: ConsoleRepository, case_key: str, finding_key: str) -> list[dict[str, Any]]:
     try:
-        if _table_exists(repo, "fraud_alert_review_events"):
+        if table_exists(repo, "fraud_alert_review_events"):
             rows = repo.fetch_all(
                 """
                 SELECT
@@ -781,7 +1169,7 @@ def _fetch_review_history(repo: ConsoleRepository, case_key: str, finding_key: s
                 """,
                 {"case_key": case_key},
             )
-        elif _table_exists(repo, "fraud_alert_review_states"):
+        elif table_exists(repo, "fraud_alert_review_states"):
             rows = repo.fetch_all(
                 """
                 SELECT
@@ -797,7 +1185,7 @@ def _fetch_review_history(repo: ConsoleRepository, case_key: str, finding_key: s
                 """,
                 {"case_key": case_key},
             )
-        elif _table_exists(repo, "fraud_alert_reviews"):
+        elif table_exists(repo, "fraud_alert_reviews"):
             rows = repo.fetch_all(
                 """
                 SELECT
@@ -835,7 +1223,7 @@ def _fetch_review_history(repo: ConsoleRepository, case_key: str, finding_key: s
 
 def _fetch_case_assignments(repo: ConsoleRepository, case_keys: list[str]) -> dict[str, dict[str, Any]]:
     resolved_case_keys = sorted({value for value in case_keys if value})
-    if not resolved_case_keys or not _table_exists(repo, "fraud_alert_case_assignments"):
+    if not resolved_case_keys or not table_exists(repo, "fraud_alert_case_assignments"):
         return {}
 
     placeholders, params = _sequence_placeholders("assignment_case_", resolved_case_keys)
@@ -861,7 +1249,7 @@ def _fetch_case_assignments(repo: ConsoleRepository, case_keys: list[str]) -> di
 
 def _fetch_followup_tasks(repo: ConsoleRepository, case_keys: list[str]) -> dict[str, list[dict[str, Any]]]:
     resolved_case_keys = sorted({value for value in case_keys if value})
-    if not resolved_case_keys or not _table_exists(repo, "fraud_alert_followup_tasks"):
+    if not resolved_case_keys or not table_exists(repo, "fraud_alert_followup_tasks"):
         return {}
 
     placeholders, params = _sequence_placeholders("followup_case_", resolved_case_keys)
@@ -920,8 +1308,7 @@ def _attach_case_context(repo: ConsoleRepository, items: list[dict[str, Any]]) -
         )
 
 
-def _build_review_outcomes(items: list[dict[str, Any]]) -> dict[str, Any]:
-    counts = Counter(str(item.get("status") or "unhandled") for item in items)
+def _build_review_outcomes(counts: Mapping[str, int]) -> dict[str, Any]:
     reviewed_total = counts.get("confirmed_fraud", 0) + counts.get("white", 0)
     confirmed_ratio = (
         round((counts.get("confirmed_fraud", 0) / reviewed_total) * 100, 1)
@@ -937,28 +1324,18 @@ def _build_review_outcomes(items: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def _build_operational_insights(repo: ConsoleRepository, items: list[dict[str, Any]]) -> dict[str, Any]:
-    unhandled_items = [
-        item
-        for item in items
-        if item.get("status") == "unhandled" and item.get("environment", {}).get("date")
-    ]
+def _build_operational_insights(
+    repo: ConsoleRepository,
+    unhandled: Mapping[str, Any] | None,
+) -> dict[str, Any]:
     oldest_unhandled_days = None
     stale_unhandled_count = 0
-    if unhandled_items:
-        today = now_local().date()
-        ages = []
-        for item in unhandled_items:
-            try:
-                detected_date = parse_iso_date(str(item["environment"]["date"]))
-            except ValueError:
-                continue
-            age_days = (today - detected_date).days
-            ages.append(age_days)
-            if age_days >= 3:
-                stale_unhandled_count += 1
-        if ages:
-            oldest_unhandled_days = max(ages)
+    if unhandled and unhandled.get("oldest_date"):
+        oldest_date = unhandled["oldest_date"]
+        if not isinstance(oldest_date, date):
+            oldest_date = parse_iso_date(str(oldest_date)[:10])
+        oldest_unhandled_days = (now_local().date() - oldest_date).days
+        stale_unhandled_count = int(unhandled.get("stale_count") or 0)
 
     failed_jobs: list[dict[str, Any]] = []
     schedules: list[dict[str, Any]] = []
@@ -1043,7 +1420,7 @@ def _fetch_related_cases(repo: ConsoleRepository, row: dict[str, Any]) -> list[d
             {review_status_sql} AS review_status
         FROM suspicious_conversion_findings f
         {join_sql}
-        WHERE f.is_current = TRUE
+        WHERE {_current_findings_sql(repo)}
           AND f.ipaddress = :ipaddress
           AND f.useragent = :useragent
           AND f.date <> :target_date
@@ -1062,7 +1439,6 @@ def _fetch_related_cases(repo: ConsoleRepository, row: dict[str, Any]) -> list[d
         },
     )
     items = [_build_case_item(_deserialize_alert_row(item), None) for item in related_rows]
-    _attach_case_context(repo, items)
     return [
         {
             "case_key": item["case_key"],
@@ -1078,7 +1454,63 @@ def _fetch_related_cases(repo: ConsoleRepository, row: dict[str, Any]) -> list[d
 
 
 def _fetch_alert_transaction_summary(repo: ConsoleRepository, rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    if not rows or not _table_exists(repo, "conversion_raw"):
+    if not rows:
+        return {}
+    summaries = _fetch_persisted_transaction_summaries(repo, rows)
+    pending_rows = [row for row in rows if str(row["finding_key"]) not in summaries]
+    if pending_rows:
+        summaries.update(_fetch_live_transaction_summary(repo, pending_rows))
+    return summaries
+
+
+def _fetch_persisted_transaction_summaries(
+    repo: ConsoleRepository,
+    rows: list[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    if not table_exists(repo, "conversion_finding_summaries"):
+        return {}
+    findings_by_key = {str(row["finding_key"]): row for row in rows}
+    placeholders, params = _sequence_placeholders("summary_key_", sorted(findings_by_key))
+    persisted_rows = repo.fetch_all(
+        f"""
+        SELECT
+            finding_key,
+            transaction_count,
+            reward_amount,
+            reward_amount_source,
+            affiliate_id,
+            affiliate_name,
+            outcome_type,
+            latest_occurred_at
+        FROM conversion_finding_summaries
+        WHERE finding_key IN ({placeholders})
+        """,
+        params,
+    )
+    summaries: dict[str, dict[str, Any]] = {}
+    for persisted in persisted_rows:
+        finding_key = str(persisted["finding_key"])
+        finding = findings_by_key.get(finding_key, {})
+        summaries[finding_key] = {
+            "transaction_count": int(persisted.get("transaction_count") or 0),
+            "reward_amount": int(persisted.get("reward_amount") or 0),
+            "reward_amount_source": persisted.get("reward_amount_source") or "unknown",
+            "latest_occurred_at": _iso(persisted.get("latest_occurred_at"))
+            or _iso(finding.get("last_time"))
+            or _iso(finding.get("computed_at")),
+            "affiliate_id": persisted.get("affiliate_id") or DEFAULT_AFFILIATE_ID,
+            "affiliate_name": persisted.get("affiliate_name")
+            or _first_non_empty(finding.get("affiliate_names_json"))
+            or DEFAULT_AFFILIATE_NAME,
+            "outcome_type": persisted.get("outcome_type")
+            or _first_non_empty(finding.get("program_names_json"))
+            or DEFAULT_OUTCOME_TYPE,
+        }
+    return summaries
+
+
+def _fetch_live_transaction_summary(repo: ConsoleRepository, rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    if not table_exists(repo, "conversion_raw"):
         return {}
     keys = [
         (row["finding_key"], row["date"], *_date_time_bounds(row["date"]), row["ipaddress"], row["useragent"])
@@ -1114,6 +1546,7 @@ def _fetch_alert_transaction_summary(repo: ConsoleRepository, rows: list[dict[st
             c.conversion_time,
             c.state,
             c.raw_payload,
+            {_conversion_reward_sql(repo)},
             c.user_id,
             COALESCE(u.name, c.user_id, :default_affiliate_name) AS affiliate_name,
             c.program_id,
@@ -1166,6 +1599,11 @@ def _fetch_program_unit_prices(repo: ConsoleRepository, findings: list[dict[str,
     )
     if not requested_dates or not requested_program_ids:
         return {}
+    prices = _fetch_persisted_program_unit_prices(repo, requested_dates, requested_program_ids)
+    materialized_dates = {target_date for target_date, _program_id in prices}
+    requested_dates = [value for value in requested_dates if value not in materialized_dates]
+    if not requested_dates:
+        return prices
     program_placeholders = ", ".join(f":program_id_{idx}" for idx in range(len(requested_program_ids)))
     date_ranges = {value: _date_time_bounds(value) for value in requested_dates}
     params: dict[str, object] = {
@@ -1173,31 +1611,92 @@ def _fetch_program_unit_prices(repo: ConsoleRepository, findings: list[dict[str,
         "overall_end": max(bounds[1] for bounds in date_ranges.values()),
         **{f"program_id_{idx}": value for idx, value in enumerate(requested_program_ids)},
     }
+    if _conversion_reward_column_exists(repo):
+        rows = repo.fetch_all(
+            f"""
+            SELECT
+                CAST(conversion_time AS date) AS conversion_date,
+                program_id,
+                reward_yen,
+                reward_resolved,
+                CASE WHEN NOT reward_resolved THEN raw_payload END AS raw_payload,
+                COUNT(*) AS conversion_count
+            FROM conversion_raw
+            WHERE conversion_time >= :overall_start
+              AND conversion_time < :overall_end
+              AND program_id IN ({program_placeholders})
+            GROUP BY
+                CAST(conversion_time AS date),
+                program_id,
+                reward_yen,
+                reward_resolved,
+                CASE WHEN NOT reward_resolved THEN raw_payload END
+            """,
+            params,
+        )
+    else:
+        rows = [
+            {**row, "conversion_date": row.get("conversion_time"), "conversion_count": 1}
+            for row in repo.fetch_all(
+                f"""
+                SELECT conversion_time, program_id, raw_payload
+                FROM conversion_raw
+                WHERE conversion_time >= :overall_start
+                  AND conversion_time < :overall_end
+                  AND program_id IN ({program_placeholders})
+                """,
+                params,
+            )
+        ]
+    grouped_prices: dict[tuple[date, str], Counter[int]] = defaultdict(Counter)
+    for row in rows:
+        target_date = row.get("conversion_date")
+        if isinstance(target_date, datetime):
+            target_date = target_date.date()
+        elif isinstance(target_date, str):
+            target_date = parse_iso_date(target_date[:10])
+        program_id = row.get("program_id")
+        if not isinstance(target_date, date) or not program_id or target_date not in date_ranges:
+            continue
+        grouped_prices[(target_date, str(program_id))][reward_from_row(row)] += int(row.get("conversion_count") or 0)
+    prices.update(
+        {
+            key: representative
+            for key, representative in (
+                (key, representative_weighted_price(counts)) for key, counts in grouped_prices.items()
+            )
+            if representative is not None
+        }
+    )
+    return prices
+
+
+def _fetch_persisted_program_unit_prices(
+    repo: ConsoleRepository,
+    requested_dates: list[date],
+    requested_program_ids: list[str],
+) -> dict[tuple[date, str], int]:
+    if not table_exists(repo, "program_unit_prices_daily"):
+        return {}
+    date_placeholders, date_params = _sequence_placeholders("price_date_", requested_dates)
+    program_placeholders, program_params = _sequence_placeholders("price_program_", requested_program_ids)
     rows = repo.fetch_all(
         f"""
-        SELECT conversion_time, program_id, raw_payload
-        FROM conversion_raw
-        WHERE conversion_time >= :overall_start
-          AND conversion_time < :overall_end
+        SELECT date, program_id, unit_price_yen
+        FROM program_unit_prices_daily
+        WHERE date IN ({date_placeholders})
           AND program_id IN ({program_placeholders})
         """,
-        params,
+        {**date_params, **program_params},
     )
-    grouped_prices: dict[tuple[date, str], list[int]] = defaultdict(list)
+    prices: dict[tuple[date, str], int] = {}
     for row in rows:
-        conversion_time = row.get("conversion_time")
-        target_date = conversion_time.date() if isinstance(conversion_time, datetime) else None
-        program_id = row.get("program_id")
-        if not isinstance(target_date, date) or not program_id:
-            continue
-        grouped_prices[(target_date, str(program_id))].append(_reward_from_payload(row.get("raw_payload")))
-    return {
-        key: representative
-        for key, representative in (
-            (key, _representative_unit_price(values)) for key, values in grouped_prices.items()
-        )
-        if representative is not None
-    }
+        row_date = row.get("date")
+        if isinstance(row_date, str):
+            row_date = parse_iso_date(row_date)
+        if isinstance(row_date, date) and row.get("program_id") and row.get("unit_price_yen"):
+            prices[(row_date, str(row["program_id"]))] = int(row["unit_price_yen"])
+    return prices
 
 
 def _merge_summary_with_fallback(
@@ -1225,8 +1724,8 @@ def _merge_summary_with_fallback(
     if missing_count <= 0:
         return summary
 
-    direct_unit_price = _representative_unit_price(
-        [_reward_from_payload(row.get("raw_payload")) for row in matched_rows]
+    direct_unit_price = representative_unit_price(
+        [reward_from_row(row) for row in matched_rows]
     )
     fallback_unit_price = direct_unit_price or _resolve_finding_unit_price(finding, price_index) or DEFAULT_REWARD_YEN
     summary["reward_amount"] += fallback_unit_price * missing_count
@@ -1246,12 +1745,7 @@ def _resolve_finding_unit_price(
         for program_id in (finding.get("program_ids_json") or [])
         if program_id and (target_date, str(program_id)) in price_index
     ]
-    return _representative_unit_price(prices)
-
-
-def _representative_unit_price(prices: list[int]) -> int | None:
-    positive_prices = [price for price in prices if price > 0]
-    return Counter(positive_prices).most_common(1)[0][0] if positive_prices else None
+    return representative_unit_price(prices)
 
 
 def _priority_score(*, risk_score: int, reward_amount: int) -> int:
@@ -1452,16 +1946,17 @@ def _resolve_alert_summary(row: dict[str, Any], fallback_summary: dict[str, Any]
 
 
 def _fetch_entity_transactions(repo: ConsoleRepository, target_date: date, ipaddress: str, useragent: str) -> list[dict[str, Any]]:
-    if not _table_exists(repo, "conversion_raw"):
+    if not table_exists(repo, "conversion_raw"):
         return []
     target_start, target_end = _date_time_bounds(target_date)
     return repo.fetch_all(
-        """
+        f"""
         SELECT
             c.id AS transaction_id,
             c.conversion_time,
             c.state,
             c.raw_payload,
+            {_conversion_reward_sql(repo)},
             c.user_id,
             COALESCE(u.name, c.user_id, :default_affiliate_name) AS affiliate_name,
             c.program_id,
@@ -1487,15 +1982,16 @@ def _fetch_entity_transactions(repo: ConsoleRepository, target_date: date, ipadd
 
 
 def _fetch_recent_affiliate_transactions(repo: ConsoleRepository, user_id: str) -> list[dict[str, Any]]:
-    if not user_id or user_id == DEFAULT_AFFILIATE_ID or not _table_exists(repo, "conversion_raw"):
+    if not user_id or user_id == DEFAULT_AFFILIATE_ID or not table_exists(repo, "conversion_raw"):
         return []
     return repo.fetch_all(
-        """
+        f"""
         SELECT
             c.id AS transaction_id,
             c.conversion_time,
             c.state,
             c.raw_payload,
+            {_conversion_reward_sql(repo)},
             c.user_id,
             COALESCE(u.name, c.user_id, :default_affiliate_name) AS affiliate_name,
             c.program_id,
@@ -1522,7 +2018,7 @@ def _present_transaction(row: dict[str, Any]) -> dict[str, Any]:
         "occurred_at": _iso(row.get("conversion_time")),
         "outcome_type": row.get("promotion_name") or DEFAULT_OUTCOME_TYPE,
         "program_name": row.get("promotion_name") or DEFAULT_OUTCOME_TYPE,
-        "reward_amount": _reward_from_payload(row.get("raw_payload")),
+        "reward_amount": reward_from_row(row),
         "state": _format_transaction_state(raw_state),
         "state_raw": raw_state,
         "affiliate_id": row.get("user_id") or DEFAULT_AFFILIATE_ID,
@@ -1536,7 +2032,7 @@ def _summarize_transactions(rows: list[dict[str, Any]]) -> dict[str, Any]:
     program_counts: Counter[str] = Counter()
     affiliate_names: dict[str, str] = {}
     for row in rows:
-        reward_amount += _reward_from_payload(row.get("raw_payload"))
+        reward_amount += reward_from_row(row)
         user_id = row.get("user_id")
         if user_id:
             affiliate_counts[str(user_id)] += 1
@@ -1558,47 +2054,6 @@ def _summarize_transactions(rows: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def _reward_from_payload(raw_payload: Any) -> int:
-    parsed = _parse_json(raw_payload)
-    extracted = _extract_reward_value(parsed)
-    return extracted if extracted is not None else DEFAULT_REWARD_YEN
-
-
-def _extract_reward_value(value: Any) -> int | None:
-    if isinstance(value, dict):
-        for key, nested in value.items():
-            if key.lower() in REWARD_KEYS:
-                parsed = _coerce_int(nested)
-                if parsed is not None and parsed > 0:
-                    return parsed
-        for nested in value.values():
-            nested_value = _extract_reward_value(nested)
-            if nested_value is not None:
-                return nested_value
-    if isinstance(value, list):
-        for item in value:
-            nested_value = _extract_reward_value(item)
-            if nested_value is not None:
-                return nested_value
-    return None
-
-
-def _coerce_int(value: Any) -> int | None:
-    if isinstance(value, bool) or value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return int(value)
-    if isinstance(value, str):
-        stripped = value.replace(",", "").replace("ﾂ･", "").strip()
-        if not stripped:
-            return None
-        try:
-            return int(float(stripped))
-        except ValueError:
-            return None
-    return None
-
-
 def _first_non_empty(values: Any) -> str | None:
     if not isinstance(values, list):
         return None
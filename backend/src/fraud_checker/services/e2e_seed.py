@@ -19,6 +19,8 @@ RESET_TABLES = (
     "conversion_raw",
     "click_ipua_daily",
     "conversion_ipua_daily",
+    "daily_data_catalog",
+    "daily_totals",
     "master_media",
     "master_promotion",
     "master_user",
@@ -222,6 +224,8 @@ def seed_baseline(repo: PostgresRepository) -> dict:
         conn.execute(sa.insert(_table("conversion_ipua_daily")), conversion_rows)
         conn.execute(sa.insert(_table("conversion_raw")), conversion_raw_rows)
 
+    repo.refresh_date_rollups([PREVIOUS_DATE, TARGET_DATE])
+
     settings_service._settings_cache = None
     recomputed = findings_service.recompute_findings_for_dates(
         repo,
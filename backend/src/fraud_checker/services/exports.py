@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..console_service_support import gzip_chunks
+from ..service_protocols import ConsoleRepository
+from ..time_utils import now_local
+from . import console as console_service
+
+logger = logging.getLogger(__name__)
+
+ALERT_EXPORT_FILTER_KEYS = ("status", "risk_level", "start_date", "end_date", "search", "sort")
+ALERT_EXPORT_FORMAT = "csv.gz"
+ALERT_EXPORT_MEDIA_TYPE = "application/gzip"
+
+
+ALERT_EXPORT_PREFIX = "fraud-alerts-"
+_PARTIAL_EXPORT_PREFIX = ".export-"
+
+
+def export_artifact_dir() -> Path:
+    """Where export jobs write and the API serves artifacts from.
+
+    The worker writes and the API reads, so when they run on different hosts this must be a
+    directory both can see (a shared volume); the tempdir default only works on a single host.
+    """
+    raw = os.getenv("FC_EXPORT_ARTIFACT_DIR")
+    return Path(raw) if raw else Path(tempfile.gettempdir()) / "fraud-checker-exports"
+
+
+def normalize_alert_export_filters(filters: dict[str, Any] | None) -> dict[str, Any]:
+    filters = filters or {}
+    normalized = {key: filters.get(key) for key in ALERT_EXPORT_FILTER_KEYS}
+    normalized["status"] = normalized["status"] or "unhandled"
+    normalized["sort"] = normalized["sort"] or "risk_desc"
+    return normalized
+
+
+def write_alert_export(repo: ConsoleRepository, filters: dict[str, Any]) -> dict[str, Any]:
+    """Write the filtered alert CSV as a gzip artifact, reusing an existing file when nothing changed."""
+    filters = normalize_alert_export_filters(filters)
+    fingerprint = _alert_export_fingerprint(repo, filters)
+    artifact_dir = export_artifact_dir()
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    artifact_name = f"{ALERT_EXPORT_PREFIX}{fingerprint[:16]}.{ALERT_EXPORT_FORMAT}"
+    artifact_path = artifact_dir / artifact_name
+
+    reused = artifact_path.exists()
+    if reused:
+        # Retention goes by mtime, so a reused artifact counts as freshly written.
+        artifact_path.touch()
+    else:
+        chunks = console_service.iter_alerts_csv(repo, **filters)
+        fd, tmp_name = tempfile.mkstemp(dir=artifact_dir, prefix=_PARTIAL_EXPORT_PREFIX, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                for block in gzip_chunks(chunks):
+                    handle.write(block)
+            os.replace(tmp_name, artifact_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    return {
+        "success": True,
+        "artifact": artifact_name,
+        "format": ALERT_EXPORT_FORMAT,
+        "bytes": artifact_path.stat().st_size,
+        "fingerprint": fingerprint,
+        "filters": filters,
+        "reused": reused,
+        "generated_at": now_local().isoformat(),
+        "host": socket.gethostname(),
+    }
+
+
+def resolve_export_artifact(result: dict[str, Any] | None) -> Path | None:
+    artifact_name = (result or {}).get("artifact")
+    if not artifact_name or Path(str(artifact_name)).name != artifact_name:
+        return None
+    path = export_artifact_dir() / str(artifact_name)
+    if path.is_file():
+        return path
+    written_on = (result or {}).get("host")
+    if written_on and written_on != socket.gethostname():
+        logger.warning(
+            "Export artifact %s was written on host %s; FC_EXPORT_ARTIFACT_DIR must be shared with this host",
+            artifact_name,
+            written_on,
+        )
+    return None
+
+
+def purge_export_artifacts_before(cutoff: datetime, *, execute: bool) -> int:
+    """Count (and with `execute`, delete) artifacts and abandoned partial writes older than `cutoff`."""
+    artifact_dir = export_artifact_dir()
+    if not artifact_dir.is_dir():
+        return 0
+    cutoff_ts = cutoff.timestamp()
+    matched = 0
+    for path in artifact_dir.iterdir():
+        if not path.name.startswith((ALERT_EXPORT_PREFIX, _PARTIAL_EXPORT_PREFIX)):
+            continue
+        try:
+            if not path.is_file() or path.stat().st_mtime >= cutoff_ts:
+                continue
+            if execute:
+                path.unlink()
+        except FileNotFoundError:
+            continue
+        matched += 1
+    return matched
+
+
+def _alert_export_fingerprint(repo: ConsoleRepository, filters: dict[str, Any]) -> str:
+    # Findings only change through generation publishes and reviews; both leave a timestamp behind.
+    markers: dict[str, Any] = {"filters": filters}
+    probes = {
+        "findings_current_generations": "SELECT MAX(published_at) AS marker FROM findings_current_generations",
+        "findings_generations": "SELECT MAX(created_at) AS marker FROM findings_generations",
+        "fraud_alert_review_states": "SELECT MAX(updated_at) AS marker FROM fraud_alert_review_states",
+    }
+    for table_name, query in probes.items():
+        if not console_service.table_exists(repo, table_name):
+            continue
+        row = repo.fetch_one(query, {}) or {}
+        markers[table_name] = str(row.get("marker"))
+    row = repo.fetch_one(
+        """
+        SELECT COUNT(*) AS row_count, MAX(computed_at) AS marker
+        FROM suspicious_conversion_findings
+        WHERE is_current = TRUE
+        """,
+        {},
+    ) or {}
+    markers["suspicious_conversion_findings"] = [row.get("row_count"), str(row.get("marker"))]
+    payload = json.dumps(markers, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
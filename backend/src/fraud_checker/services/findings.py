@@ -9,7 +9,10 @@ from pathlib import Path
 
 from ..api_presenters import calculate_risk_level, format_reasons
 from ..constants import DEFAULT_REWARD_YEN
+from ..job_control import raise_if_job_aborted, report_job_progress
 from ..logging_utils import log_event, log_timed
+from ..rewards import representative_unit_price
+from ..search_text import normalize_search_text
 from ..service_protocols import FindingsRepository
 from ..suspicious import ConversionSuspiciousDetector
 from ..time_utils import now_local
@@ -37,7 +40,7 @@ def _detector_code_version() -> str:
 
 
 def _search_text(*parts: str) -> str:
-    return " ".join(part.lower() for part in parts if part)
+    return normalize_search_text(" ".join(part for part in parts if part))
 
 
 def _unique(values: list[str]) -> list[str]:
@@ -51,6 +54,35 @@ def _unique(values: list[str]) -> list[str]:
     return result
 
 
+def _transaction_summary_snapshot(
+    *,
+    finding_key: str,
+    total_conversions: int,
+    observed: dict | None,
+    program_unit_price: int | None,
+) -> dict[str, object]:
+    observed = observed or {}
+    matched_count = int(observed.get("transaction_count") or 0)
+    reward_amount = int(observed.get("reward_amount") or 0)
+    missing_count = max(total_conversions - matched_count, 0)
+    if missing_count <= 0:
+        reward_amount_source = "observed_transactions"
+    else:
+        fallback_unit_price = observed.get("unit_price_yen") or program_unit_price or DEFAULT_REWARD_YEN
+        reward_amount += fallback_unit_price * missing_count
+        reward_amount_source = "mixed" if matched_count > 0 else "fallback_default"
+    return {
+        "finding_key": finding_key,
+        "transaction_count": max(total_conversions, matched_count),
+        "reward_amount": reward_amount,
+        "reward_amount_source": reward_amount_source,
+        "affiliate_id": observed.get("affiliate_id"),
+        "affiliate_name": observed.get("affiliate_name"),
+        "outcome_type": observed.get("outcome_type"),
+        "latest_occurred_at": observed.get("latest_occurred_at"),
+    }
+
+
 def _estimate_damage_snapshot(
     *,
     total_conversions: int,
@@ -142,6 +174,7 @@ def recompute_findings_for_dates(
     conversion_detector = ConversionSuspiciousDetector(repo, conversion_rules)
 
     for target_date in sorted(set(target_dates)):
+        raise_if_job_aborted()
         with log_timed(logger, "recompute_findings", target_date=target_date):
             source_click_watermark = repo.get_click_data_watermark(target_date)
             source_conversion_watermark = repo.get_conversion_data_watermark(target_date)
@@ -159,7 +192,17 @@ def recompute_findings_for_dates(
                     if detail.get("program_id")
                 ],
             )
+            fetch_transaction_summaries = getattr(repo, "get_conversion_transaction_summaries_bulk", None)
+            observed_summaries = (
+                fetch_transaction_summaries(
+                    target_date,
+                    [(finding.ipaddress, finding.useragent) for finding in conversion_findings],
+                )
+                if callable(fetch_transaction_summaries)
+                else {}
+            )
             conversion_rows = []
+            transaction_summaries = []
             for finding in conversion_findings:
                 details = conversion_details.get((finding.ipaddress, finding.useragent), [])
                 media_ids = _unique([detail["media_id"] for detail in details])
@@ -188,11 +231,22 @@ def recompute_findings_for_dates(
                     "first_time": finding.first_conversion_time.isoformat(),
                     "last_time": finding.last_conversion_time.isoformat(),
                 }
+                finding_key = _hash_text(
+                    f"conversion|{target_date.isoformat()}|{finding.ipaddress}|{finding.useragent}|{rule_version}"
+                )
+                transaction_summaries.append(
+                    _transaction_summary_snapshot(
+                        finding_key=finding_key,
+                        total_conversions=finding.conversion_count,
+                        observed=observed_summaries.get((finding.ipaddress, finding.useragent)),
+                        program_unit_price=representative_unit_price(
+                            [program_unit_prices[program_id] for program_id in program_ids if program_id in program_unit_prices]
+                        ),
+                    )
+                )
                 conversion_rows.append(
                     {
-                        "finding_key": _hash_text(
-                            f"conversion|{target_date.isoformat()}|{finding.ipaddress}|{finding.useragent}|{rule_version}"
-                        ),
+                        "finding_key": finding_key,
                         "case_key": _case_key(target_date, finding.ipaddress, finding.useragent),
                         "date": target_date,
                         "ipaddress": finding.ipaddress,
@@ -253,10 +307,16 @@ def recompute_findings_for_dates(
                     "row_count": len(conversion_rows),
                     "created_at": computed_at,
                 },
+                enrichment={
+                    "unit_prices": program_unit_prices,
+                    "summaries": transaction_summaries,
+                    "computed_at": computed_at,
+                },
             )
             results[target_date.isoformat()] = {
                 "suspicious_conversions": len(conversion_rows),
             }
+            report_job_progress(dates_recomputed=1, current_date=target_date.isoformat())
             log_event(
                 logger,
                 "findings_recomputed",
@@ -269,4 +329,9 @@ def recompute_findings_for_dates(
                 generation_id=generation_id,
             )
 
+    retire_superseded = getattr(repo, "retire_superseded_conversion_findings", None)
+    if callable(retire_superseded):
+        retired = retire_superseded(sorted(set(target_dates)))
+        log_event(logger, "superseded_findings_retired", retired_rows=retired, generation_id=generation_id)
+
     return results
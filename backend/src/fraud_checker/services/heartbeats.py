@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterable
+
+from ..job_control import ABORT_CANCELLED, ABORT_LEASE_LOST, JobControl
+from ..logging_utils import log_event
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatManager:
+    """One thread that renews every lease a worker holds, one statement per beat.
+
+    Jobs register their run ids and get back a `JobControl`. Each beat also writes the
+    progress jobs reported since the last one, so progress costs no extra round trips.
+    When a renewal comes back without a run (the lease expired and was recovered), or
+    flags a requested cancellation, the control is aborted so the job stops at its next
+    checkpoint.
+    """
+
+    def __init__(
+        self,
+        store,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+        interval_seconds: float | None = None,
+    ) -> None:
+        self.store = store
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.interval_seconds = interval_seconds if interval_seconds is not None else max(10, lease_seconds // 3)
+        self._leases: dict[str, JobControl] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"job-heartbeat-{self.worker_id}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def register(self, run_id: str) -> JobControl:
+        with self._lock:
+            return self._leases.setdefault(run_id, JobControl())
+
+    def release(self, run_id: str) -> None:
+        with self._lock:
+            self._leases.pop(run_id, None)
+
+    @contextmanager
+    def leases(self, run_ids: Iterable[str]):
+        run_ids = list(run_ids)
+        controls = {run_id: self.register(run_id) for run_id in run_ids}
+        try:
+            yield controls
+        finally:
+            for run_id in run_ids:
+                self.release(run_id)
+
+    def beat_once(self) -> set[str]:
+        """Renew all registered leases; returns the run ids whose lease was lost."""
+        with self._lock:
+            controls = dict(sorted(self._leases.items()))
+        if not controls:
+            return set()
+        progress = {
+            run_id: snapshot
+            for run_id, control in controls.items()
+            if (snapshot := control.take_progress()) is not None
+        }
+        try:
+            renewed = self._renew(list(controls), progress)
+        except Exception:
+            # A failed beat says nothing about ownership; the lease may still be valid.
+            for run_id in progress:
+                controls[run_id].mark_dirty()
+            logger.exception("Job heartbeat failed", extra={"worker_id": self.worker_id})
+            return set()
+
+        lost = set(controls) - set(renewed)
+        for run_id in lost:
+            with self._lock:
+                self._leases.pop(run_id, None)
+            controls[run_id].abort(ABORT_LEASE_LOST)
+            log_event(logger, "job_lease_lost", run_id=run_id, worker_id=self.worker_id)
+        for run_id, cancel_requested in renewed.items():
+            # The lease stays registered so it is still ours while the job records the cancel.
+            if cancel_requested and run_id in controls and not controls[run_id].aborted:
+                controls[run_id].abort(ABORT_CANCELLED)
+                log_event(logger, "job_cancel_requested", run_id=run_id, worker_id=self.worker_id)
+        return lost
+
+    def _renew(self, run_ids: list[str], progress: dict[str, dict]) -> dict[str, bool]:
+        heartbeat_many = getattr(self.store, "heartbeat_many", None)
+        if callable(heartbeat_many):
+            renewed = heartbeat_many(
+                run_ids=run_ids,
+                worker_id=self.worker_id,
+                lease_seconds=self.lease_seconds,
+                progress=progress,
+            )
+            return renewed if isinstance(renewed, dict) else dict.fromkeys(renewed, False)
+        # Single-run beats carry neither progress nor cancellation flags.
+        return {
+            run_id: False
+            for run_id in run_ids
+            if self.store.heartbeat(run_id=run_id, worker_id=self.worker_id, lease_seconds=self.lease_seconds)
+            is not False
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.beat_once()
@@ -4,7 +4,6 @@ import json
 import logging
 import os
 import socket
-import threading
 import uuid
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta
@@ -14,6 +13,7 @@ from sqlalchemy.exc import IntegrityError
 
 from ..config import resolve_acs_settings
 from ..ingestion import ClickLogIngestor, ConversionIngestor
+from ..job_control import ABORT_CANCELLED, JobAbortedError, job_control_scope, raise_if_job_aborted
 from ..job_status_pg import JobRun, JobStatusStorePG
 from ..logging_utils import log_event, log_timed
 from ..runtime_guards import _env_truthy, current_env
@@ -24,7 +24,11 @@ from ..service_dependencies import (
     get_repository as default_get_repository,
 )
 from ..time_utils import now_local
+from . import console as console_service
+from . import exports as exports_service
 from . import findings as findings_service
+from . import refresh_pipeline
+from .heartbeats import HeartbeatManager
 
 logger = logging.getLogger(__name__)
 
@@ -33,13 +37,17 @@ JOB_TYPE_CONVERSION_INGEST = "ingest_conversions"
 JOB_TYPE_REFRESH = "refresh"
 JOB_TYPE_RECOMPUTE_FINDINGS_DATE = "recompute_findings_date"
 JOB_TYPE_MASTER_SYNC = "master_sync"
+JOB_TYPE_EXPORT_ALERTS = "export_alerts"
 DEFAULT_JOB_LEASE_SECONDS = 300
+DEFAULT_RERUN_DEBOUNCE_SECONDS = 30
+DEFAULT_JOB_HEARTBEAT_SECONDS = 5
 JOB_MAX_ATTEMPTS = {
     JOB_TYPE_CLICK_INGEST: 3,
     JOB_TYPE_CONVERSION_INGEST: 3,
     JOB_TYPE_REFRESH: 4,
     JOB_TYPE_RECOMPUTE_FINDINGS_DATE: 4,
     JOB_TYPE_MASTER_SYNC: 2,
+    JOB_TYPE_EXPORT_ALERTS: 2,
 }
 JOB_PRIORITIES = {
     JOB_TYPE_CLICK_INGEST: 20,
@@ -47,7 +55,12 @@ JOB_PRIORITIES = {
     JOB_TYPE_REFRESH: 10,
     JOB_TYPE_RECOMPUTE_FINDINGS_DATE: 30,
     JOB_TYPE_MASTER_SYNC: 50,
+    JOB_TYPE_EXPORT_ALERTS: 90,
 }
+# Short per-date jobs whose queue overhead dominates; workers lease these in batches.
+BATCHABLE_JOB_TYPES = frozenset({JOB_TYPE_RECOMPUTE_FINDINGS_DATE})
+# Idempotent jobs that re-read current data: a request against a running run becomes one follow-up.
+COALESCING_JOB_TYPES = frozenset({JOB_TYPE_RECOMPUTE_FINDINGS_DATE})
 
 
 class JobConflictError(RuntimeError):
@@ -87,6 +100,24 @@ def _job_lease_seconds() -> int:
         return DEFAULT_JOB_LEASE_SECONDS
 
 
+def _rerun_debounce_seconds() -> int:
+    raw = os.getenv("FC_JOB_RERUN_DEBOUNCE_SECONDS", str(DEFAULT_RERUN_DEBOUNCE_SECONDS))
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return DEFAULT_RERUN_DEBOUNCE_SECONDS
+
+
+def _heartbeat_interval_seconds(lease_seconds: int) -> int:
+    # Beats also carry progress and pick up cancellations, so they run well inside the lease.
+    raw = os.getenv("FC_JOB_HEARTBEAT_SECONDS", str(DEFAULT_JOB_HEARTBEAT_SECONDS))
+    try:
+        interval = max(1, int(raw))
+    except ValueError:
+        interval = DEFAULT_JOB_HEARTBEAT_SECONDS
+    return min(interval, max(1, lease_seconds // 3))
+
+
 def _worker_id() -> str:
     return f"{socket.gethostname()}:{os.getpid()}"
 
@@ -121,6 +152,8 @@ def _job_concurrency_key(job_type: str, params: dict[str, Any] | None) -> str |
         return _date_write_concurrency_key(date.fromisoformat(params["date"]))
     if job_type == JOB_TYPE_MASTER_SYNC:
         return "master-sync"
+    if job_type == JOB_TYPE_EXPORT_ALERTS:
+        return "alert-export"
     return None
 
 
@@ -136,21 +169,33 @@ def _is_retryable_job_error(exc: Exception) -> bool:
 
 
 @contextmanager
-def _heartbeat(store: JobStatusStorePG, run_id: str, worker_id: str, lease_seconds: int):
-    stop_event = threading.Event()
-    interval = max(10, lease_seconds // 3)
-
-    def _beat() -> None:
-        while not stop_event.wait(interval):
-            store.heartbeat(run_id=run_id, worker_id=worker_id, lease_seconds=lease_seconds)
+def _leases(
+    store: JobStatusStorePG,
+    run_ids: list[str],
+    worker_id: str,
+    lease_seconds: int,
+    heartbeats: HeartbeatManager | None = None,
+):
+    """Keep `run_ids` leased for the block; yields run id -> `JobControl`.
 
-    thread = threading.Thread(target=_beat, name=f"job-heartbeat-{run_id}", daemon=True)
-    thread.start()
+    Worker pools pass their shared manager; one-shot callers get a private one for the block.
+    """
+    if heartbeats is not None:
+        with heartbeats.leases(run_ids) as controls:
+            yield controls
+        return
+    manager = HeartbeatManager(
+        store,
+        worker_id=worker_id,
+        lease_seconds=lease_seconds,
+        interval_seconds=_heartbeat_interval_seconds(lease_seconds),
+    )
+    manager.start()
     try:
-        yield
+        with manager.leases(run_ids) as controls:
+            yield controls
     finally:
-        stop_event.set()
-        thread.join(timeout=1)
+        manager.stop()
 
 
 def enqueue_job(
@@ -167,6 +212,11 @@ def enqueue_job(
     dedupe_key = dedupe_key or _dedupe_key(job_type, params)
     concurrency_key = concurrency_key if concurrency_key is not None else _job_concurrency_key(job_type, params)
     duplicate = store.find_active_duplicate(dedupe_key)
+    if duplicate is not None and _coalesces_as_rerun(store, duplicate, job_type):
+        if _request_rerun(store, duplicate, job_type, params):
+            return duplicate
+        # The run finished between the lookup and the flag; enqueue a fresh run instead.
+        duplicate = None
     if duplicate is not None:
         log_event(
             logger,
@@ -217,6 +267,35 @@ def enqueue_job(
     return job
 
 
+def _coalesces_as_rerun(store: JobStatusStorePG, duplicate: JobRun, job_type: str) -> bool:
+    # A queued duplicate absorbs the request as-is; a running one may have read its inputs
+    # before this request's data landed, so it owes one follow-up instead.
+    return (
+        job_type in COALESCING_JOB_TYPES
+        and getattr(duplicate, "status", None) == "running"
+        and callable(getattr(store, "request_rerun", None))
+    )
+
+
+def _request_rerun(
+    store: JobStatusStorePG,
+    duplicate: JobRun,
+    job_type: str,
+    params: dict[str, Any] | None,
+) -> bool:
+    not_before = now_local() + timedelta(seconds=_rerun_debounce_seconds())
+    if not store.request_rerun(duplicate.id, params=params, not_before=not_before):
+        return False
+    log_event(
+        logger,
+        "job_enqueue_coalesced_rerun",
+        run_id=duplicate.id,
+        job_type=job_type,
+        not_before=not_before,
+    )
+    return True
+
+
 def process_queued_jobs_after_cli_enqueue(max_jobs: int = 1) -> int:
     """
     Drain the queue in-process when dev-style in-process kick is enabled.
@@ -342,6 +421,21 @@ def enqueue_master_sync_job(*, background_tasks=None, deps: RuntimeDependencies
     )
 
 
+def enqueue_alert_export_job(
+    filters: dict[str, Any] | None,
+    *,
+    background_tasks=None,
+    deps: RuntimeDependencies | None = None,
+) -> JobRun:
+    return enqueue_job(
+        background_tasks=background_tasks,
+        job_type=JOB_TYPE_EXPORT_ALERTS,
+        params=exports_service.normalize_alert_export_filters(filters),
+        start_message="\u30a2\u30e9\u30fc\u30c8 CSV \u30a8\u30af\u30b9\u30dd\u30fc\u30c8\u30b8\u30e7\u30d6\u3092\u767b\u9332\u3057\u307e\u3057\u305f",
+        deps=deps,
+    )
+
+
 def process_queued_jobs(max_jobs: int = 1, deps: RuntimeDependencies | None = None) -> int:
     runtime = _deps(deps)
     store = runtime.job_store()
@@ -372,15 +466,17 @@ def _execute_job_run(
     worker_id: str,
     lease_seconds: int,
     deps: RuntimeDependencies | None = None,
+    heartbeats: HeartbeatManager | None = None,
 ) -> None:
     log_event(logger, "job_started", run_id=run.id, job_type=run.job_type, worker_id=worker_id)
     try:
         with store.advisory_lock(run.concurrency_key) as acquired:
             if not acquired:
+                # Two workers raced on the key, or the holder's lease lapsed while it still holds
+                # the lock; requeue_blocked backs off briefly so this does not spin until recovery.
                 store.requeue_blocked(
                     run.id,
                     f"{run.job_type} is waiting for {run.concurrency_key}",
-                    delay_seconds=15,
                 )
                 log_event(
                     logger,
@@ -391,14 +487,18 @@ def _execute_job_run(
                 )
                 return
 
-            with _heartbeat(store, run.id, worker_id, lease_seconds), log_timed(
-                logger,
-                "job_completed",
-                run_id=run.id,
-                job_type=run.job_type,
-            ):
-                result, done_message = _dispatch_job_with_optional_deps(run, deps)
-                store.complete(run.id, done_message, result)
+            with _leases(store, [run.id], worker_id, lease_seconds, heartbeats) as controls:
+                with job_control_scope(controls[run.id]), log_timed(
+                    logger,
+                    "job_completed",
+                    run_id=run.id,
+                    job_type=run.job_type,
+                ):
+                    result, done_message = _dispatch_job_with_optional_deps(run, deps)
+                    raise_if_job_aborted()
+                    store.complete(run.id, done_message, result)
+    except JobAbortedError as exc:
+        _record_aborted_job(store, run, exc, worker_id)
     except Exception as exc:
         message = f"{run.job_type} failed: {exc}"
         next_status = store.fail(
@@ -419,6 +519,91 @@ def _execute_job_run(
         logger.exception("Job execution failed", extra={"run_id": run.id, "job_type": run.job_type})
 
 
+def _execute_job_batch(
+    *,
+    store: JobStatusStorePG,
+    runs: list[JobRun],
+    worker_id: str,
+    lease_seconds: int,
+    deps: RuntimeDependencies | None = None,
+    heartbeats: HeartbeatManager | None = None,
+) -> None:
+    """Run a leased batch sequentially and record every success in one transaction.
+
+    Failures go through `store.fail` one run at a time so attempts and back-off stay per job.
+    Advisory locks are held until the batch completion commits, as `_execute_job_run` does.
+    """
+    if len(runs) == 1:
+        _execute_job_run(
+            store=store,
+            run=runs[0],
+            worker_id=worker_id,
+            lease_seconds=lease_seconds,
+            deps=deps,
+            heartbeats=heartbeats,
+        )
+        return
+
+    completions: list[tuple[str, str, dict[str, Any] | None]] = []
+    with store.advisory_locks([run.concurrency_key for run in runs]) as acquired_keys, _leases(
+        store,
+        [run.id for run in runs],
+        worker_id,
+        lease_seconds,
+        heartbeats,
+    ) as controls, log_timed(logger, "job_batch_completed", job_type=runs[0].job_type, batch_size=len(runs)):
+        for run in runs:
+            if run.concurrency_key and run.concurrency_key not in acquired_keys:
+                store.requeue_blocked(run.id, f"{run.job_type} is waiting for {run.concurrency_key}")
+                log_event(
+                    logger,
+                    "job_requeued_for_concurrency",
+                    run_id=run.id,
+                    job_type=run.job_type,
+                    concurrency_key=run.concurrency_key,
+                )
+                continue
+            log_event(logger, "job_started", run_id=run.id, job_type=run.job_type, worker_id=worker_id)
+            try:
+                with job_control_scope(controls[run.id]):
+                    raise_if_job_aborted()
+                    result, done_message = _dispatch_job_with_optional_deps(run, deps)
+                    raise_if_job_aborted()
+            except JobAbortedError as exc:
+                _record_aborted_job(store, run, exc, worker_id)
+                continue
+            except Exception as exc:
+                next_status = store.fail(
+                    run.id,
+                    f"{run.job_type} failed: {exc}",
+                    {"success": False, "error": str(exc)},
+                    error_message=str(exc),
+                    retryable=_is_retryable_job_error(exc),
+                )
+                log_event(
+                    logger,
+                    "job_failed",
+                    run_id=run.id,
+                    job_type=run.job_type,
+                    next_status=next_status,
+                    retryable=next_status == "queued",
+                )
+                logger.exception("Job execution failed", extra={"run_id": run.id, "job_type": run.job_type})
+                continue
+            completions.append((run.id, done_message, result))
+        store.complete_many(completions)
+
+
+def _record_aborted_job(store: JobStatusStorePG, run: JobRun, exc: JobAbortedError, worker_id: str) -> None:
+    if exc.reason == ABORT_CANCELLED:
+        # The lease is still ours, so the run can be closed out as cancelled here.
+        store.cancel(run.id, f"{run.job_type} cancelled")
+        log_event(logger, "job_cancelled", run_id=run.id, job_type=run.job_type, worker_id=worker_id)
+        return
+    # The lease now belongs to recovery or another worker; recording an outcome would race it.
+    log_event(logger, "job_aborted_lease_lost", run_id=run.id, job_type=run.job_type, worker_id=worker_id)
+
+
 def _dispatch_job_with_optional_deps(
     run: JobRun,
     deps: RuntimeDependencies | None,
@@ -465,6 +650,8 @@ def _dispatch_job(
         )
     if run.job_type == JOB_TYPE_MASTER_SYNC:
         return run_master_sync(job_run_id=run.id, deps=runtime)
+    if run.job_type == JOB_TYPE_EXPORT_ALERTS:
+        return run_alert_export(params, job_run_id=run.id, deps=runtime)
     raise ValueError(f"Unsupported job_type: {run.job_type}")
 
 
@@ -491,6 +678,7 @@ def run_recompute_findings_for_date(
             computed_by_job_id=job_run_id,
             generation_id=generation_id,
         )
+    console_service.invalidate_dashboard_snapshots(repo)
     return {
         "success": True,
         "target_date": target_date.isoformat(),
@@ -525,6 +713,7 @@ def run_click_ingestion(
             computed_by_job_id=job_run_id,
             generation_id=job_run_id,
         )
+    console_service.invalidate_dashboard_snapshots(repo)
     return {
         "success": True,
         "count": count,
@@ -555,6 +744,7 @@ def run_conversion_ingestion(
             computed_by_job_id=job_run_id,
             generation_id=job_run_id,
         )
+    console_service.invalidate_dashboard_snapshots(repo)
     message = f"Ingested {total} conversions for {target_date}"
     return {
         "success": True,
@@ -582,7 +772,22 @@ def run_refresh(
     client = runtime.acs_client()
     settings = resolve_acs_settings()
 
-    result: dict[str, Any] = {"success": True, "clicks": None, "conversions": None}
+    generation_id = f"refresh-{job_run_id or uuid.uuid4().hex[:12]}"
+    recompute_job_ids: list[str] = []
+    recompute_dates: list[date] = []
+
+    def enqueue_ready_dates(ready_dates: list[date]) -> None:
+        # Dates arrive as soon as both streams committed them, so recompute overlaps later persists.
+        recompute_jobs = enqueue_findings_recompute_jobs(
+            ready_dates,
+            generation_id=generation_id,
+            trigger="refresh",
+            source_job_id=job_run_id,
+            deps=runtime,
+        )
+        recompute_job_ids.extend(job.id for job in recompute_jobs)
+        recompute_dates.extend(ready_dates)
+
     with log_timed(
         logger,
         "refresh_job",
@@ -591,51 +796,43 @@ def run_refresh(
         conversions=conversions,
         detect=detect,
     ):
-        dates_to_recompute: set[date] = set()
-
-        if clicks:
-            click_ingestor = ClickLogIngestor(
-                client=client,
-                repository=repo,
-                page_size=settings.page_size,
-                store_raw=True,
-            )
-            click_new, click_skip = click_ingestor.run_for_time_range(start_time, end_time)
-            result["clicks"] = {"new": click_new, "skipped": click_skip}
-            dates_to_recompute.update(getattr(click_ingestor, "last_affected_dates", []))
-
-        if conversions:
-            conv_ingestor = ConversionIngestor(
-                client=client,
-                repository=repo,
-                page_size=settings.page_size,
-            )
-            conv_new, conv_skip, conv_valid, click_enriched = conv_ingestor.run_for_time_range(
-                start_time, end_time
-            )
-            result["conversions"] = {
-                "new": conv_new,
-                "skipped": conv_skip,
-                "valid_entry": conv_valid,
-                "click_enriched": click_enriched,
-            }
-            dates_to_recompute.update(getattr(conv_ingestor, "last_affected_dates", []))
-
-        if detect and dates_to_recompute:
-            generation_id = f"refresh-{job_run_id or uuid.uuid4().hex[:12]}"
-            recompute_jobs = enqueue_findings_recompute_jobs(
-                sorted(dates_to_recompute),
-                generation_id=generation_id,
-                trigger="refresh",
-                source_job_id=job_run_id,
-                deps=runtime,
-            )
-            result["findings_recompute"] = {
-                "mode": "queued",
-                "generation_id": generation_id,
-                "job_ids": [job.id for job in recompute_jobs],
-                "target_dates": [target_date.isoformat() for target_date in sorted(dates_to_recompute)],
-            }
+        stage_results = refresh_pipeline.run_refresh_pipeline(
+            start_time=start_time,
+            end_time=end_time,
+            click_ingestor=(
+                ClickLogIngestor(
+                    client=client,
+                    repository=repo,
+                    page_size=settings.page_size,
+                    store_raw=True,
+                )
+                if clicks
+                else None
+            ),
+            conversion_ingestor=(
+                ConversionIngestor(
+                    client=client,
+                    repository=repo,
+                    page_size=settings.page_size,
+                )
+                if conversions
+                else None
+            ),
+            on_dates_ready=enqueue_ready_dates if detect else None,
+        )
+
+    result: dict[str, Any] = {
+        "success": True,
+        "clicks": stage_results[refresh_pipeline.STAGE_CLICKS],
+        "conversions": stage_results[refresh_pipeline.STAGE_CONVERSIONS],
+    }
+    if recompute_dates:
+        result["findings_recompute"] = {
+            "mode": "queued",
+            "generation_id": generation_id,
+            "job_ids": recompute_job_ids,
+            "target_dates": [target_date.isoformat() for target_date in sorted(recompute_dates)],
+        }
 
     return result, f"Refresh completed for last {hours} hours"
 
@@ -687,3 +884,24 @@ def run_master_sync(
         }
 
     return result, "Master sync completed"
+
+
+def run_alert_export(
+    filters: dict[str, Any] | None,
+    *,
+    job_run_id: str | None = None,
+    deps: RuntimeDependencies | None = None,
+) -> tuple[dict[str, Any], str]:
+    runtime = _deps(deps)
+    repo = runtime.repository()
+    with log_timed(logger, "alert_export", run_id=job_run_id):
+        result = exports_service.write_alert_export(repo, filters or {})
+    log_event(
+        logger,
+        "alert_export_written",
+        run_id=job_run_id,
+        artifact=result["artifact"],
+        bytes=result["bytes"],
+        reused=result["reused"],
+    )
+    return result, "Alert export completed"
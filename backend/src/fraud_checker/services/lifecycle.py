@@ -13,6 +13,7 @@ DEFAULT_RAW_RETENTION_DAYS = 90
 DEFAULT_AGGREGATE_RETENTION_DAYS = 365
 DEFAULT_FINDINGS_RETENTION_DAYS = 365
 DEFAULT_JOB_RUN_RETENTION_DAYS = 30
+DEFAULT_EXPORT_ARTIFACT_RETENTION_DAYS = 7
 DEFAULT_EVIDENCE_CONTRACT_DAYS = DEFAULT_RAW_RETENTION_DAYS
 
 
@@ -22,6 +23,7 @@ class RetentionPolicy:
     aggregate_days: int | None = DEFAULT_AGGREGATE_RETENTION_DAYS
     findings_days: int | None = DEFAULT_FINDINGS_RETENTION_DAYS
     job_run_days: int | None = DEFAULT_JOB_RUN_RETENTION_DAYS
+    export_artifact_days: int | None = DEFAULT_EXPORT_ARTIFACT_RETENTION_DAYS
 
 
 def get_evidence_contract_days() -> int | None:
@@ -65,6 +67,7 @@ def resolve_retention_policy(
     aggregate_days: int | None = None,
     findings_days: int | None = None,
     job_run_days: int | None = None,
+    export_artifact_days: int | None = None,
 ) -> RetentionPolicy:
     return RetentionPolicy(
         raw_days=_resolve_days("FC_RETENTION_RAW_DAYS", DEFAULT_RAW_RETENTION_DAYS, raw_days),
@@ -83,6 +86,11 @@ def resolve_retention_policy(
             DEFAULT_JOB_RUN_RETENTION_DAYS,
             job_run_days,
         ),
+        export_artifact_days=_resolve_days(
+            "FC_RETENTION_EXPORT_ARTIFACT_DAYS",
+            DEFAULT_EXPORT_ARTIFACT_RETENTION_DAYS,
+            export_artifact_days,
+        ),
     )
 
 
@@ -94,6 +102,9 @@ def purge_old_data(
     execute: bool = False,
     reference_time: datetime | None = None,
 ) -> dict[str, Any]:
+    # Imported here: exports pulls in the console service, which imports this module.
+    from . import exports as exports_service
+
     effective_policy = policy or resolve_retention_policy()
     now = reference_time or now_local()
 
@@ -101,6 +112,7 @@ def purge_old_data(
     aggregate_cutoff = _cutoff_date(now, effective_policy.aggregate_days)
     findings_cutoff = _cutoff_date(now, effective_policy.findings_days)
     job_run_cutoff = _cutoff_datetime(now, effective_policy.job_run_days)
+    export_artifact_cutoff = _cutoff_datetime(now, effective_policy.export_artifact_days)
 
     counts = {
         "raw": repo.purge_raw_before(raw_cutoff, execute=execute) if raw_cutoff else {},
@@ -115,6 +127,11 @@ def purge_old_data(
             if job_run_cutoff
             else {}
         ),
+        "export_artifacts": (
+            {"files": exports_service.purge_export_artifacts_before(export_artifact_cutoff, execute=execute)}
+            if export_artifact_cutoff
+            else {}
+        ),
     }
 
     return {
@@ -127,6 +144,7 @@ def purge_old_data(
             "aggregates_before": aggregate_cutoff.isoformat() if aggregate_cutoff else None,
             "findings_before": findings_cutoff.isoformat() if findings_cutoff else None,
             "job_runs_before": job_run_cutoff.isoformat() if job_run_cutoff else None,
+            "export_artifacts_before": export_artifact_cutoff.isoformat() if export_artifact_cutoff else None,
         },
         "counts": counts,
     }
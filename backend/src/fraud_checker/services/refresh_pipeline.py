@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Callable, Iterable
+
+from ..ingestion import ClickLogIngestor, ConversionIngestor
+from ..job_control import raise_if_job_aborted
+from ..logging_utils import log_event
+
+logger = logging.getLogger(__name__)
+
+STAGE_CLICKS = "clicks"
+STAGE_CONVERSIONS = "conversions"
+
+
+class RefreshStageFailed(RuntimeError):
+    """Raised in a stage that was waiting on another stage when that stage failed."""
+
+
+class RefreshPipeline:
+    """Date-level dependencies between the concurrent refresh stages.
+
+    Each stream (clicks, conversions) fetches its whole window, announces the dates it will
+    persist, then commits them one date at a time in ascending order. A stream has committed
+    "through" a date once none of its announced dates at or before it are still pending.
+    Conversion enrichment waits only for clicks through the dates its conversions point at,
+    and a date is ready for recompute once every enabled stream has committed through it.
+    """
+
+    def __init__(self, streams: Iterable[str]) -> None:
+        self._cond = threading.Condition()
+        self._pending: dict[str, set[date] | None] = {stream: None for stream in streams}
+        self._affected: set[date] = set()
+        self._released: set[date] = set()
+        self._finished: set[str] = set()
+        self._error: BaseException | None = None
+
+    def planned(self, stream: str, dates: Iterable[date]) -> None:
+        with self._cond:
+            self._pending[stream] = set(dates)
+            self._cond.notify_all()
+
+    def committed(self, stream: str, target_date: date, affected_dates: Iterable[date]) -> None:
+        with self._cond:
+            pending = self._pending[stream]
+            if pending is not None:
+                pending.discard(target_date)
+            self._affected.update(affected_dates)
+            self._cond.notify_all()
+
+    def finish(self, stream: str) -> None:
+        with self._cond:
+            self._pending[stream] = set()
+            self._finished.add(stream)
+            self._cond.notify_all()
+
+    def fail(self, exc: BaseException) -> None:
+        with self._cond:
+            if self._error is None:
+                self._error = exc
+            self._cond.notify_all()
+
+    def _committed_through(self, stream: str, target_date: date) -> bool:
+        if stream not in self._pending:
+            return True
+        pending = self._pending[stream]
+        return pending is not None and all(pending_date > target_date for pending_date in pending)
+
+    def wait_committed_through(self, stream: str, target_date: date) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._error is not None or self._committed_through(stream, target_date))
+            if self._error is not None:
+                raise RefreshStageFailed(f"{stream} stage failed") from self._error
+
+    def take_ready_dates(self) -> tuple[list[date], bool]:
+        """Block until some affected dates become ready or every stage has stopped.
+
+        Returns the newly ready dates (each date only once) and whether the pipeline is over.
+        """
+
+        def ready() -> list[date]:
+            return sorted(
+                target_date
+                for target_date in self._affected - self._released
+                if all(self._committed_through(stream, target_date) for stream in self._pending)
+            )
+
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._error is not None or len(self._finished) == len(self._pending) or bool(ready())
+            )
+            dates = [] if self._error is not None else ready()
+            self._released.update(dates)
+            over = self._error is not None or (len(self._finished) == len(self._pending) and not ready())
+        return dates, over
+
+
+def _group_by_date(rows: list, key: Callable[[Any], date]) -> dict[date, list]:
+    grouped: dict[date, list] = defaultdict(list)
+    for row in rows:
+        grouped[key(row)].append(row)
+    return grouped
+
+
+def _click_stage(
+    pipeline: RefreshPipeline,
+    ingestor: ClickLogIngestor,
+    start_time: datetime,
+    end_time: datetime,
+) -> dict[str, int]:
+    try:
+        by_date = _group_by_date(
+            ingestor.fetch_for_time_range(start_time, end_time),
+            lambda click: click.click_time.date(),
+        )
+        pipeline.planned(STAGE_CLICKS, by_date)
+        totals = {"new": 0, "skipped": 0}
+        for target_date in sorted(by_date):
+            raise_if_job_aborted()
+            new_count, skip_count = ingestor.persist_time_range(by_date[target_date])
+            totals["new"] += new_count
+            totals["skipped"] += skip_count
+            pipeline.committed(STAGE_CLICKS, target_date, getattr(ingestor, "last_affected_dates", []))
+        pipeline.finish(STAGE_CLICKS)
+        return totals
+    except BaseException as exc:
+        pipeline.fail(exc)
+        raise
+
+
+def _conversion_click_date(conversion) -> date:
+    # Enrichment looks the click up by cid, so it lives on the click's date, not the conversion's.
+    return (conversion.click_time or conversion.conversion_time).date()
+
+
+def _conversion_stage(
+    pipeline: RefreshPipeline,
+    ingestor: ConversionIngestor,
+    start_time: datetime,
+    end_time: datetime,
+) -> dict[str, int]:
+    try:
+        by_date = _group_by_date(
+            ingestor.fetch_for_time_range(start_time, end_time),
+            lambda conversion: conversion.conversion_time.date(),
+        )
+        pipeline.planned(STAGE_CONVERSIONS, by_date)
+        totals = {"new": 0, "skipped": 0, "valid_entry": 0, "click_enriched": 0}
+        for target_date in sorted(by_date):
+            conversions = by_date[target_date]
+            pipeline.wait_committed_through(
+                STAGE_CLICKS,
+                max(_conversion_click_date(conversion) for conversion in conversions),
+            )
+            raise_if_job_aborted()
+            new_count, skip_count, valid_count, enriched_count = ingestor.persist_time_range(conversions)
+            totals["new"] += new_count
+            totals["skipped"] += skip_count
+            totals["valid_entry"] += valid_count
+            totals["click_enriched"] += enriched_count
+            pipeline.committed(STAGE_CONVERSIONS, target_date, getattr(ingestor, "last_affected_dates", []))
+        pipeline.finish(STAGE_CONVERSIONS)
+        return totals
+    except BaseException as exc:
+        pipeline.fail(exc)
+        raise
+
+
+def run_refresh_pipeline(
+    *,
+    start_time: datetime,
+    end_time: datetime,
+    click_ingestor: ClickLogIngestor | None,
+    conversion_ingestor: ConversionIngestor | None,
+    on_dates_ready: Callable[[list[date]], None] | None = None,
+) -> dict[str, dict[str, int] | None]:
+    """Run the enabled fetch -> persist streams concurrently.
+
+    `on_dates_ready` is called on the calling thread as soon as dates are committed by every
+    stream, so per-date recompute can start while later dates are still being persisted.
+    Stage threads inherit the caller's context, so job checkpoints and progress still apply.
+    """
+    stages: dict[str, Callable[[RefreshPipeline], dict[str, int]]] = {}
+    if click_ingestor is not None:
+        stages[STAGE_CLICKS] = lambda pipeline: _click_stage(pipeline, click_ingestor, start_time, end_time)
+    if conversion_ingestor is not None:
+        stages[STAGE_CONVERSIONS] = lambda pipeline: _conversion_stage(
+            pipeline, conversion_ingestor, start_time, end_time
+        )
+    results: dict[str, dict[str, int] | None] = {STAGE_CLICKS: None, STAGE_CONVERSIONS: None}
+    if not stages:
+        return results
+
+    pipeline = RefreshPipeline(stages)
+    with ThreadPoolExecutor(max_workers=len(stages), thread_name_prefix="refresh-stage") as executor:
+        futures = {
+            name: executor.submit(contextvars.copy_context().run, stage, pipeline)
+            for name, stage in stages.items()
+        }
+        while True:
+            ready_dates, over = pipeline.take_ready_dates()
+            if ready_dates:
+                log_event(logger, "refresh_dates_ready", dates=[value.isoformat() for value in ready_dates])
+                if on_dates_ready is not None:
+                    on_dates_ready(ready_dates)
+            if over:
+                break
+        # Clicks come first: conversions only raise RefreshStageFailed after clicks failed,
+        # so the original error is the one that surfaces.
+        for name in stages:
+            results[name] = futures[name].result()
+    return results
@@ -56,10 +56,15 @@ def get_latest_date(repo: ReportingRepository, table: str) -> Optional[str]:
     allowed_tables = {"click_ipua_daily", "conversion_ipua_daily"}
     if table not in allowed_tables:
         raise ValueError(f"Unsupported table: {table}")
-    row = repo.fetch_one(f"SELECT MAX(date) as last_date FROM {table}")
-    if not row or not row.get("last_date"):
+    catalog_latest = getattr(repo, "get_catalog_latest_dates", None)
+    latest = catalog_latest() if callable(catalog_latest) else None
+    if latest is not None:
+        value = latest.get(table)
+    else:
+        row = repo.fetch_one(f"SELECT MAX(date) as last_date FROM {table}")
+        value = row.get("last_date") if row else None
+    if not value:
         return None
-    value = row["last_date"]
     if isinstance(value, date):
         return value.isoformat()
     return value
@@ -117,14 +122,44 @@ def resolve_summary_date(repo: ReportingRepository, target_date: Optional[str])
     return (today_local() - timedelta(days=1)).isoformat()
 
 
-def get_summary(
+def _load_summary_rollup(
     repo: ReportingRepository,
-    target_date: Optional[str],
-    *,
-    job_store: JobStatusStorePG | None = None,
-) -> dict:
-    resolved_date = resolve_summary_date(repo, target_date)
+    resolved_date: str,
+    prev_date: str,
+) -> tuple[dict, dict, dict, dict] | None:
+    get_daily_totals = getattr(repo, "get_daily_totals", None)
+    if not callable(get_daily_totals):
+        return None
+    try:
+        end_date = date.fromisoformat(resolved_date)
+    except ValueError:
+        return None
+    rows = get_daily_totals(2, end_date=end_date)
+    if rows is None:
+        return None
+    by_date = {_iso(row["date"]): row for row in rows}
+    current = by_date.get(resolved_date, {})
+    previous = by_date.get(prev_date, {})
+    return (
+        {
+            "total_clicks": current.get("click_total", 0),
+            "unique_ips": current.get("click_unique_ips", 0),
+            "active_media": current.get("click_media_count", 0),
+        },
+        {
+            "total_conversions": current.get("conversion_total", 0),
+            "conversion_ips": current.get("conversion_unique_ips", 0),
+        },
+        {"total": previous.get("click_total", 0)},
+        {"total": previous.get("conversion_total", 0)},
+    )
 
+
+def _scan_summary_totals(
+    repo: ReportingRepository,
+    resolved_date: str,
+    prev_date: str,
+) -> tuple[dict | None, dict | None, dict | None, dict | None]:
     click_row = repo.fetch_one(
         """
         SELECT
@@ -148,8 +183,6 @@ def get_summary(
         {"resolved_date": resolved_date},
     )
 
-    prev_date = (datetime.fromisoformat(resolved_date) - timedelta(days=1)).strftime("%Y-%m-%d")
-
     prev_click = repo.fetch_one(
         "SELECT COALESCE(SUM(click_count), 0) as total FROM click_ipua_daily WHERE date = :prev_date",
         {"prev_date": prev_date},
@@ -158,6 +191,22 @@ def get_summary(
         "SELECT COALESCE(SUM(conversion_count), 0) as total FROM conversion_ipua_daily WHERE date = :prev_date",
         {"prev_date": prev_date},
     )
+    return click_row, conv_row, prev_click, prev_conv
+
+
+def get_summary(
+    repo: ReportingRepository,
+    target_date: Optional[str],
+    *,
+    job_store: JobStatusStorePG | None = None,
+) -> dict:
+    resolved_date = resolve_summary_date(repo, target_date)
+    prev_date = (datetime.fromisoformat(resolved_date) - timedelta(days=1)).strftime("%Y-%m-%d")
+    rollup = _load_summary_rollup(repo, resolved_date, prev_date)
+    if rollup is not None:
+        click_row, conv_row, prev_click, prev_conv = rollup
+    else:
+        click_row, conv_row, prev_click, prev_conv = _scan_summary_totals(repo, resolved_date, prev_date)
 
     try:
         target_date_obj = date.fromisoformat(resolved_date)
@@ -236,29 +285,41 @@ def get_daily_stats(
         except ValueError:
             target_date_obj = None
 
-    click_rows = repo.fetch_all(
-        """
-        SELECT date, SUM(click_count) as clicks
-        FROM click_ipua_daily
-        {daily_where}
-        GROUP BY date
-        ORDER BY date DESC
-        LIMIT :limit
-        """.format(daily_where=daily_where),
-        params,
-    )
+    get_daily_totals = getattr(repo, "get_daily_totals", None)
+    totals = None
+    if callable(get_daily_totals) and (target_date is None or target_date_obj is not None):
+        totals = get_daily_totals(limit, end_date=target_date_obj)
+    if totals is not None:
+        click_rows = [{"date": row["date"], "clicks": row["click_total"]} for row in totals if row["click_total"]]
+        conv_rows = [
+            {"date": row["date"], "conversions": row["conversion_total"]}
+            for row in totals
+            if row["conversion_total"]
+        ]
+    else:
+        click_rows = repo.fetch_all(
+            """
+            SELECT date, SUM(click_count) as clicks
+            FROM click_ipua_daily
+            {daily_where}
+            GROUP BY date
+            ORDER BY date DESC
+            LIMIT :limit
+            """.format(daily_where=daily_where),
+            params,
+        )
 
-    conv_rows = repo.fetch_all(
-        """
-        SELECT date, SUM(conversion_count) as conversions
-        FROM conversion_ipua_daily
-        {daily_where}
-        GROUP BY date
-        ORDER BY date DESC
-        LIMIT :limit
-        """.format(daily_where=daily_where),
-        params,
-    )
+        conv_rows = repo.fetch_all(
+            """
+            SELECT date, SUM(conversion_count) as conversions
+            FROM conversion_ipua_daily
+            {daily_where}
+            GROUP BY date
+            ORDER BY date DESC
+            LIMIT :limit
+            """.format(daily_where=daily_where),
+            params,
+        )
 
     merged: dict[str, dict] = {}
     for row in click_rows:
@@ -298,6 +359,11 @@ def get_daily_stats(
 
 
 def get_available_dates(repo: ReportingRepository) -> list[str]:
+    catalog_dates = getattr(repo, "get_catalog_dates", None)
+    dates = catalog_dates() if callable(catalog_dates) else None
+    if dates is not None:
+        return [value.isoformat() if isinstance(value, date) else value for value in dates]
+
     click_dates = repo.fetch_all("SELECT DISTINCT date FROM click_ipua_daily ORDER BY date DESC")
     conv_dates = repo.fetch_all("SELECT DISTINCT date FROM conversion_ipua_daily ORDER BY date DESC")
 
@@ -5,8 +5,12 @@ from typing import Optional
 
 from ..api_parsers import parse_iso_date
 from ..api_presenters import present_conversion_finding_record
+from ..pagination import decode_cursor, encode_cursor
 from . import lifecycle, reporting
 
+FINDING_SORT_COLUMNS = {"count": "total_conversions", "risk": "risk_score", "latest": "last_time"}
+FINDING_SORT_KINDS = {"count": "int", "risk": "int", "latest": "datetime"}
+
 
 @dataclass(frozen=True)
 class SuspiciousDetailResult:
@@ -34,21 +38,37 @@ def get_conversion_findings(
     include_names: bool,
     include_details: bool,
     mask_sensitive: bool,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
 ) -> dict:
     resolved_date = resolve_target_date(repo, "conversion_ipua_daily", target_date)
     if not resolved_date:
-        return {"date": "", "data": [], "total": 0, "limit": limit, "offset": offset}
+        return {"date": "", "data": [], "total": 0, "limit": limit, "offset": offset, "next_cursor": None}
 
     target_date_obj = parse_iso_date(resolved_date)
+    resolved_sort_by = sort_by if sort_by in FINDING_SORT_KINDS else "count"
+    cursor_sort = f"{resolved_sort_by}_{'asc' if sort_order.lower() == 'asc' else 'desc'}"
+    cursor_kinds = [FINDING_SORT_KINDS[resolved_sort_by], "text"]
+    keyset = decode_cursor(cursor, sort=cursor_sort, kinds=cursor_kinds) if cursor else None
     rows, total = repo.list_conversion_findings(
         target_date=target_date_obj,
-        limit=limit,
+        limit=limit + 1,
         offset=offset,
         search=search,
         risk_level=risk_level,
         sort_by=sort_by,
         sort_order=sort_order,
+        keyset=keyset,
+        include_total=include_total if include_total is not None else cursor is None,
     )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            cursor_sort,
+            [last.get(FINDING_SORT_COLUMNS[resolved_sort_by]), last.get("finding_key")],
+        )
     details_cache = {}
     if include_details and include_names and rows:
         details_cache = repo.get_suspicious_conversion_details_bulk(
@@ -70,6 +90,7 @@ def get_conversion_findings(
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
     }
 
 
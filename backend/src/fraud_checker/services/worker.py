@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+
+from ..logging_utils import log_event
+from ..service_dependencies import RuntimeDependencies
+from ..time_utils import now_local
+from . import jobs as jobs_service
+from .heartbeats import HeartbeatManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKER_CONCURRENCY = 4
+DEFAULT_WORKER_POLL_SECONDS = 5.0
+DEFAULT_WORKER_RECOVERY_SECONDS = 60.0
+DEFAULT_WORKER_BATCH_SIZE = 8
+DEFAULT_WORKER_ARCHIVE_SECONDS = 300.0
+DEFAULT_JOB_ARCHIVE_AFTER_HOURS = 24.0
+
+
+@dataclass(frozen=True)
+class WorkerSettings:
+    concurrency: int = DEFAULT_WORKER_CONCURRENCY
+    poll_seconds: float = DEFAULT_WORKER_POLL_SECONDS
+    recovery_seconds: float = DEFAULT_WORKER_RECOVERY_SECONDS
+    batch_size: int = DEFAULT_WORKER_BATCH_SIZE
+    archive_seconds: float = DEFAULT_WORKER_ARCHIVE_SECONDS
+    archive_after_hours: float = DEFAULT_JOB_ARCHIVE_AFTER_HOURS
+
+
+def _env_number(name: str, default: float, *, minimum: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return max(minimum, float(raw))
+    except ValueError:
+        return default
+
+
+def resolve_worker_settings(
+    *,
+    concurrency: int | None = None,
+    poll_seconds: float | None = None,
+    recovery_seconds: float | None = None,
+    batch_size: int | None = None,
+) -> WorkerSettings:
+    return WorkerSettings(
+        concurrency=max(
+            1,
+            concurrency
+            if concurrency is not None
+            else int(_env_number("FC_WORKER_CONCURRENCY", DEFAULT_WORKER_CONCURRENCY, minimum=1)),
+        ),
+        poll_seconds=max(
+            0.1,
+            poll_seconds
+            if poll_seconds is not None
+            else _env_number("FC_WORKER_POLL_SECONDS", DEFAULT_WORKER_POLL_SECONDS, minimum=0.1),
+        ),
+        recovery_seconds=max(
+            1.0,
+            recovery_seconds
+            if recovery_seconds is not None
+            else _env_number("FC_WORKER_RECOVERY_SECONDS", DEFAULT_WORKER_RECOVERY_SECONDS, minimum=1.0),
+        ),
+        batch_size=max(
+            1,
+            batch_size
+            if batch_size is not None
+            else int(_env_number("FC_WORKER_BATCH_SIZE", DEFAULT_WORKER_BATCH_SIZE, minimum=1)),
+        ),
+        archive_seconds=_env_number("FC_WORKER_ARCHIVE_SECONDS", DEFAULT_WORKER_ARCHIVE_SECONDS, minimum=10.0),
+        archive_after_hours=_env_number("FC_JOB_ARCHIVE_AFTER_HOURS", DEFAULT_JOB_ARCHIVE_AFTER_HOURS, minimum=0.0),
+    )
+
+
+class JobWorkerPool:
+    """Persistent queue consumer: one acquiring loop feeding a fixed pool of job threads.
+
+    Enqueue notifications (LISTEN/NOTIFY) wake the loop immediately; `poll_seconds` bounds the
+    wait when notifications are unavailable or a retry becomes due. `stop()` only stops
+    acquisition — running jobs finish and complete their own leases.
+
+    When the head run is a batchable type, up to `batch_size - 1` more runs of that type are
+    leased in one statement and executed on the same thread. Every `archive_seconds` the loop
+    also moves runs finished more than `archive_after_hours` ago into job_runs_history.
+    """
+
+    def __init__(
+        self,
+        settings: WorkerSettings | None = None,
+        *,
+        deps: RuntimeDependencies | None = None,
+        worker_id: str | None = None,
+    ) -> None:
+        self.settings = settings or resolve_worker_settings()
+        self.runtime = jobs_service._deps(deps)
+        self.worker_id = worker_id or jobs_service._worker_id()
+        self.lease_seconds = jobs_service._job_lease_seconds()
+        self.processed = 0
+        self.heartbeats: HeartbeatManager | None = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stop.is_set()
+
+    def run(self) -> int:
+        store = self.runtime.job_store()
+        listener = self._start_listener(store)
+        # One renewal statement per beat covers every run this pool is executing.
+        self.heartbeats = HeartbeatManager(
+            store,
+            worker_id=self.worker_id,
+            lease_seconds=self.lease_seconds,
+            interval_seconds=jobs_service._heartbeat_interval_seconds(self.lease_seconds),
+        )
+        self.heartbeats.start()
+        executor = ThreadPoolExecutor(
+            max_workers=self.settings.concurrency,
+            thread_name_prefix="job-worker",
+        )
+        in_flight: set[Future] = set()
+        next_recovery_at = 0.0
+        next_archive_at = time.monotonic() + self.settings.archive_seconds
+        log_event(
+            logger,
+            "job_worker_started",
+            worker_id=self.worker_id,
+            concurrency=self.settings.concurrency,
+            listening=listener is not None,
+        )
+        try:
+            while not self._stop.is_set():
+                self._wake.clear()
+                if time.monotonic() >= next_recovery_at:
+                    self._recover(store)
+                    next_recovery_at = time.monotonic() + self.settings.recovery_seconds
+                if time.monotonic() >= next_archive_at:
+                    self._archive(store)
+                    next_archive_at = time.monotonic() + self.settings.archive_seconds
+
+                in_flight = {future for future in in_flight if not future.done()}
+                try:
+                    while len(in_flight) < self.settings.concurrency and not self._stop.is_set():
+                        run = store.acquire_next(
+                            worker_id=self.worker_id,
+                            lease_seconds=self.lease_seconds,
+                            recover_stale=False,
+                        )
+                        if run is None:
+                            break
+                        batch = [run, *self._acquire_batch_tail(store, run)]
+                        self.processed += len(batch)
+                        future = executor.submit(self._execute, store, batch)
+                        future.add_done_callback(lambda _future: self._wake.set())
+                        in_flight.add(future)
+                except Exception:
+                    logger.exception("Job acquisition failed; retrying after poll interval")
+
+                timeout = min(
+                    self.settings.poll_seconds,
+                    max(0.0, min(next_recovery_at, next_archive_at) - time.monotonic()),
+                )
+                self._wake.wait(timeout)
+        finally:
+            log_event(
+                logger,
+                "job_worker_draining",
+                worker_id=self.worker_id,
+                in_flight=sum(1 for future in in_flight if not future.done()),
+            )
+            self._stop.set()
+            executor.shutdown(wait=True)
+            self.heartbeats.stop()
+            if listener is not None:
+                listener.join(timeout=5)
+            log_event(logger, "job_worker_stopped", worker_id=self.worker_id, processed=self.processed)
+        return self.processed
+
+    def _acquire_batch_tail(self, store, run) -> list:
+        acquire_batch = getattr(store, "acquire_batch", None)
+        if (
+            self.settings.batch_size <= 1
+            or run.job_type not in jobs_service.BATCHABLE_JOB_TYPES
+            or not callable(acquire_batch)
+        ):
+            return []
+        try:
+            return acquire_batch(
+                worker_id=self.worker_id,
+                lease_seconds=self.lease_seconds,
+                job_type=run.job_type,
+                limit=self.settings.batch_size - 1,
+                recover_stale=False,
+            )
+        except Exception:
+            logger.exception("Batch job acquisition failed; running the head job alone")
+            return []
+
+    def _execute(self, store, runs: list) -> None:
+        try:
+            if len(runs) == 1:
+                jobs_service._execute_job_run(
+                    store=store,
+                    run=runs[0],
+                    worker_id=self.worker_id,
+                    lease_seconds=self.lease_seconds,
+                    deps=self.runtime,
+                    heartbeats=self.heartbeats,
+                )
+            else:
+                jobs_service._execute_job_batch(
+                    store=store,
+                    runs=runs,
+                    worker_id=self.worker_id,
+                    lease_seconds=self.lease_seconds,
+                    deps=self.runtime,
+                    heartbeats=self.heartbeats,
+                )
+        except Exception:
+            # Job failures are recorded per run; this only fires when that bookkeeping fails.
+            logger.exception("Job worker could not record run outcome", extra={"run_ids": [run.id for run in runs]})
+
+    def _recover(self, store) -> None:
+        try:
+            recovered = store.recover_stale_runs()
+        except Exception:
+            logger.exception("Stale job recovery failed")
+            return
+        if recovered:
+            log_event(logger, "job_worker_recovered_stale_runs", worker_id=self.worker_id, count=recovered)
+
+    def _archive(self, store) -> None:
+        archive = getattr(store, "archive_finished_runs", None)
+        if not callable(archive):
+            return
+        cutoff = now_local() - timedelta(hours=self.settings.archive_after_hours)
+        try:
+            archived = archive(cutoff)
+        except Exception:
+            logger.exception("Job run archival failed")
+            return
+        if archived:
+            log_event(logger, "job_worker_archived_runs", worker_id=self.worker_id, count=archived)
+
+    def _start_listener(self, store) -> threading.Thread | None:
+        listen = getattr(store, "listen_for_jobs", None)
+        notify_enabled = getattr(store, "_notify_enabled", None)
+        if not callable(listen) or not (callable(notify_enabled) and notify_enabled()):
+            return None
+
+        def _listen() -> None:
+            while not self._stop.is_set():
+                try:
+                    listen(self.wake, self._stop)
+                except Exception:
+                    logger.exception("Job notification listener failed; relying on polling")
+                    self._stop.wait(self.settings.poll_seconds)
+
+        thread = threading.Thread(target=_listen, name="job-worker-listener", daemon=True)
+        thread.start()
+        return thread
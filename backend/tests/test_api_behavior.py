@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 
 from fraud_checker import api
 from fraud_checker import api_presenters
+from fraud_checker import response_cache
 from fraud_checker.api_routers import (
     health as health_router,
     jobs as jobs_router,
@@ -277,6 +278,64 @@ def test_suspicious_conversions_rejects_invalid_date(monkeypatch):
     assert response.json()["detail"] == "日付形式が不正です。YYYY-MM-DD を指定してください。"
 
 
+def test_suspicious_conversions_page_with_keyset_cursor(monkeypatch):
+    calls: list[dict] = []
+    base_row = {
+        "date": datetime(2026, 1, 1).date(),
+        "useragent": "Mozilla/5.0 Chrome/120.0",
+        "total_conversions": 6,
+        "media_count": 1,
+        "program_count": 1,
+        "first_time": datetime(2026, 1, 1, 10, 0, 0),
+        "last_time": datetime(2026, 1, 1, 10, 1, 0),
+        "reasons_json": [],
+        "reasons_formatted_json": [],
+        "metrics_json": {},
+        "risk_level": "high",
+        "risk_score": 90,
+    }
+
+    class DummyRepo:
+        def list_conversion_findings(self, **kwargs):
+            calls.append(kwargs)
+            rows = [
+                {**base_row, "finding_key": "cv-1", "ipaddress": "9.9.9.1"},
+                {**base_row, "finding_key": "cv-2", "ipaddress": "9.9.9.2"},
+            ]
+            return rows[: kwargs["limit"]], (2 if kwargs["include_total"] else None)
+
+    monkeypatch.setattr(suspicious_router, "get_repository", lambda: DummyRepo())
+    client = TestClient(api.app)
+
+    first = client.get(
+        "/api/suspicious/conversions",
+        params={"date": "2026-01-01", "limit": 1, "include_names": False},
+    )
+
+    assert first.status_code == 200
+    assert first.json()["total"] == 2
+    assert first.json()["next_cursor"]
+    assert calls[0]["limit"] == 2
+    assert calls[0]["keyset"] is None
+
+    second = client.get(
+        "/api/suspicious/conversions",
+        params={"date": "2026-01-01", "limit": 1, "include_names": False, "cursor": first.json()["next_cursor"]},
+    )
+
+    assert second.status_code == 200
+    assert second.json()["total"] is None
+    assert calls[1]["keyset"] == [6, "cv-1"]
+    assert calls[1]["include_total"] is False
+
+    mismatched = client.get(
+        "/api/suspicious/conversions",
+        params={"date": "2026-01-01", "sort_by": "risk", "cursor": first.json()["next_cursor"]},
+    )
+
+    assert mismatched.status_code == 400
+
+
 def _deprecated_test_suspicious_click_detail_returns_single_finding(monkeypatch):
     first = datetime(2026, 1, 1, 10, 0, 0)
     captured = {}
@@ -654,6 +713,30 @@ def test_dates_endpoint_returns_available_dates(monkeypatch):
     assert response.json()["dates"] == ["2026-01-03", "2026-01-02"]
 
 
+def test_dates_endpoint_serves_cached_payload_with_etag(monkeypatch):
+    class VersionedRepo:
+        def get_cache_version(self, scope):
+            return 41
+
+    calls = []
+    monkeypatch.setattr(response_cache, "_backend", response_cache.InMemoryCacheBackend())
+    monkeypatch.setattr(reporting_router, "get_repository", lambda: VersionedRepo())
+    monkeypatch.setattr(
+        reporting_router.reporting,
+        "get_available_dates",
+        lambda repo: calls.append(repo) or ["2026-01-03"],
+    )
+    client = TestClient(api.app)
+
+    first = client.get("/api/dates")
+    second = client.get("/api/dates", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert first.json() == {"dates": ["2026-01-03"]}
+    assert second.status_code == 304
+    assert len(calls) == 1
+
+
 def test_job_status_endpoint_returns_running_payload(monkeypatch):
     class DummyStore:
         def get(self):
@@ -60,6 +60,7 @@ def test_build_parser_accepts_refresh_sync_masters_and_worker():
     enqueue_backfill_args = parser.parse_args(["enqueue-backfill", "--hours", "24", "--detect"])
     enqueue_sync_args = parser.parse_args(["enqueue-sync-masters"])
     worker_args = parser.parse_args(["run-worker", "--max-jobs", "2"])
+    daemon_args = parser.parse_args(["worker", "--concurrency", "8", "--poll-interval", "2.5"])
     purge_args = parser.parse_args(["purge-data", "--execute", "--raw-days", "45"])
 
     # Then
@@ -76,6 +77,11 @@ def test_build_parser_accepts_refresh_sync_masters_and_worker():
     assert enqueue_sync_args.command == "enqueue-sync-masters"
     assert worker_args.command == "run-worker"
     assert worker_args.max_jobs == 2
+    assert daemon_args.command == "worker"
+    assert daemon_args.concurrency == 8
+    assert daemon_args.poll_interval == 2.5
+    assert daemon_args.recovery_interval is None
+    assert daemon_args.batch_size is None
     assert purge_args.command == "purge-data"
     assert purge_args.execute is True
     assert purge_args.raw_days == 45
@@ -466,6 +472,24 @@ def test_cmd_run_worker_delegates_to_job_processor(monkeypatch, capsys):
     assert "Processed 2 queued job(s)" in output
 
 
+def test_cmd_backfill_rewards_reports_updated_rows(monkeypatch, capsys):
+    captured = {}
+
+    class DummyRepo:
+        def backfill_conversion_reward_yen(self, *, batch_size):
+            captured["batch_size"] = batch_size
+            return 7
+
+    monkeypatch.setattr(cli, "_build_repository", lambda store_raw: DummyRepo())
+
+    code = cli.main(["backfill-rewards", "--batch-size", "250"])
+    output = capsys.readouterr().out
+
+    assert code == 0
+    assert captured["batch_size"] == 250
+    assert "Conversions updated: 7" in output
+
+
 def test_cmd_purge_data_runs_lifecycle_service(monkeypatch, capsys):
     monkeypatch.setattr(cli, "_build_repository", lambda store_raw: object())
     monkeypatch.setattr(cli, "_require_database_url", lambda: "postgresql://example/db")
@@ -485,12 +509,14 @@ def test_cmd_purge_data_runs_lifecycle_service(monkeypatch, capsys):
                 "aggregates_before": "2025-03-24",
                 "findings_before": "2025-03-24",
                 "job_runs_before": "2026-02-23T00:00:00",
+                "export_artifacts_before": "2026-03-17T00:00:00",
             },
             "counts": {
                 "raw": {"click_raw": 10},
                 "aggregates": {"click_ipua_daily": 20},
                 "findings": {"suspicious_conversion_findings": 5},
                 "job_runs": {"job_runs": 3},
+                "export_artifacts": {"files": 2},
             },
         },
     )
@@ -502,6 +528,7 @@ def test_cmd_purge_data_runs_lifecycle_service(monkeypatch, capsys):
             aggregate_days=365,
             findings_days=365,
             job_run_days=30,
+            export_artifact_days=7,
         )
     )
     output = capsys.readouterr().out
@@ -510,3 +537,4 @@ def test_cmd_purge_data_runs_lifecycle_service(monkeypatch, capsys):
     assert "=== Data Lifecycle Purge (DRY-RUN) ===" in output
     assert "Raw rows: {'click_raw': 10}" in output
     assert "Job runs: {'job_runs': 3}" in output
+    assert "Export artifacts: {'files': 2}" in output
@@ -36,7 +36,7 @@ def test_console_dashboard_endpoint_returns_business_payload(monkeypatch):
     monkeypatch.setattr(console_router, "get_repository", lambda: object())
     monkeypatch.setattr(
         console_router.console_service,
-        "get_dashboard",
+        "load_dashboard",
         lambda repo, target_date=None: {
             "available_dates": ["2026-04-05", "2026-04-04"],
             "kpis": {
@@ -54,6 +54,13 @@ def test_console_dashboard_endpoint_returns_business_payload(monkeypatch):
                     "stale_reasons": [],
                 }
             },
+        },
+    )
+    monkeypatch.setattr(
+        console_router.console_service,
+        "attach_dashboard_job_status",
+        lambda repo, payload: {
+            **payload,
             "job_status_summary": {
                 "status": "queued",
                 "job_id": "job-123",
@@ -135,6 +142,81 @@ def test_console_job_status_endpoint_returns_normalized_queue_summary(monkeypatc
     }
 
 
+def test_console_job_cancel_endpoint_requests_cancellation(monkeypatch):
+    from fraud_checker.api_routers import console as console_router
+
+    monkeypatch.setenv("FC_INTERNAL_PROXY_SECRET", "proxy-secret")
+    requested = []
+
+    class DummyStore:
+        def get_by_id(self, job_id):
+            return None if job_id == "missing" else object()
+
+        def request_cancel(self, job_id, message):
+            requested.append(job_id)
+            return None if job_id == "job-done" else "running"
+
+    monkeypatch.setattr(console_router, "get_job_store", lambda: DummyStore())
+    client = TestClient(api.app)
+
+    response = client.post("/api/console/job-status/job-123/cancel", headers=console_headers())
+
+    assert response.status_code == 200
+    assert response.json()["details"] == {"job_id": "job-123", "status": "running"}
+    assert client.post("/api/console/job-status/job-done/cancel", headers=console_headers()).status_code == 409
+    assert client.post("/api/console/job-status/missing/cancel", headers=console_headers()).status_code == 404
+    assert requested == ["job-123", "job-done"]
+
+
+def test_console_export_job_download_serves_artifact_for_completed_export(tmp_path, monkeypatch):
+    from fraud_checker.api_routers import console as console_router
+
+    monkeypatch.setenv("FC_INTERNAL_PROXY_SECRET", "proxy-secret")
+    monkeypatch.setenv("FC_EXPORT_ARTIFACT_DIR", str(tmp_path))
+    (tmp_path / "fraud-alerts-abc.csv.gz").write_bytes(b"gzip-bytes")
+    runs = {
+        "job-export": {"job_type": "export_alerts", "status": "succeeded"},
+        "job-running": {"job_type": "export_alerts", "status": "running"},
+        "job-refresh": {"job_type": "refresh", "status": "succeeded"},
+    }
+
+    class DummyStore:
+        def get_by_id(self, job_id):
+            run = runs.get(job_id)
+            if run is None:
+                return None
+            return type(
+                "Run",
+                (),
+                {
+                    "id": job_id,
+                    "message": "done",
+                    "started_at": None,
+                    "finished_at": None,
+                    "result": {"artifact": "fraud-alerts-abc.csv.gz", "filters": {"start_date": "2026-04-05"}},
+                    **run,
+                },
+            )()
+
+        def get_queue_metrics(self):
+            return {}
+
+        def _serialize_queue_metrics(self, metrics):
+            return {}
+
+    monkeypatch.setattr(console_router, "get_job_store", lambda: DummyStore())
+    client = TestClient(api.app)
+
+    status_payload = client.get("/api/console/job-status/job-export", headers=console_headers()).json()
+    response = client.get(status_payload["download_url"], headers=console_headers())
+
+    assert response.status_code == 200
+    assert response.content == b"gzip-bytes"
+    assert "fraud-alerts-2026-04-05.csv.gz" in response.headers["content-disposition"]
+    assert client.get("/api/console/job-status/job-running/download", headers=console_headers()).status_code == 409
+    assert client.get("/api/console/job-status/job-refresh/download", headers=console_headers()).status_code == 404
+
+
 def test_console_alerts_endpoint_defaults_to_unhandled_status_and_risk_desc(monkeypatch):
     from fraud_checker.api_routers import console as console_router
     monkeypatch.setenv("FC_INTERNAL_PROXY_SECRET", "proxy-secret")
@@ -152,6 +234,8 @@ def test_console_alerts_endpoint_defaults_to_unhandled_status_and_risk_desc(monk
         sort: str,
         page: int,
         page_size: int,
+        cursor: str | None,
+        include_totals: bool | None,
     ):
         captured["status"] = status
         captured["risk_level"] = risk_level
@@ -161,6 +245,8 @@ def test_console_alerts_endpoint_defaults_to_unhandled_status_and_risk_desc(monk
         captured["sort"] = sort
         captured["page"] = page
         captured["page_size"] = page_size
+        captured["cursor"] = cursor
+        captured["include_totals"] = include_totals
         return {
             "available_dates": ["2026-04-05"],
             "applied_filters": {
@@ -210,6 +296,8 @@ def test_console_alerts_endpoint_defaults_to_unhandled_status_and_risk_desc(monk
         "sort": "risk_desc",
         "page": 1,
         "page_size": 50,
+        "cursor": None,
+        "include_totals": None,
     }
     assert response.json()["items"][0]["risk_score"] == 97
 
@@ -318,8 +406,8 @@ def test_console_export_endpoint_returns_csv(monkeypatch):
     monkeypatch.setattr(console_router, "get_repository", lambda: object())
     monkeypatch.setattr(
         console_router.console_service,
-        "export_alerts_csv",
-        lambda repo, **kwargs: "finding_key,affiliate_name\nfk-001,Alpha\n",
+        "iter_alerts_csv",
+        lambda repo, **kwargs: iter(["finding_key,affiliate_name\n", "fk-001,Alpha\n"]),
     )
     client = TestClient(api.app)
 
@@ -335,6 +423,48 @@ def test_console_export_endpoint_returns_csv(monkeypatch):
     assert "fk-001" in response.text
 
 
+def test_console_export_endpoint_streams_gzip_variant(monkeypatch):
+    import gzip
+
+    from fraud_checker.api_routers import console as console_router
+    monkeypatch.setenv("FC_INTERNAL_PROXY_SECRET", "proxy-secret")
+
+    monkeypatch.setattr(console_router, "get_repository", lambda: object())
+    monkeypatch.setattr(
+        console_router.console_service,
+        "iter_alerts_csv",
+        lambda repo, **kwargs: iter(["finding_key,affiliate_name\n", "fk-001,アルファ\n"]),
+    )
+    client = TestClient(api.app)
+
+    response = client.get(
+        "/api/console/alerts/export",
+        params={"compress": "true"},
+        headers=console_headers(),
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'fraud-alerts-all.csv.gz' in response.headers["content-disposition"]
+    assert gzip.decompress(response.content).decode("utf-8") == "finding_key,affiliate_name\nfk-001,アルファ\n"
+
+
+def test_console_export_endpoint_rejects_invalid_dates_before_streaming(monkeypatch):
+    from fraud_checker.api_routers import console as console_router
+    monkeypatch.setenv("FC_INTERNAL_PROXY_SECRET", "proxy-secret")
+
+    monkeypatch.setattr(console_router, "get_repository", lambda: object())
+    client = TestClient(api.app)
+
+    response = client.get(
+        "/api/console/alerts/export",
+        params={"start_date": "not-a-date"},
+        headers=console_headers(),
+    )
+
+    assert response.status_code == 400
+
+
 def test_console_review_endpoint_returns_mutation_result_for_authenticated_viewers(monkeypatch):
     from fraud_checker.api_routers import console as console_router
 
@@ -662,6 +792,7 @@ def test_console_dashboard_uses_migrated_review_table(tmp_path, monkeypatch):
             suspicious_findings.insert(),
             {
                 "finding_key": "finding-001",
+                "case_key": "finding-001",
                 "date": datetime(2026, 4, 5).date(),
                 "ipaddress": "203.0.113.10",
                 "useragent": "Mozilla/5.0 Chrome/123.0",
@@ -720,10 +851,467 @@ def test_console_dashboard_uses_migrated_review_table(tmp_path, monkeypatch):
             {"date": "2026-04-05", "suspicious_conversions": 1},
         ],
     )
+    monkeypatch.setattr(console_service, "now_local", lambda: datetime(2026, 4, 10, 12, 0, 0))
+    executed: list[tuple[str, dict]] = []
+    original_fetch_all = repo.fetch_all
+
+    def recording_fetch_all(query, params=None):
+        executed.append((str(query), dict(params or {})))
+        return original_fetch_all(query, params)
+
+    monkeypatch.setattr(repo, "fetch_all", recording_fetch_all)
     payload = console_service.get_dashboard(repo, target_date="2026-04-05")
 
     assert payload["kpis"]["unhandled_alerts"]["value"] == 1
     assert payload["kpis"]["estimated_damage"]["value"] == 3000
+    assert payload["kpis"]["fraud_rate"]["value"] == 10.0
+    assert payload["review_outcomes"]["reviewed_total"] == 0
+    assert payload["operations"]["oldest_unhandled_days"] == 5
+    assert payload["operations"]["stale_unhandled_count"] == 1
+    assert [item["finding_key"] for item in payload["backlog"]["items"]] == ["finding-001"]
+    row_queries = [
+        params
+        for query, params in executed
+        if "FROM suspicious_conversion_findings f" in query and "GROUP BY" not in query
+    ]
+    assert row_queries
+    assert all(params.get("limit") == console_service.DASHBOARD_BACKLOG_LIMIT for params in row_queries)
+
+
+def test_console_dashboard_serves_materialized_snapshot_until_invalidated(tmp_path, monkeypatch):
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+    from fraud_checker.repository_pg import PostgresRepository
+    from fraud_checker.services import console as console_service
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'dashboard-snapshot.db'}")
+    Base.metadata.create_all(
+        repo.engine,
+        tables=[
+            Base.metadata.tables["suspicious_conversion_findings"],
+            Base.metadata.tables["console_dashboard_snapshots"],
+        ],
+    )
+    summary_calls: list[str | None] = []
+
+    def fake_summary(repo, target_date=None):
+        summary_calls.append(target_date)
+        return {"date": "2026-04-05", "stats": {"conversions": {"total": 10}}}
+
+    monkeypatch.setattr(console_service.reporting, "get_summary", fake_summary)
+    monkeypatch.setattr(console_service.reporting, "get_available_dates", lambda repo: ["2026-04-05"])
+    monkeypatch.setattr(console_service.reporting, "get_daily_stats", lambda repo, days, resolved_date: [])
+
+    first = console_service.get_dashboard(repo)
+    second = console_service.get_dashboard(repo)
+
+    assert summary_calls == [None]
+    assert first["snapshot"]["served_from"] == "live"
+    assert second["snapshot"]["served_from"] == "snapshot"
+    assert second["snapshot"]["computed_at"] == first["snapshot"]["computed_at"]
+    assert second["kpis"] == first["kpis"]
+    assert "job_status_summary" in second
+    assert console_service.dashboard_cache_expiry(first) is None
+    assert console_service.dashboard_cache_expiry(second) == (
+        datetime.fromisoformat(second["snapshot"]["computed_at"]) + console_service.DASHBOARD_SNAPSHOT_MAX_AGE
+    )
+
+    console_service.invalidate_dashboard_snapshots(repo)
+    assert summary_calls == [None]
+    third = console_service.get_dashboard(repo)
+    fourth = console_service.get_dashboard(repo)
+
+    assert summary_calls == [None, None]
+    assert third["snapshot"]["served_from"] == "live"
+    assert fourth["snapshot"]["served_from"] == "snapshot"
+
+
+def test_list_alerts_pages_with_keyset_cursor_and_skips_totals(tmp_path, monkeypatch):
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+    from fraud_checker.repository_pg import PostgresRepository
+    from fraud_checker.services import console as console_service
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'alerts-cursor.db'}")
+    suspicious_findings = Base.metadata.tables["suspicious_conversion_findings"]
+    Base.metadata.create_all(repo.engine, tables=[suspicious_findings])
+    base_row = {
+        "date": date(2026, 4, 5),
+        "useragent": "Mozilla/5.0 Chrome/123.0",
+        "ua_hash": "ua-hash-1",
+        "risk_level": "high",
+        "reasons_json": "[]",
+        "reasons_formatted_json": "[]",
+        "metrics_json": "{}",
+        "total_conversions": 1,
+        "media_count": 1,
+        "program_count": 1,
+        "first_time": datetime(2026, 4, 5, 9, 0, 0),
+        "last_time": datetime(2026, 4, 5, 10, 0, 0),
+        "rule_version": "test",
+        "computed_at": datetime(2026, 4, 5, 10, 0, 0),
+        "estimated_damage_yen": 3000,
+        "is_current": True,
+        "search_text": "alpha",
+    }
+    with repo.engine.begin() as conn:
+        conn.execute(
+            suspicious_findings.insert(),
+            [
+                {
+                    **base_row,
+                    "finding_key": f"finding-00{idx}",
+                    "case_key": f"case-00{idx}",
+                    "ipaddress": f"203.0.113.{idx}",
+                    "risk_score": score,
+                }
+                for idx, score in enumerate([90, 70, 80], start=1)
+            ],
+        )
+    monkeypatch.setattr(console_service.reporting, "get_available_dates", lambda repo: ["2026-04-05"])
+
+    first = console_service.list_alerts(repo, status="all", page_size=2)
+
+    assert [item["finding_key"] for item in first["items"]] == ["finding-001", "finding-003"]
+    assert first["total"] == 3
+    assert first["has_next"] is True
+    assert first["next_cursor"]
+
+    second = console_service.list_alerts(repo, status="all", page_size=2, cursor=first["next_cursor"])
+
+    assert [item["finding_key"] for item in second["items"]] == ["finding-002"]
+    assert second["has_next"] is False
+    assert second["next_cursor"] is None
+    assert second["total"] is None
+    assert second["status_counts"] is None
+
+    with pytest.raises(ValueError):
+        console_service.list_alerts(repo, status="all", sort="detected_desc", cursor=first["next_cursor"])
+
+
+def test_alert_detail_loads_case_context_concurrently_with_memoized_schema_probes(tmp_path, monkeypatch):
+    import threading
+
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+    from fraud_checker.repository_pg import PostgresRepository
+    from fraud_checker.services import console as console_service
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'alert-detail.db'}")
+    tables = Base.metadata.tables
+    Base.metadata.create_all(
+        repo.engine,
+        tables=[
+            tables["suspicious_conversion_findings"],
+            tables["fraud_alert_review_states"],
+            tables["fraud_alert_review_events"],
+            tables["fraud_alert_case_assignments"],
+            tables["fraud_alert_followup_tasks"],
+        ],
+    )
+    base_row = {
+        "ipaddress": "203.0.113.10",
+        "useragent": "Mozilla/5.0 Chrome/123.0",
+        "ua_hash": "ua-hash-1",
+        "affiliate_ids_json": '["aff-001"]',
+        "affiliate_names_json": '["Affiliate Alpha"]',
+        "program_names_json": '["Program Alpha"]',
+        "risk_level": "high",
+        "risk_score": 90,
+        "reasons_json": "[]",
+        "reasons_formatted_json": "[]",
+        "metrics_json": "{}",
+        "total_conversions": 1,
+        "media_count": 1,
+        "program_count": 1,
+        "first_time": datetime(2026, 4, 5, 9, 0, 0),
+        "last_time": datetime(2026, 4, 5, 10, 0, 0),
+        "rule_version": "test",
+        "computed_at": datetime(2026, 4, 5, 10, 0, 0),
+        "estimated_damage_yen": 3000,
+        "is_current": True,
+        "search_text": "alpha",
+    }
+    with repo.engine.begin() as conn:
+        conn.execute(
+            tables["suspicious_conversion_findings"].insert(),
+            [
+                {**base_row, "finding_key": "finding-001", "case_key": "case-001", "date": date(2026, 4, 5)},
+                {**base_row, "finding_key": "finding-002", "case_key": "case-002", "date": date(2026, 4, 3)},
+            ],
+        )
+        conn.execute(
+            tables["fraud_alert_case_assignments"].insert(),
+            {
+                "case_key": "case-001",
+                "assignee_user_id": "analyst-1",
+                "assigned_by": "lead",
+                "assigned_at": datetime(2026, 4, 5, 11, 0, 0),
+                "updated_at": datetime(2026, 4, 5, 11, 0, 0),
+            },
+        )
+
+    probe_counts: dict[tuple[str, ...], int] = {}
+    original_column_exists = repo._column_exists
+
+    def counting_column_exists(table_name, column_name):
+        key = (table_name, column_name)
+        probe_counts[key] = probe_counts.get(key, 0) + 1
+        return original_column_exists(table_name, column_name)
+
+    fetch_threads: set[str] = set()
+    original_fetch_all = repo.fetch_all
+
+    def recording_fetch_all(query, params=()):
+        fetch_threads.add(threading.current_thread().name)
+        return original_fetch_all(query, params)
+
+    monkeypatch.setattr(repo, "_column_exists", counting_column_exists)
+    monkeypatch.setattr(repo, "fetch_all", recording_fetch_all)
+
+    monkeypatch.setenv("FC_ALERT_DETAIL_CONTEXT_WORKERS", "1")
+    sequential = console_service.get_alert_detail(repo, "finding-001")
+
+    assert probe_counts and max(probe_counts.values()) == 1
+    assert not any(name.startswith("alert-detail") for name in fetch_threads)
+
+    monkeypatch.setenv("FC_ALERT_DETAIL_CONTEXT_WORKERS", "4")
+    concurrent = console_service.get_alert_detail(repo, "finding-001")
+
+    assert any(name.startswith("alert-detail") for name in fetch_threads)
+    assert concurrent == sequential
+    assert concurrent["assignee"]["user_id"] == "analyst-1"
+    assert [item["case_key"] for item in concurrent["related_cases"]] == ["case-002"]
+
+
+def test_iter_alerts_csv_streams_rows_in_batches(tmp_path, monkeypatch):
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+    from fraud_checker.repository_pg import PostgresRepository
+    from fraud_checker.services import console as console_service
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'alerts-export.db'}")
+    suspicious_findings = Base.metadata.tables["suspicious_conversion_findings"]
+    Base.metadata.create_all(repo.engine, tables=[suspicious_findings])
+    base_row = {
+        "date": date(2026, 4, 5),
+        "useragent": "Mozilla/5.0 Chrome/123.0",
+        "ua_hash": "ua-hash-1",
+        "affiliate_ids_json": '["aff-001"]',
+        "affiliate_names_json": '["Affiliate Alpha"]',
+        "risk_level": "high",
+        "reasons_json": "[]",
+        "reasons_formatted_json": "[]",
+        "metrics_json": "{}",
+        "total_conversions": 1,
+        "media_count": 1,
+        "program_count": 1,
+        "first_time": datetime(2026, 4, 5, 9, 0, 0),
+        "last_time": datetime(2026, 4, 5, 10, 0, 0),
+        "rule_version": "test",
+        "computed_at": datetime(2026, 4, 5, 10, 0, 0),
+        "estimated_damage_yen": 3000,
+        "is_current": True,
+        "search_text": "alpha",
+    }
+    with repo.engine.begin() as conn:
+        conn.execute(
+            suspicious_findings.insert(),
+            [
+                {
+                    **base_row,
+                    "finding_key": f"finding-00{idx}",
+                    "case_key": f"case-00{idx}",
+                    "ipaddress": f"203.0.113.{idx}",
+                    "risk_score": 100 - idx,
+                }
+                for idx in range(1, 6)
+            ],
+        )
+
+    batch_sizes: list[int] = []
+    original_iter_batches = repo.iter_batches
+
+    def recording_iter_batches(query, params=(), *, batch_size=1000):
+        for rows in original_iter_batches(query, params, batch_size=batch_size):
+            batch_sizes.append(len(rows))
+            yield rows
+
+    monkeypatch.setattr(repo, "iter_batches", recording_iter_batches)
+
+    chunks = list(console_service.iter_alerts_csv(repo, status="all", batch_size=2))
+
+    assert batch_sizes == [2, 2, 1]
+    assert chunks[0].startswith("case_key,latest_detected_at")
+    body = "".join(chunks)
+    assert [line.split(",")[0] for line in body.splitlines()[1:6]] == [
+        f"case-00{idx}" for idx in range(1, 6)
+    ]
+    assert body.splitlines()[-1].startswith("exported_at,")
+
+
+def test_alert_sort_orders_are_served_by_partial_current_indexes(tmp_path, monkeypatch):
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+    from fraud_checker.repository_pg import PostgresRepository
+    from fraud_checker.services import console as console_service
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'alert-sort-plans.db'}")
+    Base.metadata.create_all(
+        repo.engine,
+        tables=[
+            Base.metadata.tables["suspicious_conversion_findings"],
+            Base.metadata.tables["fraud_alert_review_states"],
+        ],
+    )
+    captured: dict[str, object] = {}
+
+    def capture_fetch_all(query, params=None):
+        captured["query"] = query
+        captured["params"] = params
+        return []
+
+    monkeypatch.setattr(repo, "fetch_all", capture_fetch_all)
+
+    sort_families = {
+        "risk_desc": "risk",
+        "risk_asc": "risk",
+        "damage_desc": "damage",
+        "damage_asc": "damage",
+        "detected_desc": "detected",
+        "detected_asc": "detected",
+    }
+    assert set(sort_families) == set(console_service.ALERT_SORT_KEYS)
+    for sort, family in sort_families.items():
+        for start_date, end_date in ((None, None), ("2026-01-01", "2026-01-31")):
+            console_service._fetch_alert_rows(
+                repo,
+                start_date=start_date,
+                end_date=end_date,
+                status="unhandled",
+                sort=sort,
+                limit=51,
+            )
+            with repo.engine.connect() as conn:
+                plan = " | ".join(
+                    str(row[3])
+                    for row in conn.execute(
+                        sa.text(f"EXPLAIN QUERY PLAN {captured['query']}"),
+                        captured["params"],
+                    )
+                )
+
+            assert f"USING INDEX idx_scof_status_{family} " in f"{plan} ", (sort, start_date, plan)
+            assert "TEMP B-TREE" not in plan, (sort, start_date, plan)
+            assert "review_state" not in captured["query"], sort
+
+
+class _PlanProbeRepo:
+    def _table_exists(self, table_name: str) -> bool:
+        return table_name in {"suspicious_conversion_findings", "findings_current_generations"}
+
+    def _column_exists(self, table_name: str, column_name: str) -> bool:
+        return True
+
+
+@pytest.mark.integration
+def test_alert_sort_orders_use_status_date_indexes_on_postgres() -> None:
+    import json
+    import os
+
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+    from fraud_checker.services import console as console_service
+
+    database_url = os.getenv("FRAUD_TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("Set FRAUD_TEST_DATABASE_URL to run Postgres plan checks.")
+
+    engine = sa.create_engine(database_url)
+    with engine.connect() as conn, conn.begin() as transaction:
+        conn.execute(sa.text("CREATE SCHEMA console_plan_probe"))
+        conn.execute(sa.text("SET LOCAL search_path TO console_plan_probe"))
+        Base.metadata.create_all(
+            conn,
+            tables=[
+                Base.metadata.tables["suspicious_conversion_findings"],
+                Base.metadata.tables["findings_current_generations"],
+            ],
+        )
+        conn.execute(
+            sa.text(
+                """
+                INSERT INTO suspicious_conversion_findings (
+                    finding_key, case_key, date, ipaddress, useragent, ua_hash, risk_level, risk_score,
+                    reasons_json, reasons_formatted_json, metrics_json, total_conversions, media_count,
+                    program_count, first_time, last_time, rule_version, computed_at, estimated_damage_yen,
+                    generation_id, is_current, search_text, review_status
+                )
+                SELECT
+                    'finding-' || lpad(n::text, 7, '0'),
+                    'case-' || lpad(n::text, 7, '0'),
+                    DATE '2026-01-01' + (n % 90),
+                    '203.0.113.' || (n % 250),
+                    'agent',
+                    'ua',
+                    'high',
+                    n % 100,
+                    '[]', '[]', '{}', 1, 1, 1,
+                    TIMESTAMP '2026-01-01', TIMESTAMP '2026-01-01', 'v1',
+                    TIMESTAMP '2026-01-01' + n * INTERVAL '1 second',
+                    (n * 37) % 50000,
+                    'gen-' || (n % 90),
+                    n % 10 <> 0,
+                    'agent',
+                    CASE WHEN n % 5 = 0 THEN 'confirmed_fraud' ELSE 'unhandled' END
+                FROM generate_series(1, 200000) AS n
+                """
+            )
+        )
+        conn.execute(
+            sa.text(
+                """
+                INSERT INTO findings_current_generations (finding_type, target_date, generation_id, published_at)
+                SELECT 'conversion', DATE '2026-01-01' + d, 'gen-' || d, TIMESTAMP '2026-04-01'
+                FROM generate_series(0, 89) AS d
+                """
+            )
+        )
+        conn.execute(sa.text("ANALYZE suspicious_conversion_findings"))
+        conn.execute(sa.text("ANALYZE findings_current_generations"))
+
+        for sort in console_service.ALERT_SORT_KEYS:
+            family = sort.rsplit("_", 1)[0]
+            for start_date, end_date in ((None, None), ("2026-02-01", "2026-03-02")):
+                query, params = console_service._alert_rows_query(
+                    _PlanProbeRepo(),
+                    start_date=start_date,
+                    end_date=end_date,
+                    status="unhandled",
+                    sort=sort,
+                    limit=51,
+                )
+                plan = conn.execute(sa.text(f"EXPLAIN (FORMAT JSON) {query}"), params).scalar_one()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                nodes = _plan_nodes(plan[0]["Plan"])
+
+                index_nodes = [node for node in nodes if node.get("Index Name") == f"idx_scof_status_{family}"]
+                assert index_nodes, (sort, start_date, plan)
+                assert not any(node["Node Type"] in {"Sort", "Incremental Sort"} for node in nodes), (sort, plan)
+                if start_date:
+                    # The date window is checked inside the index, not on fetched heap rows.
+                    assert all("date" in node.get("Index Cond", "") for node in index_nodes), (sort, plan)
+        transaction.rollback()
+
+
+def _plan_nodes(node: dict) -> list[dict]:
+    return [node, *(child for sub_plan in node.get("Plans", []) for child in _plan_nodes(sub_plan))]
 
 
 def test_apply_alert_reviews_persists_case_state_and_history(tmp_path):
@@ -738,7 +1326,22 @@ def test_apply_alert_reviews_persists_case_state_and_history(tmp_path):
     suspicious_findings = Base.metadata.tables["suspicious_conversion_findings"]
     review_states = Base.metadata.tables["fraud_alert_review_states"]
     review_events = Base.metadata.tables["fraud_alert_review_events"]
-    Base.metadata.create_all(repo.engine, tables=[suspicious_findings, review_states, review_events])
+    Base.metadata.create_all(
+        repo.engine,
+        tables=[
+            suspicious_findings,
+            review_states,
+            review_events,
+            Base.metadata.tables["cache_versions"],
+            Base.metadata.tables["console_dashboard_snapshots"],
+        ],
+    )
+    repo.save_dashboard_snapshot(
+        "latest",
+        target_date=None,
+        payload_json="{}",
+        computed_at=datetime(2026, 4, 5, 11, 0, 0),
+    )
 
     with repo.engine.begin() as conn:
         conn.execute(
@@ -798,14 +1401,21 @@ def test_apply_alert_reviews_persists_case_state_and_history(tmp_path):
     with repo.engine.begin() as conn:
         state_row = conn.execute(sa.text("SELECT * FROM fraud_alert_review_states")).mappings().one()
         event_row = conn.execute(sa.text("SELECT * FROM fraud_alert_review_events")).mappings().one()
+        finding_status = conn.execute(
+            sa.text("SELECT review_status FROM suspicious_conversion_findings WHERE finding_key = 'finding-001'")
+        ).scalar_one()
 
     assert state_row["case_key"] == "case-001"
+    assert finding_status == "white"
     assert state_row["review_status"] == "white"
     assert state_row["reason"] == "manual review"
     assert state_row["reviewed_by"] == "admin-user"
     assert state_row["request_id"] == "req-1"
     assert event_row["case_key"] == "case-001"
     assert event_row["finding_key_at_review"] == "finding-001"
+    # The pre-review dashboard is gone by the time readers can observe the new cache version.
+    assert repo.get_dashboard_snapshot("latest") is None
+    assert repo.get_cache_version("reporting") == 1
 
 
 def test_apply_alert_reviews_creates_and_cancels_followup_tasks(tmp_path):
@@ -1099,3 +1709,51 @@ def test_fetch_alert_rows_logs_sqlalchemy_errors(monkeypatch):
         )
 
     assert captured == ["Failed to fetch console alert rows"]
+
+
+def test_alert_transaction_summary_prefers_persisted_summaries():
+    from fraud_checker.services import console as console_service
+
+    class DummyRepo:
+        def _table_exists(self, name):
+            return name == "conversion_finding_summaries"
+
+        def fetch_all(self, query, params=None):
+            if "FROM conversion_finding_summaries" in query:
+                assert list(params.values()) == ["finding-001"]
+                return [
+                    {
+                        "finding_key": "finding-001",
+                        "transaction_count": 3,
+                        "reward_amount": 24000,
+                        "reward_amount_source": "observed_transactions",
+                        "affiliate_id": "aff-1",
+                        "affiliate_name": None,
+                        "outcome_type": None,
+                        "latest_occurred_at": datetime(2026, 4, 5, 10, 0, 0),
+                    }
+                ]
+            raise AssertionError(f"Unexpected query: {query}")
+
+    summary = console_service._fetch_alert_transaction_summary(
+        DummyRepo(),
+        [
+            {
+                "finding_key": "finding-001",
+                "date": date(2026, 4, 5),
+                "ipaddress": "203.0.113.10",
+                "useragent": "Mozilla/5.0",
+                "program_ids_json": ["program-1"],
+                "program_names_json": ["Program Alpha"],
+                "affiliate_names_json": ["Affiliate Alpha"],
+                "total_conversions": 3,
+                "last_time": datetime(2026, 4, 5, 10, 0, 0),
+                "computed_at": datetime(2026, 4, 5, 10, 5, 0),
+            }
+        ],
+    )
+
+    assert summary["finding-001"]["reward_amount"] == 24000
+    assert summary["finding-001"]["affiliate_id"] == "aff-1"
+    assert summary["finding-001"]["affiliate_name"] == "Affiliate Alpha"
+    assert summary["finding-001"]["outcome_type"] == "Program Alpha"
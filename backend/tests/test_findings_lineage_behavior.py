@@ -78,9 +78,10 @@ def test_recompute_findings_persists_lineage_metadata_for_conversion_rows(monkey
             assert program_ids == ["p1"]
             return {"p1": 12000}
 
-        def replace_conversion_findings(self, requested_date, rows, *, generation_metadata):
+        def replace_conversion_findings(self, requested_date, rows, *, generation_metadata, enrichment=None):
             captured["conversion"] = rows
             captured_generations["conversion"] = generation_metadata
+            captured["enrichment"] = enrichment
 
     monkeypatch.setattr(findings.settings_service, "get_settings", lambda repo: {"conversion_threshold": 5})
     monkeypatch.setattr(findings.settings_service, "build_rule_sets", lambda repo: (object(), object()))
@@ -108,6 +109,42 @@ def test_recompute_findings_persists_lineage_metadata_for_conversion_rows(monkey
     )
     assert captured_generations["conversion"]["settings_version_id"] == "settings-ver-1"
     assert captured_generations["conversion"]["generation_id"] == "gen-456"
+    assert captured["enrichment"]["unit_prices"] == {"p1": 12000}
     assert captured_generations["conversion"]["source_click_watermark"] == click_watermark
     assert captured_generations["conversion"]["source_conversion_watermark"] == conversion_watermark
     assert captured_generations["conversion"]["row_count"] == 1
+
+
+def test_transaction_summary_snapshot_fills_unmatched_conversions_with_program_price():
+    summary = findings._transaction_summary_snapshot(
+        finding_key="finding-001",
+        total_conversions=5,
+        observed={
+            "transaction_count": 2,
+            "reward_amount": 16000,
+            "unit_price_yen": None,
+            "affiliate_id": "aff-1",
+            "affiliate_name": "Affiliate 1",
+            "outcome_type": "Program 1",
+            "latest_occurred_at": datetime(2026, 1, 21, 11, 10, 0),
+        },
+        program_unit_price=9000,
+    )
+
+    assert summary["transaction_count"] == 5
+    assert summary["reward_amount"] == 16000 + 3 * 9000
+    assert summary["reward_amount_source"] == "mixed"
+    assert summary["affiliate_id"] == "aff-1"
+
+
+def test_transaction_summary_snapshot_defaults_when_nothing_was_observed():
+    summary = findings._transaction_summary_snapshot(
+        finding_key="finding-001",
+        total_conversions=2,
+        observed=None,
+        program_unit_price=None,
+    )
+
+    assert summary["reward_amount"] == 2 * findings.DEFAULT_REWARD_YEN
+    assert summary["reward_amount_source"] == "fallback_default"
+    assert summary["affiliate_id"] is None
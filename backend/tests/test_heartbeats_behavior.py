@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+
+from fraud_checker.ingestion import ClickLogIngestor
+from fraud_checker.job_control import ABORT_CANCELLED, JobAbortedError, JobControl, job_control_scope
+from fraud_checker.services import jobs
+from fraud_checker.services.heartbeats import HeartbeatManager
+
+
+class _LeaseStore:
+    def __init__(self, owned: set[str]) -> None:
+        self.owned = owned
+        self.calls: list[list[str]] = []
+        self.completed: list[str] = []
+        self.failed: list[str] = []
+
+        self.cancelled: set[str] = set()
+        self.progress: list[dict] = []
+
+    def heartbeat_many(self, *, run_ids, worker_id, lease_seconds, progress=None):
+        self.calls.append(list(run_ids))
+        self.progress.append(dict(progress or {}))
+        return {run_id: run_id in self.cancelled for run_id in run_ids if run_id in self.owned}
+
+
+class _NoLock:
+    def __enter__(self):
+        return True
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def _run(run_id: str) -> jobs.JobRun:
+    return jobs.JobRun(
+        id=run_id,
+        job_type=jobs.JOB_TYPE_MASTER_SYNC,
+        status="running",
+        params=None,
+        result=None,
+        error_message=None,
+        message="queued",
+        attempt_count=0,
+        max_attempts=2,
+        next_retry_at=None,
+        dedupe_key="master_sync:{}",
+        priority=50,
+        queued_at=datetime(2026, 1, 1, 0, 0, 0),
+        started_at=None,
+        finished_at=None,
+        heartbeat_at=None,
+        locked_until=None,
+        worker_id="worker-1",
+    )
+
+
+def test_heartbeat_manager_renews_all_leases_in_one_call_and_flags_lost_runs():
+    store = _LeaseStore({"run-1"})
+    manager = HeartbeatManager(store, worker_id="worker-1", lease_seconds=60)
+    kept = manager.register("run-1")
+    lost = manager.register("run-2")
+
+    assert manager.beat_once() == {"run-2"}
+    assert store.calls == [["run-1", "run-2"]]
+    assert lost.aborted
+    assert not kept.aborted
+
+    manager.beat_once()
+    assert store.calls[-1] == ["run-1"]
+
+
+def test_heartbeat_manager_keeps_leases_when_renewal_errors_and_falls_back_to_single_beats():
+    class FlakyStore:
+        def heartbeat_many(self, **kwargs):
+            raise RuntimeError("db down")
+
+    manager = HeartbeatManager(FlakyStore(), worker_id="worker-1", lease_seconds=60)
+    control = manager.register("run-1")
+    control.report(pages_fetched=1)
+    assert manager.beat_once() == set()
+    assert not control.aborted
+    # Progress that failed to persist is sent again with the next beat.
+    assert control.take_progress() == {"pages_fetched": 1}
+
+    class SingleBeatStore:
+        def heartbeat(self, *, run_id, worker_id, lease_seconds):
+            return run_id == "run-1"
+
+    manager = HeartbeatManager(SingleBeatStore(), worker_id="worker-1", lease_seconds=60)
+    with manager.leases(["run-1", "run-2"]) as controls:
+        assert manager.beat_once() == {"run-2"}
+        assert controls["run-2"].aborted
+    assert manager.beat_once() == set()
+
+
+def test_execute_job_run_skips_outcome_when_lease_is_lost_mid_job(monkeypatch):
+    store = _LeaseStore(set())
+    store.advisory_lock = lambda concurrency_key: _NoLock()
+    store.complete = lambda run_id, message, result=None: store.completed.append(run_id)
+    store.fail = lambda run_id, *args, **kwargs: store.failed.append(run_id)
+    manager = HeartbeatManager(store, worker_id="worker-1", lease_seconds=60)
+
+    def dispatch(run, deps):
+        manager.beat_once()
+        return {"success": True}, "done"
+
+    monkeypatch.setattr(jobs, "_dispatch_job_with_optional_deps", dispatch)
+    run = _run("run-1")
+
+    jobs._execute_job_run(store=store, run=run, worker_id="worker-1", lease_seconds=60, heartbeats=manager)
+
+    assert store.completed == []
+    assert store.failed == []
+
+
+def test_ingestion_stops_at_page_checkpoint_once_aborted():
+    class Client:
+        def fetch_click_logs(self, target_date, page, limit):
+            raise AssertionError("aborted ingestion must not fetch")
+
+    control = JobControl()
+    control.abort("lease_lost")
+    ingestor = ClickLogIngestor(Client(), repository=None)
+
+    with job_control_scope(control), pytest.raises(JobAbortedError):
+        ingestor.run_for_date(date(2026, 1, 1))
+
+
+def test_heartbeat_carries_progress_and_cancellation_stops_the_job(monkeypatch):
+    store = _LeaseStore({"run-1"})
+    store.cancelled_runs = []
+    store.cancel = lambda run_id, message: store.cancelled_runs.append(run_id)
+    store.advisory_lock = lambda concurrency_key: _NoLock()
+    store.complete = lambda run_id, message, result=None: store.completed.append(run_id)
+    store.fail = lambda run_id, *args, **kwargs: store.failed.append(run_id)
+    manager = HeartbeatManager(store, worker_id="worker-1", lease_seconds=60)
+
+    class Client:
+        def __init__(self) -> None:
+            self.pages = 0
+
+        def fetch_click_logs(self, target_date, page, limit):
+            self.pages += 1
+            manager.beat_once()
+            if page == 1:
+                store.cancelled.add("run-1")
+            return [object()] * limit
+
+    client = Client()
+
+    def dispatch(run, deps):
+        ClickLogIngestor(client, repository=None, page_size=2).run_for_date(date(2026, 1, 1))
+        return {"success": True}, "done"
+
+    monkeypatch.setattr(jobs, "_dispatch_job_with_optional_deps", dispatch)
+
+    jobs._execute_job_run(store=store, run=_run("run-1"), worker_id="worker-1", lease_seconds=60, heartbeats=manager)
+
+    assert client.pages == 2
+    assert store.progress[1] == {"run-1": {"pages_fetched": 1, "rows_fetched": 2}}
+    assert store.cancelled_runs == ["run-1"]
+    assert store.completed == []
+    assert store.failed == []
+
+
+def test_job_control_accumulates_counts_and_reports_only_changes():
+    control = JobControl()
+    assert control.take_progress() is None
+    control.report(pages_fetched=1, rows_fetched=10)
+    control.report(pages_fetched=1, rows_fetched=5, current_date="2026-01-02")
+
+    assert control.take_progress() == {"pages_fetched": 2, "rows_fetched": 15, "current_date": "2026-01-02"}
+    assert control.take_progress() is None
+    control.abort(ABORT_CANCELLED)
+    control.abort("lease_lost")
+    assert control.abort_reason == ABORT_CANCELLED
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+from fraud_checker import job_scheduling
+from fraud_checker.job_scheduling import SchedulingPolicy
+from fraud_checker.services import jobs
+
+_EPOCH = datetime(2026, 1, 1, 0, 0, 0)
+_HORIZON_SECONDS = 2 * 60 * 60
+
+
+def _simulate(policy: SchedulingPolicy, arrivals, *, workers: int = 2):
+    """Tick-by-tick model of workers picking with `policy`; returns per-run waits and peak concurrency.
+
+    Runs that never start before the horizon get a wait of None.
+    """
+    pending = sorted(arrivals, key=lambda arrival: arrival[0])
+    queue: list[dict] = []
+    running: list[tuple[int, dict]] = []
+    waits: dict[str, int | None] = {arrival[1]: None for arrival in arrivals}
+    peak_running: Counter = Counter()
+    for now in range(_HORIZON_SECONDS):
+        running = [(ends_at, run) for ends_at, run in running if ends_at > now]
+        while pending and pending[0][0] <= now:
+            queued_at, run_id, job_type, duration = pending.pop(0)
+            queue.append(
+                {
+                    "id": run_id,
+                    "job_type": job_type,
+                    "priority": jobs.JOB_PRIORITIES[job_type],
+                    "queued_at": _EPOCH + timedelta(seconds=queued_at),
+                    "duration": duration,
+                }
+            )
+        while len(running) < workers:
+            running_by_type = Counter(run["job_type"] for _ends_at, run in running)
+            eligible = [run for run in queue if not policy.is_capped(run["job_type"], running_by_type)]
+            if not eligible:
+                break
+            run = min(eligible, key=lambda item: policy.sort_key(item["priority"], item["queued_at"]))
+            queue.remove(run)
+            waits[run["id"]] = now - int((run["queued_at"] - _EPOCH).total_seconds())
+            running.append((now + run["duration"], run))
+            running_by_type[run["job_type"]] += 1
+            peak_running[run["job_type"]] = max(peak_running[run["job_type"]], running_by_type[run["job_type"]])
+    return waits, peak_running
+
+
+def _saturated_workload():
+    # Refreshes alone keep both workers busy all the time; the backlog arrives on top of them.
+    arrivals = [
+        (second, f"refresh-{second}", jobs.JOB_TYPE_REFRESH, 10)
+        for second in range(0, _HORIZON_SECONDS, 5)
+    ]
+    arrivals += [(0, f"recompute-{index}", jobs.JOB_TYPE_RECOMPUTE_FINDINGS_DATE, 20) for index in range(30)]
+    arrivals += [(0, "master-sync", jobs.JOB_TYPE_MASTER_SYNC, 60)]
+    return arrivals
+
+
+def test_strict_priority_starves_lower_priority_jobs_under_steady_refreshes():
+    waits, _peak = _simulate(SchedulingPolicy(aging_seconds=0), _saturated_workload())
+
+    assert waits["master-sync"] is None
+    # Only the recompute taken by the second, idle worker at t=0 ever starts.
+    assert sum(waits[f"recompute-{index}"] is not None for index in range(30)) == 1
+
+
+def test_priority_aging_bounds_waits_for_every_job_type():
+    policy = SchedulingPolicy(aging_seconds=15)
+    waits, _peak = _simulate(policy, _saturated_workload())
+
+    # A run is ordered ahead of every refresh queued more than (priority - 10) * 15s after it,
+    # so its wait is bounded by the work ordered ahead of it, not by the refresh stream.
+    assert waits["master-sync"] is not None and waits["master-sync"] <= 20 * 60
+    assert max(waits[f"recompute-{index}"] for index in range(30)) <= 10 * 60
+    refresh_waits = [wait for run_id, wait in waits.items() if run_id.startswith("refresh-") and wait is not None]
+    assert refresh_waits and min(refresh_waits) == 0
+
+
+def test_type_caps_limit_concurrency_without_blocking_other_types():
+    policy = SchedulingPolicy(aging_seconds=15, type_caps={jobs.JOB_TYPE_RECOMPUTE_FINDINGS_DATE: 1})
+    arrivals = [(0, f"recompute-{index}", jobs.JOB_TYPE_RECOMPUTE_FINDINGS_DATE, 20) for index in range(10)]
+    arrivals += [(30, "master-sync", jobs.JOB_TYPE_MASTER_SYNC, 60)]
+
+    waits, peak = _simulate(policy, arrivals, workers=3)
+
+    assert peak[jobs.JOB_TYPE_RECOMPUTE_FINDINGS_DATE] == 1
+    assert waits["master-sync"] == 0
+    assert all(waits[f"recompute-{index}"] is not None for index in range(10))
+
+
+def test_scheduling_policy_reads_environment(monkeypatch):
+    monkeypatch.setenv("FC_JOB_PRIORITY_AGING_SECONDS", "0")
+    monkeypatch.setenv("FC_JOB_TYPE_CAPS", "recompute_findings_date=2, export_alerts=1,broken,=3,bad=x")
+
+    policy = job_scheduling.resolve_scheduling_policy()
+
+    assert policy.aging_seconds == 0
+    assert dict(policy.type_caps) == {"recompute_findings_date": 2, "export_alerts": 1}
+    assert policy.order_by_sql() == "priority ASC, queued_at ASC"
+    assert policy.sql_params() == {
+        "cap_types": ["export_alerts", "recompute_findings_date"],
+        "cap_limits": [1, 2],
+    }
+    assert "HAVING COUNT(*) >= caps.cap_limit" in policy.cap_filter_sql()
+    assert SchedulingPolicy().cap_filter_sql() == ""
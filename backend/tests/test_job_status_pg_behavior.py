@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 
 from fraud_checker import job_status_pg
 from fraud_checker import job_status_queue
+from fraud_checker.services import jobs
 
 
 class _DummyContext:
@@ -293,10 +294,15 @@ def test_fail_marks_terminal_failure_when_attempts_exhausted(monkeypatch):
     monkeypatch.setattr(store, "_get_attempt_state", lambda run_id: {"attempt_count": 2, "max_attempts": 3})
     calls = []
 
+    class DummyResult:
+        def all(self):
+            # No rerun was requested, so no follow-up is inserted.
+            return []
+
     class DummyConn:
         def execute(self, stmt, params=None):
             calls.append(params)
-            return None
+            return DummyResult()
 
     class DummyEngine:
         def begin(self):
@@ -310,6 +316,7 @@ def test_fail_marks_terminal_failure_when_attempts_exhausted(monkeypatch):
     assert calls[0]["attempt_count"] == 3
     assert calls[0]["next_retry_at"] is None
     assert calls[0]["finished_at"] == fixed_now
+    assert len(calls) == 2
 
 
 def test_get_queue_metrics_returns_operational_counts(monkeypatch):
@@ -362,3 +369,593 @@ def test_has_active_job_returns_true_for_running_or_queued():
     store.engine = DummyEngine()
 
     assert store.has_active_job() is True
+
+
+def test_enqueue_notifies_listeners_on_postgres_and_acquire_can_skip_recovery(monkeypatch):
+    store = _new_store()
+    fixed_now = datetime(2026, 1, 1, 0, 0, 0)
+    monkeypatch.setattr(job_status_queue, "now_local", lambda: fixed_now)
+    recoveries = []
+    monkeypatch.setattr(store, "recover_stale_runs", lambda: recoveries.append(1) or 0)
+    statements = []
+
+    class DummyResult:
+        def mappings(self):
+            return self
+
+        def first(self):
+            return None
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            statements.append((" ".join(str(stmt).split()), params))
+            return DummyResult()
+
+    class DummyEngine:
+        dialect = type("Dialect", (), {"name": "postgresql"})()
+
+        def begin(self):
+            return _DummyContext(DummyConn())
+
+    store.engine = DummyEngine()
+
+    store.enqueue(job_type="refresh", params=None, message="queued")
+    run = store.acquire_next(worker_id="worker-1", lease_seconds=60, recover_stale=False)
+
+    assert statements[1] == (
+        "SELECT pg_notify(:channel, :payload)",
+        {"channel": job_status_queue.JOB_NOTIFY_CHANNEL, "payload": "refresh"},
+    )
+    assert run is None
+    assert recoveries == []
+
+
+def test_acquire_skips_held_concurrency_keys_and_release_wakes_blocked_runs(monkeypatch):
+    store = _new_store()
+    fixed_now = datetime(2026, 1, 1, 0, 0, 0)
+    monkeypatch.setattr(job_status_queue, "now_local", lambda: fixed_now)
+    monkeypatch.setattr(store, "_cache_versions_enabled", lambda: False)
+    statements = []
+
+    class DummyResult:
+        def mappings(self):
+            return self
+
+        def first(self):
+            return None
+
+        def all(self):
+            return []
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            statements.append((" ".join(str(stmt).split()), params))
+            return DummyResult()
+
+    class DummyEngine:
+        dialect = type("Dialect", (), {"name": "postgresql"})()
+
+        def begin(self):
+            return _DummyContext(DummyConn())
+
+    store.engine = DummyEngine()
+
+    assert store.acquire_next(worker_id="worker-1", lease_seconds=60, recover_stale=False) is None
+    acquire_sql = statements[0][0]
+    assert "concurrency_key IS NULL OR NOT EXISTS" in acquire_sql
+    assert "holder.concurrency_key = job_runs.concurrency_key" in acquire_sql
+    assert acquire_sql.index("NOT EXISTS") < acquire_sql.index("FOR UPDATE SKIP LOCKED")
+
+    statements.clear()
+    store.requeue_blocked("run-2", "waiting", delay_seconds=0)
+    assert statements[0][1]["retry_at"] is None
+
+    statements.clear()
+    store.complete("run-1", "done", {"success": True})
+    assert statements[-1] == (
+        "SELECT pg_notify(:channel, :payload)",
+        {"channel": job_status_queue.JOB_NOTIFY_CHANNEL, "payload": job_status_queue.JOB_RELEASED_NOTIFY_PAYLOAD},
+    )
+
+
+def test_lock_held_past_lapsed_lease_requeues_with_back_off(monkeypatch):
+    store = _new_store()
+    fixed_now = datetime(2026, 1, 1, 0, 0, 0)
+    monkeypatch.setattr(job_status_queue, "now_local", lambda: fixed_now)
+    updates = []
+    dispatched = []
+
+    class DummyResult:
+        def scalar_one(self):
+            # The previous holder's lease lapsed, so acquisition handed this run out,
+            # but the holder's session still holds the advisory lock.
+            return False
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            updates.append((" ".join(str(stmt).split()), params))
+            return DummyResult()
+
+        def close(self):
+            return None
+
+    class DummyEngine:
+        dialect = type("Dialect", (), {"name": "postgresql"})()
+
+        def connect(self):
+            return DummyConn()
+
+        def begin(self):
+            return _DummyContext(DummyConn())
+
+    store.engine = DummyEngine()
+    monkeypatch.setattr(jobs, "_dispatch_job_with_optional_deps", lambda run, deps: dispatched.append(run.id))
+    run = jobs.JobRun(
+        id="run-2",
+        job_type=jobs.JOB_TYPE_RECOMPUTE_FINDINGS_DATE,
+        status="running",
+        params={"date": "2026-01-21"},
+        result=None,
+        error_message=None,
+        message="queued",
+        attempt_count=0,
+        max_attempts=4,
+        next_retry_at=None,
+        dedupe_key="recompute:2026-01-21",
+        priority=30,
+        queued_at=fixed_now,
+        started_at=fixed_now,
+        finished_at=None,
+        heartbeat_at=None,
+        locked_until=None,
+        worker_id="worker-2",
+        concurrency_key="date-write:2026-01-21",
+    )
+
+    jobs._execute_job_run(store=store, run=run, worker_id="worker-2", lease_seconds=60)
+
+    requeue_sql, requeue_params = updates[-1]
+    assert requeue_sql.startswith("UPDATE job_runs SET status = 'queued'")
+    assert requeue_params["retry_at"] == fixed_now + timedelta(seconds=job_status_queue.BLOCKED_RETRY_SECONDS)
+    assert dispatched == []
+
+
+def test_get_queue_metrics_reports_blocked_by_concurrency_jobs(monkeypatch):
+    store = _new_store()
+    fixed_now = datetime(2026, 1, 1, 1, 0, 0)
+    monkeypatch.setattr(job_status_queue, "now_local", lambda: fixed_now)
+    captured = {}
+
+    class DummyResult:
+        def mappings(self):
+            return self
+
+        def one(self):
+            return {
+                "queued_jobs_count": 3,
+                "retry_scheduled_jobs_count": 0,
+                "running_jobs_count": 1,
+                "failed_jobs_count": 0,
+                "oldest_queued_at": fixed_now - timedelta(minutes=5),
+                "blocked_jobs_count": 2,
+                "oldest_blocked_queued_at": fixed_now - timedelta(minutes=4),
+            }
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            captured["sql"] = str(stmt)
+            return DummyResult()
+
+    class DummyEngine:
+        def begin(self):
+            return _DummyContext(DummyConn())
+
+    store.engine = DummyEngine()
+    metrics = store.get_queue_metrics()
+
+    assert "AS blocked_jobs_count" in captured["sql"]
+    assert metrics["blocked_jobs_count"] == 2
+    assert metrics["oldest_blocked_age_seconds"] == 240
+
+
+def test_acquire_batch_leases_distinct_keys_and_complete_many_uses_one_transaction(monkeypatch):
+    store = _new_store()
+    fixed_now = datetime(2026, 1, 1, 0, 0, 0)
+    monkeypatch.setattr(job_status_queue, "now_local", lambda: fixed_now)
+    monkeypatch.setattr(store, "_cache_versions_enabled", lambda: False)
+    statements = []
+    transactions = []
+
+    class DummyResult:
+        def mappings(self):
+            return self
+
+        def all(self):
+            return []
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            statements.append((" ".join(str(stmt).split()), params))
+            return DummyResult()
+
+    class DummyEngine:
+        def begin(self):
+            transactions.append(1)
+            return _DummyContext(DummyConn())
+
+    store.engine = DummyEngine()
+
+    runs = store.acquire_batch(
+        worker_id="worker-1",
+        lease_seconds=60,
+        job_type="recompute_findings_date",
+        limit=5,
+        recover_stale=False,
+    )
+
+    assert runs == []
+    sql, params = statements[0]
+    assert "DISTINCT ON (COALESCE(concurrency_key, id))" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert params["job_type"] == "recompute_findings_date"
+    assert params["limit"] == 5
+    assert params["scan_limit"] == 20
+
+    statements.clear()
+    transactions.clear()
+    store.complete_many([("run-1", "done", {"success": True}), ("run-2", "done", None)])
+
+    assert transactions == [1]
+    assert [item["run_id"] for item in statements[0][1]] == ["run-1", "run-2"]
+    assert statements[0][1][1]["result_json"] is None
+
+
+def test_rerun_requests_on_running_job_collapse_into_one_follow_up(tmp_path):
+    store = job_status_pg.JobStatusStorePG(f"sqlite:///{tmp_path / 'jobs.db'}")
+    store.ensure_schema()
+    run = store.enqueue(
+        job_type="recompute_findings_date",
+        params={"date": "2026-01-21", "generation_id": "gen-1"},
+        message="queued",
+        dedupe_key="recompute_findings_date:2026-01-21",
+        concurrency_key="date-write:2026-01-21",
+    )
+    with store.engine.begin() as conn:
+        conn.execute(
+            job_status_queue.sa.text("UPDATE job_runs SET status = 'running' WHERE id = :run_id"),
+            {"run_id": run.id},
+        )
+    not_before = datetime(2030, 1, 1, 0, 0, 30)
+
+    assert store.request_rerun(run.id, params={"date": "2026-01-21", "generation_id": "gen-2"}, not_before=not_before)
+    assert store.request_rerun(run.id, params={"date": "2026-01-21", "generation_id": "gen-3"}, not_before=not_before)
+    store.complete(run.id, "done", {"success": True})
+
+    follow_up = store.find_active_duplicate("recompute_findings_date:2026-01-21")
+    assert follow_up is not None
+    assert follow_up.id != run.id
+    assert follow_up.status == "queued"
+    assert follow_up.params == {"date": "2026-01-21", "generation_id": "gen-3"}
+    # Raw sqlite reads hand back the stored text; Postgres returns the datetime itself.
+    assert str(follow_up.next_retry_at) == "2030-01-01 00:00:30"
+    assert follow_up.concurrency_key == "date-write:2026-01-21"
+    assert store.request_rerun(run.id, params=None, not_before=not_before) is False
+    with store.engine.begin() as conn:
+        total = conn.execute(job_status_queue.sa.text("SELECT COUNT(*) FROM job_runs")).scalar_one()
+        keys = conn.execute(
+            job_status_queue.sa.text("SELECT id, priority, queued_at, effective_at FROM job_runs")
+        ).mappings().all()
+    assert total == 2
+    policy = store._scheduling_policy()
+    for row in keys:
+        queued_at = datetime.fromisoformat(str(row["queued_at"]))
+        assert datetime.fromisoformat(str(row["effective_at"])) == policy.effective_at(row["priority"], queued_at)
+
+
+def test_get_queue_metrics_reads_status_totals_from_counters(monkeypatch):
+    store = _new_store()
+    fixed_now = datetime(2026, 1, 1, 1, 0, 0)
+    monkeypatch.setattr(job_status_queue, "now_local", lambda: fixed_now)
+    monkeypatch.setattr(store, "_queue_counters_enabled", lambda: True)
+    statements = []
+    counter_rows = {"queued": 1}
+
+    class DummyResult:
+        def mappings(self):
+            return self
+
+        def all(self):
+            return [
+                {"status": "queued", "job_count": 4, "delta_rows": counter_rows["queued"]},
+                {"status": "failed", "job_count": 120, "delta_rows": 1},
+            ]
+
+        def one(self):
+            return {
+                "queued_jobs_count": 4,
+                "retry_scheduled_jobs_count": 1,
+                "running_jobs_count": 2,
+                "failed_jobs_count": 0,
+                "oldest_queued_at": fixed_now - timedelta(minutes=1),
+            }
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            statements.append(" ".join(str(stmt).split()))
+            return DummyResult()
+
+    class DummyEngine:
+        def begin(self):
+            return _DummyContext(DummyConn())
+
+    store.engine = DummyEngine()
+    metrics = store.get_queue_metrics()
+
+    assert "FROM job_queue_counters" in statements[0]
+    assert statements[1].endswith("FROM job_runs WHERE status IN ('queued', 'running')")
+    assert metrics["queued_jobs_count"] == 4
+    assert metrics["failed_jobs_count"] == 120
+    assert metrics["running_jobs_count"] == 2
+    assert len(statements) == 2
+
+    # Without the archive daemon the deltas pile up; the metrics read folds them itself.
+    statements.clear()
+    counter_rows["queued"] = job_status_queue.QUEUE_COUNTER_COMPACT_ROWS
+    store.get_queue_metrics()
+    assert "DELETE FROM job_queue_counters" in statements[-1]
+
+
+def test_archive_finished_runs_moves_batches_and_compacts_counters(monkeypatch):
+    store = _new_store()
+    monkeypatch.setattr(store, "_history_enabled", lambda: True)
+    monkeypatch.setattr(store, "_queue_counters_enabled", lambda: True)
+    rowcounts = [2, 1]
+    statements = []
+
+    class DummyResult:
+        def __init__(self, rowcount):
+            self.rowcount = rowcount
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            sql = " ".join(str(stmt).split())
+            statements.append((sql, params))
+            return DummyResult(rowcounts.pop(0) if sql.startswith("WITH archived") else 0)
+
+    class DummyEngine:
+        def begin(self):
+            return _DummyContext(DummyConn())
+
+    store.engine = DummyEngine()
+    cutoff = datetime(2026, 1, 1, 0, 0, 0)
+
+    moved = store.archive_finished_runs(cutoff, batch_size=2)
+
+    assert moved == 3
+    archive_sql = [sql for sql, _params in statements if sql.startswith("WITH archived")]
+    assert len(archive_sql) == 2
+    assert "DELETE FROM job_runs" in archive_sql[0]
+    assert "INSERT INTO job_runs_history" in archive_sql[0]
+    assert "FOR UPDATE SKIP LOCKED" in archive_sql[0]
+    assert statements[0][1]["cutoff"] == cutoff
+    assert "DELETE FROM job_queue_counters" in statements[-1][0]
+
+
+def test_reads_fall_back_to_archived_history(tmp_path):
+    store = job_status_pg.JobStatusStorePG(f"sqlite:///{tmp_path / 'jobs.db'}")
+    store.ensure_schema()
+    job_status_pg.Base.metadata.create_all(
+        store.engine,
+        tables=[job_status_pg.Base.metadata.tables["job_runs_history"]],
+    )
+    with store.engine.begin() as conn:
+        conn.execute(
+            job_status_queue.sa.text(
+                """
+                INSERT INTO job_runs_history (
+                    id, job_type, status, attempt_count, max_attempts, priority,
+                    queued_at, finished_at, archived_at
+                ) VALUES (
+                    'run-old', 'ingest_clicks', 'succeeded', 0, 3, 20,
+                    '2026-01-01 00:00:00', '2026-01-01 00:05:00', '2026-01-03 00:00:00'
+                )
+                """
+            )
+        )
+
+    assert store.get_by_id("run-old").status == "succeeded"
+    assert store.get_latest_run().id == "run-old"
+    assert str(store.get_latest_successful_finished_at(["ingest_clicks"])) == "2026-01-01 00:05:00"
+    assert store.purge_finished_runs_before(datetime(2026, 1, 2), execute=False) == 1
+    compactions = []
+    store.compact_counters = lambda: compactions.append(True)
+    assert store.purge_finished_runs_before(datetime(2026, 1, 2), execute=True) == 1
+    assert compactions == [True]
+
+
+def test_failure_reads_include_archived_history(tmp_path):
+    store = job_status_pg.JobStatusStorePG(f"sqlite:///{tmp_path / 'jobs.db'}")
+    store.ensure_schema()
+    job_status_pg.Base.metadata.create_all(
+        store.engine,
+        tables=[job_status_pg.Base.metadata.tables["job_runs_history"]],
+    )
+    with store.engine.begin() as conn:
+        for table_name, run_id, finished_at in (
+            ("job_runs", "run-new", "2026-01-05 00:00:00"),
+            ("job_runs_history", "run-old", "2026-01-01 00:00:00"),
+            ("job_runs_history", "run-older", "2025-12-31 00:00:00"),
+        ):
+            archived = ", archived_at" if table_name == "job_runs_history" else ""
+            conn.execute(
+                job_status_queue.sa.text(
+                    f"""
+                    INSERT INTO {table_name} (
+                        id, job_type, status, error_message, attempt_count, max_attempts, priority,
+                        queued_at, finished_at{archived}
+                    ) VALUES (
+                        :run_id, 'refresh', 'failed', 'boom', 3, 3, 10,
+                        :finished_at, :finished_at{", :finished_at" if archived else ""}
+                    )
+                    """
+                ),
+                {"run_id": run_id, "finished_at": finished_at},
+            )
+
+    assert [run["job_id"] for run in store.list_recent_failed_runs(limit=2)] == ["run-new", "run-old"]
+    assert store.get_queue_metrics()["failed_jobs_count"] == 3
+
+
+def test_heartbeat_many_renews_owned_leases_with_one_statement(monkeypatch):
+    store = _new_store()
+    fixed_now = datetime(2026, 1, 1, 0, 0, 0)
+    monkeypatch.setattr(job_status_queue, "now_local", lambda: fixed_now)
+    statements = []
+
+    class DummyResult:
+        def all(self):
+            return [("run-1", True)]
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            statements.append((" ".join(str(stmt).split()), params))
+            return DummyResult()
+
+    class DummyEngine:
+        def begin(self):
+            return _DummyContext(DummyConn())
+
+    store.engine = DummyEngine()
+
+    renewed = store.heartbeat_many(
+        run_ids=["run-1", "run-2"],
+        worker_id="worker-1",
+        lease_seconds=90,
+        progress={"run-1": {"pages_fetched": 3}},
+    )
+
+    assert renewed == {"run-1": True}
+    assert len(statements) == 1
+    assert "unnest(CAST(:run_ids AS text[]), CAST(:progress AS text[]))" in statements[0][0]
+    assert "cancel_requested_at IS NOT NULL AS cancel_requested" in statements[0][0]
+    assert statements[0][1]["run_ids"] == ["run-1", "run-2"]
+    assert statements[0][1]["progress"] == ['{"pages_fetched": 3}', None]
+    assert statements[0][1]["locked_until"] == fixed_now + timedelta(seconds=90)
+
+
+def test_request_cancel_cancels_queued_runs_and_flags_running_ones(tmp_path):
+    store = job_status_pg.JobStatusStorePG(f"sqlite:///{tmp_path / 'jobs.db'}")
+    store.ensure_schema()
+    queued = store.enqueue(job_type="refresh", params=None, message="queued")
+    running = store.enqueue(job_type="ingest_clicks", params=None, message="queued")
+    stale = store.enqueue(job_type="ingest_conversions", params=None, message="queued")
+    with store.engine.begin() as conn:
+        conn.execute(
+            job_status_queue.sa.text(
+                "UPDATE job_runs SET status = 'running', locked_until = :locked_until WHERE id IN (:running, :stale)"
+            ),
+            {"running": running.id, "stale": stale.id, "locked_until": datetime(2999, 1, 1)},
+        )
+
+    assert store.request_cancel(queued.id, "cancel requested") == "cancelled"
+    assert store.request_cancel(running.id, "cancel requested") == "running"
+    assert store.request_cancel(queued.id, "cancel requested") is None
+    assert store.get_by_id(queued.id).finished_at is not None
+    assert store.get_by_id(running.id).cancel_requested_at is not None
+
+    # A flagged run whose worker died is cancelled by recovery rather than requeued.
+    store.request_cancel(stale.id, "cancel requested")
+    with store.engine.begin() as conn:
+        conn.execute(
+            job_status_queue.sa.text("UPDATE job_runs SET locked_until = :expired WHERE id = :run_id"),
+            {"run_id": stale.id, "expired": datetime(2000, 1, 1)},
+        )
+    assert store.recover_stale_runs() == 1
+    assert store.get_by_id(stale.id).status == "cancelled"
+    assert store.get_by_id(running.id).status == "running"
+
+
+def test_recover_stale_runs_requeues_with_pending_rerun_params(tmp_path):
+    store = job_status_pg.JobStatusStorePG(f"sqlite:///{tmp_path / 'jobs.db'}")
+    store.ensure_schema()
+    run = store.enqueue(job_type="refresh", params={"hours": 1}, message="queued")
+    with store.engine.begin() as conn:
+        conn.execute(
+            job_status_queue.sa.text(
+                "UPDATE job_runs SET status = 'running', locked_until = :locked_until WHERE id = :run_id"
+            ),
+            {"run_id": run.id, "locked_until": datetime(2999, 1, 1)},
+        )
+    assert store.request_rerun(run.id, params={"hours": 3}, not_before=datetime(2026, 1, 1))
+    with store.engine.begin() as conn:
+        conn.execute(
+            job_status_queue.sa.text("UPDATE job_runs SET locked_until = :expired WHERE id = :run_id"),
+            {"run_id": run.id, "expired": datetime(2000, 1, 1)},
+        )
+
+    assert store.recover_stale_runs() == 1
+
+    recovered = store.get_by_id(run.id)
+    assert recovered.status == "queued"
+    assert recovered.params == {"hours": 3}
+    with store.engine.begin() as conn:
+        pending = conn.execute(
+            job_status_queue.sa.text("SELECT rerun_not_before, rerun_params_json FROM job_runs WHERE id = :run_id"),
+            {"run_id": run.id},
+        ).one()
+    assert tuple(pending) == (None, None)
+
+
+def test_acquire_applies_priority_aging_and_serializes_capped_types(monkeypatch):
+    store = _new_store()
+    fixed_now = datetime(2026, 1, 1, 0, 0, 0)
+    monkeypatch.setattr(job_status_queue, "now_local", lambda: fixed_now)
+    store._policy = job_status_queue.SchedulingPolicy(aging_seconds=15, type_caps={"recompute_findings_date": 2})
+    statements = []
+
+    class DummyResult:
+        def mappings(self):
+            return self
+
+        def first(self):
+            return None
+
+        def scalar_one(self):
+            return 2
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            statements.append((" ".join(str(stmt).split()), params))
+            return DummyResult()
+
+    class DummyEngine:
+        dialect = type("Dialect", (), {"name": "postgresql"})()
+
+        def begin(self):
+            return _DummyContext(DummyConn())
+
+    store.engine = DummyEngine()
+
+    assert store.acquire_next(worker_id="worker-1", lease_seconds=60, recover_stale=False) is None
+    assert statements[0][0] == "SELECT pg_advisory_xact_lock(hashtext(:lock_key))"
+    acquire_sql, acquire_params = statements[1]
+    assert "ORDER BY effective_at ASC, queued_at ASC" in acquire_sql
+    assert "HAVING COUNT(*) >= caps.cap_limit" in acquire_sql
+    assert "priority_step" not in acquire_params
+    assert acquire_params["cap_types"] == ["recompute_findings_date"]
+    assert acquire_params["cap_limits"] == [2]
+
+    # Both recompute slots are taken, so the batch lease stops before selecting anything.
+    statements.clear()
+    assert (
+        store.acquire_batch(
+            worker_id="worker-1",
+            lease_seconds=60,
+            job_type="recompute_findings_date",
+            limit=8,
+            recover_stale=False,
+        )
+        == []
+    )
+    assert len(statements) == 2
+    assert "SELECT COUNT(*) FROM job_runs WHERE status = 'running'" in statements[1][0]
@@ -254,6 +254,51 @@ def test_enqueue_job_returns_existing_run_when_dedupe_matches(monkeypatch):
     assert run.id == "run-existing"
 
 
+def test_enqueue_recompute_requests_rerun_on_running_duplicate(monkeypatch):
+    fixed_now = datetime(2026, 1, 1, 0, 0, 0)
+    rerun_calls = []
+
+    class DummyStore:
+        def __init__(self):
+            self.running = True
+
+        def find_active_duplicate(self, dedupe_key):
+            return type("RunningJob", (), {"id": "run-running", "status": "running"})()
+
+        def request_rerun(self, run_id, *, params, not_before):
+            rerun_calls.append((run_id, params["generation_id"], not_before))
+            return self.running
+
+        def enqueue(self, *, job_type, params, message, max_attempts, dedupe_key, priority, concurrency_key=None):
+            return type(
+                "QueuedJob",
+                (),
+                {
+                    "id": "run-fresh",
+                    "job_type": job_type,
+                    "max_attempts": max_attempts,
+                    "priority": priority,
+                    "concurrency_key": concurrency_key,
+                },
+            )()
+
+    store = DummyStore()
+    monkeypatch.setattr(jobs, "get_job_store", lambda: store)
+    monkeypatch.setattr(jobs, "now_local", lambda: fixed_now)
+    monkeypatch.setenv("FC_JOB_RERUN_DEBOUNCE_SECONDS", "45")
+
+    coalesced = jobs.enqueue_recompute_findings_job(date(2026, 1, 21), generation_id="gen-2", trigger="refresh")
+    store.running = False
+    fresh = jobs.enqueue_recompute_findings_job(date(2026, 1, 21), generation_id="gen-3", trigger="refresh")
+
+    assert coalesced.id == "run-running"
+    assert fresh.id == "run-fresh"
+    assert rerun_calls == [
+        ("run-running", "gen-2", fixed_now + timedelta(seconds=45)),
+        ("run-running", "gen-3", fixed_now + timedelta(seconds=45)),
+    ]
+
+
 def test_enqueue_job_returns_existing_run_when_unique_index_race_occurs(monkeypatch):
     class DummyStore:
         def __init__(self):
@@ -373,6 +418,31 @@ def test_enqueue_master_sync_job_builds_expected_message(monkeypatch):
     assert captured["start_message"] == "\u30de\u30b9\u30bf\u540c\u671f\u30b8\u30e7\u30d6\u3092\u767b\u9332\u3057\u307e\u3057\u305f"
 
 
+def test_enqueue_alert_export_job_normalizes_filters_and_uses_export_lane(monkeypatch):
+    captured = {}
+
+    def fake_enqueue_job(**kwargs):
+        captured.update(kwargs)
+        return type("QueuedJob", (), {"id": "run-export"})()
+
+    monkeypatch.setattr(jobs, "enqueue_job", fake_enqueue_job)
+
+    run = jobs.enqueue_alert_export_job({"start_date": "2026-04-01", "status": None, "ignored": "x"})
+
+    assert run.id == "run-export"
+    assert captured["job_type"] == jobs.JOB_TYPE_EXPORT_ALERTS
+    assert captured["params"] == {
+        "status": "unhandled",
+        "risk_level": None,
+        "start_date": "2026-04-01",
+        "end_date": None,
+        "search": None,
+        "sort": "risk_desc",
+    }
+    assert jobs._job_concurrency_key(jobs.JOB_TYPE_EXPORT_ALERTS, captured["params"]) == "alert-export"
+    assert jobs._default_priority(jobs.JOB_TYPE_EXPORT_ALERTS) > jobs._default_priority(jobs.JOB_TYPE_MASTER_SYNC)
+
+
 def test_process_queued_jobs_acquires_and_executes(monkeypatch):
     executed = []
 
@@ -557,8 +627,8 @@ def test_execute_job_run_requeues_when_concurrency_lock_is_busy(monkeypatch):
 
             return _Ctx()
 
-        def requeue_blocked(self, run_id, message, *, delay_seconds=15):
-            calls.append((run_id, message, delay_seconds))
+        def requeue_blocked(self, run_id, message, **kwargs):
+            calls.append((run_id, message, kwargs))
 
     run = jobs.JobRun(
         id="run-1",
@@ -589,7 +659,82 @@ def test_execute_job_run_requeues_when_concurrency_lock_is_busy(monkeypatch):
         lease_seconds=60,
     )
 
-    assert calls == [("run-1", "recompute_findings_date is waiting for date-write:2026-01-21", 15)]
+    # No explicit delay: the store's default back-off applies.
+    assert calls == [("run-1", "recompute_findings_date is waiting for date-write:2026-01-21", {})]
+
+
+def test_execute_job_batch_completes_successes_together_and_fails_per_job(monkeypatch):
+    events = []
+
+    class DummyStore:
+        def advisory_locks(self, concurrency_keys):
+            events.append(("locks", list(concurrency_keys)))
+
+            class _Ctx:
+                def __enter__(self_inner):
+                    return {"date-write:2026-01-21", "date-write:2026-01-22"}
+
+                def __exit__(self_inner, exc_type, exc, tb):
+                    return False
+
+            return _Ctx()
+
+        def heartbeat(self, *, run_id, worker_id, lease_seconds):
+            return True
+
+        def requeue_blocked(self, run_id, message, *, delay_seconds=0):
+            events.append(("requeue", run_id))
+
+        def fail(self, run_id, message, result=None, *, error_message=None, retryable=True):
+            events.append(("fail", run_id, retryable))
+            return "queued"
+
+        def complete_many(self, completions):
+            events.append(("complete_many", [run_id for run_id, _message, _result in completions]))
+
+    def _recompute_run(run_id, target_date):
+        return jobs.JobRun(
+            id=run_id,
+            job_type=jobs.JOB_TYPE_RECOMPUTE_FINDINGS_DATE,
+            status="running",
+            params={"date": target_date, "generation_id": "gen-1"},
+            result=None,
+            error_message=None,
+            message="queued",
+            attempt_count=0,
+            max_attempts=4,
+            next_retry_at=None,
+            dedupe_key=f"recompute:{target_date}",
+            priority=30,
+            queued_at=datetime(2026, 1, 1, 0, 0, 0),
+            started_at=datetime(2026, 1, 1, 0, 0, 1),
+            finished_at=None,
+            heartbeat_at=None,
+            locked_until=None,
+            worker_id="worker-1",
+            concurrency_key=f"date-write:{target_date}",
+        )
+
+    def fake_dispatch(run, deps):
+        if run.id == "run-2":
+            raise RuntimeError("boom")
+        return {"success": True}, f"{run.id} done"
+
+    monkeypatch.setattr(jobs, "_dispatch_job_with_optional_deps", fake_dispatch)
+    runs = [
+        _recompute_run("run-1", "2026-01-20"),
+        _recompute_run("run-2", "2026-01-21"),
+        _recompute_run("run-3", "2026-01-22"),
+    ]
+
+    jobs._execute_job_batch(store=DummyStore(), runs=runs, worker_id="worker-1", lease_seconds=60)
+
+    assert events == [
+        ("locks", ["date-write:2026-01-20", "date-write:2026-01-21", "date-write:2026-01-22"]),
+        ("requeue", "run-1"),
+        ("fail", "run-2", True),
+        ("complete_many", ["run-3"]),
+    ]
 
 
 def test_should_use_in_process_background_kick_defaults_off_in_production(monkeypatch):
@@ -755,3 +900,68 @@ def test_run_master_sync_enqueues_findings_recompute_for_available_dates(monkeyp
     assert captured["kwargs"]["trigger"] == "master_sync"
     assert captured["kwargs"]["source_job_id"] == "job-master-1"
     assert result["findings_recompute"]["job_ids"] == ["recompute-1", "recompute-2"]
+
+
+def test_run_alert_export_writes_gzip_artifact_and_reuses_it_when_unchanged(tmp_path, monkeypatch):
+    import gzip
+
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+    from fraud_checker.repository_pg import PostgresRepository
+    from fraud_checker.services import exports
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'export-job.db'}")
+    suspicious_findings = Base.metadata.tables["suspicious_conversion_findings"]
+    Base.metadata.create_all(repo.engine, tables=[suspicious_findings])
+    row = {
+        "finding_key": "finding-001",
+        "case_key": "case-001",
+        "date": date(2026, 4, 5),
+        "ipaddress": "203.0.113.1",
+        "useragent": "Mozilla/5.0",
+        "ua_hash": "ua-hash-1",
+        "risk_level": "high",
+        "risk_score": 90,
+        "reasons_json": "[]",
+        "reasons_formatted_json": "[]",
+        "metrics_json": "{}",
+        "total_conversions": 1,
+        "media_count": 1,
+        "program_count": 1,
+        "first_time": datetime(2026, 4, 5, 9, 0, 0),
+        "last_time": datetime(2026, 4, 5, 10, 0, 0),
+        "rule_version": "test",
+        "computed_at": datetime(2026, 4, 5, 10, 0, 0),
+        "estimated_damage_yen": 3000,
+        "is_current": True,
+        "search_text": "alpha",
+    }
+    with repo.engine.begin() as conn:
+        conn.execute(suspicious_findings.insert(), row)
+    monkeypatch.setenv("FC_EXPORT_ARTIFACT_DIR", str(tmp_path / "exports"))
+    monkeypatch.setattr(jobs, "get_repository", lambda: repo)
+
+    first, message = jobs.run_alert_export({"status": "all"}, job_run_id="job-export-1")
+
+    assert message == "Alert export completed"
+    assert first["reused"] is False
+    artifact = exports.resolve_export_artifact(first)
+    assert artifact is not None and artifact.parent == tmp_path / "exports"
+    assert "case-001" in gzip.decompress(artifact.read_bytes()).decode("utf-8")
+
+    second, _ = jobs.run_alert_export({"status": "all"}, job_run_id="job-export-2")
+
+    assert second["reused"] is True
+    assert second["artifact"] == first["artifact"]
+
+    with repo.engine.begin() as conn:
+        conn.execute(
+            suspicious_findings.insert(),
+            {**row, "finding_key": "finding-002", "case_key": "case-002", "computed_at": datetime(2026, 4, 5, 11)},
+        )
+    third, _ = jobs.run_alert_export({"status": "all"}, job_run_id="job-export-3")
+
+    assert third["reused"] is False
+    assert third["artifact"] != first["artifact"]
+    assert exports.resolve_export_artifact({"artifact": "../" + first["artifact"]}) is None
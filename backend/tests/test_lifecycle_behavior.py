@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from datetime import date, datetime, timedelta
 
 from fraud_checker.services import lifecycle
@@ -77,7 +78,8 @@ def test_resolve_retention_policy_uses_defaults_when_not_overridden() -> None:
     assert policy.job_run_days == lifecycle.DEFAULT_JOB_RUN_RETENTION_DAYS
 
 
-def test_purge_old_data_dry_run_reports_counts_without_deleting() -> None:
+def test_purge_old_data_dry_run_reports_counts_without_deleting(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("FC_EXPORT_ARTIFACT_DIR", str(tmp_path))
     repo = _FakeRepo()
     job_store = _FakeJobStore()
     reference_time = datetime(2026, 3, 24, 0, 0, 0)
@@ -103,7 +105,8 @@ def test_purge_old_data_dry_run_reports_counts_without_deleting() -> None:
     assert len(job_store.finished_runs) == 2
 
 
-def test_purge_old_data_execute_deletes_only_older_rows() -> None:
+def test_purge_old_data_execute_deletes_only_older_rows(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("FC_EXPORT_ARTIFACT_DIR", str(tmp_path))
     repo = _FakeRepo()
     job_store = _FakeJobStore()
     reference_time = datetime(2026, 3, 24, 0, 0, 0)
@@ -127,6 +130,31 @@ def test_purge_old_data_execute_deletes_only_older_rows() -> None:
     assert job_store.finished_runs == [datetime(2026, 3, 20, 0, 0, 0)]
 
 
+def test_purge_old_data_removes_stale_export_artifacts(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("FC_EXPORT_ARTIFACT_DIR", str(tmp_path))
+    reference_time = datetime(2026, 3, 24, 0, 0, 0)
+    stale = tmp_path / "fraud-alerts-stale.csv.gz"
+    partial = tmp_path / ".export-abandoned.tmp"
+    fresh = tmp_path / "fraud-alerts-fresh.csv.gz"
+    unrelated = tmp_path / "notes.txt"
+    for path in (stale, partial, fresh, unrelated):
+        path.write_bytes(b"x")
+    old_ts = (reference_time - timedelta(days=10)).timestamp()
+    for path in (stale, partial, unrelated):
+        os.utime(path, (old_ts, old_ts))
+    os.utime(fresh, (reference_time.timestamp(), reference_time.timestamp()))
+    policy = lifecycle.RetentionPolicy(
+        raw_days=None, aggregate_days=None, findings_days=None, job_run_days=None, export_artifact_days=7
+    )
+
+    dry_run = lifecycle.purge_old_data(_FakeRepo(), _FakeJobStore(), policy=policy, reference_time=reference_time)
+    assert dry_run["counts"]["export_artifacts"] == {"files": 2}
+    assert stale.exists()
+
+    lifecycle.purge_old_data(_FakeRepo(), _FakeJobStore(), policy=policy, execute=True, reference_time=reference_time)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["fraud-alerts-fresh.csv.gz", "notes.txt"]
+
+
 def test_describe_evidence_availability_marks_old_findings_as_expired() -> None:
     result = lifecycle.describe_evidence_availability(
         date(2025, 12, 1),
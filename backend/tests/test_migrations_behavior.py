@@ -128,7 +128,7 @@ def test_infer_legacy_schema_revision_for_queue_concurrency_ready_schema() -> No
 def test_head_revision_advances_beyond_findings_search_indexes() -> None:
     from fraud_checker.migrations import ALEMBIC_HEAD_REVISION
 
-    assert ALEMBIC_HEAD_REVISION == "0014_case_key_review_hist"
+    assert ALEMBIC_HEAD_REVISION == "0034_consolidate_scof_sort_idx"
 
 
 def test_head_revision_fits_alembic_version_column_limit() -> None:
@@ -243,3 +243,266 @@ def test_case_key_review_history_migration_adds_tables_and_backfill() -> None:
     assert "fraud_alert_review_states" in migration
     assert "fraud_alert_review_events" in migration
     assert "Migrated from legacy fraud_alert_reviews" in migration
+
+
+def test_findings_current_pointer_migration_creates_pointer_and_backfills() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0018_add_findings_current_generations.py"
+    ).read_text(encoding="utf-8")
+
+    assert '"findings_current_generations"' in migration
+    assert 'sa.PrimaryKeyConstraint("finding_type", "target_date")' in migration
+    assert "idx_scof_date_generation" in migration
+    assert "INSERT INTO findings_current_generations" in migration
+
+
+def test_findings_enrichment_migration_creates_unit_price_and_summary_tables() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0019_add_findings_enrichment_tables.py"
+    ).read_text(encoding="utf-8")
+
+    assert '"program_unit_prices_daily"' in migration
+    assert 'sa.PrimaryKeyConstraint("date", "program_id")' in migration
+    assert '"conversion_finding_summaries"' in migration
+    assert "idx_conversion_finding_summaries_date" in migration
+
+
+def test_conversion_reward_migration_adds_nullable_column_without_inline_backfill() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0020_add_conversion_reward_yen.py"
+    ).read_text(encoding="utf-8")
+
+    assert 'sa.Column("reward_yen", sa.Integer(), nullable=True)' in migration
+    assert "UPDATE conversion_raw" not in migration
+
+
+def test_dashboard_snapshot_migration_creates_keyed_payload_table() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0021_add_console_dashboard_snapshots.py"
+    ).read_text(encoding="utf-8")
+
+    assert '"console_dashboard_snapshots"' in migration
+    assert 'sa.PrimaryKeyConstraint("snapshot_key")' in migration
+    assert 'sa.Column("computed_at", sa.DateTime(), nullable=False)' in migration
+
+
+def test_console_sort_index_migration_adds_partial_indexes_and_requires_case_key() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0022_add_console_sort_indexes.py"
+    ).read_text(encoding="utf-8")
+
+    for sort in ("risk_desc", "risk_asc", "damage_desc", "damage_asc", "detected_desc", "detected_asc"):
+        assert f"idx_scof_current_{sort}" in migration
+    assert 'CURRENT_FINDINGS_WHERE = "is_current = TRUE"' in migration
+    assert "SET case_key = finding_key WHERE case_key IS NULL" in migration
+    assert 'alter_column("case_key", existing_type=sa.Text(), nullable=False)' in migration
+
+
+def test_findings_review_status_migration_backfills_from_case_states() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0023_add_findings_review_status.py"
+    ).read_text(encoding="utf-8")
+
+    assert 'sa.Column("review_status", sa.Text(), nullable=False, server_default="unhandled")' in migration
+    assert "WHERE s.case_key = suspicious_conversion_findings.case_key" in migration
+    for sort in ("risk_desc", "risk_asc", "damage_desc", "damage_asc", "detected_desc", "detected_asc"):
+        assert f"idx_scof_current_status_{sort}" in migration
+
+
+def test_cache_versions_migration_creates_scope_counter_table() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0024_add_cache_versions.py"
+    ).read_text(encoding="utf-8")
+
+    assert '"cache_versions"' in migration
+    assert 'sa.PrimaryKeyConstraint("scope")' in migration
+    assert 'sa.Column("version", sa.BigInteger(), nullable=False, server_default="0")' in migration
+
+
+def test_daily_data_catalog_migration_backfills_from_aggregates_and_generations() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0025_add_daily_data_catalog.py"
+    ).read_text(encoding="utf-8")
+
+    assert '"daily_data_catalog"' in migration
+    assert 'sa.PrimaryKeyConstraint("date")' in migration
+    assert "SELECT date FROM click_ipua_daily\n            UNION\n            SELECT date FROM conversion_ipua_daily" in migration
+    assert "SET findings_generation_id = g.generation_id" in migration
+
+
+def test_daily_totals_migration_backfills_exact_counts_without_sketches() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0026_add_daily_totals.py"
+    ).read_text(encoding="utf-8")
+
+    assert '"daily_totals"' in migration
+    assert 'sa.Column("click_ip_sketch", sa.Text(), nullable=True)' in migration
+    assert "COUNT(DISTINCT ipaddress) AS unique_ips" in migration
+    assert "COUNT(DISTINCT media_id) AS media_count" in migration
+
+
+def test_job_run_rerun_migration_adds_coalescing_columns() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0027_add_job_run_rerun.py"
+    ).read_text(encoding="utf-8")
+
+    assert 'down_revision = "0026_daily_totals"' in migration
+    assert 'sa.Column("rerun_not_before", sa.DateTime(), nullable=True)' in migration
+    assert 'sa.Column("rerun_params_json", sa.Text(), nullable=True)' in migration
+
+
+def test_job_runs_history_migration_adds_partial_indexes_and_counter_triggers() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0028_add_job_runs_history.py"
+    ).read_text(encoding="utf-8")
+
+    assert '"job_runs_history"' in migration
+    assert '("idx_job_runs_queued_pick", ["priority", "queued_at"], "status = \'queued\'")' in migration
+    assert "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows" in migration
+    assert "FOR EACH STATEMENT EXECUTE FUNCTION job_runs_count_statuses()" in migration
+    assert 'sa.Column("archived_at", sa.DateTime(), nullable=False)' in migration
+
+
+def test_job_run_progress_migration_covers_hot_and_history_tables() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0029_add_job_run_progress.py"
+    ).read_text(encoding="utf-8")
+
+    assert 'for table_name in ("job_runs", "job_runs_history"):' in migration
+    assert 'sa.Column("progress_json", sa.Text(), nullable=True)' in migration
+    assert 'sa.Column("cancel_requested_at", sa.DateTime(), nullable=True)' in migration
+
+
+def test_job_run_effective_at_migration_backfills_queued_runs_and_indexes_the_pick() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0030_add_job_run_effective_at.py"
+    ).read_text(encoding="utf-8")
+
+    assert 'down_revision = "0029_job_run_progress"' in migration
+    assert 'sa.Column("effective_at", sa.DateTime(), nullable=True)' in migration
+    assert "WHERE status = 'queued'" in migration
+    assert '["effective_at", "queued_at"]' in migration
+
+
+def test_job_runs_history_failed_index_migration_is_partial() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0031_add_job_runs_history_failed_index.py"
+    ).read_text(encoding="utf-8")
+
+    assert 'down_revision = "0030_job_run_effective_at"' in migration
+    assert '"idx_job_runs_history_failed"' in migration
+    assert "postgresql_where=sa.text(\"status = 'failed'\")" in migration
+
+
+def test_conversion_reward_resolved_migration_adds_flag_without_rewrite() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0032_add_conversion_reward_resolved.py"
+    ).read_text(encoding="utf-8")
+
+    assert 'down_revision = "0031_history_failed_index"' in migration
+    assert 'sa.Column("reward_resolved", sa.Boolean(), nullable=False, server_default=sa.false())' in migration
+    assert "UPDATE" not in migration
+
+
+def test_search_text_migration_normalizes_existing_rows_in_batches(monkeypatch) -> None:
+    import importlib.util
+
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    from fraud_checker.search_text import normalize_search_text
+
+    path = Path(__file__).resolve().parents[1] / "alembic" / "versions" / "0033_normalize_findings_search_text.py"
+    spec = importlib.util.spec_from_file_location("migration_0033", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    monkeypatch.setattr(migration, "BATCH_SIZE", 2)
+
+    legacy_rows = {
+        "f-1": "203.0.113.10 mozilla/5.0 ｐｒｏｍｏ　ａ",
+        "f-2": "203.0.113.11  chrome\tmedia",
+        "f-3": "already normalized",
+        "f-4": None,
+        "f-5": "ＡＢＣ",
+    }
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text("CREATE TABLE suspicious_conversion_findings (finding_key TEXT PRIMARY KEY, search_text TEXT)")
+        )
+        conn.execute(
+            sa.text("INSERT INTO suspicious_conversion_findings VALUES (:finding_key, :search_text)"),
+            [{"finding_key": key, "search_text": value} for key, value in legacy_rows.items()],
+        )
+        monkeypatch.setattr(migration, "op", Operations(MigrationContext.configure(conn)))
+        migration.upgrade()
+        stored = dict(
+            conn.execute(sa.text("SELECT finding_key, search_text FROM suspicious_conversion_findings")).all()
+        )
+
+    assert stored == {
+        key: normalize_search_text(value) if value is not None else None for key, value in legacy_rows.items()
+    }
+    assert stored["f-1"] == "203.0.113.10 mozilla/5.0 promo a"
+
+
+def test_sort_index_consolidation_migration_keeps_three_status_date_indexes() -> None:
+    migration = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0034_consolidate_findings_sort_indexes.py"
+    ).read_text(encoding="utf-8")
+
+    assert '"idx_scof_status_risk": ("review_status", "risk_score DESC", "finding_key", "date")' in migration
+    for family in ("damage", "detected"):
+        assert f'"idx_scof_status_{family}": (' in migration
+    for sort in ("risk_desc", "risk_asc", "damage_desc", "damage_asc", "detected_desc", "detected_asc"):
+        assert f'"idx_scof_current_{sort}"' in migration
+        assert f'"idx_scof_current_status_{sort}"' in migration
+    assert "_drop_indexes(LEGACY_SORT_INDEXES)" in migration
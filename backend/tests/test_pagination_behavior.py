@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+import sqlalchemy as sa
+
+from fraud_checker.pagination import decode_cursor, encode_cursor, keyset_params, keyset_predicate
+
+
+def test_cursor_round_trips_typed_sort_values() -> None:
+    cursor = encode_cursor("risk_desc", [97, datetime(2026, 4, 5, 10, 0, 0), "finding-001"])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, sort="risk_desc", kinds=["int", "datetime", "text"]) == [
+        97,
+        datetime(2026, 4, 5, 10, 0, 0),
+        "finding-001",
+    ]
+
+
+def test_cursor_rejects_tampered_or_mismatched_values() -> None:
+    cursor = encode_cursor("risk_desc", [97, "finding-001"])
+
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, sort="detected_desc", kinds=["int", "text"])
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, sort="risk_desc", kinds=["int", "datetime", "text"])
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor!", sort="risk_desc", kinds=["int", "text"])
+
+
+def test_keyset_predicate_expands_mixed_directions_behind_a_leading_bound() -> None:
+    predicate = keyset_predicate([("f.risk_score", "DESC"), ("f.finding_key", "ASC")])
+
+    assert predicate == (
+        "(f.risk_score <= :cursor_0 AND "
+        "((f.risk_score < :cursor_0) OR (f.risk_score = :cursor_0 AND f.finding_key > :cursor_1)))"
+    )
+    assert keyset_params([97, "finding-001"]) == {"cursor_0": 97, "cursor_1": "finding-001"}
+
+
+def test_keyset_predicate_uses_row_values_for_a_single_direction() -> None:
+    assert keyset_predicate([("f.total_conversions", "ASC"), ("f.finding_key", "ASC")]) == (
+        "((f.total_conversions, f.finding_key) > (:cursor_0, :cursor_1))"
+    )
+    assert keyset_predicate([("f.finding_key", "DESC")]) == "(f.finding_key < :cursor_0)"
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        [("score", "DESC"), ("item_key", "ASC")],
+        [("score", "ASC"), ("item_key", "ASC")],
+        [("score", "DESC"), ("item_key", "DESC")],
+    ],
+)
+def test_keyset_pages_match_offset_pages(columns) -> None:
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(sa.text("CREATE TABLE items (score INTEGER, item_key TEXT)"))
+        conn.execute(
+            sa.text("INSERT INTO items (score, item_key) VALUES (:score, :item_key)"),
+            [{"score": idx % 4, "item_key": f"key-{idx:02d}"} for idx in range(20)],
+        )
+        order_by = ", ".join(f"{expr} {direction}" for expr, direction in columns)
+        expected = conn.execute(sa.text(f"SELECT score, item_key FROM items ORDER BY {order_by}")).all()
+        seen: list = []
+        last = None
+        while True:
+            where = f"WHERE {keyset_predicate(columns)}" if last is not None else ""
+            page = conn.execute(
+                sa.text(f"SELECT score, item_key FROM items {where} ORDER BY {order_by} LIMIT 3"),
+                keyset_params(last) if last is not None else {},
+            ).all()
+            if not page:
+                break
+            seen.extend(page)
+            last = list(page[-1])
+
+    assert seen == expected
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("columns", "index_sql"),
+    [
+        ([("score", "DESC"), ("item_key", "ASC")], "(score DESC, item_key ASC)"),
+        ([("score", "DESC"), ("item_key", "DESC")], "(score DESC, item_key DESC)"),
+    ],
+)
+def test_keyset_predicate_is_an_index_condition_on_postgres(columns, index_sql) -> None:
+    database_url = os.getenv("FRAUD_TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("Set FRAUD_TEST_DATABASE_URL to run Postgres plan checks.")
+
+    engine = sa.create_engine(database_url)
+    order_by = ", ".join(f"{expr} {direction}" for expr, direction in columns)
+    with engine.begin() as conn:
+        conn.execute(sa.text("CREATE TEMP TABLE keyset_probe (score INTEGER NOT NULL, item_key TEXT NOT NULL)"))
+        conn.execute(
+            sa.text(
+                """
+                INSERT INTO keyset_probe (score, item_key)
+                SELECT n % 100, 'key-' || lpad(n::text, 6, '0') FROM generate_series(1, 50000) AS n
+                """
+            )
+        )
+        conn.execute(sa.text(f"CREATE INDEX keyset_probe_sort ON keyset_probe {index_sql}"))
+        conn.execute(sa.text("ANALYZE keyset_probe"))
+        plan = conn.execute(
+            sa.text(
+                f"""
+                EXPLAIN (FORMAT JSON)
+                SELECT * FROM keyset_probe
+                WHERE {keyset_predicate(columns)}
+                ORDER BY {order_by}
+                LIMIT 50
+                """
+            ),
+            keyset_params([10, "key-025000"]),
+        ).scalar_one()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+
+    # A deep cursor page seeks into the index instead of filtering from its top.
+    index_conditions = [
+        node.get("Index Cond", "")
+        for node in _plan_nodes(plan[0]["Plan"])
+        if node.get("Index Name") == "keyset_probe_sort"
+    ]
+    assert index_conditions and all("score" in condition for condition in index_conditions)
+
+
+def _plan_nodes(node: dict) -> list[dict]:
+    return [node, *(child for sub_plan in node.get("Plans", []) for child in _plan_nodes(sub_plan))]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _load_bench():
+    path = Path(__file__).resolve().parents[1] / "bench" / "queue_throughput.py"
+    spec = importlib.util.spec_from_file_location("queue_throughput", path)
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolve their module through sys.modules while the class body executes.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_bench_report_summarizes_latency_percentiles_and_lock_waits():
+    bench = _load_bench()
+    stats = bench.BenchStats(
+        acquire_ms=[float(value) for value in range(1, 101)],
+        complete_ms=[2.0],
+        completed=50,
+        recovered=3,
+        lock_wait_samples=[0, 0, 2, 1],
+    )
+
+    report = bench.build_report(stats, config=bench.BenchConfig(jobs=50), elapsed_seconds=2.0)
+
+    assert report["acquire_ms"] == {"p50": 50.0, "p90": 90.0, "p95": 95.0, "p99": 99.0, "max": 100.0}
+    assert report["complete_ms"]["p99"] == 2.0
+    assert report["fail_ms"] == {"p50": None, "p90": None, "p95": None, "p99": None, "max": None}
+    assert report["throughput_jobs_per_second"] == 25.0
+    assert report["stale_recoveries"] == 3
+    assert report["lock_waits"] == {
+        "samples": 4,
+        "samples_with_waiters": 2,
+        "max_waiting_sessions": 2,
+        "mean_waiting_sessions": 0.75,
+    }
+
+
+@pytest.mark.integration
+def test_bench_drains_small_mixed_workload_against_postgres():
+    database_url = os.getenv("FRAUD_TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("Set FRAUD_TEST_DATABASE_URL to run the queue benchmark.")
+    bench = _load_bench()
+
+    report = bench.run_benchmark(
+        database_url,
+        bench.BenchConfig(jobs=200, workers=4, sleep_ms=1, crash_ratio=0.05, timeout_seconds=120),
+    )
+
+    assert report["unfinished"] == 0
+    assert report["completed"] == 200
+    assert report["crashed_leases"] <= report["stale_recoveries"]
+    assert report["acquire_ms"]["p50"] is not None
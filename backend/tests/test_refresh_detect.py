@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from fraud_checker.services import jobs
 
 
@@ -9,16 +11,22 @@ def test_run_refresh_includes_detect(monkeypatch):
         def __init__(self, *args, **kwargs):
             self.last_affected_dates = []
 
-        def run_for_time_range(self, start_time, end_time):
-            self.last_affected_dates = [start_time.date()]
+        def fetch_for_time_range(self, start_time, end_time):
+            return [SimpleNamespace(click_time=start_time)]
+
+        def persist_time_range(self, clicks):
+            self.last_affected_dates = [clicks[0].click_time.date()]
             return 1, 0
 
     class DummyConversionIngestor:
         def __init__(self, *args, **kwargs):
             self.last_affected_dates = []
 
-        def run_for_time_range(self, start_time, end_time):
-            self.last_affected_dates = [start_time.date()]
+        def fetch_for_time_range(self, start_time, end_time):
+            return [SimpleNamespace(conversion_time=start_time, click_time=start_time)]
+
+        def persist_time_range(self, conversions):
+            self.last_affected_dates = [conversions[0].conversion_time.date()]
             return 2, 0, 2, 1
 
     class DummyRepo:
@@ -78,16 +86,22 @@ def test_run_refresh_skips_recompute_when_detect_is_false(monkeypatch):
         def __init__(self, *args, **kwargs):
             self.last_affected_dates = []
 
-        def run_for_time_range(self, start_time, end_time):
-            self.last_affected_dates = [start_time.date()]
+        def fetch_for_time_range(self, start_time, end_time):
+            return [SimpleNamespace(click_time=start_time)]
+
+        def persist_time_range(self, clicks):
+            self.last_affected_dates = [clicks[0].click_time.date()]
             return 1, 0
 
     class DummyConversionIngestor:
         def __init__(self, *args, **kwargs):
             self.last_affected_dates = []
 
-        def run_for_time_range(self, start_time, end_time):
-            self.last_affected_dates = [start_time.date()]
+        def fetch_for_time_range(self, start_time, end_time):
+            return [SimpleNamespace(conversion_time=start_time, click_time=start_time)]
+
+        def persist_time_range(self, conversions):
+            self.last_affected_dates = [conversions[0].conversion_time.date()]
             return 2, 0, 2, 1
 
     class DummyRepo:
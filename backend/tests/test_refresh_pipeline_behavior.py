@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from fraud_checker.services import refresh_pipeline
+
+_DAY_1 = date(2026, 1, 1)
+_DAY_2 = date(2026, 1, 2)
+_START = datetime(2026, 1, 1, 0, 0, 0)
+_END = datetime(2026, 1, 2, 23, 59, 59)
+
+
+def _at(target_date: date) -> datetime:
+    return datetime.combine(target_date, datetime.min.time())
+
+
+class _ClickIngestor:
+    def __init__(self, *, release_day_2: threading.Event | None = None, fail: bool = False) -> None:
+        self.release_day_2 = release_day_2
+        self.fail = fail
+        self.persisted: list[date] = []
+        self.last_affected_dates: list[date] = []
+
+    def fetch_for_time_range(self, start_time, end_time):
+        return [SimpleNamespace(click_time=_at(_DAY_1)), SimpleNamespace(click_time=_at(_DAY_2))]
+
+    def persist_time_range(self, clicks):
+        target_date = clicks[0].click_time.date()
+        if self.fail:
+            raise RuntimeError("click merge failed")
+        if target_date == _DAY_2 and self.release_day_2 is not None:
+            assert self.release_day_2.wait(timeout=5), "day 1 never became ready while day 2 clicks were held"
+        self.persisted.append(target_date)
+        self.last_affected_dates = [target_date]
+        return 1, 0
+
+
+class _ConversionIngestor:
+    def __init__(self, clicks: _ClickIngestor) -> None:
+        self.clicks = clicks
+        self.enriched_after: dict[date, list[date]] = {}
+        self.last_affected_dates: list[date] = []
+
+    def fetch_for_time_range(self, start_time, end_time):
+        return [
+            SimpleNamespace(conversion_time=_at(_DAY_1), click_time=_at(_DAY_1)),
+            SimpleNamespace(conversion_time=_at(_DAY_2), click_time=_at(_DAY_2)),
+        ]
+
+    def persist_time_range(self, conversions):
+        target_date = conversions[0].conversion_time.date()
+        self.enriched_after[target_date] = list(self.clicks.persisted)
+        self.last_affected_dates = [target_date]
+        return 1, 0, 1, 1
+
+
+def test_dates_become_ready_before_later_click_dates_are_persisted():
+    release_day_2 = threading.Event()
+    clicks = _ClickIngestor(release_day_2=release_day_2)
+    conversions = _ConversionIngestor(clicks)
+    ready_batches: list[list[date]] = []
+
+    def on_dates_ready(dates):
+        ready_batches.append(dates)
+        # Day 1 recompute is released while day 2 clicks are still being persisted.
+        release_day_2.set()
+
+    results = refresh_pipeline.run_refresh_pipeline(
+        start_time=_START,
+        end_time=_END,
+        click_ingestor=clicks,
+        conversion_ingestor=conversions,
+        on_dates_ready=on_dates_ready,
+    )
+
+    assert ready_batches[0] == [_DAY_1]
+    assert sorted(day for batch in ready_batches for day in batch) == [_DAY_1, _DAY_2]
+    # Day 1 conversions were enriched against day 1 clicks without waiting for day 2.
+    assert conversions.enriched_after[_DAY_1] == [_DAY_1]
+    assert conversions.enriched_after[_DAY_2] == [_DAY_1, _DAY_2]
+    assert results["clicks"] == {"new": 2, "skipped": 0}
+    assert results["conversions"] == {"new": 2, "skipped": 0, "valid_entry": 2, "click_enriched": 2}
+
+
+def test_click_failure_stops_waiting_conversions_and_surfaces_original_error():
+    clicks = _ClickIngestor(fail=True)
+    conversions = _ConversionIngestor(clicks)
+    ready_batches: list[list[date]] = []
+
+    with pytest.raises(RuntimeError, match="click merge failed"):
+        refresh_pipeline.run_refresh_pipeline(
+            start_time=_START,
+            end_time=_END,
+            click_ingestor=clicks,
+            conversion_ingestor=conversions,
+            on_dates_ready=ready_batches.append,
+        )
+
+    assert conversions.enriched_after == {}
+    assert ready_batches == []
+
+
+def test_single_stream_refresh_does_not_wait_on_disabled_stage():
+    conversions = _ConversionIngestor(_ClickIngestor())
+    ready_batches: list[list[date]] = []
+
+    results = refresh_pipeline.run_refresh_pipeline(
+        start_time=_START,
+        end_time=_END,
+        click_ingestor=None,
+        conversion_ingestor=conversions,
+        on_dates_ready=ready_batches.append,
+    )
+
+    assert results["clicks"] is None
+    assert results["conversions"]["new"] == 2
+    assert sorted(day for batch in ready_batches for day in batch) == [_DAY_1, _DAY_2]
@@ -398,3 +398,228 @@ def test_get_daily_stats_skips_invalid_date_rows():
     assert len(rows) == 2
     by_date = {row["date"]: row for row in rows}
     assert by_date["bad-date"]["suspicious_conversions"] == 0
+
+
+def test_date_catalog_serves_available_dates_latest_dates_and_watermarks(tmp_path):
+    import fraud_checker.db.models  # noqa: F401
+    import sqlalchemy as sa
+
+    from fraud_checker.db import Base
+    from fraud_checker.repository_pg import PostgresRepository
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'catalog.db'}")
+    clicks = Base.metadata.tables["click_ipua_daily"]
+    conversions = Base.metadata.tables["conversion_ipua_daily"]
+    Base.metadata.create_all(
+        repo.engine,
+        tables=[clicks, conversions, Base.metadata.tables["daily_data_catalog"]],
+    )
+    stamp = datetime(2026, 1, 3, 9, 0, 0)
+    common = {"program_id": "p-1", "first_time": stamp, "last_time": stamp, "created_at": stamp}
+    with repo.engine.begin() as conn:
+        conn.execute(
+            clicks.insert(),
+            [
+                {**common, "date": date(2026, 1, 2), "media_id": "m-1", "ipaddress": "203.0.113.1",
+                 "useragent": "ua", "click_count": 3, "updated_at": stamp},
+                {**common, "date": date(2026, 1, 2), "media_id": "m-2", "ipaddress": "203.0.113.2",
+                 "useragent": "ua", "click_count": 4, "updated_at": datetime(2026, 1, 3, 10, 0, 0)},
+            ],
+        )
+        conn.execute(
+            conversions.insert(),
+            {**common, "date": date(2026, 1, 3), "media_id": "m-1", "ipaddress": "203.0.113.1",
+             "useragent": "ua", "conversion_count": 2, "updated_at": stamp},
+        )
+    repo.refresh_date_rollups([date(2026, 1, 2), date(2026, 1, 3)])
+
+    with repo.engine.begin() as conn:
+        catalog = {
+            str(row["date"]): row
+            for row in conn.execute(sa.text("SELECT * FROM daily_data_catalog")).mappings().all()
+        }
+    assert catalog["2026-01-02"]["click_row_count"] == 2
+    assert catalog["2026-01-02"]["click_total"] == 7
+    assert catalog["2026-01-03"]["conversion_total"] == 2
+    assert reporting.get_available_dates(repo) == ["2026-01-03", "2026-01-02"]
+    assert reporting.get_latest_date(repo, "click_ipua_daily") == "2026-01-02"
+    assert reporting.get_latest_date(repo, "conversion_ipua_daily") == "2026-01-03"
+    assert repo.get_click_data_watermark(date(2026, 1, 2)) == repo._max_timestamp_for_date(
+        "click_ipua_daily", date(2026, 1, 2)
+    )
+
+    repo.clear_date(date(2026, 1, 2), store_raw=False)
+    assert reporting.get_available_dates(repo) == ["2026-01-03"]
+
+    repo.purge_aggregates_before(date(2026, 1, 4), execute=True)
+    assert reporting.get_available_dates(repo) == []
+
+
+def test_date_catalog_refresh_rewrites_only_its_own_side_and_locks_the_row_on_postgres(tmp_path):
+    import fraud_checker.db.models  # noqa: F401
+    import sqlalchemy as sa
+
+    from fraud_checker.date_catalog import refresh_date_catalog
+    from fraud_checker.db import Base
+
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'catalog.db'}")
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            Base.metadata.tables["click_ipua_daily"],
+            Base.metadata.tables["conversion_ipua_daily"],
+            Base.metadata.tables["daily_data_catalog"],
+        ],
+    )
+    stamp = datetime(2026, 1, 3, 9, 0, 0)
+    with engine.begin() as conn:
+        conn.execute(
+            Base.metadata.tables["click_ipua_daily"].insert(),
+            {"date": date(2026, 1, 2), "media_id": "m-1", "program_id": "p-1", "ipaddress": "203.0.113.1",
+             "useragent": "ua", "click_count": 3, "first_time": stamp, "last_time": stamp,
+             "created_at": stamp, "updated_at": stamp},
+        )
+        # Counts a concurrent conversion writer already committed; the click refresh must keep them.
+        conn.execute(
+            sa.text(
+                "INSERT INTO daily_data_catalog (date, click_row_count, click_total, conversion_row_count, "
+                "conversion_total, updated_at) VALUES ('2026-01-02', 0, 0, 4, 9, '2026-01-03 08:00:00')"
+            )
+        )
+        refresh_date_catalog(conn, [date(2026, 1, 2)], sides=("click",))
+        row = conn.execute(sa.text("SELECT * FROM daily_data_catalog")).mappings().one()
+
+    assert (row["click_row_count"], row["click_total"]) == (1, 3)
+    assert (row["conversion_row_count"], row["conversion_total"]) == (4, 9)
+
+    statements = []
+
+    class PostgresConn:
+        dialect = type("Dialect", (), {"name": "postgresql"})()
+
+        def execute(self, stmt, params=None):
+            statements.append(" ".join(str(stmt).split()))
+
+    refresh_date_catalog(PostgresConn(), [date(2026, 1, 2)], sides=("conversion",))
+
+    assert "ON CONFLICT (date) DO NOTHING" in statements[0]
+    assert statements[1].endswith("FOR UPDATE")
+    assert len(statements) == 3
+    assert "SET conversion_row_count = counted.row_count" in statements[2]
+
+
+def test_daily_totals_delta_creates_and_locks_the_row_before_reading_on_postgres():
+    from fraud_checker.daily_totals import DailyTotalsDelta, apply_daily_totals
+    from fraud_checker.hyperloglog import HyperLogLog
+
+    statements = []
+    existing = {
+        "click_total": 5,
+        "click_ip_sketch": HyperLogLog().to_text(),
+        "click_media_sketch": HyperLogLog().to_text(),
+    }
+
+    class Result:
+        def mappings(self):
+            return self
+
+        def first(self):
+            return existing
+
+    class PostgresConn:
+        dialect = type("Dialect", (), {"name": "postgresql"})()
+
+        def execute(self, stmt, params=None):
+            statements.append((" ".join(str(stmt).split()), params))
+            return Result()
+
+    delta = DailyTotalsDelta()
+    delta.add(ipaddress="203.0.113.1", media_id="m-1")
+    apply_daily_totals(PostgresConn(), "click", {date(2026, 1, 2): delta})
+
+    assert "ON CONFLICT (date) DO NOTHING" in statements[0][0]
+    assert statements[1][0].endswith("FOR UPDATE")
+    assert statements[2][1]["click_total"] == 6
+    assert len(statements) == 3
+
+
+def test_hyperloglog_estimates_distinct_counts_and_round_trips():
+    from fraud_checker.hyperloglog import HyperLogLog
+
+    small = HyperLogLog()
+    small.update(["203.0.113.1", "203.0.113.2", "203.0.113.2", None])
+    large = HyperLogLog()
+    large.update(f"198.51.{i // 256}.{i % 256}" for i in range(20000))
+    restored = HyperLogLog.from_text(large.to_text())
+    restored.merge(small)
+
+    assert small.estimate() == 2
+    assert abs(large.estimate() - 20000) / 20000 < 0.05
+    assert abs(restored.estimate() - 20002) / 20002 < 0.05
+
+
+def test_daily_totals_rollup_serves_trends_and_applies_merge_deltas(tmp_path):
+    import fraud_checker.db.models  # noqa: F401
+    import sqlalchemy as sa
+
+    from fraud_checker.daily_totals import DailyTotalsDelta, apply_daily_totals
+    from fraud_checker.db import Base
+    from fraud_checker.repository_pg import PostgresRepository
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'totals.db'}")
+    clicks = Base.metadata.tables["click_ipua_daily"]
+    conversions = Base.metadata.tables["conversion_ipua_daily"]
+    Base.metadata.create_all(
+        repo.engine,
+        tables=[clicks, conversions, Base.metadata.tables["daily_totals"]],
+    )
+    stamp = datetime(2026, 1, 3, 9, 0, 0)
+    common = {"program_id": "p-1", "useragent": "ua", "first_time": stamp, "last_time": stamp,
+              "created_at": stamp, "updated_at": stamp}
+    with repo.engine.begin() as conn:
+        conn.execute(
+            clicks.insert(),
+            [
+                {**common, "date": date(2026, 1, 1), "media_id": "m-1", "ipaddress": "203.0.113.1", "click_count": 2},
+                {**common, "date": date(2026, 1, 2), "media_id": "m-1", "ipaddress": "203.0.113.1", "click_count": 3},
+                {**common, "date": date(2026, 1, 2), "media_id": "m-2", "ipaddress": "203.0.113.2", "click_count": 4},
+            ],
+        )
+        conn.execute(
+            conversions.insert(),
+            {**common, "date": date(2026, 1, 2), "media_id": "m-1", "ipaddress": "203.0.113.1", "conversion_count": 1},
+        )
+    repo.refresh_date_rollups([date(2026, 1, 1), date(2026, 1, 2)])
+
+    assert reporting.get_daily_stats(repo, 30) == [
+        {"date": "2026-01-01", "clicks": 2, "conversions": 0, "suspicious_conversions": 0},
+        {"date": "2026-01-02", "clicks": 7, "conversions": 1, "suspicious_conversions": 0},
+    ]
+    assert [row["date"] for row in reporting.get_daily_stats(repo, 1, "2026-01-01")] == ["2026-01-01"]
+    assert reporting._load_summary_rollup(repo, "2026-01-02", "2026-01-01") == (
+        {"total_clicks": 7, "unique_ips": 2, "active_media": 2},
+        {"total_conversions": 1, "conversion_ips": 1},
+        {"total": 2},
+        {"total": 0},
+    )
+
+    with repo.engine.begin() as conn:
+        conn.execute(
+            clicks.insert(),
+            {**common, "date": date(2026, 1, 2), "media_id": "m-3", "ipaddress": "203.0.113.9", "click_count": 1},
+        )
+        delta = DailyTotalsDelta()
+        delta.add(ipaddress="203.0.113.9", media_id="m-3")
+        apply_daily_totals(conn, "click", {date(2026, 1, 2): delta})
+        row = conn.execute(sa.text("SELECT * FROM daily_totals WHERE date = '2026-01-02'")).mappings().one()
+
+    assert (row["click_total"], row["click_unique_ips"], row["click_media_count"]) == (8, 3, 3)
+    assert row["conversion_total"] == 1
+
+    repo.clear_date(date(2026, 1, 2), store_raw=False)
+    assert reporting.get_daily_stats(repo, 30)[-1] == {
+        "date": "2026-01-02",
+        "clicks": 0,
+        "conversions": 1,
+        "suspicious_conversions": 0,
+    }
@@ -6,6 +6,7 @@ from datetime import date, datetime
 import sqlalchemy as sa
 
 from fraud_checker.repository_pg import PostgresRepository
+from fraud_checker.rewards import reward_from_row
 
 
 def _new_repo() -> PostgresRepository:
@@ -164,7 +165,7 @@ def test_get_suspicious_conversion_detail_bulk_maps_rows(monkeypatch):
     assert conv[("1.1.1.1", "UA")][0]["program_name"] == "p1"
 
 
-def test_get_daily_finding_counts_uses_generation_join(monkeypatch):
+def test_get_daily_finding_counts_uses_current_generation_pointer(monkeypatch):
     repo = _new_repo()
     monkeypatch.setattr(repo, "_table_exists", lambda name: True)
     captured = {}
@@ -178,7 +179,7 @@ def test_get_daily_finding_counts_uses_generation_join(monkeypatch):
 
     counts = repo.get_daily_finding_counts(7, target_date=date(2026, 1, 10))
 
-    assert "findings_generations" in captured["query"]
+    assert "findings_current_generations" in captured["query"]
     assert captured["params"]["target_date"] == date(2026, 1, 10)
     assert counts == {"2026-01-01": {"suspicious_conversions": 3}}
 
@@ -201,3 +202,278 @@ def test_save_settings_returns_without_execute_when_empty(monkeypatch):
     repo.save_settings({}, fingerprint="unused")
 
     assert executed["count"] == 0
+
+
+def test_replace_conversion_findings_publishes_pointer_without_mass_update(monkeypatch):
+    repo = _new_repo()
+    monkeypatch.setattr(repo, "_table_exists", lambda name: True)
+    executed: list[str] = []
+
+    class DummyConn:
+        def execute(self, stmt, params=None):
+            executed.append(" ".join(str(stmt).split()))
+
+    @contextmanager
+    def fake_connect():
+        yield DummyConn()
+
+    monkeypatch.setattr(repo, "_connect", fake_connect)
+
+    repo.replace_conversion_findings(
+        date(2026, 1, 1),
+        [],
+        generation_metadata={
+            "generation_id": "gen-2",
+            "finding_type": "conversion",
+            "target_date": date(2026, 1, 1),
+            "computed_by_job_id": None,
+            "settings_version_id": None,
+            "settings_fingerprint": "fp",
+            "detector_code_version": "v1",
+            "source_click_watermark": None,
+            "source_conversion_watermark": None,
+            "row_count": 0,
+            "created_at": datetime(2026, 1, 1, 12, 0, 0),
+        },
+    )
+
+    assert not any(sql.startswith("UPDATE suspicious_conversion_findings") for sql in executed)
+    assert executed[-1].startswith("INSERT INTO findings_current_generations")
+    assert "ON CONFLICT (finding_type, target_date)" in executed[-1]
+
+
+def test_replace_conversion_findings_writes_enrichment_in_the_publishing_transaction(monkeypatch):
+    repo = _new_repo()
+    monkeypatch.setattr(repo, "_table_exists", lambda name: True)
+    connections: list[list[str]] = []
+
+    class DummyConn:
+        def __init__(self) -> None:
+            self.executed: list[str] = []
+            connections.append(self.executed)
+
+        def execute(self, stmt, params=None):
+            self.executed.append(" ".join(str(stmt).split()))
+
+    @contextmanager
+    def fake_connect():
+        yield DummyConn()
+
+    monkeypatch.setattr(repo, "_connect", fake_connect)
+
+    computed_at = datetime(2026, 1, 1, 12, 0, 0)
+    repo.replace_conversion_findings(
+        date(2026, 1, 1),
+        [],
+        generation_metadata={
+            "generation_id": "gen-2",
+            "finding_type": "conversion",
+            "target_date": date(2026, 1, 1),
+            "computed_by_job_id": None,
+            "settings_version_id": None,
+            "settings_fingerprint": "fp",
+            "detector_code_version": "v1",
+            "source_click_watermark": None,
+            "source_conversion_watermark": None,
+            "row_count": 0,
+            "created_at": computed_at,
+        },
+        enrichment={"unit_prices": {"p1": 1200}, "summaries": [], "computed_at": computed_at},
+    )
+
+    assert len(connections) == 1
+    executed = connections[0]
+    unit_price_insert = next(
+        index for index, sql in enumerate(executed) if sql.startswith("INSERT INTO program_unit_prices_daily")
+    )
+    assert any(sql.startswith("DELETE FROM conversion_finding_summaries") for sql in executed)
+    # The pointer moves last, after the new generation's enrichment is in place.
+    assert unit_price_insert < len(executed) - 1
+    assert executed[-1].startswith("INSERT INTO findings_current_generations")
+
+
+def test_retire_superseded_conversion_findings_keeps_published_generation(tmp_path):
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'generation-swap.db'}")
+    findings = Base.metadata.tables["suspicious_conversion_findings"]
+    pointer = Base.metadata.tables["findings_current_generations"]
+    Base.metadata.create_all(repo.engine, tables=[findings, pointer])
+    target_date = date(2026, 1, 1)
+    with repo.engine.begin() as conn:
+        for finding_key, generation_id in (("stale", "gen-1"), ("fresh", "gen-2")):
+            conn.execute(
+                findings.insert(),
+                {
+                    "finding_key": finding_key,
+                    "case_key": finding_key,
+                    "date": target_date,
+                    "ipaddress": "203.0.113.10",
+                    "useragent": "Mozilla/5.0",
+                    "ua_hash": "ua",
+                    "risk_level": "high",
+                    "risk_score": 90,
+                    "reasons_json": "[]",
+                    "reasons_formatted_json": "[]",
+                    "metrics_json": "{}",
+                    "total_conversions": 1,
+                    "media_count": 1,
+                    "program_count": 1,
+                    "first_time": datetime(2026, 1, 1, 9, 0, 0),
+                    "last_time": datetime(2026, 1, 1, 9, 0, 0),
+                    "rule_version": "test",
+                    "computed_at": datetime(2026, 1, 1, 10, 0, 0),
+                    "generation_id": generation_id,
+                    "is_current": True,
+                    "search_text": "mozilla",
+                },
+            )
+        conn.execute(
+            pointer.insert(),
+            {
+                "finding_type": "conversion",
+                "target_date": target_date,
+                "generation_id": "gen-2",
+                "published_at": datetime(2026, 1, 1, 10, 0, 0),
+            },
+        )
+
+    assert repo.count_current_conversion_findings(target_date) == 1
+    assert repo.retire_superseded_conversion_findings([target_date]) == 1
+
+    with repo.engine.begin() as conn:
+        rows = conn.execute(
+            sa.text("SELECT finding_key, is_current FROM suspicious_conversion_findings ORDER BY finding_key")
+        ).all()
+
+    assert [(row[0], bool(row[1])) for row in rows] == [("fresh", True), ("stale", False)]
+
+
+def test_backfill_conversion_reward_yen_updates_rows_in_batches(tmp_path):
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'reward-backfill.db'}")
+    conversion_raw = Base.metadata.tables["conversion_raw"]
+    Base.metadata.create_all(repo.engine, tables=[conversion_raw])
+    with repo.engine.begin() as conn:
+        conn.execute(
+            conversion_raw.insert(),
+            [
+                {
+                    "id": f"conv-{idx}",
+                    "conversion_time": datetime(2026, 1, 1, 9, idx, 0),
+                    "raw_payload": '{"reward": 1500}' if idx % 2 else None,
+                    # conv-0 carries the default an earlier ingest wrote for a payload without a reward.
+                    "reward_yen": 3000 if idx == 0 else None,
+                    "created_at": datetime(2026, 1, 1, 9, 0, 0),
+                    "updated_at": datetime(2026, 1, 1, 9, 0, 0),
+                }
+                for idx in range(5)
+            ],
+        )
+
+    selects = []
+
+    @sa.event.listens_for(repo.engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT id, raw_payload"):
+            selects.append((" ".join(statement.split()), parameters))
+
+    assert repo.backfill_conversion_reward_yen(batch_size=2) == 5
+    # Every batch after the first resumes after the previous batch's last id.
+    assert [params[0] for _sql, params in selects[1:]] == ["conv-1", "conv-3", "conv-4"]
+    assert all("AND id > ?" in sql for sql, _params in selects[1:])
+    assert repo.backfill_conversion_reward_yen(batch_size=2) == 0
+
+    with repo.engine.begin() as conn:
+        rows = {
+            row[0]: (row[1], bool(row[2]))
+            for row in conn.execute(sa.text("SELECT id, reward_yen, reward_resolved FROM conversion_raw")).all()
+        }
+
+    assert rows["conv-1"] == (1500, True)
+    # No reward in the payload stays NULL; the default is applied when the row is read.
+    assert rows["conv-0"] == (None, True)
+    assert reward_from_row({"reward_yen": None, "reward_resolved": True, "raw_payload": None}) == 3000
+
+
+def test_get_program_unit_prices_aggregates_typed_reward_column(monkeypatch):
+    repo = _new_repo()
+    monkeypatch.setattr(repo, "_table_exists", lambda name: True)
+    monkeypatch.setattr(repo, "_column_exists", lambda table_name, column_name: True)
+    captured = {}
+
+    def fake_fetch_all(query, params=None):
+        captured["query"] = query
+        return [
+            {"program_id": "p1", "reward_yen": 1000, "reward_resolved": True, "raw_payload": None, "conversion_count": 4},
+            {
+                "program_id": "p1",
+                "reward_yen": None,
+                "reward_resolved": False,
+                "raw_payload": '{"reward": 2000}',
+                "conversion_count": 1,
+            },
+        ]
+
+    monkeypatch.setattr(repo, "fetch_all", fake_fetch_all)
+
+    prices = repo.get_program_unit_prices(date(2026, 1, 1), ["p1"])
+
+    assert "GROUP BY c.program_id, c.reward_yen, c.reward_resolved" in captured["query"]
+    assert prices == {"p1": 1000}
+
+
+def test_list_conversion_findings_search_escapes_like_wildcards(tmp_path):
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'findings-search.db'}")
+    findings = Base.metadata.tables["suspicious_conversion_findings"]
+    Base.metadata.create_all(repo.engine, tables=[findings])
+    target_date = date(2026, 1, 1)
+    with repo.engine.begin() as conn:
+        for finding_key, search_text in (("underscore", "203.0.113.10 promo_a"), ("plain", "203.0.113.11 promoxa")):
+            conn.execute(
+                findings.insert(),
+                {
+                    "finding_key": finding_key,
+                    "case_key": finding_key,
+                    "date": target_date,
+                    "ipaddress": "203.0.113.10",
+                    "useragent": "Mozilla/5.0",
+                    "ua_hash": "ua",
+                    "risk_level": "high",
+                    "risk_score": 90,
+                    "reasons_json": "[]",
+                    "reasons_formatted_json": "[]",
+                    "metrics_json": "{}",
+                    "total_conversions": 1,
+                    "media_count": 1,
+                    "program_count": 1,
+                    "first_time": datetime(2026, 1, 1, 9, 0, 0),
+                    "last_time": datetime(2026, 1, 1, 9, 0, 0),
+                    "rule_version": "test",
+                    "computed_at": datetime(2026, 1, 1, 10, 0, 0),
+                    "is_current": True,
+                    "search_text": search_text,
+                },
+            )
+
+    rows, total = repo.list_conversion_findings(
+        target_date=target_date,
+        limit=10,
+        offset=0,
+        search="ＰＲＯＭＯ_A",
+        risk_level=None,
+        sort_by="count",
+        sort_order="desc",
+    )
+
+    assert total == 1
+    assert [row["finding_key"] for row in rows] == ["underscore"]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from fraud_checker import response_cache
+from fraud_checker.response_cache import CachedPayload, InMemoryCacheBackend, cached_json_response
+
+
+def _build_app(state: dict) -> FastAPI:
+    app = FastAPI()
+
+    def compute():
+        state["calls"] += 1
+        return {"dates": ["2026-01-02"], "calls": state["calls"]}
+
+    @app.get("/cached")
+    def cached(request: Request):
+        return cached_json_response(
+            request,
+            endpoint="test.cached",
+            params={"limit": 10},
+            version=state["version"],
+            compute=compute,
+            live=state.get("live"),
+        )
+
+    return app
+
+
+def test_in_memory_cache_backend_evicts_least_recently_used() -> None:
+    backend = InMemoryCacheBackend(max_entries=2)
+    entry = CachedPayload(payload={}, body=b"{}", etag='"x"')
+
+    backend.set("a", entry)
+    backend.set("b", entry)
+    assert backend.get("a") is entry
+    backend.set("c", entry)
+
+    assert backend.get("b") is None
+    assert backend.get("a") is entry
+    assert backend.get("c") is entry
+
+
+def test_cached_json_response_reuses_payload_until_version_changes(monkeypatch) -> None:
+    monkeypatch.setattr(response_cache, "_backend", InMemoryCacheBackend())
+    state = {"calls": 0, "version": 1}
+    client = TestClient(_build_app(state))
+
+    first = client.get("/cached")
+    second = client.get("/cached")
+    state["version"] = 2
+    third = client.get("/cached")
+
+    assert first.status_code == 200
+    assert first.json() == second.json() == {"dates": ["2026-01-02"], "calls": 1}
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+    assert third.json()["calls"] == 2
+    assert third.headers["etag"] != first.headers["etag"]
+
+
+def test_cached_json_response_answers_matching_etag_with_not_modified(monkeypatch) -> None:
+    monkeypatch.setattr(response_cache, "_backend", InMemoryCacheBackend())
+    state = {"calls": 0, "version": 7}
+    client = TestClient(_build_app(state))
+
+    etag = client.get("/cached").headers["etag"]
+    response = client.get("/cached", headers={"If-None-Match": f'W/{etag}, "other"'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert state["calls"] == 1
+
+
+def test_cached_json_response_recomputes_every_time_without_version(monkeypatch) -> None:
+    monkeypatch.setattr(response_cache, "_backend", InMemoryCacheBackend())
+    state = {"calls": 0, "version": None}
+    client = TestClient(_build_app(state))
+
+    client.get("/cached")
+    response = client.get("/cached")
+
+    assert response.json()["calls"] == 2
+
+
+def test_cached_json_response_applies_live_fields_on_top_of_cached_payload(monkeypatch) -> None:
+    monkeypatch.setattr(response_cache, "_backend", InMemoryCacheBackend())
+    job_state = {"status": "running"}
+    state = {
+        "calls": 0,
+        "version": 3,
+        "live": lambda payload: {**payload, "job": job_state["status"]},
+    }
+    client = TestClient(_build_app(state))
+
+    first = client.get("/cached")
+    job_state["status"] = "idle"
+    second = client.get("/cached")
+
+    assert first.json()["job"] == "running"
+    assert second.json() == {"dates": ["2026-01-02"], "calls": 1, "job": "idle"}
+    assert first.headers["etag"] != second.headers["etag"]
+
+
+def test_cached_json_response_recomputes_expired_entries_within_a_version(monkeypatch) -> None:
+    from datetime import datetime, timedelta
+
+    monkeypatch.setattr(response_cache, "_backend", InMemoryCacheBackend())
+    clock = {"now": datetime(2026, 1, 2, 9, 0, 0)}
+    monkeypatch.setattr(response_cache, "now_local", lambda: clock["now"])
+    state = {"calls": 0}
+    app = FastAPI()
+
+    @app.get("/cached")
+    def cached(request: Request):
+        def compute():
+            state["calls"] += 1
+            return {"calls": state["calls"]}
+
+        return cached_json_response(
+            request,
+            endpoint="test.expiring",
+            params={},
+            version=1,
+            compute=compute,
+            expires_at=lambda payload: clock["now"] + timedelta(minutes=15),
+        )
+
+    client = TestClient(app)
+    client.get("/cached")
+    clock["now"] += timedelta(minutes=10)
+    assert client.get("/cached").json() == {"calls": 1}
+    clock["now"] += timedelta(minutes=10)
+    assert client.get("/cached").json() == {"calls": 2}
+
+
+def test_cache_version_counter_increments_per_bump(tmp_path) -> None:
+    import fraud_checker.db.models  # noqa: F401
+
+    from fraud_checker.db import Base
+    from fraud_checker.repository_pg import PostgresRepository
+
+    repo = PostgresRepository(f"sqlite:///{tmp_path / 'cache-version.db'}")
+    assert repo.get_cache_version("reporting") is None
+
+    Base.metadata.create_all(repo.engine, tables=[Base.metadata.tables["cache_versions"]])
+
+    assert repo.get_cache_version("reporting") == 0
+    repo.bump_cache_version("reporting")
+    repo.bump_cache_version("reporting")
+
+    assert repo.get_cache_version("reporting") == 2
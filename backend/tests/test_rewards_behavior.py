@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from fraud_checker import rewards
+from fraud_checker.constants import DEFAULT_REWARD_YEN
+
+
+def test_reward_from_payload_reads_nested_reward_keys():
+    assert rewards.reward_from_payload('{"detail": {"Reward": "1,200"}}') == 1200
+    assert rewards.reward_from_payload({"price": "￥800"}) == 800
+
+
+def test_reward_from_payload_defaults_when_no_reward_is_present():
+    assert rewards.reward_from_payload(None) == DEFAULT_REWARD_YEN
+    assert rewards.reward_from_payload('{"reward": 0}') == DEFAULT_REWARD_YEN
+
+
+def test_reward_from_row_prefers_typed_column_over_payload():
+    assert rewards.reward_from_row({"reward_yen": 4500, "raw_payload": '{"reward": 100}'}) == 4500
+    assert rewards.reward_from_row({"reward_yen": None, "raw_payload": '{"reward": 100}'}) == 100
+
+
+def test_reward_from_row_applies_default_to_resolved_rows_without_reward():
+    assert rewards.observed_reward('{"status": "approved"}') is None
+    row = {"reward_yen": None, "reward_resolved": True, "raw_payload": '{"reward": 100}'}
+    # Resolved rows are not re-parsed; NULL means the payload carried no reward.
+    assert rewards.reward_from_row(row) == DEFAULT_REWARD_YEN
+
+
+def test_representative_weighted_price_picks_most_frequent_then_highest():
+    assert rewards.representative_weighted_price({1000: 3, 2000: 3, 500: 1}) == 2000
+    assert rewards.representative_unit_price([0, -1]) is None
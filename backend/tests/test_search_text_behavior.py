@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+import sqlalchemy as sa
+
+from fraud_checker.search_text import contains_pattern, normalize_search_text, search_condition_sql
+
+
+def test_normalize_search_text_folds_width_case_and_whitespace() -> None:
+    assert normalize_search_text("  ＡＢＣ　Affiliate   Alpha ") == "abc affiliate alpha"
+
+
+def test_contains_pattern_escapes_like_wildcards() -> None:
+    assert contains_pattern("100%_off\\x") == "%100\\%\\_off\\\\x%"
+
+
+def test_search_condition_sql_targets_stored_column_without_wrapping() -> None:
+    condition = search_condition_sql()
+
+    assert condition == "f.search_text LIKE :search ESCAPE '\\'"
+    assert "LOWER(" not in condition
+    assert "COALESCE(" not in condition
+
+
+@pytest.mark.integration
+def test_search_benchmark_uses_trigram_index_on_large_findings_table() -> None:
+    database_url = os.getenv("FRAUD_TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("Set FRAUD_TEST_DATABASE_URL to run the search benchmark.")
+    row_count = int(os.getenv("FRAUD_SEARCH_BENCHMARK_ROWS", "1000000"))
+    engine = sa.create_engine(database_url)
+    with engine.connect() as conn:
+        available = conn.execute(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).scalar()
+        if not available:
+            pytest.skip("pg_trgm is not available on the benchmark database.")
+        conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(
+            sa.text(
+                """
+                CREATE TEMP TABLE bench_findings (
+                    finding_key TEXT PRIMARY KEY,
+                    ipaddress TEXT NOT NULL,
+                    useragent TEXT NOT NULL,
+                    search_text TEXT NOT NULL,
+                    is_current BOOLEAN NOT NULL
+                )
+                """
+            )
+        )
+        conn.execute(
+            sa.text(
+                """
+                INSERT INTO bench_findings
+                SELECT
+                    'finding-' || n,
+                    '10.' || (n % 250) || '.' || (n / 250 % 250) || '.' || (n % 7),
+                    'mozilla/5.0 chrome/' || (n % 120),
+                    '10.' || (n % 250) || '.' || (n / 250 % 250) || ' mozilla/5.0 chrome/' || (n % 120)
+                        || ' affiliate ' || md5(n::text),
+                    TRUE
+                FROM generate_series(1, :row_count) AS n
+                """
+            ),
+            {"row_count": row_count},
+        )
+        conn.execute(
+            sa.text(
+                "CREATE INDEX bench_findings_search_trgm ON bench_findings "
+                "USING gin (search_text gin_trgm_ops) WHERE is_current = TRUE"
+            )
+        )
+        conn.execute(sa.text("ANALYZE bench_findings"))
+        pattern = contains_pattern("affiliate " + "c4ca4238")
+
+        def timed(where_sql: str) -> tuple[float, str]:
+            started = time.perf_counter()
+            plan = conn.execute(
+                sa.text(f"EXPLAIN (ANALYZE, FORMAT TEXT) SELECT finding_key FROM bench_findings f WHERE f.is_current = TRUE AND {where_sql}"),
+                {"search": pattern},
+            ).scalars().all()
+            return time.perf_counter() - started, "\n".join(plan)
+
+        legacy_seconds, _legacy_plan = timed(
+            "(LOWER(COALESCE(f.search_text, '')) LIKE :search "
+            "OR LOWER(COALESCE(f.ipaddress, '')) LIKE :search "
+            "OR LOWER(COALESCE(f.useragent, '')) LIKE :search)"
+        )
+        indexed_seconds, indexed_plan = timed(search_condition_sql())
+
+    print(f"search benchmark rows={row_count} legacy={legacy_seconds:.3f}s indexed={indexed_seconds:.3f}s")
+    assert "bench_findings_search_trgm" in indexed_plan
+    assert indexed_seconds < legacy_seconds
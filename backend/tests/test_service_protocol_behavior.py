@@ -102,7 +102,8 @@ def test_reporting_service_accepts_narrow_repository_interface(monkeypatch):
     assert summary["stats"]["clicks"]["total"] == 12
 
 
-def test_lifecycle_service_accepts_narrow_repository_interface():
+def test_lifecycle_service_accepts_narrow_repository_interface(monkeypatch, tmp_path):
+    monkeypatch.setenv("FC_EXPORT_ARTIFACT_DIR", str(tmp_path))
     result = lifecycle.purge_old_data(
         StubLifecycleRepo(),
         StubJobStore(),
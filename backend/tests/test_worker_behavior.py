@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+
+from fraud_checker.services import jobs
+from fraud_checker.services import worker as worker_service
+
+
+def _run(run_id: str, job_type: str = jobs.JOB_TYPE_MASTER_SYNC) -> jobs.JobRun:
+    return jobs.JobRun(
+        id=run_id,
+        job_type=job_type,
+        status="running",
+        params=None,
+        result=None,
+        error_message=None,
+        message="queued",
+        attempt_count=0,
+        max_attempts=2,
+        next_retry_at=None,
+        dedupe_key=run_id,
+        priority=50,
+        queued_at=datetime(2026, 1, 1, 0, 0, 0),
+        started_at=None,
+        finished_at=None,
+        heartbeat_at=None,
+        locked_until=None,
+        worker_id="worker-1",
+    )
+
+
+class _QueueStore:
+    def __init__(self, run_ids: list[str]) -> None:
+        self.pending = list(run_ids)
+        self.lock = threading.Lock()
+        self.acquire_calls: list[bool] = []
+        self.recoveries = 0
+
+    def recover_stale_runs(self) -> int:
+        self.recoveries += 1
+        return 0
+
+    def acquire_next(self, *, worker_id, lease_seconds, recover_stale=True):
+        with self.lock:
+            self.acquire_calls.append(recover_stale)
+            return _run(self.pending.pop(0)) if self.pending else None
+
+
+def _runtime(store):
+    return jobs.RuntimeDependencies(
+        repository_factory=lambda: None,
+        job_store_factory=lambda: store,
+        acs_client_factory=lambda: None,
+        now_provider=datetime.now,
+    )
+
+
+def test_resolve_worker_settings_reads_environment_with_overrides(monkeypatch):
+    monkeypatch.setenv("FC_WORKER_CONCURRENCY", "6")
+    monkeypatch.setenv("FC_WORKER_POLL_SECONDS", "not-a-number")
+    monkeypatch.setenv("FC_WORKER_RECOVERY_SECONDS", "0")
+
+    settings = worker_service.resolve_worker_settings(poll_seconds=0.5)
+
+    assert settings == worker_service.WorkerSettings(concurrency=6, poll_seconds=0.5, recovery_seconds=1.0)
+
+
+def test_worker_pool_runs_jobs_concurrently_and_drains_on_stop(monkeypatch):
+    store = _QueueStore(["run-1", "run-2", "run-3"])
+    started = threading.Barrier(2, timeout=5)
+    executed: list[str] = []
+    peak = {"active": 0, "max": 0}
+    guard = threading.Lock()
+
+    def fake_execute(*, store, run, worker_id, lease_seconds, deps, heartbeats):
+        with guard:
+            peak["active"] += 1
+            peak["max"] = max(peak["max"], peak["active"])
+        if run.id in {"run-1", "run-2"}:
+            started.wait()
+        time.sleep(0.05)
+        with guard:
+            peak["active"] -= 1
+            executed.append(run.id)
+
+    monkeypatch.setattr(jobs, "_execute_job_run", fake_execute)
+    pool = worker_service.JobWorkerPool(
+        worker_service.WorkerSettings(concurrency=2, poll_seconds=0.05, recovery_seconds=60),
+        deps=_runtime(store),
+        worker_id="worker-1",
+    )
+    thread = threading.Thread(target=pool.run)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while len(executed) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    pool.stop()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert sorted(executed) == ["run-1", "run-2", "run-3"]
+    assert peak["max"] == 2
+    assert pool.processed == 3
+    assert store.recoveries == 1
+    assert set(store.acquire_calls) == {False}
+
+
+def test_worker_pool_wakes_immediately_when_notified(monkeypatch):
+    store = _QueueStore([])
+    executed: list[str] = []
+    monkeypatch.setattr(
+        jobs,
+        "_execute_job_run",
+        lambda *, store, run, worker_id, lease_seconds, deps, heartbeats: executed.append(run.id),
+    )
+    pool = worker_service.JobWorkerPool(
+        worker_service.WorkerSettings(concurrency=1, poll_seconds=30, recovery_seconds=60),
+        deps=_runtime(store),
+        worker_id="worker-1",
+    )
+    thread = threading.Thread(target=pool.run)
+    thread.start()
+    time.sleep(0.05)
+
+    with store.lock:
+        store.pending.append("run-late")
+    notified_at = time.monotonic()
+    pool.wake()
+    while not executed and time.monotonic() - notified_at < 5:
+        time.sleep(0.005)
+    latency = time.monotonic() - notified_at
+    pool.stop()
+    thread.join(timeout=5)
+
+    assert executed == ["run-late"]
+    assert latency < 1
+
+
+def test_worker_pool_leases_batchable_jobs_together(monkeypatch):
+    store = _QueueStore([])
+    batch_calls = []
+    executed: list[list[str]] = []
+
+    def acquire_next(*, worker_id, lease_seconds, recover_stale=True):
+        with store.lock:
+            if store.acquire_calls:
+                return None
+            store.acquire_calls.append(recover_stale)
+            return _run("head", jobs.JOB_TYPE_RECOMPUTE_FINDINGS_DATE)
+
+    def acquire_batch(*, worker_id, lease_seconds, job_type, limit, recover_stale=True):
+        batch_calls.append((job_type, limit, recover_stale))
+        return [_run("tail-1", job_type), _run("tail-2", job_type)]
+
+    store.acquire_next = acquire_next
+    store.acquire_batch = acquire_batch
+    monkeypatch.setattr(
+        jobs,
+        "_execute_job_batch",
+        lambda *, store, runs, worker_id, lease_seconds, deps, heartbeats: executed.append([run.id for run in runs]),
+    )
+    pool = worker_service.JobWorkerPool(
+        worker_service.WorkerSettings(concurrency=1, poll_seconds=0.05, recovery_seconds=60, batch_size=3),
+        deps=_runtime(store),
+        worker_id="worker-1",
+    )
+    thread = threading.Thread(target=pool.run)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not executed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    pool.stop()
+    thread.join(timeout=5)
+
+    assert batch_calls == [(jobs.JOB_TYPE_RECOMPUTE_FINDINGS_DATE, 2, False)]
+    assert executed == [["head", "tail-1", "tail-2"]]
+    assert pool.processed == 3
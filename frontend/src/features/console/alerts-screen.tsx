@@ -102,7 +102,7 @@ function toFilterQuery(filters: AlertFilters) {
   return query.toString();
 }
 
-function filtersFromResponse(response: AlertsResponse): AlertFilters {
+function filtersFromResponse(response: AlertsResponse, requested: AlertFilters): AlertFilters {
   return {
     status: response.applied_filters.status as AlertFilterStatus,
     riskLevel: (response.applied_filters.risk_level ?? "all") as AlertRiskFilter,
@@ -110,7 +110,7 @@ function filtersFromResponse(response: AlertsResponse): AlertFilters {
     endDate: response.applied_filters.end_date ?? "",
     search: response.applied_filters.search ?? "",
     sort: response.applied_filters.sort,
-    page: response.page,
+    page: response.page ?? requested.page,
     pageSize: response.page_size,
   };
 }
@@ -177,7 +177,7 @@ export function AlertsScreen({ searchParams }: AlertsScreenProps) {
         setData(response);
         setSelectedKeys([]);
         setReviewScope("selected");
-        const canonicalFilters = filtersFromResponse(response);
+        const canonicalFilters = filtersFromResponse(response, filters);
         if (toFilterQuery(filters) !== toFilterQuery(canonicalFilters)) {
           replace(`${pathname}?${toFilterQuery(canonicalFilters)}`, { scroll: false });
         }
@@ -271,7 +271,7 @@ export function AlertsScreen({ searchParams }: AlertsScreenProps) {
 
   const items = useMemo(() => data?.items ?? [], [data?.items]);
   const allSelected = items.length > 0 && selectedKeys.length === items.length;
-  const activeFilters = data ? filtersFromResponse(data) : routeFilters;
+  const activeFilters = data ? filtersFromResponse(data, routeFilters) : routeFilters;
   const total = data?.total ?? 0;
   const totalPages = Math.max(1, Math.ceil(total / activeFilters.pageSize));
   const currentListHref = `${pathname}?${toFilterQuery(activeFilters)}`;
@@ -336,7 +336,7 @@ export function AlertsScreen({ searchParams }: AlertsScreenProps) {
       <div className="alerts-topbar">
         <div className="alerts-topbar-left">
           <h1 className="alerts-title">アラート一覧</h1>
-          {data ? <StatusCountStrip counts={data.status_counts} /> : null}
+          {data?.status_counts ? <StatusCountStrip counts={data.status_counts} /> : null}
           <p className="table-secondary">初期表示では全期間の最新ケースを表示します。</p>
           {showAdvanced ? <p className="table-secondary">キー操作：J/K で行の移動、X でチェックの切り替え</p> : null}
         </div>
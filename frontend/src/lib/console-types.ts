@@ -156,12 +156,13 @@ export type AlertsResponse = {
     search: string | null;
     sort: string;
   };
-  status_counts: Record<ReviewStatus, number>;
+  status_counts: Record<ReviewStatus, number> | null;
   items: AlertListItem[];
-  total: number;
-  page: number;
+  total: number | null;
+  page: number | null;
   page_size: number;
   has_next: boolean;
+  next_cursor?: string | null;
 };
 
 export type AlertTransaction = {